@@ -1,11 +1,30 @@
+"""
+MemOS API clients.
+
+`MemOSClient` (blocking, on a pooled `requests.Session`) and `AsyncMemOSClient`
+(asyncio, on `httpx.AsyncClient`) expose the same methods. Both keep connections
+alive, retry 429/5xx responses and connection errors with jittered exponential
+backoff that honours Retry-After, and can gzip large request bodies.
+"""
+
+import asyncio
+import gzip
 import json
 import mimetypes
 import os
+import random
+import time
 
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from memos.api.product_models import (
     MemOSAddFeedBackResponse,
     MemOSAddKnowledgebaseFileResponse,
@@ -26,17 +45,49 @@ from memos.log import get_logger
 logger = get_logger(__name__)
 
 MAX_RETRY_COUNT = 3
+DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 10
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 8.0
+# Longest Retry-After the client is willing to sleep for
+MAX_RETRY_AFTER = 60.0
+# Bodies smaller than this are sent uncompressed even with gzip enabled
+GZIP_MIN_BYTES = 1024
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
 
-class MemOSClient:
-    """MemOS API client"""
+class _BaseMemOSClient(ABC):
+    """
+    Shared configuration and API surface of the MemOS clients.
+
+    Every API method builds its payload and delegates to `_request`, which the
+    concrete clients implement either synchronously or as a coroutine.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         is_global: str | bool = "false",
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = MAX_RETRY_COUNT,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        gzip_requests: bool = False,
     ):
+        """
+        Args:
+            api_key: MemOS API key, defaults to MEMOS_API_KEY.
+            base_url: API base URL, defaults to MEMOS_BASE_URL or the public endpoint.
+            is_global: Use the global endpoint when no base URL is given.
+            timeout: Per-request timeout in seconds.
+            max_retries: Total attempts for retryable failures.
+            backoff_base: First retry delay in seconds, doubled on each attempt.
+            backoff_max: Upper bound of the backoff delay.
+            pool_size: Maximum number of pooled keep-alive connections.
+            gzip_requests: Gzip JSON request bodies of at least GZIP_MIN_BYTES.
+        """
         # Priority:
         # 1. base_url argument
         # 2. MEMOS_BASE_URL environment variable (direct URL)
@@ -58,6 +109,55 @@ class MemOSClient:
             raise ValueError("MemOS API key is required")
         self.api_key = api_key
         self.headers = {"Content-Type": "application/json", "Authorization": f"Token {api_key}"}
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_size = pool_size
+        self.gzip_requests = gzip_requests
+
+    @abstractmethod
+    def _request(
+        self,
+        path: str,
+        payload: dict[str, Any] | None,
+        response_model: type,
+        action: str,
+        params: dict[str, Any] | None = None,
+        file_paths: list[str] | None = None,
+    ):
+        """Send a request and parse the response into `response_model`."""
+
+    def _encode_json(self, payload: dict[str, Any]) -> tuple[bytes, dict[str, str]]:
+        """Return the request body and headers for a JSON payload."""
+        body = json.dumps(payload).encode("utf-8")
+        headers = dict(self.headers)
+        if self.gzip_requests and len(body) >= GZIP_MIN_BYTES:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return body, headers
+
+    @staticmethod
+    def _open_file(file_path: str) -> tuple[str, tuple[str, Any, str]]:
+        """Build the multipart `files` entry for a local file."""
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if mime_type is None:
+            mime_type = "application/octet-stream"
+        return ("file", (os.path.basename(file_path), open(file_path, "rb"), mime_type))
+
+    def _retry_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Delay before the next attempt: Retry-After if given, else full-jitter backoff."""
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(0.0, delay), MAX_RETRY_AFTER)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
 
     def _validate_required_params(self, **params):
         """Validate required parameters - if passed, they must not be empty"""
@@ -77,7 +177,7 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(user_id=user_id)
 
-        url = f"{self.base_url}/get/message"
+        path = "/get/message"
         payload = {
             "user_id": user_id,
             "conversation_id": conversation_id,
@@ -85,19 +185,7 @@ class MemOSClient:
             "message_limit_number": message_limit_number,
             "source": source,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetMessagesResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get messages (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSGetMessagesResponse, "get messages")
 
     def add_message(
         self,
@@ -119,7 +207,7 @@ class MemOSClient:
             messages=messages, user_id=user_id, conversation_id=conversation_id
         )
 
-        url = f"{self.base_url}/add/message"
+        path = "/add/message"
         payload = {
             "messages": messages,
             "user_id": user_id,
@@ -133,19 +221,7 @@ class MemOSClient:
             "tags": tags,
             "asyncMode": async_mode,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add message (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSAddResponse, "add message")
 
     def search_memory(
         self,
@@ -165,7 +241,7 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(query=query, user_id=user_id)
 
-        url = f"{self.base_url}/search/memory"
+        path = "/search/memory"
         payload = {
             "query": query,
             "user_id": user_id,
@@ -180,19 +256,7 @@ class MemOSClient:
             "include_tool_memory": include_tool_memory,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSSearchResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to search memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSSearchResponse, "search memory")
 
     def get_memory(
         self, user_id: str, include_preference: bool = True, page: int = 1, size: int = 10
@@ -201,7 +265,7 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(include_preference=include_preference, user_id=user_id)
 
-        url = f"{self.base_url}/get/memory"
+        path = "/get/memory"
         payload = {
             "include_preference": include_preference,
             "user_id": user_id,
@@ -209,19 +273,7 @@ class MemOSClient:
             "size": size,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetMemoryResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSGetMemoryResponse, "get memory")
 
     def create_knowledgebase(
         self, knowledgebase_name: str, knowledgebase_description: str
@@ -235,25 +287,15 @@ class MemOSClient:
             knowledgebase_description=knowledgebase_description,
         )
 
-        url = f"{self.base_url}/create/knowledgebase"
+        path = "/create/knowledgebase"
         payload = {
             "knowledgebase_name": knowledgebase_name,
             "knowledgebase_description": knowledgebase_description,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSCreateKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to create knowledgebase (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path, payload, MemOSCreateKnowledgebaseResponse, "create knowledgebase"
+        )
 
     def delete_knowledgebase(
         self, knowledgebase_id: str
@@ -264,24 +306,14 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_id=knowledgebase_id)
 
-        url = f"{self.base_url}/delete/knowledgebase"
+        path = "/delete/knowledgebase"
         payload = {
             "knowledgebase_id": knowledgebase_id,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete knowledgebase (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path, payload, MemOSDeleteKnowledgebaseResponse, "delete knowledgebase"
+        )
 
     def add_knowledgebase_file_json(
         self, knowledgebase_id: str, file: list[dict[str, Any]]
@@ -292,25 +324,15 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_id=knowledgebase_id, file=file)
 
-        url = f"{self.base_url}/add/knowledgebase-file"
+        path = "/add/knowledgebase-file"
         payload = {
             "knowledgebase_id": knowledgebase_id,
             "file": file,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add knowledgebase-file json (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path, payload, MemOSAddKnowledgebaseFileResponse, "add knowledgebase-file json"
+        )
 
     def add_knowledgebase_file_form(
         self, knowledgebase_id: str, files: list[str]
@@ -321,45 +343,25 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_id=knowledgebase_id, files=files)
 
-        def build_file_form_param(file_path):
-            """
-            form-Automatically generate the structure required for the `files` parameter in requests based on the local file path
-            """
+        file_paths = []
+        for file_path in files:
             if not os.path.isfile(file_path):
                 logger.warning(f"File {file_path} does not exist")
-                return None
-            filename = os.path.basename(file_path)
+                continue
+            file_paths.append(file_path)
 
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if mime_type is None:
-                mime_type = "application/octet-stream"
-            return ("file", (filename, open(file_path, "rb"), mime_type))
-
-        url = f"{self.base_url}/add/knowledgebase-file"
-        payload = {
+        path = "/add/knowledgebase-file"
+        params = {
             "knowledgebase_id": knowledgebase_id,
         }
-        headers = {
-            "Authorization": f"Token {self.api_key}",
-        }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url,
-                    params=payload,
-                    headers=headers,
-                    timeout=30,
-                    files=[build_file_form_param(file_path) for file_path in files],
-                )
-                response.raise_for_status()
-                response_data = response.json()
-                print(response_data)
-
-                return MemOSAddKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add knowledgebase-file form (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path,
+            None,
+            MemOSAddKnowledgebaseFileResponse,
+            "add knowledgebase-file form",
+            params=params,
+            file_paths=file_paths,
+        )
 
     def delete_knowledgebase_file(
         self, file_ids: list[str]
@@ -370,24 +372,14 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(file_ids=file_ids)
 
-        url = f"{self.base_url}/delete/knowledgebase-file"
+        path = "/delete/knowledgebase-file"
         payload = {
             "file_ids": file_ids,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete knowledgebase-file (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path, payload, MemOSDeleteKnowledgebaseResponse, "delete knowledgebase-file"
+        )
 
     def get_knowledgebase_file(
         self, file_ids: list[str]
@@ -398,24 +390,14 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(file_ids=file_ids)
 
-        url = f"{self.base_url}/get/knowledgebase-file"
+        path = "/get/knowledgebase-file"
         payload = {
             "file_ids": file_ids,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get knowledgebase-file (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            path, payload, MemOSGetKnowledgebaseFileResponse, "get knowledgebase-file"
+        )
 
     def get_task_status(self, task_id: str) -> MemOSGetTaskStatusResponse | None:
         """
@@ -424,24 +406,12 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(task_id=task_id)
 
-        url = f"{self.base_url}/get/status"
+        path = "/get/status"
         payload = {
             "task_id": task_id,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetTaskStatusResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get task status (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSGetTaskStatusResponse, "get task status")
 
     def add_feedback(
         self,
@@ -460,7 +430,7 @@ class MemOSClient:
             feedback_content=feedback_content, user_id=user_id, conversation_id=conversation_id
         )
 
-        url = f"{self.base_url}/add/feedback"
+        path = "/add/feedback"
         payload = {
             "feedback_content": feedback_content,
             "user_id": user_id,
@@ -471,19 +441,7 @@ class MemOSClient:
             "allow_public": allow_public,
             "allow_knowledgebase_ids": allow_knowledgebase_ids,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddFeedBackResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add feedback (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSAddFeedBackResponse, "add feedback")
 
     def delete_memory(
         self, user_ids: list[str], memory_ids: list[str]
@@ -492,25 +450,13 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(user_ids=user_ids, memory_ids=memory_ids)
 
-        url = f"{self.base_url}/delete/memory"
+        path = "/delete/memory"
         payload = {
             "user_ids": user_ids,
             "memory_ids": memory_ids,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteMemoryResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(path, payload, MemOSDeleteMemoryResponse, "delete memory")
 
     def chat(
         self,
@@ -545,7 +491,7 @@ class MemOSClient:
             user_id=user_id, conversation_id=conversation_id, query=query
         )
 
-        url = f"{self.base_url}/chat"
+        path = "/chat"
         payload = {
             "user_id": user_id,
             "conversation_id": conversation_id,
@@ -573,16 +519,229 @@ class MemOSClient:
             "memory_limit_number": memory_limit_number,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
+        return self._request(path, payload, MemOSChatResponse, "chat")
+
+
+class MemOSClient(_BaseMemOSClient):
+    """MemOS API client"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "MemOSClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _request(
+        self,
+        path: str,
+        payload: dict[str, Any] | None,
+        response_model: type,
+        action: str,
+        params: dict[str, Any] | None = None,
+        file_paths: list[str] | None = None,
+    ):
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.max_retries):
+            is_last = attempt == self.max_retries - 1
+            files = None
             try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
+                if file_paths is not None:
+                    files = [self._open_file(file_path) for file_path in file_paths]
+                    body, headers = None, {"Authorization": self.headers["Authorization"]}
+                else:
+                    body, headers = self._encode_json(payload)
+                response = self.session.post(
+                    url,
+                    data=body,
+                    params=params,
+                    files=files,
+                    headers=headers,
+                    timeout=self.timeout,
                 )
+                if response.status_code in RETRYABLE_STATUS_CODES and not is_last:
+                    delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                    logger.warning(
+                        f"Failed to {action} (retry {attempt + 1}/{self.max_retries}): "
+                        f"HTTP {response.status_code}, retrying in {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    continue
                 response.raise_for_status()
-                response_data = response.json()
+                return response_model(**response.json())
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.error(f"Failed to {action} (retry {attempt + 1}/{self.max_retries}): {e}")
+                if is_last:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+            except Exception as e:
+                logger.error(f"Failed to {action}: {e}")
+                raise
+            finally:
+                for _, (_, file_obj, _) in files or []:
+                    file_obj.close()
 
-                return MemOSChatResponse(**response_data)
+    def _run_batch(
+        self,
+        method: Callable,
+        calls: list[dict[str, Any]],
+        max_workers: int,
+        return_exceptions: bool,
+    ) -> list[Any]:
+        def _call(kwargs: dict[str, Any]) -> Any:
+            try:
+                return method(**kwargs)
             except Exception as e:
-                logger.error(f"Failed to chat (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
+                if return_exceptions:
+                    return e
+                raise
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, self.pool_size))) as executor:
+            return list(executor.map(_call, calls))
+
+    def search_memory_batch(
+        self,
+        searches: list[dict[str, Any]],
+        max_workers: int = DEFAULT_POOL_SIZE,
+        return_exceptions: bool = False,
+    ) -> list[MemOSSearchResponse | Exception | None]:
+        """
+        Run `search_memory` for each kwargs dict concurrently over the shared pool.
+
+        Returns:
+            Results in input order; with `return_exceptions`, failures are returned
+            in place instead of raised.
+        """
+        return self._run_batch(self.search_memory, searches, max_workers, return_exceptions)
+
+    def add_message_batch(
+        self,
+        messages: list[dict[str, Any]],
+        max_workers: int = DEFAULT_POOL_SIZE,
+        return_exceptions: bool = False,
+    ) -> list[MemOSAddResponse | Exception | None]:
+        """Run `add_message` for each kwargs dict concurrently, see `search_memory_batch`."""
+        return self._run_batch(self.add_message, messages, max_workers, return_exceptions)
+
+
+class AsyncMemOSClient(_BaseMemOSClient):
+    """
+    Asyncio MemOS API client.
+
+    Has the same methods as `MemOSClient`; each of them returns a coroutine.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.pool_size, max_keepalive_connections=self.pool_size
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncMemOSClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        path: str,
+        payload: dict[str, Any] | None,
+        response_model: type,
+        action: str,
+        params: dict[str, Any] | None = None,
+        file_paths: list[str] | None = None,
+    ):
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.max_retries):
+            is_last = attempt == self.max_retries - 1
+            files = None
+            try:
+                if file_paths is not None:
+                    files = [self._open_file(file_path) for file_path in file_paths]
+                    body, headers = None, {"Authorization": self.headers["Authorization"]}
+                else:
+                    body, headers = self._encode_json(payload)
+                response = await self.client.post(
+                    url, content=body, params=params, files=files, headers=headers
+                )
+                if response.status_code in RETRYABLE_STATUS_CODES and not is_last:
+                    delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                    logger.warning(
+                        f"Failed to {action} (retry {attempt + 1}/{self.max_retries}): "
+                        f"HTTP {response.status_code}, retrying in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                response.raise_for_status()
+                return response_model(**response.json())
+            except self._httpx.TransportError as e:
+                logger.error(f"Failed to {action} (retry {attempt + 1}/{self.max_retries}): {e}")
+                if is_last:
                     raise
+                await asyncio.sleep(self._retry_delay(attempt))
+            except Exception as e:
+                logger.error(f"Failed to {action}: {e}")
+                raise
+            finally:
+                for _, (_, file_obj, _) in files or []:
+                    file_obj.close()
+
+    async def _run_batch(
+        self,
+        method: Callable,
+        calls: list[dict[str, Any]],
+        concurrency: int,
+        return_exceptions: bool,
+    ) -> list[Any]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _call(kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await method(**kwargs)
+
+        return await asyncio.gather(
+            *(_call(kwargs) for kwargs in calls), return_exceptions=return_exceptions
+        )
+
+    async def search_memory_batch(
+        self,
+        searches: list[dict[str, Any]],
+        concurrency: int = DEFAULT_POOL_SIZE,
+        return_exceptions: bool = False,
+    ) -> list[MemOSSearchResponse | Exception | None]:
+        """
+        Run `search_memory` for each kwargs dict with at most `concurrency` in flight.
+
+        Returns:
+            Results in input order; with `return_exceptions`, failures are returned
+            in place instead of raised.
+        """
+        return await self._run_batch(self.search_memory, searches, concurrency, return_exceptions)
+
+    async def add_message_batch(
+        self,
+        messages: list[dict[str, Any]],
+        concurrency: int = DEFAULT_POOL_SIZE,
+        return_exceptions: bool = False,
+    ) -> list[MemOSAddResponse | Exception | None]:
+        """Run `add_message` for each kwargs dict concurrently, see `search_memory_batch`."""
+        return await self._run_batch(self.add_message, messages, concurrency, return_exceptions)
@@ -50,4 +50,5 @@ class APIExceptionHandler:
         return JSONResponse(
             status_code=exc.status_code,
             content={"code": exc.status_code, "message": str(exc.detail), "data": None},
+            headers=getattr(exc, "headers", None),
         )
@@ -5,10 +5,16 @@ This module provides a class-based implementation of add handlers,
 using dependency injection for better modularity and testability.
 """
 
+from fastapi import HTTPException
 from pydantic import validate_call
 
 from memos.api.handlers.base_handler import BaseHandler, HandlerDependencies
 from memos.api.product_models import APIADDRequest, APIFeedbackRequest, MemoryResponse
+from memos.mem_scheduler.task_schedule_modules.admission_control import (
+    ADMISSION_POLICY_DEGRADE,
+    ADMISSION_POLICY_REJECT,
+    ADMISSION_POLICY_SHED,
+)
 from memos.memories.textual.item import (
     list_all_fields,
 )
@@ -61,6 +67,8 @@ class AddHandler(BaseHandler):
             if len(add_req.info) < info_len:
                 self.logger.warning(f"[AddHandler] info fields can not contain {exclude_fields}.")
 
+        self._apply_admission_control(add_req)
+
         cube_view = self._build_cube_view(add_req)
 
         @validate_call
@@ -113,6 +121,37 @@ class AddHandler(BaseHandler):
             data=results,
         )
 
+    def _apply_admission_control(self, add_req: APIADDRequest) -> None:
+        """
+        Check the scheduler backlog before accepting an add request.
+
+        Raises:
+            HTTPException: 429 with a Retry-After header under the "reject" policy.
+        """
+        controller = getattr(self.mem_scheduler, "admission_controller", None)
+        if controller is None:
+            return
+
+        decision = controller.check(user_id=add_req.user_id)
+        if decision.action == ADMISSION_POLICY_REJECT:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Scheduler queue is overloaded: {'; '.join(decision.reasons)}",
+                headers={"Retry-After": str(decision.retry_after_seconds)},
+            )
+        if (
+            decision.action in (ADMISSION_POLICY_DEGRADE, ADMISSION_POLICY_SHED)
+            and add_req.async_mode == "async"
+        ):
+            # Fast sync add writes memories inline and enqueues no mem_read task.
+            # Shedding cannot drop mem_read, which holds the only copy of the messages.
+            self.logger.warning(
+                f"[AddHandler] Degrading add for user {add_req.user_id} to sync fast mode: "
+                f"{decision.reasons}"
+            )
+            add_req.async_mode = "sync"
+            add_req.mode = "fast"
+
     def _resolve_cube_ids(self, add_req: APIADDRequest) -> list[str]:
         """
         Normalize target cube ids from add_req.
@@ -12,8 +12,11 @@ import re
 import time
 import traceback
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import aclosing
 from datetime import datetime
+from itertools import chain
 from typing import Any, Literal
 
 from fastapi import HTTPException
@@ -28,7 +31,8 @@ from memos.api.product_models import (
     ChatPlaygroundRequest,
     ChatRequest,
 )
-from memos.context.context import ContextThread
+from memos.context.context import ContextThread, ContextThreadPoolExecutor
+from memos.llms.utils import ThinkStreamFilter
 from memos.mem_os.utils.format_utils import clean_json_response
 from memos.mem_os.utils.reference_utils import (
     prepare_reference_data,
@@ -45,7 +49,18 @@ from memos.templates.mos_prompts import (
     FURTHER_SUGGESTION_PROMPT,
     get_memos_prompt,
 )
-from memos.types import MessageList
+from memos.types import MessageList, SearchMode
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+# Overlap fast-mode retrieval with the requested (fine/mixture) search in streaming chat
+CHAT_SPECULATIVE_RETRIEVAL = os.getenv("CHAT_SPECULATIVE_RETRIEVAL", "true").lower() == "true"
+# How long generation waits for the full search once fast results are ready
+CHAT_SPECULATIVE_WINDOW_MS = int(os.getenv("CHAT_SPECULATIVE_WINDOW_MS", "800"))
+CHAT_RETRIEVAL_MAX_WORKERS = int(os.getenv("CHAT_RETRIEVAL_MAX_WORKERS", "16"))
 
 
 class ChatHandler(BaseHandler):
@@ -92,6 +107,9 @@ class ChatHandler(BaseHandler):
         self.search_handler = search_handler
         self.add_handler = add_handler
         self.online_bot = online_bot
+        self._retrieval_executor = ContextThreadPoolExecutor(
+            max_workers=CHAT_RETRIEVAL_MAX_WORKERS, thread_name_prefix="memos-chat-retrieval"
+        )
 
         # Check if scheduler is enabled
         self.enable_mem_scheduler = (
@@ -250,9 +268,13 @@ class ChatHandler(BaseHandler):
         self.logger.info(f"[ChatHandler] Chat Req is: {chat_req}")
         try:
 
-            def generate_chat_response() -> Generator[str, None, None]:
+            async def generate_chat_response() -> AsyncGenerator[str, None]:
                 """Generate chat stream response as SSE stream."""
                 try:
+                    request_start = time.perf_counter()
+                    timings: dict[str, Any] = {}
+                    model = self._resolve_chat_model(chat_req.model_name_or_path)
+
                     # Resolve readable cube IDs (for search)
                     readable_cube_ids = chat_req.readable_cube_ids or (
                         [chat_req.mem_cube_id] if chat_req.mem_cube_id else [chat_req.user_id]
@@ -273,13 +295,16 @@ class ChatHandler(BaseHandler):
                         relativity=chat_req.relativity,
                     )
 
-                    search_response = self.search_handler.handle_search_memories(search_req)
+                    search_response = await asyncio.to_thread(
+                        self._search_for_chat, search_req, timings
+                    )
 
                     # Use first readable cube ID for scheduler (backward compatibility)
                     scheduler_cube_id = (
                         readable_cube_ids[0] if readable_cube_ids else chat_req.user_id
                     )
-                    self._send_message_to_scheduler(
+                    await asyncio.to_thread(
+                        self._send_message_to_scheduler,
                         user_id=chat_req.user_id,
                         mem_cube_id=scheduler_cube_id,
                         query=chat_req.query,
@@ -324,49 +349,21 @@ class ChatHandler(BaseHandler):
                     )
 
                     # Step 3: Generate streaming response from LLM
-                    if (
-                        chat_req.model_name_or_path
-                        and chat_req.model_name_or_path not in self.chat_llms
-                    ):
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Model {chat_req.model_name_or_path} not suport, choose from {list(self.chat_llms.keys())}",
-                        )
-
-                    model = chat_req.model_name_or_path or next(iter(self.chat_llms.keys()))
                     self.logger.info(f"[Cloud Service] Chat Stream Model: {model}")
 
+                    timings["prompt_ready_ms"] = _elapsed_ms(request_start)
                     start = time.time()
-                    response_stream = self.chat_llms[model].generate_stream(
-                        current_messages, model_name_or_path=model
-                    )
-
-                    # Stream the response
-                    buffer = ""
-                    full_response = ""
-                    in_think = False
-
-                    for chunk in response_stream:
-                        if chunk == "<think>":
-                            in_think = True
-                            continue
-                        if chunk == "</think>":
-                            in_think = False
-                            continue
-
-                        if in_think:
-                            chunk_data = f"data: {json.dumps({'type': 'reasoning', 'data': chunk}, ensure_ascii=False)}\n\n"
-                            yield chunk_data
-                            continue
-
-                        buffer += chunk
-                        full_response += chunk
-
-                        chunk_data = f"data: {json.dumps({'type': 'text', 'data': chunk}, ensure_ascii=False)}\n\n"
+                    response_parts: list[str] = []
+                    async for chunk_data in self._stream_chat_events(
+                        model, current_messages, timings, request_start, response_parts
+                    ):
                         yield chunk_data
+                    full_response = "".join(response_parts)
 
                     end = time.time()
                     self.logger.info(f"[Cloud Service] Chat Stream Time: {end - start} seconds")
+                    timings["total_ms"] = _elapsed_ms(request_start)
+                    yield f"data: {json.dumps({'type': 'timing', 'data': timings})}\n\n"
 
                     self.logger.info(
                         f"[Cloud Service] Chat Stream LLM Input: {json.dumps(current_messages, ensure_ascii=False)} Chat Stream LLM Response: {full_response}"
@@ -379,7 +376,9 @@ class ChatHandler(BaseHandler):
                             [chat_req.mem_cube_id] if chat_req.mem_cube_id else [chat_req.user_id]
                         )
                         start = time.time()
-                        self._start_add_to_memory(
+                        # From a worker thread, so the add is not run on the event loop
+                        await asyncio.to_thread(
+                            self._start_add_to_memory,
                             user_id=chat_req.user_id,
                             writable_cube_ids=writable_cube_ids,
                             session_id=chat_req.session_id or "default_session",
@@ -640,35 +639,40 @@ class ChatHandler(BaseHandler):
                         # Stream the response
                         buffer = ""
                         full_response = ""
-                        in_think = False
-
-                        for chunk in response_stream:
-                            if chunk == "<think>":
-                                in_think = True
-                                yield f"data: {json.dumps({'type': 'status', 'data': 'reasoning'})}\n\n"
-                                continue
-                            if chunk == "</think>":
-                                in_think = False
-                                yield f"data: {json.dumps({'type': 'status', 'data': '2'})}\n\n"
-                                continue
-
-                            if in_think:
-                                chunk_data = f"data: {json.dumps({'type': 'reasoning', 'data': chunk}, ensure_ascii=False)}\n\n"
-                                yield chunk_data
-                                continue
-
-                            buffer += chunk
-                            full_response += chunk
-
-                            # Process buffer to ensure complete reference tags
-                            processed_chunk, remaining_buffer = (
-                                process_streaming_references_complete(buffer)
+                        think_filter = ThinkStreamFilter()
+
+                        for chunk in chain(response_stream, [None]):
+                            in_think = think_filter.in_think
+                            # Tags may arrive inline or split across chunks; None flushes
+                            parts = (
+                                think_filter.feed(chunk)
+                                if chunk is not None
+                                else think_filter.flush()
                             )
-
-                            if processed_chunk:
-                                chunk_data = f"data: {json.dumps({'type': 'text', 'data': processed_chunk}, ensure_ascii=False)}\n\n"
-                                yield chunk_data
-                                buffer = remaining_buffer
+                            for kind, text in parts:
+                                if kind == "reasoning":
+                                    if not in_think:
+                                        in_think = True
+                                        yield f"data: {json.dumps({'type': 'status', 'data': 'reasoning'})}\n\n"
+                                    chunk_data = f"data: {json.dumps({'type': 'reasoning', 'data': text}, ensure_ascii=False)}\n\n"
+                                    yield chunk_data
+                                    continue
+                                if in_think:
+                                    in_think = False
+                                    yield f"data: {json.dumps({'type': 'status', 'data': '2'})}\n\n"
+
+                                buffer += text
+                                full_response += text
+
+                                # Process buffer to ensure complete reference tags
+                                processed_chunk, remaining_buffer = (
+                                    process_streaming_references_complete(buffer)
+                                )
+
+                                if processed_chunk:
+                                    chunk_data = f"data: {json.dumps({'type': 'text', 'data': processed_chunk}, ensure_ascii=False)}\n\n"
+                                    yield chunk_data
+                                    buffer = remaining_buffer
 
                         # Process any remaining buffer
                         if buffer:
@@ -792,9 +796,13 @@ class ChatHandler(BaseHandler):
 
         try:
 
-            def generate_chat_response() -> Generator[str, None, None]:
+            async def generate_chat_response() -> AsyncGenerator[str, None]:
                 """Generate chat stream response as SSE stream."""
                 try:
+                    request_start = time.perf_counter()
+                    timings: dict[str, Any] = {}
+                    model = self._resolve_chat_model(chat_req.model_name_or_path)
+
                     if chat_req.need_search:
                         # Resolve readable cube IDs (for search)
                         readable_cube_ids = chat_req.readable_cube_ids or (
@@ -816,7 +824,9 @@ class ChatHandler(BaseHandler):
                             relativity=chat_req.relativity,
                         )
 
-                        search_response = self.search_handler.handle_search_memories(search_req)
+                        search_response = await asyncio.to_thread(
+                            self._search_for_chat, search_req, timings
+                        )
 
                         # Extract memories from search results
                         memories_list = []
@@ -864,51 +874,23 @@ class ChatHandler(BaseHandler):
                     ]
 
                     # Step 3: Generate streaming response from LLM
-                    if (
-                        chat_req.model_name_or_path
-                        and chat_req.model_name_or_path not in self.chat_llms
-                    ):
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Model {chat_req.model_name_or_path} not suport, choose from {list(self.chat_llms.keys())}",
-                        )
-
-                    model = chat_req.model_name_or_path or next(iter(self.chat_llms.keys()))
                     self.logger.info(f"[ChatBusinessHandler] Chat Stream Model: {model}")
 
+                    timings["prompt_ready_ms"] = _elapsed_ms(request_start)
                     start = time.time()
-                    response_stream = self.chat_llms[model].generate_stream(
-                        current_messages, model_name_or_path=model
-                    )
-
-                    # Stream the response
-                    buffer = ""
-                    full_response = ""
-                    in_think = False
-
-                    for chunk in response_stream:
-                        if chunk == "<think>":
-                            in_think = True
-                            continue
-                        if chunk == "</think>":
-                            in_think = False
-                            continue
-
-                        if in_think:
-                            chunk_data = f"data: {json.dumps({'type': 'reasoning', 'data': chunk}, ensure_ascii=False)}\n\n"
-                            yield chunk_data
-                            continue
-
-                        buffer += chunk
-                        full_response += chunk
-
-                        chunk_data = f"data: {json.dumps({'type': 'text', 'data': chunk}, ensure_ascii=False)}\n\n"
+                    response_parts: list[str] = []
+                    async for chunk_data in self._stream_chat_events(
+                        model, current_messages, timings, request_start, response_parts
+                    ):
                         yield chunk_data
+                    full_response = "".join(response_parts)
 
                     end = time.time()
                     self.logger.info(
                         f"[ChatBusinessHandler] Chat Stream Time: {end - start} seconds"
                     )
+                    timings["total_ms"] = _elapsed_ms(request_start)
+                    yield f"data: {json.dumps({'type': 'timing', 'data': timings})}\n\n"
 
                     self.logger.info(
                         f"[ChatBusinessHandler] Chat Stream LLM Input: {json.dumps(current_messages, ensure_ascii=False)} Chat Stream LLM Response: {full_response}"
@@ -921,7 +903,9 @@ class ChatHandler(BaseHandler):
                             [chat_req.mem_cube_id] if chat_req.mem_cube_id else [chat_req.user_id]
                         )
                         start = time.time()
-                        self._start_add_to_memory(
+                        # From a worker thread, so the add is not run on the event loop
+                        await asyncio.to_thread(
+                            self._start_add_to_memory,
                             user_id=chat_req.user_id,
                             writable_cube_ids=writable_cube_ids,
                             session_id=chat_req.session_id or "default_session",
@@ -963,6 +947,95 @@ class ChatHandler(BaseHandler):
             )
             raise HTTPException(status_code=500, detail=str(traceback.format_exc())) from err
 
+    async def _stream_chat_events(
+        self,
+        model: str,
+        messages: MessageList,
+        timings: dict[str, Any],
+        request_start: float,
+        response_parts: list[str],
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream the model answer as SSE events, with thinking text split out.
+
+        Answer text is appended to `response_parts`. Generation runs on
+        `agenerate_stream`, so when the client disconnects and the response is
+        cancelled, the upstream request is closed instead of generating on.
+        """
+
+        def event(kind: str, text: str) -> str:
+            if kind == "text":
+                response_parts.append(text)
+            return f"data: {json.dumps({'type': kind, 'data': text}, ensure_ascii=False)}\n\n"
+
+        # Tags may arrive inline or split across chunks
+        think_filter = ThinkStreamFilter()
+        async with aclosing(
+            self.chat_llms[model].agenerate_stream(messages, model_name_or_path=model)
+        ) as response_stream:
+            async for chunk in response_stream:
+                timings.setdefault("ttft_ms", _elapsed_ms(request_start))
+                for kind, text in think_filter.feed(chunk):
+                    yield event(kind, text)
+        timings.setdefault("ttft_ms", _elapsed_ms(request_start))
+        for kind, text in think_filter.flush():
+            yield event(kind, text)
+
+    def _resolve_chat_model(self, model_name_or_path: str | None) -> str:
+        """Validate the requested chat model before any retrieval work starts."""
+        if model_name_or_path and model_name_or_path not in self.chat_llms:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Model {model_name_or_path} not suport, choose from {list(self.chat_llms.keys())}",
+            )
+        return model_name_or_path or next(iter(self.chat_llms.keys()))
+
+    def _search_for_chat(self, search_req: APISearchRequest, timings: dict[str, Any]) -> Any:
+        """
+        Retrieve memories for a streaming chat prompt.
+
+        For fine/mixture searches the requested search runs in the background while a
+        fast-mode search runs inline. Once the fast results are ready, generation waits
+        at most CHAT_SPECULATIVE_WINDOW_MS for the full search and otherwise starts from
+        the fast results. Stage timings and the source used are recorded in `timings`.
+        """
+        start = time.perf_counter()
+        mode = getattr(search_req.mode, "value", search_req.mode)
+        if not CHAT_SPECULATIVE_RETRIEVAL or mode == SearchMode.FAST.value:
+            response = self.search_handler.handle_search_memories(search_req)
+            timings["retrieval_ms"] = _elapsed_ms(start)
+            timings["retrieval_source"] = mode
+            return response
+
+        full_future = self._retrieval_executor.submit(
+            self.search_handler.handle_search_memories, search_req
+        )
+        fast_response = None
+        try:
+            fast_response = self.search_handler.handle_search_memories(
+                search_req.model_copy(update={"mode": SearchMode.FAST})
+            )
+            timings["retrieval_fast_ms"] = _elapsed_ms(start)
+        except Exception as e:
+            self.logger.warning(f"[ChatHandler] Speculative fast search failed: {e}")
+
+        window = CHAT_SPECULATIVE_WINDOW_MS / 1000 if fast_response is not None else None
+        try:
+            response = full_future.result(timeout=window)
+            timings["retrieval_source"] = mode
+        except FuturesTimeoutError:
+            # The full search finishes in the background; generation does not wait for it
+            response = fast_response
+            timings["retrieval_source"] = SearchMode.FAST.value
+        except Exception as e:
+            if fast_response is None:
+                raise
+            self.logger.warning(f"[ChatHandler] Full search failed, using fast results: {e}")
+            response = fast_response
+            timings["retrieval_source"] = SearchMode.FAST.value
+        timings["retrieval_ms"] = _elapsed_ms(start)
+        return response
+
     def _dedup_and_supplement_memories(
         self, first_filtered_memories: list, second_filtered_memories: list
     ) -> list:
@@ -4,16 +4,19 @@ Memory handler for retrieving and managing memories.
 This module handles retrieving all memories or specific subgraphs based on queries.
 """
 
+from collections.abc import Iterator
 from typing import Any, Literal
 
 from memos.api.product_models import (
     DeleteMemoryRequest,
     DeleteMemoryResponse,
+    ExportMemoryRequest,
     GetMemoryDashboardRequest,
     GetMemoryRequest,
     GetMemoryResponse,
     MemoryResponse,
 )
+from memos.api.utils.serialization import EMBEDDING_KEY, apply_embedding_format
 from memos.log import get_logger
 from memos.mem_cube.navie import NaiveMemCube
 from memos.mem_os.utils.format_utils import (
@@ -314,6 +317,70 @@ def handle_get_memories(
     return GetMemoryResponse(message="Memories retrieved successfully", data=filtered_results)
 
 
+def _project_memory(
+    memory: dict[str, Any], fields: list[str] | None, keep_embedding: bool
+) -> dict[str, Any]:
+    metadata = memory.get("metadata") or {}
+    if fields is not None:
+        metadata = {key: metadata[key] for key in fields if key in metadata}
+        if keep_embedding and EMBEDDING_KEY in memory.get("metadata", {}):
+            metadata[EMBEDDING_KEY] = memory["metadata"][EMBEDDING_KEY]
+    elif not keep_embedding:
+        metadata = {key: value for key, value in metadata.items() if key != EMBEDDING_KEY}
+    return {"id": memory.get("id"), "memory": memory.get("memory", ""), "metadata": metadata}
+
+
+def handle_export_memories(
+    export_req: ExportMemoryRequest, naive_mem_cube: NaiveMemCube
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream a cube's memories page by page using cursor pagination.
+
+    Only one page is held in memory at a time. Yields {"type": "memory", "data": ...}
+    records followed by a final {"type": "end", "count": ..., "next_cursor": ...}
+    record; next_cursor is set when the export stopped at `limit` and can be resumed.
+    A failure mid-stream yields a {"type": "error", ...} record carrying the cursor of
+    the last completed page instead.
+    """
+    keep_embedding = export_req.embedding_format != "exclude"
+    cursor = export_req.cursor
+    exported = 0
+    while True:
+        page_size = export_req.page_size
+        if export_req.limit is not None:
+            page_size = min(page_size, export_req.limit - exported)
+        try:
+            page = naive_mem_cube.text_mem.get_all_page(
+                user_name=export_req.mem_cube_id,
+                user_id=export_req.user_id,
+                cursor=cursor,
+                page_size=page_size,
+                filter=export_req.filter,
+                memory_type=export_req.memory_type,
+                include_embedding=keep_embedding,
+            )
+        except Exception as e:
+            logger.error(
+                f"[ExportMemories] Failed to export cube={export_req.mem_cube_id} "
+                f"after {exported} memories: {e}",
+                exc_info=True,
+            )
+            yield {"type": "error", "message": str(e), "count": exported, "next_cursor": cursor}
+            return
+
+        for memory in page["nodes"]:
+            data = _project_memory(memory, export_req.fields, keep_embedding)
+            if export_req.embedding_format == "base64_f16":
+                apply_embedding_format(data, "base64_f16")
+            yield {"type": "memory", "data": data}
+        exported += len(page["nodes"])
+        cursor = page["next_cursor"]
+        if cursor is None or (export_req.limit is not None and exported >= export_req.limit):
+            break
+
+    yield {"type": "end", "count": exported, "next_cursor": cursor}
+
+
 def handle_delete_memories(delete_mem_req: DeleteMemoryRequest, naive_mem_cube: NaiveMemCube):
     """
     Handler for deleting memories.
@@ -400,6 +467,27 @@ def handle_delete_memories(delete_mem_req: DeleteMemoryRequest, naive_mem_cube:
 # =============================================================================
 
 
+def _get_dashboard_aggregates(
+    get_mem_req: GetMemoryDashboardRequest, naive_mem_cube: NaiveMemCube
+) -> dict[str, Any] | None:
+    """
+    Precomputed per-cube aggregates, or None when they do not apply.
+
+    Aggregates are kept per cube, so requests narrowed by user_id or filter keep the
+    totals computed from the query itself.
+    """
+    get_aggregates = getattr(naive_mem_cube.text_mem, "get_memory_aggregates", None)
+    if not get_mem_req.mem_cube_id or get_mem_req.user_id or get_mem_req.filter:
+        return None
+    if get_aggregates is None:
+        return None
+    try:
+        return get_aggregates(user_name=get_mem_req.mem_cube_id)
+    except Exception as e:
+        logger.warning(f"Failed to read memory aggregates, using query totals: {e}")
+        return None
+
+
 def handle_get_memories_dashboard(
     get_mem_req: GetMemoryDashboardRequest, naive_mem_cube: NaiveMemCube
 ) -> GetMemoryResponse:
@@ -410,6 +498,10 @@ def handle_get_memories_dashboard(
     total_skill_nodes = 0
     total_preference_nodes = 0
 
+    aggregates = _get_dashboard_aggregates(get_mem_req, naive_mem_cube)
+    # Precomputed counts replace the count queries, so only the page itself is read
+    totals_kwargs = {} if aggregates is None else {"include_totals": False}
+
     text_memory_type = ["WorkingMemory", "LongTermMemory", "UserMemory", "OuterMemory"]
     text_memories_info = naive_mem_cube.text_mem.get_all(
         user_name=get_mem_req.mem_cube_id,
@@ -418,8 +510,12 @@ def handle_get_memories_dashboard(
         page_size=get_mem_req.page_size,
         filter=get_mem_req.filter,
         memory_type=text_memory_type,
+        **totals_kwargs,
+    )
+    text_memories, total_text_nodes = (
+        text_memories_info["nodes"],
+        text_memories_info.get("total_nodes", 0),
     )
-    text_memories, total_text_nodes = text_memories_info["nodes"], text_memories_info["total_nodes"]
 
     # Group text memories by cube_id from metadata.user_name
     text_mem_by_cube: dict[str, list] = {}
@@ -450,10 +546,11 @@ def handle_get_memories_dashboard(
             page_size=get_mem_req.page_size,
             filter=get_mem_req.filter,
             memory_type=["ToolSchemaMemory", "ToolTrajectoryMemory"],
+            **totals_kwargs,
         )
         tool_memories, total_tool_nodes = (
             tool_memories_info["nodes"],
-            tool_memories_info["total_nodes"],
+            tool_memories_info.get("total_nodes", 0),
         )
 
         # Group tool memories by cube_id from metadata.user_name
@@ -485,10 +582,11 @@ def handle_get_memories_dashboard(
             page_size=get_mem_req.page_size,
             filter=get_mem_req.filter,
             memory_type=["SkillMemory"],
+            **totals_kwargs,
         )
         skill_memories, total_skill_nodes = (
             skill_memories_info["nodes"],
-            skill_memories_info["total_nodes"],
+            skill_memories_info.get("total_nodes", 0),
         )
 
         # Group skill memories by cube_id from metadata.user_name
@@ -520,10 +618,11 @@ def handle_get_memories_dashboard(
             page_size=get_mem_req.page_size,
             filter=get_mem_req.filter,
             memory_type=["PreferenceMemory"],
+            **totals_kwargs,
         )
         pref_memories, total_preference_nodes = (
             pref_memories_info["nodes"],
-            pref_memories_info["total_nodes"],
+            pref_memories_info.get("total_nodes", 0),
         )
 
         # Group preference memories by cube_id from metadata.user_name
@@ -562,6 +661,19 @@ def handle_get_memories_dashboard(
         "total_skill_nodes": total_skill_nodes,
         "total_preference_nodes": total_preference_nodes,
     }
+    if aggregates is not None:
+        by_type = aggregates["by_memory_type"]
+        statistics.update(
+            {
+                "total_text_nodes": sum(by_type.get(t, 0) for t in text_memory_type),
+                "total_tool_nodes": sum(
+                    by_type.get(t, 0) for t in ("ToolSchemaMemory", "ToolTrajectoryMemory")
+                ),
+                "total_skill_nodes": by_type.get("SkillMemory", 0),
+                "total_preference_nodes": by_type.get("PreferenceMemory", 0),
+                "aggregates": aggregates,
+            }
+        )
     filtered_results["statistics"] = statistics
 
     return GetMemoryResponse(message="Memories retrieved successfully", data=filtered_results)
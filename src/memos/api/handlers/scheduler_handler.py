@@ -20,6 +20,7 @@ from fastapi.responses import StreamingResponse
 from memos.api.product_models import (
     AllStatusResponse,
     AllStatusResponseData,
+    QueueHealthResponse,
     StatusResponse,
     StatusResponseItem,
     TaskQueueData,
@@ -29,6 +30,9 @@ from memos.api.product_models import (
 from memos.log import get_logger
 from memos.mem_scheduler.base_scheduler import BaseScheduler
 from memos.mem_scheduler.optimized_scheduler import OptimizedScheduler
+from memos.mem_scheduler.task_schedule_modules.admission_control import (
+    SchedulerAdmissionController,
+)
 from memos.mem_scheduler.utils.status_tracker import TaskStatusTracker
 
 
@@ -340,6 +344,36 @@ def handle_task_queue_status(
         raise HTTPException(status_code=500, detail="Failed to get scheduler status") from err
 
 
+def handle_queue_health(
+    mem_scheduler: BaseScheduler, user_id: str | None = None
+) -> QueueHealthResponse:
+    """
+    Report scheduler queue backlog and admission control state.
+
+    Works for every queue backend. When admission control is disabled, the backlog is
+    sampled with the default limits so the report still shows how close the queue is
+    to them.
+    """
+    try:
+        controller = getattr(mem_scheduler, "admission_controller", None)
+        if controller is None:
+            queue = getattr(mem_scheduler, "memos_message_queue", None)
+            if queue is None:
+                raise HTTPException(status_code=503, detail="Scheduler queue is not available")
+            controller = SchedulerAdmissionController(memos_message_queue=queue)
+
+        health = controller.get_queue_health(user_id=user_id)
+        health["admission_control_enabled"] = (
+            getattr(mem_scheduler, "admission_controller", None) is not None
+        )
+        return QueueHealthResponse(data=health)
+    except HTTPException:
+        raise
+    except Exception as err:
+        logger.error(f"Failed to get scheduler queue health: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail="Failed to get scheduler queue health") from err
+
+
 def handle_scheduler_wait(
     user_name: str,
     status_tracker: TaskStatusTracker,
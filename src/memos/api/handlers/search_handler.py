@@ -7,12 +7,20 @@ using dependency injection for better modularity and testability.
 
 import copy
 import math
+import os
 
+from collections.abc import Iterator
+from concurrent.futures import as_completed
 from typing import Any
 
+from fastapi import HTTPException
+
 from memos.api.handlers.base_handler import BaseHandler, HandlerDependencies
 from memos.api.handlers.formatters_handler import rerank_knowledge_mem
-from memos.api.product_models import APISearchRequest, SearchResponse
+from memos.api.product_models import APIBatchSearchRequest, APISearchRequest, SearchResponse
+from memos.api.utils.single_flight import SingleFlight, SingleFlightTimeoutError
+from memos.context.context import ContextThreadPoolExecutor
+from memos.embedders.prefetch import prefetch_embeddings, prefetched_embeddings
 from memos.log import get_logger
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
     cosine_similarity_matrix,
@@ -24,6 +32,10 @@ from memos.multi_mem_cube.views import MemCubeView
 
 logger = get_logger(__name__)
 
+# Coalesce identical concurrent searches into one computation
+SEARCH_SINGLE_FLIGHT_ENABLED = os.getenv("SEARCH_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+SEARCH_SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SEARCH_SINGLE_FLIGHT_TIMEOUT_SEC", "60"))
+
 
 class SearchHandler(BaseHandler):
     """
@@ -43,20 +55,51 @@ class SearchHandler(BaseHandler):
         self._validate_dependencies(
             "naive_mem_cube", "mem_scheduler", "searcher", "deepsearch_agent"
         )
+        self.single_flight = (
+            SingleFlight(timeout=SEARCH_SINGLE_FLIGHT_TIMEOUT)
+            if SEARCH_SINGLE_FLIGHT_ENABLED
+            else None
+        )
+
+    @staticmethod
+    def _single_flight_key(search_req: APISearchRequest) -> str:
+        """Key identical searches by user and request, ignoring query whitespace."""
+        payload = search_req.model_dump(mode="json")
+        payload["query"] = " ".join(search_req.query.split())
+        return SingleFlight.make_key(search_req.user_id, payload)
 
     def handle_search_memories(self, search_req: APISearchRequest) -> SearchResponse:
         """
         Main handler for search memories endpoint.
 
         Orchestrates the search process based on the requested search mode,
-        supporting text memory searches.
+        supporting text memory searches. Identical requests that arrive while a
+        search is in flight share its result instead of running the pipeline again.
 
         Args:
             search_req: Search request containing query and parameters
 
         Returns:
             SearchResponse with formatted results
+
+        Raises:
+            HTTPException: 504 if waiting for an identical in-flight search timed out.
         """
+        if self.single_flight is None:
+            return self._search_memories(search_req)
+
+        try:
+            return self.single_flight.do(
+                self._single_flight_key(search_req),
+                lambda: self._search_memories(search_req),
+            )
+        except SingleFlightTimeoutError as e:
+            self.logger.warning(f"[SearchHandler] {e}")
+            raise HTTPException(
+                status_code=504, detail="Timed out waiting for an identical in-flight search"
+            ) from e
+
+    def _search_memories(self, search_req: APISearchRequest) -> SearchResponse:
         self.logger.info(f"[SearchHandler] Search Req is: {search_req}")
 
         # Use deepcopy to avoid modifying the original request object
@@ -100,6 +143,50 @@ class SearchHandler(BaseHandler):
             data=results,
         )
 
+    def handle_search_batch(self, batch_req: APIBatchSearchRequest) -> Iterator[dict[str, Any]]:
+        """
+        Run many searches and yield one result per entry as soon as it completes.
+
+        All entry queries are embedded in a single embedder call up front, and entries
+        run with bounded concurrency through `handle_search_memories`, so identical
+        entries are also coalesced.
+
+        Args:
+            batch_req: Batch of search requests
+
+        Yields:
+            Dicts with the entry index, user id, and either the search data or an error.
+        """
+        entries = batch_req.entries
+        embedder = getattr(self.searcher, "embedder", None) or self.embedder
+        vectors: dict[str, list[float]] = {}
+        if embedder is not None:
+            try:
+                vectors = prefetch_embeddings(embedder, [entry.query for entry in entries])
+            except Exception as e:
+                self.logger.warning(f"[SearchHandler] Batch embedding prefetch failed: {e}")
+
+        with (
+            prefetched_embeddings(embedder, vectors),
+            ContextThreadPoolExecutor(max_workers=batch_req.max_concurrency) as executor,
+        ):
+            futures = {
+                executor.submit(self.handle_search_memories, entry): idx
+                for idx, entry in enumerate(entries)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                result = {"index": idx, "user_id": entries[idx].user_id}
+                try:
+                    response = future.result()
+                    result.update(code=response.code, message=response.message, data=response.data)
+                except HTTPException as e:
+                    result.update(code=e.status_code, message=str(e.detail), data=None)
+                except Exception as e:
+                    self.logger.error(f"[SearchHandler] Batch entry {idx} failed: {e}")
+                    result.update(code=500, message=f"Search failed: {e}", data=None)
+                yield result
+
     @staticmethod
     def _apply_relativity_threshold(results: dict[str, Any], relativity: float) -> dict[str, Any]:
         if relativity <= 0:
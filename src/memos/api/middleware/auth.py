@@ -5,10 +5,15 @@ Validates API keys and extracts user context for downstream handlers.
 Keys are validated against SHA-256 hashes stored in PostgreSQL.
 """
 
+import asyncio
+import atexit
 import hashlib
 import os
+import threading
 import time
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from fastapi import Depends, HTTPException, Request, Security
@@ -27,8 +32,29 @@ AUTH_ENABLED = os.getenv("AUTH_ENABLED", "false").lower() == "true"
 MASTER_KEY_HASH = os.getenv("MASTER_KEY_HASH")  # SHA-256 hash of master key
 INTERNAL_SERVICE_IPS = {"127.0.0.1", "::1", "memos-mcp", "moltbot", "clawdbot"}
 
+# Validation cache: positive results live for AUTH_CACHE_TTL_SEC, unknown or inactive
+# keys for AUTH_NEGATIVE_CACHE_TTL_SEC
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL_SEC", "60"))
+AUTH_NEGATIVE_CACHE_TTL = float(os.getenv("AUTH_NEGATIVE_CACHE_TTL_SEC", "10"))
+AUTH_CACHE_MAX_KEYS = int(os.getenv("AUTH_CACHE_MAX_KEYS", "10000"))
+# Granularity of last_used_at; pending timestamps are flushed in one batch this often
+AUTH_LAST_USED_INTERVAL = float(os.getenv("AUTH_LAST_USED_INTERVAL_SEC", "60"))
+AUTH_POOL_MAX_CONN = int(os.getenv("AUTH_POOL_MAX_CONN", "5"))
+
 # Connection pool for auth queries (lazy init)
 _auth_pool = None
+_auth_executor: ThreadPoolExecutor | None = None
+
+# key_hash -> (cached_until (monotonic), key data or None)
+_key_cache: OrderedDict[str, tuple[float, dict[str, Any] | None]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Write-behind state for last_used_at: key_id -> epoch seconds
+_pending_last_used: dict[str, float] = {}
+_last_used_flushed: dict[str, float] = {}
+_usage_lock = threading.Lock()
+_usage_stop = threading.Event()
+_usage_flusher: threading.Thread | None = None
 
 
 def _get_auth_pool():
@@ -42,7 +68,7 @@ def _get_auth_pool():
 
         _auth_pool = psycopg2.pool.ThreadedConnectionPool(
             minconn=1,
-            maxconn=5,
+            maxconn=AUTH_POOL_MAX_CONN,
             host=os.getenv("POSTGRES_HOST", "postgres"),
             port=int(os.getenv("POSTGRES_PORT", "5432")),
             user=os.getenv("POSTGRES_USER", "memos"),
@@ -81,12 +107,17 @@ def get_key_prefix(key: str) -> str:
     return key[:12] if len(key) >= 12 else key
 
 
-async def lookup_api_key(key_hash: str) -> dict[str, Any] | None:
-    """
-    Look up API key in database.
+def _to_epoch(value: Any) -> float | None:
+    """Convert a DB timestamp (datetime or epoch seconds) to epoch seconds."""
+    if value is None:
+        return None
+    if hasattr(value, "timestamp"):
+        return value.timestamp()
+    return float(value)
 
-    Returns dict with user_name, scopes, etc. or None if not found.
-    """
+
+def _lookup_api_key_sync(key_hash: str) -> dict[str, Any] | None:
+    """Blocking database lookup; runs on the auth thread pool."""
     pool = _get_auth_pool()
     if not pool:
         logger.warning("Auth pool not available, cannot validate key")
@@ -116,31 +147,191 @@ async def lookup_api_key(key_hash: str) -> dict[str, Any] | None:
                 logger.warning(f"Inactive API key used: {key_hash[:16]}...")
                 return None
 
-            # Check expiration
-            if expires_at and expires_at < time.time():
-                logger.warning(f"Expired API key used: {key_hash[:16]}...")
-                return None
-
-            # Update last_used_at
-            cur.execute(
-                "UPDATE api_keys SET last_used_at = NOW() WHERE id = %s",
-                (key_id,),
-            )
-            conn.commit()
-
             return {
                 "id": str(key_id),
                 "user_name": user_name,
                 "scopes": scopes or ["read"],
+                "expires_at": _to_epoch(expires_at),
             }
     except Exception as e:
         logger.error(f"Database error during key lookup: {e}")
-        return None
+        raise
     finally:
         if conn and pool:
             pool.putconn(conn)
 
 
+def _get_auth_executor() -> ThreadPoolExecutor:
+    """Thread pool for blocking auth queries, sized to the connection pool."""
+    global _auth_executor
+    if _auth_executor is None:
+        _auth_executor = ThreadPoolExecutor(
+            max_workers=AUTH_POOL_MAX_CONN, thread_name_prefix="memos-auth"
+        )
+    return _auth_executor
+
+
+def _cache_get(key_hash: str) -> tuple[bool, dict[str, Any] | None]:
+    """Return (hit, key_data) for a cached validation result."""
+    with _cache_lock:
+        entry = _key_cache.get(key_hash)
+        if entry is None:
+            return False, None
+        cached_until, key_data = entry
+        if time.monotonic() >= cached_until:
+            del _key_cache[key_hash]
+            return False, None
+        _key_cache.move_to_end(key_hash)
+        return True, key_data
+
+
+def _cache_put(key_hash: str, key_data: dict[str, Any] | None) -> None:
+    ttl = AUTH_CACHE_TTL if key_data is not None else AUTH_NEGATIVE_CACHE_TTL
+    if ttl <= 0:
+        return
+    with _cache_lock:
+        _key_cache[key_hash] = (time.monotonic() + ttl, key_data)
+        _key_cache.move_to_end(key_hash)
+        while len(_key_cache) > AUTH_CACHE_MAX_KEYS:
+            _key_cache.popitem(last=False)
+
+
+def invalidate_api_key_cache(key_hash: str | None = None, key_id: str | None = None) -> int:
+    """
+    Drop cached validation results, e.g. after a key is revoked.
+
+    Other processes keep their cached entry until AUTH_CACHE_TTL_SEC expires.
+
+    Args:
+        key_hash: Hash of the key to drop.
+        key_id: Database id of the key to drop.
+        If neither is given the whole cache is cleared.
+
+    Returns:
+        Number of entries removed.
+    """
+    with _cache_lock:
+        if key_hash is None and key_id is None:
+            removed = len(_key_cache)
+            _key_cache.clear()
+            return removed
+        targets = {key_hash} if key_hash is not None else set()
+        if key_id is not None:
+            targets.update(
+                cached_hash
+                for cached_hash, (_, key_data) in _key_cache.items()
+                if key_data is not None and key_data["id"] == str(key_id)
+            )
+        removed = 0
+        for target in targets:
+            if _key_cache.pop(target, None) is not None:
+                removed += 1
+        return removed
+
+
+def _record_key_usage(key_id: str) -> None:
+    """Queue a coarse-grained last_used_at update for the write-behind flusher."""
+    now = time.time()
+    with _usage_lock:
+        last_flushed = _last_used_flushed.get(key_id)
+        if last_flushed is not None and now - last_flushed < AUTH_LAST_USED_INTERVAL:
+            return
+        _pending_last_used[key_id] = now
+        _last_used_flushed[key_id] = now
+    _ensure_usage_flusher()
+
+
+def flush_last_used() -> int:
+    """
+    Write pending last_used_at timestamps in one batch.
+
+    Returns:
+        Number of keys updated.
+    """
+    with _usage_lock:
+        if not _pending_last_used:
+            return 0
+        pending = dict(_pending_last_used)
+        _pending_last_used.clear()
+
+    pool = _get_auth_pool()
+    if not pool:
+        return 0
+
+    conn = None
+    try:
+        conn = pool.getconn()
+        with conn.cursor() as cur:
+            cur.executemany(
+                "UPDATE api_keys SET last_used_at = to_timestamp(%s) WHERE id = %s",
+                [(ts, key_id) for key_id, ts in pending.items()],
+            )
+        conn.commit()
+        return len(pending)
+    except Exception as e:
+        logger.warning(f"Failed to flush API key usage for {len(pending)} keys: {e}")
+        with _usage_lock:
+            for key_id, ts in pending.items():
+                _pending_last_used.setdefault(key_id, ts)
+        return 0
+    finally:
+        if conn and pool:
+            pool.putconn(conn)
+
+
+def _usage_flush_loop() -> None:
+    while not _usage_stop.wait(AUTH_LAST_USED_INTERVAL):
+        flush_last_used()
+
+
+def _ensure_usage_flusher() -> None:
+    global _usage_flusher
+    if _usage_flusher is not None and _usage_flusher.is_alive():
+        return
+    with _usage_lock:
+        if _usage_flusher is not None and _usage_flusher.is_alive():
+            return
+        _usage_flusher = threading.Thread(
+            target=_usage_flush_loop, name="memos-auth-usage-flusher", daemon=True
+        )
+        _usage_flusher.start()
+        atexit.register(flush_last_used)
+
+
+async def lookup_api_key(key_hash: str) -> dict[str, Any] | None:
+    """
+    Look up API key, using the validation cache before the database.
+
+    The database query runs on a bounded thread pool so it never blocks the event
+    loop, and last_used_at is updated by a periodic write-behind batch.
+
+    Returns dict with user_name, scopes, etc. or None if not found.
+    """
+    hit, key_data = _cache_get(key_hash)
+    if not hit:
+        loop = asyncio.get_running_loop()
+        try:
+            key_data = await loop.run_in_executor(
+                _get_auth_executor(), _lookup_api_key_sync, key_hash
+            )
+        except Exception:
+            # Do not cache transient database failures
+            return None
+        _cache_put(key_hash, key_data)
+
+    if key_data is None:
+        return None
+
+    # Check expiration
+    expires_at = key_data.get("expires_at")
+    if expires_at and expires_at < time.time():
+        logger.warning(f"Expired API key used: {key_hash[:16]}...")
+        return None
+
+    _record_key_usage(key_data["id"])
+    return {"id": key_data["id"], "user_name": key_data["user_name"], "scopes": key_data["scopes"]}
+
+
 def is_internal_request(request: Request) -> bool:
     """Check if request is from internal service."""
     client_host = request.client.host if request.client else None
@@ -1,16 +1,23 @@
 """
 Redis-based Rate Limiting Middleware.
 
-Implements sliding window rate limiting with Redis.
-Falls back to in-memory limiting if Redis is unavailable.
+Implements GCRA (generic cell rate algorithm, an exact token bucket) rate limiting.
+Each client key stores a single "theoretical arrival time" (TAT) value, and the check
+runs as one Lua script, so a request costs one atomic Redis round-trip and O(1) state.
+Falls back to a bounded in-memory LRU with the same semantics if Redis is unavailable.
+
+Clients that were denied are remembered locally until their next allowed time, so
+requests from obviously over-limit clients are rejected without touching Redis.
 """
 
+import math
 import os
+import threading
 import time
 
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
@@ -25,19 +32,94 @@ logger = memos.log.get_logger(__name__)
 RATE_LIMIT = int(os.getenv("RATE_LIMIT", "100"))  # Requests per window
 RATE_WINDOW = int(os.getenv("RATE_WINDOW_SEC", "60"))  # Window in seconds
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379")
+# Max keys tracked in process (fallback buckets, local denials and per-key stats)
+RATE_LIMIT_MEMORY_MAX_KEYS = int(os.getenv("RATE_LIMIT_MEMORY_MAX_KEYS", "10000"))
+# Reject clients known to be over the limit without asking Redis
+RATE_LIMIT_LOCAL_PREADMISSION = os.getenv("RATE_LIMIT_LOCAL_PREADMISSION", "true").lower() == "true"
+# Seconds to wait before reconnecting to Redis after a failed connection
+REDIS_RETRY_INTERVAL = float(os.getenv("RATE_LIMIT_REDIS_RETRY_SEC", "30"))
+
+# Suffix for GCRA state, distinct from the sorted-set keys of the former sliding window
+GCRA_KEY_SUFFIX = ":gcra"
+
+# Guards against float rounding when converting the bucket level to a request count
+_EPSILON = 1e-9
+
+# KEYS[1]: state key; ARGV: now (s), emission interval (s), burst tolerance (s).
+# Returns {allowed, remaining, seconds}: seconds is the time until the bucket is full
+# again when allowed, and the time until the next request is allowed when denied.
+GCRA_LUA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local emission = tonumber(ARGV[2])
+local tolerance = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + emission
+local allow_at = new_tat - tolerance
+if now < allow_at then
+    return {0, 0, tostring(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+local remaining = math.floor((tolerance - (new_tat - now)) / emission + 1e-9)
+return {1, remaining, tostring(new_tat - now)}
+"""
 
 # Redis client (lazy initialization)
 _redis_client = None
+_redis_retry_at = 0.0
+_gcra_script = None
+
+
+class _BoundedLRU(OrderedDict):
+    """OrderedDict that evicts the least recently used keys beyond `max_keys`."""
+
+    def __init__(self, max_keys: int):
+        super().__init__()
+        self.max_keys = max(1, max_keys)
+
+    def touch(self, key: str, default: Any = None) -> Any:
+        """Return the value for `key` and mark it as recently used."""
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def put(self, key: str, value: Any) -> None:
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.max_keys:
+            self.popitem(last=False)
+
+
+_lock = threading.Lock()
+
+# In-memory fallback (per process): key -> TAT
+_memory_store: _BoundedLRU = _BoundedLRU(RATE_LIMIT_MEMORY_MAX_KEYS)
 
-# In-memory fallback (per process)
-_memory_store: dict[str, list[float]] = defaultdict(list)
+# Local pre-admission: key -> time before which the key is known to be denied
+_denied_until: _BoundedLRU = _BoundedLRU(RATE_LIMIT_MEMORY_MAX_KEYS)
+
+# Per-key metrics: key -> {"allowed", "denied", "local_denied"}
+_key_stats: _BoundedLRU = _BoundedLRU(RATE_LIMIT_MEMORY_MAX_KEYS)
+_global_stats: dict[str, int] = {
+    "allowed": 0,
+    "denied": 0,
+    "local_denied": 0,
+    "redis_checks": 0,
+    "redis_errors": 0,
+    "memory_checks": 0,
+}
 
 
 def _get_redis():
     """Get or create Redis client."""
-    global _redis_client
+    global _redis_client, _redis_retry_at
     if _redis_client is not None:
         return _redis_client
+    if time.time() < _redis_retry_at:
+        return None
 
     try:
         import redis
@@ -47,10 +129,26 @@ def _get_redis():
         logger.info("Rate limiter connected to Redis")
         return _redis_client
     except Exception as e:
+        _redis_client = None
+        _redis_retry_at = time.time() + REDIS_RETRY_INTERVAL
         logger.warning(f"Redis not available for rate limiting: {e}")
         return None
 
 
+def _get_gcra_script(redis_client):
+    """Register the GCRA script once; calls then use EVALSHA and reload it if needed."""
+    global _gcra_script
+    if _gcra_script is None or _gcra_script.registered_client is not redis_client:
+        _gcra_script = redis_client.register_script(GCRA_LUA_SCRIPT)
+    return _gcra_script
+
+
+def _gcra_params() -> tuple[float, float]:
+    """Return (emission interval, burst tolerance) in seconds."""
+    emission = RATE_WINDOW / max(1, RATE_LIMIT)
+    return emission, emission * max(1, RATE_LIMIT)
+
+
 def _get_client_key(request: Request) -> str:
     """
     Generate a unique key for rate limiting.
@@ -74,90 +172,136 @@ def _get_client_key(request: Request) -> str:
     return f"ratelimit:ip:{client_ip}"
 
 
+def _record(key: str, outcome: str) -> None:
+    with _lock:
+        _global_stats[outcome] += 1
+        stats = _key_stats.touch(key)
+        if stats is None:
+            stats = {"allowed": 0, "denied": 0, "local_denied": 0}
+            _key_stats.put(key, stats)
+        stats[outcome] += 1
+
+
+def _to_result(key: str, now: float, allowed: bool, remaining: int, seconds: float):
+    """Convert a GCRA outcome to (allowed, remaining, reset_time) and update local state."""
+    reset_time = math.ceil(now + seconds)
+    if allowed:
+        _record(key, "allowed")
+        return True, max(0, int(remaining)), reset_time
+    if RATE_LIMIT_LOCAL_PREADMISSION:
+        with _lock:
+            _denied_until.put(key, now + seconds)
+    _record(key, "denied")
+    return False, 0, reset_time
+
+
+def _check_local_denial(key: str, now: float) -> tuple[bool, int, int] | None:
+    """Reject keys that are known to be denied until a later time."""
+    if not RATE_LIMIT_LOCAL_PREADMISSION:
+        return None
+    with _lock:
+        denied_until = _denied_until.touch(key)
+        if denied_until is None:
+            return None
+        if now >= denied_until:
+            del _denied_until[key]
+            return None
+    _record(key, "local_denied")
+    return False, 0, math.ceil(denied_until)
+
+
 def _check_rate_limit_redis(key: str) -> tuple[bool, int, int]:
     """
-    Check rate limit using Redis sliding window.
+    Check rate limit using the Redis GCRA script.
 
     Returns:
         (allowed, remaining, reset_time)
     """
+    now = time.time()
+    local_result = _check_local_denial(key, now)
+    if local_result is not None:
+        return local_result
+
     redis_client = _get_redis()
     if not redis_client:
-        return _check_rate_limit_memory(key)
+        return _check_rate_limit_memory(key, now=now)
 
     try:
-        now = time.time()
-        window_start = now - RATE_WINDOW
-
-        pipe = redis_client.pipeline()
-
-        # Remove old entries
-        pipe.zremrangebyscore(key, 0, window_start)
-
-        # Count current entries
-        pipe.zcard(key)
-
-        # Add current request
-        pipe.zadd(key, {str(now): now})
-
-        # Set expiry
-        pipe.expire(key, RATE_WINDOW + 1)
-
-        results = pipe.execute()
-        current_count = results[1]
-
-        remaining = max(0, RATE_LIMIT - current_count - 1)
-        reset_time = int(now + RATE_WINDOW)
-
-        if current_count >= RATE_LIMIT:
-            return False, 0, reset_time
-
-        return True, remaining, reset_time
+        emission, tolerance = _gcra_params()
+        script = _get_gcra_script(redis_client)
+        allowed, remaining, seconds = script(
+            keys=[f"{key}{GCRA_KEY_SUFFIX}"], args=[repr(now), repr(emission), repr(tolerance)]
+        )
+        with _lock:
+            _global_stats["redis_checks"] += 1
+        return _to_result(key, now, bool(int(allowed)), int(remaining), float(seconds))
 
     except Exception as e:
         logger.warning(f"Redis rate limit error: {e}")
-        return _check_rate_limit_memory(key)
+        with _lock:
+            _global_stats["redis_errors"] += 1
+        return _check_rate_limit_memory(key, now=now)
 
 
-def _check_rate_limit_memory(key: str) -> tuple[bool, int, int]:
+def _check_rate_limit_memory(key: str, now: float | None = None) -> tuple[bool, int, int]:
     """
     Fallback in-memory rate limiting.
 
+    Uses the same GCRA as the Redis script. State is bounded to
+    RATE_LIMIT_MEMORY_MAX_KEYS keys, evicting the least recently seen.
+
     Note: This is per-process and not distributed!
     """
-    now = time.time()
-    window_start = now - RATE_WINDOW
+    now = time.time() if now is None else now
+    emission, tolerance = _gcra_params()
 
-    # Clean old entries
-    _memory_store[key] = [t for t in _memory_store[key] if t > window_start]
+    with _lock:
+        _global_stats["memory_checks"] += 1
+        tat = max(_memory_store.touch(key, now), now)
+        new_tat = tat + emission
+        allow_at = new_tat - tolerance
+        if now < allow_at:
+            allowed, remaining, seconds = False, 0, allow_at - now
+        else:
+            _memory_store.put(key, new_tat)
+            remaining = math.floor((tolerance - (new_tat - now)) / emission + _EPSILON)
+            allowed, seconds = True, new_tat - now
 
-    current_count = len(_memory_store[key])
+    return _to_result(key, now, allowed, remaining, seconds)
 
-    if current_count >= RATE_LIMIT:
-        reset_time = (
-            int(min(_memory_store[key]) + RATE_WINDOW)
-            if _memory_store[key]
-            else int(now + RATE_WINDOW)
-        )
-        return False, 0, reset_time
-
-    # Add current request
-    _memory_store[key].append(now)
 
-    remaining = RATE_LIMIT - current_count - 1
-    reset_time = int(now + RATE_WINDOW)
+def get_rate_limit_stats(top_n: int = 10) -> dict[str, Any]:
+    """
+    Summarize rate limiter metrics.
 
-    return True, remaining, reset_time
+    Args:
+        top_n: Number of keys with the most denied requests to include.
+    """
+    with _lock:
+        top_keys = sorted(
+            _key_stats.items(),
+            key=lambda item: item[1]["denied"] + item[1]["local_denied"],
+            reverse=True,
+        )[: max(0, top_n)]
+        return {
+            "limit": RATE_LIMIT,
+            "window_seconds": RATE_WINDOW,
+            "backend": "redis" if _redis_client is not None else "memory",
+            "totals": dict(_global_stats),
+            "tracked_keys": len(_key_stats),
+            "locally_denied_keys": len(_denied_until),
+            "top_denied_keys": {key: dict(stats) for key, stats in top_keys},
+        }
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Rate limiting middleware using sliding window algorithm.
+    Rate limiting middleware using the GCRA (token bucket) algorithm.
 
     Adds headers:
     - X-RateLimit-Limit: Maximum requests per window
     - X-RateLimit-Remaining: Remaining requests
-    - X-RateLimit-Reset: Unix timestamp when the window resets
+    - X-RateLimit-Reset: Unix timestamp when the bucket is full again
 
     Returns 429 Too Many Requests when limit is exceeded.
     """
@@ -181,18 +325,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         allowed, remaining, reset_time = _check_rate_limit_redis(key)
 
         if not allowed:
+            retry_after = max(1, reset_time - int(time.time()))
             logger.warning(f"Rate limit exceeded for {key}")
             return JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Too many requests. Please slow down.",
-                    "retry_after": reset_time - int(time.time()),
+                    "retry_after": retry_after,
                 },
                 headers={
                     "X-RateLimit-Limit": str(RATE_LIMIT),
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Reset": str(reset_time),
-                    "Retry-After": str(reset_time - int(time.time())),
+                    "Retry-After": str(retry_after),
                 },
             )
 
@@ -515,6 +515,23 @@ class APISearchRequest(BaseRequest):
         return self
 
 
+class APIBatchSearchRequest(BaseRequest):
+    """Request model for searching memories with many queries at once."""
+
+    entries: list[APISearchRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Search requests to run; each entry carries its own user, query and options.",
+    )
+    max_concurrency: int = Field(
+        4,
+        ge=1,
+        le=32,
+        description="Maximum number of entries searched concurrently. Default: 4.",
+    )
+
+
 class APIADDRequest(BaseRequest):
     """Request model for creating memories."""
 
@@ -851,6 +868,37 @@ class GetMemoryDashboardRequest(GetMemoryRequest):
     mem_cube_id: str | None = Field(None, description="Cube ID")
 
 
+class ExportMemoryRequest(BaseRequest):
+    """Request model for exporting memories as a cursor-paginated NDJSON stream."""
+
+    mem_cube_id: str = Field(..., description="Cube ID")
+    user_id: str | None = Field(None, description="User ID")
+    memory_type: list[str] | None = Field(
+        None, description="Memory types to export. If None, all memory types are exported."
+    )
+    filter: dict[str, Any] | None = Field(None, description="Filter for the memory")
+    cursor: str | None = Field(
+        None, description="Cursor returned by a previous export to resume from. None starts over."
+    )
+    page_size: int = Field(
+        500, ge=1, le=5000, description="Number of memories fetched from the store per page."
+    )
+    limit: int | None = Field(
+        None,
+        ge=1,
+        description="Maximum number of memories to stream. If None, streams until exhausted.",
+    )
+    fields: list[str] | None = Field(
+        None,
+        description="Metadata fields to keep for each memory; id and memory are always kept. "
+        "If None, all metadata fields are returned.",
+    )
+    embedding_format: Literal["full", "exclude", "base64_f16"] = Field(
+        "exclude", description="How to return embeddings: full, exclude or base64_f16."
+    )
+    gzip: bool = Field(False, description="Gzip-compress the NDJSON stream.")
+
+
 class DeleteMemoryRequest(BaseRequest):
     """Request model for deleting memories."""
 
@@ -1227,6 +1275,12 @@ class TaskQueueResponse(BaseResponse[TaskQueueData]):
     message: str = "Scheduler task queue status retrieved successfully"
 
 
+class QueueHealthResponse(BaseResponse[dict[str, Any]]):
+    """Response model for scheduler queue health (backlog depth, oldest task age, admission)."""
+
+    message: str = "Scheduler queue health retrieved successfully"
+
+
 class TaskSummary(BaseModel):
     """Aggregated counts of tasks by status."""
 
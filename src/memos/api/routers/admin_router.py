@@ -13,7 +13,11 @@ from pydantic import BaseModel, Field
 
 import memos.log
 
-from memos.api.middleware.auth import require_scope, verify_api_key
+from memos.api.middleware.auth import (
+    invalidate_api_key_cache,
+    require_scope,
+    verify_api_key,
+)
 from memos.api.utils.api_keys import (
     create_api_key_in_db,
     generate_master_key,
@@ -167,6 +171,7 @@ def revoke_key(
         try:
             success = revoke_api_key(conn, key_id)
             if success:
+                invalidate_api_key_cache(key_id=key_id)
                 logger.info(f"API key {key_id} revoked by '{auth.get('user_name')}'")
                 return SimpleResponse(message="API key revoked successfully")
             else:
@@ -11,11 +11,14 @@ Comparison with function-based approach:
 - Clear separation of concerns: Router focuses on routing, handlers handle business logic
 """
 
+import json
 import os
 import random as _random
 import socket
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from memos.api import handlers
 from memos.api.handlers.add_handler import AddHandler
@@ -26,6 +29,7 @@ from memos.api.handlers.search_handler import SearchHandler
 from memos.api.product_models import (
     AllStatusResponse,
     APIADDRequest,
+    APIBatchSearchRequest,
     APIChatCompleteRequest,
     APIFeedbackRequest,
     APISearchRequest,
@@ -38,6 +42,7 @@ from memos.api.product_models import (
     DeleteMemoryResponse,
     ExistMemCubeIdRequest,
     ExistMemCubeIdResponse,
+    ExportMemoryRequest,
     GetMemoryDashboardRequest,
     GetMemoryPlaygroundRequest,
     GetMemoryRequest,
@@ -45,6 +50,7 @@ from memos.api.product_models import (
     GetUserNamesByMemoryIdsRequest,
     GetUserNamesByMemoryIdsResponse,
     MemoryResponse,
+    QueueHealthResponse,
     RecoverMemoryByRecordIdRequest,
     RecoverMemoryByRecordIdResponse,
     SearchResponse,
@@ -53,6 +59,7 @@ from memos.api.product_models import (
     SuggestionResponse,
     TaskQueueResponse,
 )
+from memos.api.utils.serialization import EmbeddingFormat, iter_ndjson, memory_json_response
 from memos.log import get_logger
 from memos.mem_scheduler.base_scheduler import BaseScheduler
 from memos.mem_scheduler.utils.status_tracker import TaskStatusTracker
@@ -102,14 +109,35 @@ graph_db = components["graph_db"]
 
 
 @router.post("/search", summary="Search memories", response_model=SearchResponse)
-def search_memories(search_req: APISearchRequest):
+def search_memories(
+    search_req: APISearchRequest,
+    embedding_format: EmbeddingFormat = Query(  # noqa: B008
+        "full", description="How to return embeddings: full, exclude or base64_f16."
+    ),
+):
     """
     Search memories for a specific user.
 
     This endpoint uses the class-based SearchHandler for better code organization.
     """
     search_results = search_handler.handle_search_memories(search_req)
-    return search_results
+    return memory_json_response(search_results, embedding_format)
+
+
+@router.post("/search/batch", summary="Search memories in batch")
+def search_memories_batch(batch_req: APIBatchSearchRequest):
+    """
+    Run many searches in one request.
+
+    Results are streamed as NDJSON, one line per entry in completion order; each line
+    carries the entry `index` so clients can match results to their requests.
+    """
+
+    def _ndjson_lines():
+        for result in search_handler.handle_search_batch(batch_req):
+            yield json.dumps(jsonable_encoder(result), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_ndjson_lines(), media_type="application/x-ndjson")
 
 
 # =============================================================================
@@ -173,6 +201,20 @@ def scheduler_task_queue_status(
     )
 
 
+@router.get(
+    "/scheduler/queue_health",
+    summary="Get scheduler queue backlog and admission control state",
+    response_model=QueueHealthResponse,
+)
+def scheduler_queue_health(
+    user_id: str | None = Query(None, description="Optional user ID to include per-user backlog"),
+):
+    """Get queue depth, oldest task age and admission decisions of the scheduler."""
+    return handlers.scheduler_handler.handle_queue_health(
+        mem_scheduler=mem_scheduler, user_id=user_id
+    )
+
+
 @router.post("/scheduler/wait", summary="Wait until scheduler is idle for a specific user")
 def scheduler_wait(
     user_name: str,
@@ -280,33 +322,67 @@ def get_suggestion_queries(suggestion_req: SuggestionRequest):
 
 
 @router.post("/get_all", summary="Get all memories for user", response_model=MemoryResponse)
-def get_all_memories(memory_req: GetMemoryPlaygroundRequest):
+def get_all_memories(
+    memory_req: GetMemoryPlaygroundRequest,
+    embedding_format: EmbeddingFormat = Query(  # noqa: B008
+        "full", description="How to return embeddings: full, exclude or base64_f16."
+    ),
+    stream: bool = Query(
+        False, description="Stream text memories as NDJSON pages instead of a tree view."
+    ),
+):
     """
     Get all memories or subgraph for a specific user.
 
     If search_query is provided, returns a subgraph based on the query.
+    With `stream`, text memories are streamed as in /export_memory.
     Otherwise, returns all memories of the specified type.
     """
+    mem_cube_id = memory_req.mem_cube_ids[0] if memory_req.mem_cube_ids else memory_req.user_id
+    if stream and not memory_req.search_query and memory_req.memory_type == "text_mem":
+        return export_memories(
+            ExportMemoryRequest(
+                mem_cube_id=mem_cube_id,
+                user_id=memory_req.user_id,
+                embedding_format=embedding_format,
+            )
+        )
     if memory_req.search_query:
-        return handlers.memory_handler.handle_get_subgraph(
+        result = handlers.memory_handler.handle_get_subgraph(
             user_id=memory_req.user_id,
-            mem_cube_id=(
-                memory_req.mem_cube_ids[0] if memory_req.mem_cube_ids else memory_req.user_id
-            ),
+            mem_cube_id=mem_cube_id,
             query=memory_req.search_query,
             top_k=200,
             naive_mem_cube=naive_mem_cube,
             search_type=memory_req.search_type,
         )
     else:
-        return handlers.memory_handler.handle_get_all_memories(
+        result = handlers.memory_handler.handle_get_all_memories(
             user_id=memory_req.user_id,
-            mem_cube_id=(
-                memory_req.mem_cube_ids[0] if memory_req.mem_cube_ids else memory_req.user_id
-            ),
+            mem_cube_id=mem_cube_id,
             memory_type=memory_req.memory_type or "text_mem",
             naive_mem_cube=naive_mem_cube,
         )
+    return memory_json_response(result, embedding_format)
+
+
+@router.post("/export_memory", summary="Export memories for user as NDJSON")
+def export_memories(export_req: ExportMemoryRequest):
+    """
+    Stream a cube's memories as NDJSON, one memory per line.
+
+    Memories are read from the store one cursor page at a time. The last line is
+    {"type": "end", ...} and carries `next_cursor` when the export stopped at `limit`.
+    """
+    headers = {"Content-Encoding": "gzip"} if export_req.gzip else None
+    records = handlers.memory_handler.handle_export_memories(
+        export_req=export_req, naive_mem_cube=naive_mem_cube
+    )
+    return StreamingResponse(
+        iter_ndjson(records, compress=export_req.gzip),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
 
 
 @router.post("/get_memory", summary="Get memories for user", response_model=GetMemoryResponse)
@@ -0,0 +1,167 @@
+"""
+Fast JSON serialization for memory payloads.
+
+Search and get_all responses are large trees of memory dicts. `MemoryJSONResponse`
+converts pydantic models with their compiled pydantic-core serializers
+(`model_dump`) and encodes the result with orjson, skipping FastAPI's response_model
+re-validation and the stdlib JSON encoder. Embeddings can be dropped or encoded
+compactly as base64 float16 on request. Exports that do not fit one response are
+streamed record by record with `iter_ndjson`.
+"""
+
+import base64
+import json
+import zlib
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal, get_args
+
+import numpy as np
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from memos.log import get_logger
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with fastapi[all]
+    orjson = None
+
+logger = get_logger(__name__)
+
+EmbeddingFormat = Literal["full", "exclude", "base64_f16"]
+EMBEDDING_FORMATS = get_args(EmbeddingFormat)
+EMBEDDING_KEY = "embedding"
+
+# Uncompressed bytes buffered before a gzip stream is flushed to the client
+NDJSON_GZIP_FLUSH_BYTES = 64 * 1024
+
+_ORJSON_OPTIONS = (
+    (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+)
+
+
+def encode_embedding_f16(embedding: list[float]) -> dict[str, Any]:
+    """Encode an embedding as little-endian float16 bytes in base64."""
+    data = np.asarray(embedding, dtype="<f2").tobytes()
+    return {
+        "encoding": "base64_f16",
+        "dim": len(embedding),
+        "data": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def decode_embedding_f16(encoded: dict[str, Any]) -> list[float]:
+    """Inverse of `encode_embedding_f16`."""
+    data = base64.b64decode(encoded["data"])
+    return np.frombuffer(data, dtype="<f2").astype(np.float32).tolist()
+
+
+def apply_embedding_format(payload: Any, embedding_format: EmbeddingFormat) -> Any:
+    """
+    Rewrite every non-empty "embedding" value in a dict/list tree in place.
+
+    Args:
+        payload: JSON-like data (dicts, lists and scalars).
+        embedding_format: "full" keeps embeddings, "exclude" replaces them with an
+            empty list, "base64_f16" replaces them with `encode_embedding_f16` output.
+    """
+    if embedding_format not in EMBEDDING_FORMATS:
+        raise ValueError(
+            f"Unknown embedding format {embedding_format!r}, expected one of {EMBEDDING_FORMATS}"
+        )
+    if embedding_format == "full":
+        return payload
+
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == EMBEDDING_KEY and isinstance(value, list | np.ndarray):
+                    if len(value) == 0:
+                        continue
+                    node[key] = [] if embedding_format == "exclude" else encode_embedding_f16(value)
+                elif isinstance(value, dict | list):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, dict | list))
+    return payload
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, set | frozenset | tuple):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content with orjson, falling back to the stdlib encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError as e:
+            # e.g. integers beyond 64 bits
+            logger.debug(f"[MemoryJSONResponse] orjson failed, using json: {e}")
+    return json.dumps(content, default=_default, ensure_ascii=False).encode("utf-8")
+
+
+class MemoryJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, accepting pydantic models as content."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def memory_json_response(
+    content: BaseModel | dict[str, Any], embedding_format: EmbeddingFormat = "full"
+) -> MemoryJSONResponse:
+    """
+    Build a fast JSON response for a memory payload.
+
+    Args:
+        content: Response model (e.g. SearchResponse, MemoryResponse) or plain dict.
+        embedding_format: How to encode embeddings, see `apply_embedding_format`.
+    """
+    payload = content.model_dump() if isinstance(content, BaseModel) else content
+    if embedding_format != "full":
+        if payload is content:
+            payload = json.loads(dumps(payload))
+        apply_embedding_format(payload, embedding_format)
+    return MemoryJSONResponse(content=payload)
+
+
+def iter_ndjson(records: Iterable[Any], compress: bool = False) -> Iterator[bytes]:
+    """
+    Encode `records` as newline-delimited JSON, one line per record.
+
+    Args:
+        records: Records to encode; consumed lazily.
+        compress: Emit a gzip stream instead, flushed every NDJSON_GZIP_FLUSH_BYTES of
+            input so clients can decode the records received so far.
+    """
+    if not compress:
+        for record in records:
+            yield dumps(record) + b"\n"
+        return
+
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    pending = 0
+    for record in records:
+        line = dumps(record) + b"\n"
+        pending += len(line)
+        chunk = compressor.compress(line)
+        if pending >= NDJSON_GZIP_FLUSH_BYTES:
+            chunk += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if chunk:
+            yield chunk
+    yield compressor.flush()
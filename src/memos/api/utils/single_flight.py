@@ -0,0 +1,121 @@
+"""
+Single-flight call coalescing.
+
+Concurrent calls that share a key run the underlying function once: the first caller
+(the leader) computes the result and every caller that arrives while it is in flight
+(the followers) waits for and receives the same result or exception. Nothing is
+cached after the call completes, so a later call with the same key computes again.
+"""
+
+import hashlib
+import json
+import threading
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlightTimeoutError(TimeoutError):
+    """Raised to a follower that waited longer than the timeout for the leader."""
+
+
+class _Call:
+    __slots__ = ("done", "error", "followers", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group.
+
+    Results are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, timeout: float | None = None):
+        """
+        Args:
+            timeout: Default number of seconds a follower waits for the leader before
+                raising SingleFlightTimeoutError; None waits indefinitely.
+        """
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.stats: dict[str, int] = {"leaders": 0, "followers": 0, "timeouts": 0, "errors": 0}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable key from JSON-serializable parts."""
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: str, fn: Callable[[], T], timeout: float | None = None) -> T:
+        """
+        Run `fn` once for all concurrent callers with the same `key`.
+
+        Args:
+            key: Coalescing key.
+            fn: Zero-argument callable computing the result.
+            timeout: Per-call override of the follower wait timeout.
+
+        Returns:
+            The result of `fn`, shared among concurrent callers.
+
+        Raises:
+            Whatever `fn` raised, for the leader and all followers.
+            SingleFlightTimeoutError: If a follower waited longer than the timeout.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self.stats["leaders"] += 1
+            else:
+                call.followers += 1
+                self.stats["followers"] += 1
+
+        if not is_leader:
+            wait_timeout = self.timeout if timeout is None else timeout
+            if not call.done.wait(wait_timeout):
+                with self._lock:
+                    self.stats["timeouts"] += 1
+                raise SingleFlightTimeoutError(
+                    f"Timed out after {wait_timeout}s waiting for in-flight call {key[:16]}"
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+            if call.followers:
+                logger.info(
+                    f"[SingleFlight] Shared call {key[:16]} with {call.followers} followers"
+                )
@@ -104,6 +104,17 @@ class HFLLMConfig(BaseLLMConfig):
         default=True,
         description="Apply generation template for the conversation",
     )
+    continuous_batching: bool = Field(
+        default=False,
+        description="Decode concurrent requests together in a shared continuous-batching loop",
+    )
+    max_batch_size: int = Field(
+        default=8, description="Sequences decoded together per step with continuous batching"
+    )
+    prefix_cache_max_bytes: int = Field(
+        default=0,
+        description="Byte budget of the radix prefix KV cache shared across prompts (0 disables)",
+    )
 
 
 class VLLMLLMConfig(BaseLLMConfig):
@@ -119,11 +130,62 @@ class VLLMLLMConfig(BaseLLMConfig):
     extra_body: Any = Field(default=None, description="Extra options for API")
 
 
+class LLMCacheConfig(BaseConfig):
+    """Configuration for caching responses of deterministic LLM calls."""
+
+    enabled: bool = Field(default=True, description="Whether responses are cached")
+    max_entries: int = Field(default=2048, description="Entries kept in the in-memory LRU tier")
+    ttl_seconds: float | None = Field(
+        default=7 * 24 * 3600, description="Seconds a cached response stays valid (None = forever)"
+    )
+    sqlite_path: str | None = Field(
+        default=None,
+        description="SQLite file for the persistent tier; None keeps the cache in memory only",
+    )
+    cache_sampled: bool = Field(
+        default=False,
+        description="Also cache calls with temperature > 0 (otherwise only when cache=True is passed)",
+    )
+
+
+class LLMGovernorConfig(BaseConfig):
+    """Process-wide admission control for calls to one model."""
+
+    enabled: bool = Field(default=True, description="Whether calls go through the governor")
+    max_concurrency: int = Field(default=16, description="Maximum in-flight calls per model")
+    requests_per_minute: int | None = Field(
+        default=None, description="Provider RPM limit (None = unlimited)"
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        description="Provider TPM limit on prompt + completion tokens (None = unlimited)",
+    )
+    expected_completion_tokens: int = Field(
+        default=512,
+        description="Completion tokens reserved per call before the real count is known",
+    )
+    max_queue_wait_seconds: float | None = Field(
+        default=300, description="How long a call may wait for admission (None = forever)"
+    )
+    max_retries: int = Field(default=3, description="Retries of calls rejected with HTTP 429")
+    backoff_base_seconds: float = Field(
+        default=1.0, description="Cooldown after the first 429, doubled on each further 429"
+    )
+    backoff_max_seconds: float = Field(default=60.0, description="Upper bound of the cooldown")
+
+
 class LLMConfigFactory(BaseConfig):
     """Factory class for creating LLM configurations."""
 
     backend: str = Field(..., description="Backend for LLM")
     config: dict[str, Any] = Field(..., description="Configuration for the LLM backend")
+    cache: LLMCacheConfig | None = Field(
+        default=None, description="Response cache wrapped around the LLM (disabled if None)"
+    )
+    governor: LLMGovernorConfig | None = Field(
+        default=None,
+        description="Concurrency/rate governor shared by all LLMs of the model (disabled if None)",
+    )
 
     backend_to_class: ClassVar[dict[str, Any]] = {
         "openai": OpenAILLMConfig,
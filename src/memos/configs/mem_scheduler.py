@@ -12,16 +12,26 @@ from memos.mem_scheduler.schemas.general_schemas import (
     BASE_DIR,
     DEFAULT_ACT_MEM_DUMP_PATH,
     DEFAULT_ACTIVATION_MEM_MONITOR_SIZE_LIMIT,
+    DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS,
+    DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_POLICY,
+    DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
     DEFAULT_CONSUME_BATCH,
     DEFAULT_CONSUME_INTERVAL_SECONDS,
     DEFAULT_CONTEXT_WINDOW_SIZE,
+    DEFAULT_ENABLE_ADMISSION_CONTROL,
+    DEFAULT_ENABLE_MESSAGE_COALESCING,
     DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE,
+    DEFAULT_MESSAGE_COALESCE_MAX_BATCH,
+    DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS,
     DEFAULT_MULTI_TASK_RUNNING_TIMEOUT,
     DEFAULT_SCHEDULER_RETRIEVER_BATCH_SIZE,
     DEFAULT_SCHEDULER_RETRIEVER_RETRIES,
     DEFAULT_THREAD_POOL_MAX_WORKERS,
     DEFAULT_TOP_K,
     DEFAULT_USE_REDIS_QUEUE,
+    DEFAULT_USE_SQLITE_QUEUE,
     DEFAULT_WORKING_MEM_MONITOR_SIZE_LIMIT,
 )
 
@@ -60,6 +70,15 @@ class BaseSchedulerConfig(BaseConfig):
         default=DEFAULT_USE_REDIS_QUEUE,
         description="Whether to use Redis queue instead of local memory queue",
     )
+    # SQLite queue configuration (ignored when use_redis_queue is enabled)
+    use_sqlite_queue: bool = Field(
+        default=DEFAULT_USE_SQLITE_QUEUE,
+        description="Whether to use a durable SQLite WAL queue instead of local memory queue",
+    )
+    sqlite_queue_path: str | None = Field(
+        default=None,
+        description="Path to the SQLite queue database file. If None, uses the default scheduler_task_queue.db",
+    )
     redis_config: dict[str, Any] = Field(
         default_factory=lambda: {"host": "localhost", "port": 6379, "db": 0},
         description="Redis connection configuration",
@@ -72,6 +91,58 @@ class BaseSchedulerConfig(BaseConfig):
         default=DEFAULT_MULTI_TASK_RUNNING_TIMEOUT,
         description="Default timeout for multi-task running operations in seconds",
     )
+    # Message coalescing configuration
+    enable_message_coalescing: bool = Field(
+        default=DEFAULT_ENABLE_MESSAGE_COALESCING,
+        description="Whether to merge redundant messages per user/cube/label before dispatching",
+    )
+    message_coalesce_window_seconds: float = Field(
+        default=DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS,
+        ge=0,
+        description=f"How long fetched messages are buffered for coalescing (default: {DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS})",
+    )
+    message_coalesce_max_batch: int = Field(
+        default=DEFAULT_MESSAGE_COALESCE_MAX_BATCH,
+        gt=0,
+        description=f"Release a coalescing group once it holds this many messages (default: {DEFAULT_MESSAGE_COALESCE_MAX_BATCH})",
+    )
+    # Admission control configuration
+    enable_admission_control: bool = Field(
+        default=DEFAULT_ENABLE_ADMISSION_CONTROL,
+        description="Whether API requests are throttled based on the scheduler queue backlog",
+    )
+    admission_policy: str = Field(
+        default=DEFAULT_ADMISSION_POLICY,
+        description="Action taken when the backlog exceeds a limit: 'reject', 'degrade' or 'shed'",
+    )
+    admission_max_user_queue_depth: int = Field(
+        default=DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH,
+        description="Max queued tasks per user before admission control kicks in (<= 0 disables)",
+    )
+    admission_max_global_queue_depth: int = Field(
+        default=DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH,
+        description="Max queued tasks overall before admission control kicks in (<= 0 disables)",
+    )
+    admission_max_oldest_age_seconds: float = Field(
+        default=DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS,
+        description="Max age of the oldest queued task in seconds (<= 0 disables)",
+    )
+    admission_shed_labels: list[str] | None = Field(
+        default=None,
+        description="Task labels dropped under the 'shed' policy (default: maintenance labels)",
+    )
+    admission_retry_after_seconds: int = Field(
+        default=DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
+        gt=0,
+        description="Base Retry-After value returned with rejected requests",
+    )
+
+    @field_validator("admission_policy")
+    @classmethod
+    def validate_admission_policy(cls, value: str) -> str:
+        if value not in ("reject", "degrade", "shed"):
+            raise ValueError("admission_policy must be one of 'reject', 'degrade', 'shed'")
+        return value
 
 
 class GeneralSchedulerConfig(BaseSchedulerConfig):
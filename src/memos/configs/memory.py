@@ -1,4 +1,4 @@
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field, field_validator, model_validator
 
@@ -54,6 +54,19 @@ class KVCacheMemoryConfig(BaseActMemoryConfig):
         default_factory=LLMConfigFactory,
         description="LLM configuration for the memory extractor",
     )
+    max_resident_bytes: int = Field(
+        0,
+        description="RAM budget for KV cache tensors; least recently used items are "
+        "quantized or spilled to disk beyond it (0 disables the budget)",
+    )
+    cold_storage_dtype: Literal["int8", "fp8"] | None = Field(
+        None,
+        description="Quantized dtype for cold items kept in RAM (None spills them at full precision)",
+    )
+    spill_dir: str | None = Field(
+        None,
+        description="Directory for KV cache items spilled to disk (defaults to a temporary directory)",
+    )
 
     @field_validator("extractor_llm")
     @classmethod
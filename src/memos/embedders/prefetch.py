@@ -0,0 +1,52 @@
+"""
+Request-scoped embedding prefetch.
+
+Batch callers (e.g. the batch search endpoint) embed all of their texts in a single
+embedder call and publish the vectors in the request context. `embed_with_prefetch`
+then serves those texts from the prefetched vectors and only embeds the rest. The
+vectors travel with the request context, so they are visible in worker threads
+started through `ContextThreadPoolExecutor` / `ContextThread`.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from memos.context.context import RequestContext, get_current_context, set_request_context
+
+
+PREFETCH_CONTEXT_KEY = "prefetched_embeddings"
+
+
+def prefetch_embeddings(embedder: Any, texts: list[str]) -> dict[str, list[float]]:
+    """Embed the unique `texts` in one embedder call."""
+    unique_texts = list(dict.fromkeys(t for t in texts if t))
+    if not unique_texts:
+        return {}
+    return dict(zip(unique_texts, embedder.embed(unique_texts), strict=True))
+
+
+@contextmanager
+def prefetched_embeddings(embedder: Any, vectors: dict[str, list[float]]) -> Iterator[None]:
+    """Publish `vectors` produced by `embedder` in the current request context."""
+    previous = get_current_context()
+    context = get_current_context() or RequestContext()
+    context.set(PREFETCH_CONTEXT_KEY, {"embedder_id": id(embedder), "vectors": vectors})
+    set_request_context(context)
+    try:
+        yield
+    finally:
+        set_request_context(previous)
+
+
+def embed_with_prefetch(embedder: Any, texts: list[str]) -> list[list[float]]:
+    """Embed `texts`, reusing vectors prefetched for the same embedder."""
+    context = get_current_context()
+    prefetched = context.get(PREFETCH_CONTEXT_KEY) if context else None
+    if not prefetched or prefetched["embedder_id"] != id(embedder):
+        return embedder.embed(texts)
+
+    vectors = prefetched["vectors"]
+    missing = list(dict.fromkeys(t for t in texts if t not in vectors))
+    computed = dict(zip(missing, embedder.embed(missing), strict=True)) if missing else {}
+    return [vectors[t] if t in vectors else computed[t] for t in texts]
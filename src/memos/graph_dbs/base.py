@@ -1,3 +1,5 @@
+import base64
+import json
 import re
 
 from abc import ABC, abstractmethod
@@ -8,6 +10,24 @@ from typing import Any, Literal
 _VALID_FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
 
+def encode_page_cursor(position: dict[str, Any]) -> str:
+    """Encode a pagination position as an opaque URL-safe cursor."""
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_page_cursor(cursor: str) -> dict[str, Any]:
+    """Inverse of `encode_page_cursor`; raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    if not isinstance(position, dict):
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return position
+
+
 class BaseGraphDB(ABC):
     """
     Abstract base class for a graph database interface used in a memory-augmented RAG system.
@@ -264,6 +284,58 @@ class BaseGraphDB(ABC):
             A dictionary containing all nodes and edges.
         """
 
+    def export_nodes_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 500,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        include_embedding: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export one page of nodes ordered by (created_at DESC, id DESC).
+
+        Pass the returned `next_cursor` back to get the following page. Backends with
+        native support seek to the cursor position (keyset pagination), so the cost of a
+        page does not grow with its depth; this default falls back to `export_graph`
+        and an offset cursor, and refuses `filter`, which `export_graph` may ignore.
+
+        Args:
+            cursor: Opaque cursor from a previous page, None for the first page.
+            page_size: Maximum number of nodes in the page.
+            memory_type, status, filter, include_embedding: Same as `export_graph`.
+            **kwargs: Backend specific arguments of `export_graph`, e.g. user_name.
+
+        Returns:
+            {"nodes": [...], "next_cursor": str | None}, next_cursor is None on the
+            last page.
+        """
+        if filter:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support filtered paged export"
+            )
+        page_size = max(1, page_size)
+        offset = int(decode_page_cursor(cursor).get("offset", 0)) if cursor else 0
+        # Fetch everything up to the end of the page and slice locally, which is correct
+        # whether or not the backend honours page/page_size
+        result = self.export_graph(
+            page=1,
+            page_size=offset + page_size,
+            memory_type=memory_type,
+            status=status,
+            filter=filter,
+            include_embedding=include_embedding,
+            **kwargs,
+        )
+        nodes = result.get("nodes", [])[offset : offset + page_size]
+        has_more = len(nodes) == page_size
+        return {
+            "nodes": nodes,
+            "next_cursor": encode_page_cursor({"offset": offset + page_size}) if has_more else None,
+        }
+
     @abstractmethod
     def import_graph(self, data: dict[str, Any]) -> None:
         """
@@ -1,4 +1,5 @@
 import json
+import re
 import traceback
 
 from contextlib import suppress
@@ -10,7 +11,7 @@ import numpy as np
 
 from memos.configs.graph_db import NebulaGraphDBConfig
 from memos.dependency import require_python_package
-from memos.graph_dbs.base import BaseGraphDB
+from memos.graph_dbs.base import BaseGraphDB, decode_page_cursor, encode_page_cursor
 from memos.log import get_logger
 from memos.utils import timed
 
@@ -52,6 +53,10 @@ def _compose_node(item: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
     return node_id, memory, metadata
 
 
+# Metadata field names that may be interpolated into GQL
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
 @timed
 def _escape_str(value: str) -> str:
     out = []
@@ -1228,43 +1233,14 @@ class NebulaGraphDB(BaseGraphDB):
         edge_query += f' WHERE r.user_name = "{user_name}"'
 
         try:
-            if include_embedding:
-                return_fields = "n"
-            else:
-                return_fields = ",".join(
-                    [
-                        "n.id AS id",
-                        "n.memory AS memory",
-                        "n.user_name AS user_name",
-                        "n.user_id AS user_id",
-                        "n.session_id AS session_id",
-                        "n.status AS status",
-                        "n.key AS key",
-                        "n.confidence AS confidence",
-                        "n.tags AS tags",
-                        "n.created_at AS created_at",
-                        "n.updated_at AS updated_at",
-                        "n.memory_type AS memory_type",
-                        "n.sources AS sources",
-                        "n.source AS source",
-                        "n.node_type AS node_type",
-                        "n.visibility AS visibility",
-                        "n.usage AS usage",
-                        "n.background AS background",
-                    ]
-                )
-
+            return_fields = self._export_return_fields(include_embedding)
             full_node_query = f"{node_query} RETURN {return_fields}"
             node_result = self.execute_query(full_node_query, timeout=20)
-            nodes = []
             logger.debug(f"Debugging: {node_result}")
-            for row in node_result:
-                if include_embedding:
-                    props = row.values()[0].as_node().get_properties()
-                else:
-                    props = {k: v.value for k, v in row.items()}
-                node = self._parse_node(props)
-                nodes.append(node)
+            nodes = [
+                self._parse_node(self._export_row_props(row, include_embedding))
+                for row in node_result
+            ]
         except Exception as e:
             raise RuntimeError(f"[EXPORT GRAPH - NODES] Exception: {e}") from e
 
@@ -1284,6 +1260,149 @@ class NebulaGraphDB(BaseGraphDB):
 
         return {"nodes": nodes, "edges": edges}
 
+    @timed
+    def export_nodes_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 500,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        include_embedding: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export one page of nodes with keyset pagination on (created_at DESC, id DESC).
+
+        See BaseGraphDB.export_nodes_page. `filter` supports the {"and"/"or": [...]}
+        grammar with equality and gt/lt/gte/lte/in/contains/like operators; anything
+        else raises ValueError rather than being ignored.
+        """
+        user_name = kwargs.get("user_name") or self.config.user_name
+        page_size = max(1, page_size)
+        where_clauses = [f'n.user_name = "{_escape_str(user_name)}"']
+        if memory_type:
+            where_clauses.append(f"n.memory_type IN {self._format_value(list(memory_type))}")
+        if status is None:
+            where_clauses.append('(n.status IS NULL OR n.status <> "deleted")')
+        elif status:
+            where_clauses.append(f"n.status IN {self._format_value(list(status))}")
+        where_clauses.extend(self._build_filter_conditions_gql(filter))
+
+        if cursor:
+            position = decode_page_cursor(cursor)
+            cursor_id = self._format_value(position["id"])
+            if position.get("created_at") is None:
+                where_clauses.append(f"(n.created_at IS NULL AND n.id < {cursor_id})")
+            else:
+                # created_at is stored as an ISO string, so it compares lexically
+                cursor_created_at = self._format_value(position["created_at"])
+                where_clauses.append(
+                    f"(n.created_at < {cursor_created_at} OR "
+                    f"(n.created_at = {cursor_created_at} AND n.id < {cursor_id}) OR "
+                    "n.created_at IS NULL)"
+                )
+
+        query = (
+            f"MATCH (n@Memory) WHERE {' AND '.join(where_clauses)} "
+            f"RETURN {self._export_return_fields(include_embedding)} "
+            f"ORDER BY n.created_at DESC, n.id DESC LIMIT {page_size + 1}"
+        )
+        try:
+            rows = [
+                self._export_row_props(row, include_embedding)
+                for row in self.execute_query(query, timeout=20)
+            ]
+        except Exception as e:
+            raise RuntimeError(f"[EXPORT NODES PAGE] Exception: {e}") from e
+
+        nodes = [self._parse_node(dict(props)) for props in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            # The raw stored created_at, not the normalized one in the parsed node
+            last = {k: self._parse_value(v) for k, v in rows[page_size - 1].items()}
+            next_cursor = encode_page_cursor(
+                {"created_at": last.get("created_at"), "id": last["id"]}
+            )
+        return {"nodes": nodes, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _export_return_fields(include_embedding: bool) -> str:
+        if include_embedding:
+            return "n"
+        return ",".join(
+            [
+                "n.id AS id",
+                "n.memory AS memory",
+                "n.user_name AS user_name",
+                "n.user_id AS user_id",
+                "n.session_id AS session_id",
+                "n.status AS status",
+                "n.key AS key",
+                "n.confidence AS confidence",
+                "n.tags AS tags",
+                "n.created_at AS created_at",
+                "n.updated_at AS updated_at",
+                "n.memory_type AS memory_type",
+                "n.sources AS sources",
+                "n.source AS source",
+                "n.node_type AS node_type",
+                "n.visibility AS visibility",
+                "n.usage AS usage",
+                "n.background AS background",
+            ]
+        )
+
+    @staticmethod
+    def _export_row_props(row: Any, include_embedding: bool) -> dict[str, Any]:
+        if include_embedding:
+            return row.values()[0].as_node().get_properties()
+        return {k: v.value for k, v in row.items()}
+
+    def _build_filter_conditions_gql(self, filter: dict | None) -> list[str]:
+        """Translate a metadata filter into GQL WHERE conditions on node `n`."""
+        if not filter:
+            return []
+
+        comparisons = {"gt": ">", "lt": "<", "gte": ">=", "lte": "<="}
+
+        def build(condition: dict) -> str:
+            parts = []
+            for key, value in condition.items():
+                if not _FIELD_NAME.match(key):
+                    raise ValueError(f"Invalid filter field {key!r}")
+                ops = value.items() if isinstance(value, dict) else [("eq", value)]
+                for op, op_value in ops:
+                    if op in comparisons:
+                        parts.append(f"n.{key} {comparisons[op]} {self._format_value(op_value)}")
+                    elif op == "in":
+                        if not isinstance(op_value, list):
+                            raise ValueError(
+                                f"in operator only supports array format, got {op_value!r} "
+                                f"for {key!r}"
+                            )
+                        parts.append(f"n.{key} IN {self._format_value(op_value)}")
+                    elif op == "contains":
+                        parts.append(f"{self._format_value(op_value)} IN n.{key}")
+                    elif op == "like":
+                        parts.append(f"n.{key} CONTAINS {self._format_value(str(op_value))}")
+                    elif op == "eq":
+                        parts.append(f"n.{key} = {self._format_value(op_value)}")
+                    else:
+                        raise ValueError(f"Unsupported filter operator {op!r} for {key!r}")
+            return " AND ".join(parts)
+
+        if "or" in filter or "and" in filter:
+            logic = "or" if "or" in filter else "and"
+            clauses = [
+                f"({clause})"
+                for condition in filter[logic]
+                if isinstance(condition, dict) and (clause := build(condition))
+            ]
+            return [f"({f' {logic.upper()} '.join(clauses)})"] if clauses else []
+        clause = build(filter)
+        return [f"({clause})"] if clause else []
+
     @timed
     def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
         """
@@ -6,7 +6,7 @@ from typing import Any, Literal
 
 from memos.configs.graph_db import Neo4jGraphDBConfig
 from memos.dependency import require_python_package
-from memos.graph_dbs.base import BaseGraphDB
+from memos.graph_dbs.base import BaseGraphDB, decode_page_cursor, encode_page_cursor
 from memos.log import get_logger
 
 
@@ -1258,33 +1258,10 @@ class Neo4jGraphDB(BaseGraphDB):
 
         with self.driver.session(database=self.db_name) as session:
             # Build WHERE conditions for nodes
-            node_where_clauses = []
-            params: dict[str, Any] = {}
-
-            if not self.config.use_multi_db and (self.config.user_name or user_name):
-                node_where_clauses.append("n.user_name = $user_name")
-                params["user_name"] = user_name
-
-            if memory_type and isinstance(memory_type, list) and len(memory_type) > 0:
-                node_where_clauses.append("n.memory_type IN $memory_type")
-                params["memory_type"] = memory_type
-
-            if status is None:
-                node_where_clauses.append("n.status <> 'deleted'")
-            elif isinstance(status, list) and len(status) > 0:
-                node_where_clauses.append("n.status IN $status")
-                params["status"] = status
-
-            # Build filter conditions using common method (same as get_all_memory_items)
-            filter_conditions, filter_params = self._build_filter_conditions_cypher(
-                filter=filter,
-                param_counter_start=0,
-                node_alias="n",
+            node_where_clauses, params, filter_conditions = self._build_export_node_where(
+                user_name=user_name, memory_type=memory_type, status=status, filter=filter
             )
             logger.info(f"export_graph filter_conditions: {filter_conditions}")
-            node_where_clauses.extend(filter_conditions)
-            if filter_params:
-                params.update(filter_params)
 
             node_base_query = "MATCH (n:Memory)"
             if node_where_clauses:
@@ -1360,6 +1337,108 @@ class Neo4jGraphDB(BaseGraphDB):
                 "total_edges": total_edges,
             }
 
+    def _build_export_node_where(
+        self,
+        user_name: str | None,
+        memory_type: list[str] | None,
+        status: list[str] | None,
+        filter: dict | None,
+    ) -> tuple[list[str], dict[str, Any], list[str]]:
+        """
+        Build the node WHERE clauses shared by export_graph and export_nodes_page.
+
+        Returns:
+            (where clauses, query params, the subset of clauses built from `filter`)
+        """
+        node_where_clauses = []
+        params: dict[str, Any] = {}
+
+        if not self.config.use_multi_db and (self.config.user_name or user_name):
+            node_where_clauses.append("n.user_name = $user_name")
+            params["user_name"] = user_name
+
+        if memory_type and isinstance(memory_type, list) and len(memory_type) > 0:
+            node_where_clauses.append("n.memory_type IN $memory_type")
+            params["memory_type"] = memory_type
+
+        if status is None:
+            node_where_clauses.append("n.status <> 'deleted'")
+        elif isinstance(status, list) and len(status) > 0:
+            node_where_clauses.append("n.status IN $status")
+            params["status"] = status
+
+        # Build filter conditions using common method (same as get_all_memory_items)
+        filter_conditions, filter_params = self._build_filter_conditions_cypher(
+            filter=filter,
+            param_counter_start=0,
+            node_alias="n",
+        )
+        node_where_clauses.extend(filter_conditions)
+        if filter_params:
+            params.update(filter_params)
+        return node_where_clauses, params, filter_conditions
+
+    def export_nodes_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 500,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        include_embedding: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export one page of nodes with keyset pagination on (created_at DESC, id DESC).
+
+        See BaseGraphDB.export_nodes_page. Unlike export_graph, no totals or edges are
+        computed and the page is located by seeking past the cursor instead of SKIP.
+        """
+        user_name = kwargs.get("user_name") if kwargs.get("user_name") else self.config.user_name
+        page_size = max(1, page_size)
+        where_clauses, params, _ = self._build_export_node_where(
+            user_name=user_name, memory_type=memory_type, status=status, filter=filter
+        )
+
+        if cursor:
+            position = decode_page_cursor(cursor)
+            params["cursor_id"] = position["id"]
+            if position.get("created_at") is None:
+                # Nodes without created_at sort first in DESC order
+                where_clauses.append(
+                    "((n.created_at IS NULL AND n.id < $cursor_id) OR n.created_at IS NOT NULL)"
+                )
+            else:
+                params["cursor_created_at"] = position["created_at"]
+                where_clauses.append(
+                    "(n.created_at < datetime($cursor_created_at) OR "
+                    "(n.created_at = datetime($cursor_created_at) AND n.id < $cursor_id))"
+                )
+
+        query = "MATCH (n:Memory)"
+        if where_clauses:
+            query += " WHERE " + " AND ".join(where_clauses)
+        query += f" RETURN n ORDER BY n.created_at DESC, n.id DESC LIMIT {page_size + 1}"
+
+        with self.driver.session(database=self.db_name) as session:
+            records = list(session.run(query, params))
+
+        nodes = []
+        for record in records[:page_size]:
+            node_dict = dict(record["n"])
+            if not include_embedding:
+                for key in ("embedding", "embedding_1024", "embedding_3072", "embedding_768"):
+                    node_dict.pop(key, None)
+            nodes.append(self._parse_node(node_dict))
+
+        next_cursor = None
+        if len(records) > page_size and nodes:
+            last = nodes[-1]
+            next_cursor = encode_page_cursor(
+                {"created_at": last["metadata"].get("created_at"), "id": last["id"]}
+            )
+        return {"nodes": nodes, "next_cursor": next_cursor}
+
     def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
         """
         Import the entire graph from a serialized dictionary.
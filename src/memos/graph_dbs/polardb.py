@@ -12,7 +12,7 @@ import numpy as np
 
 from memos.configs.graph_db import PolarDBGraphDBConfig
 from memos.dependency import require_python_package
-from memos.graph_dbs.base import BaseGraphDB
+from memos.graph_dbs.base import BaseGraphDB, decode_page_cursor, encode_page_cursor
 from memos.log import get_logger
 from memos.utils import timed
 
@@ -2312,46 +2312,6 @@ class PolarDBGraphDB(BaseGraphDB):
         )
         user_id = user_id if user_id else self._get_config_value("user_id")
 
-        extracted_object_type: str | None = None
-        extracted_mem_cube_id: str | None = None
-
-        def _extract_special_filter_values(filter_obj):
-            nonlocal extracted_object_type, extracted_mem_cube_id
-
-            if isinstance(filter_obj, dict):
-                if "and" in filter_obj and isinstance(filter_obj["and"], list):
-                    cleaned_items = []
-                    for item in filter_obj["and"]:
-                        cleaned_item = _extract_special_filter_values(item)
-                        if cleaned_item not in (None, {}, []):
-                            cleaned_items.append(cleaned_item)
-                    return {"and": cleaned_items} if cleaned_items else None
-
-                if "or" in filter_obj and isinstance(filter_obj["or"], list):
-                    cleaned_items = []
-                    for item in filter_obj["or"]:
-                        cleaned_item = _extract_special_filter_values(item)
-                        if cleaned_item not in (None, {}, []):
-                            cleaned_items.append(cleaned_item)
-                    return {"or": cleaned_items} if cleaned_items else None
-
-                cleaned_dict = {}
-                for key, value in filter_obj.items():
-                    if key == "object_type" and isinstance(value, str):
-                        if extracted_object_type is None:
-                            extracted_object_type = value
-                        continue
-                    if key == "mem_cube_id" and isinstance(value, str):
-                        if extracted_mem_cube_id is None:
-                            extracted_mem_cube_id = value
-                        continue
-                    cleaned_dict[key] = value
-                return cleaned_dict if cleaned_dict else None
-
-            return filter_obj
-
-        filter_for_sql = _extract_special_filter_values(filter)
-
         total_nodes = 0
         total_edges = 0
 
@@ -2366,64 +2326,14 @@ class PolarDBGraphDB(BaseGraphDB):
         else:
             offset = None
 
-        where_conditions = []
-        has_object_type_filter = (
-            isinstance(extracted_object_type, str)
-            and isinstance(extracted_mem_cube_id, str)
-            and extracted_mem_cube_id.strip() != ""
+        where_conditions = self._build_export_where_conditions(
+            user_name=user_name,
+            user_id=user_id,
+            filter=filter,
+            memory_type=memory_type,
+            status=status,
         )
 
-        if user_name and not has_object_type_filter:
-            where_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{user_name}\"'::agtype"
-            )
-
-        if has_object_type_filter:
-            object_type_value = extracted_object_type.strip().lower()
-            escaped_mem_cube_id = extracted_mem_cube_id.replace("'", "''")
-            if object_type_value == "user":
-                where_conditions.append(
-                    f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) <> '\"{escaped_mem_cube_id}\"'::agtype"
-                )
-            elif object_type_value == "public":
-                where_conditions.append(
-                    f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{escaped_mem_cube_id}\"'::agtype"
-                )
-
-        if user_id:
-            where_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"user_id\"'::agtype) = '\"{user_id}\"'::agtype"
-            )
-
-        if memory_type and isinstance(memory_type, list) and len(memory_type) > 0:
-            memory_type_values = []
-            for mt in memory_type:
-                escaped_memory_type = str(mt).replace("'", "''")
-                memory_type_values.append(f"'\"{escaped_memory_type}\"'::agtype")
-            memory_type_in_clause = ", ".join(memory_type_values)
-            where_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) IN ({memory_type_in_clause})"
-            )
-
-        if status is None:
-            where_conditions.append(
-                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) <> '\"deleted\"'::agtype"
-            )
-        elif isinstance(status, list) and len(status) > 0:
-            status_values = []
-            for st in status:
-                escaped_status = str(st).replace("'", "''")
-                status_values.append(f"'\"{escaped_status}\"'::agtype")
-            status_in_clause = ", ".join(status_values)
-            where_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) IN ({status_in_clause})"
-            )
-
-        filter_conditions = self._build_filter_conditions_sql(filter_for_sql)
-        logger.info(f"[export_graph] filter_conditions: {filter_conditions}")
-        if filter_conditions:
-            where_conditions.extend(filter_conditions)
-
         where_clause = ""
         if where_conditions:
             where_clause = f"WHERE {' AND '.join(where_conditions)}"
@@ -2517,6 +2427,205 @@ class PolarDBGraphDB(BaseGraphDB):
             "total_edges": total_edges,
         }
 
+    def _build_export_where_conditions(
+        self,
+        user_name: str | None,
+        user_id: str | None,
+        filter: dict | None,
+        memory_type: list[str] | None,
+        status: list[str] | None,
+    ) -> list[str]:
+        """Build the node WHERE conditions shared by export_graph and export_nodes_page."""
+        extracted_object_type: str | None = None
+        extracted_mem_cube_id: str | None = None
+
+        def _extract_special_filter_values(filter_obj):
+            nonlocal extracted_object_type, extracted_mem_cube_id
+
+            if isinstance(filter_obj, dict):
+                if "and" in filter_obj and isinstance(filter_obj["and"], list):
+                    cleaned_items = []
+                    for item in filter_obj["and"]:
+                        cleaned_item = _extract_special_filter_values(item)
+                        if cleaned_item not in (None, {}, []):
+                            cleaned_items.append(cleaned_item)
+                    return {"and": cleaned_items} if cleaned_items else None
+
+                if "or" in filter_obj and isinstance(filter_obj["or"], list):
+                    cleaned_items = []
+                    for item in filter_obj["or"]:
+                        cleaned_item = _extract_special_filter_values(item)
+                        if cleaned_item not in (None, {}, []):
+                            cleaned_items.append(cleaned_item)
+                    return {"or": cleaned_items} if cleaned_items else None
+
+                cleaned_dict = {}
+                for key, value in filter_obj.items():
+                    if key == "object_type" and isinstance(value, str):
+                        if extracted_object_type is None:
+                            extracted_object_type = value
+                        continue
+                    if key == "mem_cube_id" and isinstance(value, str):
+                        if extracted_mem_cube_id is None:
+                            extracted_mem_cube_id = value
+                        continue
+                    cleaned_dict[key] = value
+                return cleaned_dict if cleaned_dict else None
+
+            return filter_obj
+
+        filter_for_sql = _extract_special_filter_values(filter)
+
+        where_conditions = []
+        has_object_type_filter = (
+            isinstance(extracted_object_type, str)
+            and isinstance(extracted_mem_cube_id, str)
+            and extracted_mem_cube_id.strip() != ""
+        )
+
+        if user_name and not has_object_type_filter:
+            where_conditions.append(
+                f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{user_name}\"'::agtype"
+            )
+
+        if has_object_type_filter:
+            object_type_value = extracted_object_type.strip().lower()
+            escaped_mem_cube_id = extracted_mem_cube_id.replace("'", "''")
+            if object_type_value == "user":
+                where_conditions.append(
+                    f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) <> '\"{escaped_mem_cube_id}\"'::agtype"
+                )
+            elif object_type_value == "public":
+                where_conditions.append(
+                    f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{escaped_mem_cube_id}\"'::agtype"
+                )
+
+        if user_id:
+            where_conditions.append(
+                f"ag_catalog.agtype_access_operator(properties, '\"user_id\"'::agtype) = '\"{user_id}\"'::agtype"
+            )
+
+        if memory_type and isinstance(memory_type, list) and len(memory_type) > 0:
+            memory_type_values = []
+            for mt in memory_type:
+                escaped_memory_type = str(mt).replace("'", "''")
+                memory_type_values.append(f"'\"{escaped_memory_type}\"'::agtype")
+            memory_type_in_clause = ", ".join(memory_type_values)
+            where_conditions.append(
+                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) IN ({memory_type_in_clause})"
+            )
+
+        if status is None:
+            where_conditions.append(
+                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) <> '\"deleted\"'::agtype"
+            )
+        elif isinstance(status, list) and len(status) > 0:
+            status_values = []
+            for st in status:
+                escaped_status = str(st).replace("'", "''")
+                status_values.append(f"'\"{escaped_status}\"'::agtype")
+            status_in_clause = ", ".join(status_values)
+            where_conditions.append(
+                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) IN ({status_in_clause})"
+            )
+
+        filter_conditions = self._build_filter_conditions_sql(filter_for_sql)
+        logger.info(f"[export_graph] filter_conditions: {filter_conditions}")
+        if filter_conditions:
+            where_conditions.extend(filter_conditions)
+        return where_conditions
+
+    @timed
+    def export_nodes_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 500,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        include_embedding: bool = False,
+        user_name: str | None = None,
+        user_id: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export one page of nodes with keyset pagination on (created_at DESC, id DESC).
+
+        See BaseGraphDB.export_nodes_page. Unlike export_graph, no total count is
+        computed and the page is located by seeking past the cursor instead of OFFSET.
+        """
+        user_id = user_id if user_id else self._get_config_value("user_id")
+        page_size = max(1, page_size)
+        where_conditions = self._build_export_where_conditions(
+            user_name=user_name,
+            user_id=user_id,
+            filter=filter,
+            memory_type=memory_type,
+            status=status,
+        )
+
+        created_at_expr = "ag_catalog.agtype_access_operator(properties, '\"created_at\"'::agtype)"
+        id_expr = "ag_catalog.agtype_access_operator(properties, '\"id\"'::agtype)"
+
+        def _agtype_literal(value: Any) -> str:
+            return "'" + json.dumps(str(value)).replace("'", "''") + "'::agtype"
+
+        if cursor:
+            position = decode_page_cursor(cursor)
+            cursor_id = _agtype_literal(position["id"])
+            if position.get("created_at") is None:
+                where_conditions.append(f"({created_at_expr} IS NULL AND {id_expr} < {cursor_id})")
+            else:
+                cursor_created_at = _agtype_literal(position["created_at"])
+                where_conditions.append(
+                    f"({created_at_expr} < {cursor_created_at} OR "
+                    f"({created_at_expr} = {cursor_created_at} AND {id_expr} < {cursor_id}) OR "
+                    f"{created_at_expr} IS NULL)"
+                )
+
+        where_clause = f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+        columns = "id, properties, embedding" if include_embedding else "id, properties"
+        query = f"""
+            SELECT {columns}
+            FROM "{self.db_name}_graph"."Memory"
+            {where_clause}
+            ORDER BY {created_at_expr} DESC NULLS LAST, {id_expr} DESC
+            LIMIT {page_size + 1}
+        """
+        logger.info(f"[export_nodes_page] Query: {query}")
+
+        try:
+            with self._get_connection() as conn, conn.cursor() as db_cursor:
+                db_cursor.execute(query)
+                rows = db_cursor.fetchall()
+        except Exception as e:
+            logger.error(f"[EXPORT NODES PAGE] Exception: {e}", exc_info=True)
+            raise RuntimeError(f"[EXPORT NODES PAGE] Exception: {e}") from e
+
+        nodes = []
+        for row in rows[:page_size]:
+            properties_json = row[1]
+            if isinstance(properties_json, str):
+                try:
+                    properties = json.loads(properties_json)
+                except json.JSONDecodeError:
+                    properties = {}
+            else:
+                properties = properties_json if properties_json else {}
+
+            properties.pop("embedding", None)
+            if include_embedding and row[2] is not None:
+                properties["embedding"] = row[2]
+            nodes.append(self._parse_node(properties))
+
+        next_cursor = None
+        if len(rows) > page_size and nodes:
+            last = nodes[-1]
+            next_cursor = encode_page_cursor(
+                {"created_at": last["metadata"].get("created_at"), "id": last["id"]}
+            )
+        return {"nodes": nodes, "next_cursor": next_cursor}
+
     @timed
     def count_nodes(self, scope: str, user_name: str | None = None) -> int:
         user_name = user_name if user_name else self.config.user_name
@@ -18,7 +18,7 @@ from typing import Any, Literal
 
 from memos.configs.graph_db import PostgresGraphDBConfig
 from memos.dependency import require_python_package
-from memos.graph_dbs.base import BaseGraphDB
+from memos.graph_dbs.base import BaseGraphDB, decode_page_cursor, encode_page_cursor
 from memos.log import get_logger
 
 
@@ -950,6 +950,153 @@ class PostgresGraphDB(BaseGraphDB):
         finally:
             self._put_conn(conn)
 
+    def export_nodes_page(
+        self,
+        cursor: str | None = None,
+        page_size: int = 500,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        include_embedding: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export one page of nodes with keyset pagination on (created_at DESC, id DESC).
+
+        `filter` uses the same {"and"/"or": [...]} grammar as the other backends and is
+        applied in SQL; unsupported operators raise ValueError.
+        """
+        user_name = kwargs.get("user_name") or self.user_name
+        page_size = max(1, page_size)
+        conditions = ["user_name = %s"]
+        params: list[Any] = [user_name]
+
+        if memory_type:
+            conditions.append("properties->>'memory_type' = ANY(%s)")
+            params.append(list(memory_type))
+        if status is None:
+            conditions.append("COALESCE(properties->>'status', '') <> 'deleted'")
+        elif status:
+            conditions.append("properties->>'status' = ANY(%s)")
+            params.append(list(status))
+        filter_conditions, filter_params = self._build_filter_conditions_sql(filter)
+        conditions.extend(filter_conditions)
+        params.extend(filter_params)
+
+        if cursor:
+            position = decode_page_cursor(cursor)
+            if position.get("created_at") is None:
+                conditions.append("(created_at IS NULL AND id < %s)")
+                params.append(position["id"])
+            else:
+                conditions.append(
+                    "(created_at < %s OR (created_at = %s AND id < %s) OR created_at IS NULL)"
+                )
+                params.extend([position["created_at"], position["created_at"], position["id"]])
+
+        cols = "id, memory, properties, created_at, updated_at"
+        if include_embedding:
+            cols += ", embedding"
+        conn = self._get_conn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT {cols} FROM {self.schema}.memories
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY created_at DESC NULLS LAST, id DESC
+                    LIMIT %s
+                """,
+                    [*params, page_size + 1],
+                )
+                rows = cur.fetchall()
+        finally:
+            self._put_conn(conn)
+
+        nodes = [self._parse_row(row, include_embedding) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = nodes[-1]
+            next_cursor = encode_page_cursor(
+                {"created_at": last["metadata"].get("created_at"), "id": last["id"]}
+            )
+        return {"nodes": nodes, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _build_filter_conditions_sql(filter: dict | None) -> tuple[list[str], list[Any]]:
+        """
+        Translate a metadata filter into WHERE conditions over the memories table.
+
+        Supports {"and": [...]}, {"or": [...]} or a single condition dict. Each
+        condition maps a field to a value (equality) or to {op: value} with op in
+        gt/lt/gte/lte/in/contains/like. id, memory, created_at and updated_at are
+        columns; other fields are read from the JSONB properties.
+        """
+        if not filter:
+            return [], []
+
+        comparisons = {"gt": ">", "lt": "<", "gte": ">=", "lte": "<="}
+        columns = {"id", "memory", "created_at", "updated_at"}
+
+        def build(condition: dict, params: list[Any]) -> str:
+            parts = []
+            for key, value in condition.items():
+                if key in columns:
+                    text_expr = f"{key}::text" if key.endswith("_at") else key
+                else:
+                    text_expr = "properties->>%s"
+                ops = value.items() if isinstance(value, dict) else [("eq", value)]
+                for op, op_value in ops:
+                    key_params = [] if key in columns else [key]
+                    if op in comparisons:
+                        if key in columns and key.endswith("_at"):
+                            parts.append(f"{key} {comparisons[op]} %s::timestamptz")
+                            params.append(op_value)
+                            continue
+                        if isinstance(op_value, int | float) and not isinstance(op_value, bool):
+                            parts.append(f"({text_expr})::numeric {comparisons[op]} %s")
+                        else:
+                            parts.append(f"{text_expr} {comparisons[op]} %s")
+                        params.extend([*key_params, op_value])
+                    elif op == "in":
+                        if not isinstance(op_value, list):
+                            raise ValueError(
+                                f"in operator only supports array format, got {op_value!r} "
+                                f"for {key!r}"
+                            )
+                        parts.append(f"{text_expr} = ANY(%s)")
+                        params.extend([*key_params, [str(v) for v in op_value]])
+                    elif op == "contains":
+                        if key in columns:
+                            raise ValueError(f"contains is not supported on column {key!r}")
+                        parts.append("properties->%s @> %s::jsonb")
+                        params.extend([key, json.dumps([op_value])])
+                    elif op == "like":
+                        parts.append(f"{text_expr} LIKE %s")
+                        params.extend([*key_params, f"%{op_value}%"])
+                    elif op == "eq":
+                        parts.append(f"{text_expr} = %s")
+                        params.extend([*key_params, str(op_value)])
+                    else:
+                        raise ValueError(f"Unsupported filter operator {op!r} for {key!r}")
+            return " AND ".join(parts)
+
+        if "or" in filter or "and" in filter:
+            logic = "or" if "or" in filter else "and"
+            group_params: list[Any] = []
+            clauses = [
+                f"({clause})"
+                for condition in filter[logic]
+                if isinstance(condition, dict) and (clause := build(condition, group_params))
+            ]
+            if not clauses:
+                return [], []
+            return [f"({f' {logic.upper()} '.join(clauses)})"], group_params
+
+        params: list[Any] = []
+        clause = build(filter, params)
+        return ([f"({clause})"], params) if clause else ([], [])
+
     def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
         """Import graph data."""
         user_name = user_name or self.user_name
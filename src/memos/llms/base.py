@@ -1,5 +1,8 @@
+import asyncio
+
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from contextlib import suppress
 
 from memos.configs.llm import BaseLLMConfig
 from memos.types import MessageList
@@ -23,3 +26,32 @@ class BaseLLM(ABC):
         Subclasses should override this if they support streaming.
         By default, this raises NotImplementedError.
         """
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """
+        Generate a response without blocking the event loop.
+        Backends with a native async client override this; by default `generate`
+        runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, messages, **kwargs)
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """
+        Stream a response without blocking the event loop.
+        Backends with a native async client override this; by default each chunk of
+        `generate_stream` is pulled in a worker thread.
+        """
+        iterator = self.generate_stream(messages, **kwargs)
+        done = object()
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, iterator, done)
+                if chunk is done:
+                    break
+                yield chunk
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                # Fails if a cancelled `next` is still running in its worker thread
+                with suppress(ValueError):
+                    close()
@@ -0,0 +1,255 @@
+"""
+Response cache for deterministic LLM calls.
+
+Internal prompts are often sent verbatim more than once (ingest retries, re-summaries
+of unchanged clusters, evaluation reruns, goal parsing). `CachingLLM` wraps any
+`BaseLLM` and answers repeated `generate` calls from an in-memory LRU backed by an
+optional SQLite file, keyed by model, messages and decoding parameters.
+
+Only deterministic calls are cached: temperature 0, or calls that pass `cache=True`.
+`cache=False` always bypasses the cache, and so does any kwarg outside the key (e.g.
+`past_key_values`, whose KV memory changes the answer). Streaming is never cached.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Generator
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any
+
+from memos.configs.llm import LLMCacheConfig
+from memos.llms.base import BaseLLM
+from memos.log import get_logger
+from memos.types import MessageList
+
+
+logger = get_logger(__name__)
+
+# Decoding kwargs that change the response and therefore the cache key
+KEY_PARAMS = ("temperature", "max_tokens", "top_p", "top_k", "tools", "extra_body")
+# Other kwargs that are part of the key; any remaining kwarg bypasses the cache
+_KEYED_KWARGS = {*KEY_PARAMS, "model_name_or_path"}
+# Expired rows are purged from SQLite every this many writes
+PURGE_EVERY_WRITES = 500
+
+
+class LLMResponseCache:
+    """Two-tier (LRU + SQLite) TTL cache of LLM responses with hit-rate counters."""
+
+    def __init__(self, config: LLMCacheConfig):
+        self.config = config
+        self._memory: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0, "stores": 0}
+
+        self._conn: sqlite3.Connection | None = None
+        if config.sqlite_path:
+            if config.sqlite_path != ":memory:":
+                Path(config.sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(config.sqlite_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, messages: MessageList, params: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return response
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, expires_at FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (row[1] is None or row[1] > now):
+                    self._remember(key, row[0], row[1])
+                    self.stats["disk_hits"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        expires_at = now + self.config.ttl_seconds if self.config.ttl_seconds else None
+        with self._lock:
+            self._remember(key, response, expires_at)
+            self.stats["stores"] += 1
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache "
+                    "(key, model, response, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, model, response, now, expires_at),
+                )
+                self._writes += 1
+                if self._writes % PURGE_EVERY_WRITES == 0:
+                    self._conn.execute(
+                        "DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL "
+                        "AND expires_at <= ?",
+                        (now,),
+                    )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"[LLMResponseCache] Failed to persist cache entry: {e}")
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.stats["bypassed"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_response_cache")
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, response: str, expires_at: float | None) -> None:
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > max(0, self.config.max_entries):
+            self._memory.popitem(last=False)
+
+
+class CachingLLM(BaseLLM):
+    """
+    Wraps an LLM and serves repeated deterministic `generate` calls from a cache.
+
+    Attributes other than `generate`/`generate_stream` (e.g. `config`, backend
+    specific helpers) are forwarded to the wrapped LLM.
+    """
+
+    def __init__(self, llm: BaseLLM, config: LLMCacheConfig):
+        self.llm = llm
+        self.cache_config = config
+        self.cache = LLMResponseCache(config)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def generate(self, messages: MessageList, **kwargs) -> str:
+        """Generate a response, answering from the cache for deterministic calls."""
+        explicit = kwargs.pop("cache", None)
+        if not self._should_cache(kwargs, explicit):
+            self.cache.record_bypass()
+            return self.llm.generate(messages, **kwargs)
+
+        model, params = self._key_params(kwargs)
+        key = self.cache.make_key(model, messages, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.llm.generate(messages, **kwargs)
+        # Empty responses usually mean a failed call and are not worth replaying
+        if isinstance(response, str) and response:
+            self.cache.put(key, model, response)
+        return response
+
+    def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
+        """Stream from the wrapped LLM; streamed responses are not cached."""
+        kwargs.pop("cache", None)
+        yield from self.llm.generate_stream(messages, **kwargs)
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Async `generate`, answering from the same cache."""
+        explicit = kwargs.pop("cache", None)
+        if not self._should_cache(kwargs, explicit):
+            self.cache.record_bypass()
+            return await self.llm.agenerate(messages, **kwargs)
+
+        model, params = self._key_params(kwargs)
+        key = self.cache.make_key(model, messages, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.llm.agenerate(messages, **kwargs)
+        if isinstance(response, str) and response:
+            self.cache.put(key, model, response)
+        return response
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Async stream from the wrapped LLM; streamed responses are not cached."""
+        kwargs.pop("cache", None)
+        async with aclosing(self.llm.agenerate_stream(messages, **kwargs)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and the overall hit rate."""
+        return self.cache.get_stats()
+
+    def _should_cache(self, kwargs: dict[str, Any], explicit: bool | None) -> bool:
+        if not self.cache_config.enabled or explicit is False:
+            return False
+        if not kwargs.keys() <= _KEYED_KWARGS:
+            # e.g. past_key_values: the response depends on state the key cannot see
+            return False
+        if explicit or self.cache_config.cache_sampled:
+            return True
+        llm_config = getattr(self.llm, "config", None)
+        temperature = kwargs.get("temperature", getattr(llm_config, "temperature", None))
+        return temperature is not None and float(temperature) == 0.0
+
+    def _key_params(self, kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        llm_config = getattr(self.llm, "config", None)
+        model = kwargs.get(
+            "model_name_or_path", getattr(llm_config, "model_name_or_path", "unknown")
+        )
+        params = {name: kwargs.get(name, getattr(llm_config, name, None)) for name in KEY_PARAMS}
+        params["backend"] = type(self.llm).__name__
+        return model, params
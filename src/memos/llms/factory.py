@@ -2,7 +2,9 @@ from typing import Any, ClassVar
 
 from memos.configs.llm import LLMConfigFactory
 from memos.llms.base import BaseLLM
+from memos.llms.cache import CachingLLM
 from memos.llms.deepseek import DeepSeekLLM
+from memos.llms.governor import GovernedLLM
 from memos.llms.hf import HFLLM
 from memos.llms.hf_singleton import HFSingletonLLM
 from memos.llms.ollama import OllamaLLM
@@ -35,4 +37,10 @@ class LLMFactory(BaseLLM):
         if backend not in cls.backend_to_class:
             raise ValueError(f"Invalid backend: {backend}")
         llm_class = cls.backend_to_class[backend]
-        return llm_class(config_factory.config)
+        llm = llm_class(config_factory.config)
+        # Cache hits are answered before the governor so they do not use up quota
+        if config_factory.governor is not None and config_factory.governor.enabled:
+            llm = GovernedLLM(llm, config_factory.governor)
+        if config_factory.cache is not None and config_factory.cache.enabled:
+            return CachingLLM(llm, config_factory.cache)
+        return llm
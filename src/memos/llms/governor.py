@@ -0,0 +1,441 @@
+"""
+Process-wide admission control for LLM calls.
+
+Many independent thread pools (mem_reader, reorganizer, relation detection, feedback,
+preference extraction, search goal parsing, chat) call the same provider models.
+`GovernedLLM` routes their `generate`/`generate_stream` calls through one
+`_ModelLimiter` per model, shared by every LLM instance in the process. The limiter:
+
+- bounds in-flight calls per model,
+- meters requests and estimated prompt + completion tokens with token buckets
+  (reservations are corrected with the real size once the response is known),
+- admits waiters strictly by priority class, so interactive chat/search calls go
+  ahead of queued background organize/read calls,
+- halves the concurrency limit and imposes a shared, exponentially growing cooldown
+  when the provider answers 429, then recovers additively on success.
+
+Priority comes from the `priority` kwarg, else from `llm_priority(...)` in the
+request context (inherited by ContextThread/ContextThreadPoolExecutor workers),
+else from the API path of the current request.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+from collections.abc import AsyncGenerator, Generator, Iterator
+from contextlib import aclosing, contextmanager
+from typing import Any
+
+from memos.configs.llm import LLMGovernorConfig
+from memos.context.context import (
+    RequestContext,
+    get_current_api_path,
+    get_current_context,
+    set_request_context,
+)
+from memos.llms.base import BaseLLM
+from memos.log import get_logger
+from memos.types import MessageList
+
+
+logger = get_logger(__name__)
+
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BACKGROUND = "background"
+PRIORITY_LEVELS = {INTERACTIVE: 0, NORMAL: 1, BACKGROUND: 2}
+
+# Request-context key holding the priority set by `llm_priority`
+LLM_PRIORITY_KEY = "llm_priority"
+# API paths whose LLM calls are on the user-facing critical path
+INTERACTIVE_PATH_MARKERS = ("chat", "search")
+# Rough characters-per-token ratio used for token estimates
+CHARS_PER_TOKEN = 4
+
+
+class LLMGovernorTimeoutError(TimeoutError):
+    """Raised when a call waited longer than max_queue_wait_seconds for admission."""
+
+
+def estimate_tokens(text: str | None) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1 if text else 0
+
+
+def estimate_prompt_tokens(messages: MessageList) -> int:
+    total = 0
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else message
+        if isinstance(content, list):
+            # Multimodal content parts
+            content = " ".join(
+                str(part.get("text", "")) if isinstance(part, dict) else str(part)
+                for part in content
+            )
+        total += estimate_tokens(content if isinstance(content, str) else str(content or ""))
+    return total
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    if getattr(error, "status_code", None) == 429:
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    return type(error).__name__ == "RateLimitError"
+
+
+def resolve_priority(priority: str | None = None) -> str:
+    if priority in PRIORITY_LEVELS:
+        return priority
+    context = get_current_context()
+    scoped = context.get(LLM_PRIORITY_KEY) if context else None
+    if scoped in PRIORITY_LEVELS:
+        return scoped
+    api_path = get_current_api_path() or ""
+    if any(marker in api_path for marker in INTERACTIVE_PATH_MARKERS):
+        return INTERACTIVE
+    return NORMAL
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """
+    Run LLM calls in this block (and in context-propagating workers started from it)
+    with the given priority class.
+    """
+    if priority not in PRIORITY_LEVELS:
+        raise ValueError(f"Unknown LLM priority: {priority}")
+    previous = get_current_context()
+    context = get_current_context() or RequestContext()
+    context.set(LLM_PRIORITY_KEY, priority)
+    set_request_context(context)
+    try:
+        yield
+    finally:
+        set_request_context(previous)
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay_for(self, amount: float) -> float:
+        # Requests larger than the bucket are admitted once it is full
+        missing = min(amount, self.capacity) - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+
+class _ModelLimiter:
+    def __init__(self, model: str, config: LLMGovernorConfig):
+        self.model = model
+        self.config = config
+        self.limit = float(max(1, config.max_concurrency))
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.throttle_streak = 0
+        self.requests = (
+            _TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        )
+        self.tokens = _TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self._waiters: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.metrics: dict[str, Any] = {
+            "admitted": dict.fromkeys(PRIORITY_LEVELS, 0),
+            "queue_wait_total_sec": dict.fromkeys(PRIORITY_LEVELS, 0.0),
+            "queue_wait_max_sec": dict.fromkeys(PRIORITY_LEVELS, 0.0),
+            "throttled": 0,
+            "timeouts": 0,
+        }
+
+    def acquire(self, priority: str, estimated_tokens: int) -> float:
+        """Block until the call may start; returns the time spent waiting."""
+        entry = (PRIORITY_LEVELS[priority], next(self._seq))
+        start = time.monotonic()
+        deadline = (
+            start + self.config.max_queue_wait_seconds
+            if self.config.max_queue_wait_seconds is not None
+            else None
+        )
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    # Only the highest-priority waiter may be admitted
+                    delay = None
+                    if self._waiters[0] == entry:
+                        delay = self._admission_delay(estimated_tokens, now)
+                    if delay == 0.0:
+                        self._admit(estimated_tokens)
+                        break
+                    if deadline is not None:
+                        if now >= deadline:
+                            self.metrics["timeouts"] += 1
+                            raise LLMGovernorTimeoutError(
+                                f"LLM call to {self.model} waited more than "
+                                f"{self.config.max_queue_wait_seconds}s for admission"
+                            )
+                        delay = min(delay, deadline - now) if delay is not None else deadline - now
+                    self._cond.wait(timeout=delay)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+        waited = time.monotonic() - start
+        with self._cond:
+            self.metrics["admitted"][priority] += 1
+            self.metrics["queue_wait_total_sec"][priority] += waited
+            self.metrics["queue_wait_max_sec"][priority] = max(
+                self.metrics["queue_wait_max_sec"][priority], waited
+            )
+        return waited
+
+    def release(self, reserved_tokens: int, used_tokens: int, throttled: bool = False) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            if self.tokens is not None:
+                # Refund (or charge) the difference between the estimate and the real size
+                self.tokens.tokens = min(
+                    self.tokens.capacity, self.tokens.tokens + reserved_tokens - used_tokens
+                )
+            if throttled:
+                self.metrics["throttled"] += 1
+                self.limit = max(1.0, self.limit / 2)
+                backoff = min(
+                    self.config.backoff_max_seconds,
+                    self.config.backoff_base_seconds * 2**self.throttle_streak,
+                )
+                self.cooldown_until = max(self.cooldown_until, time.monotonic() + backoff)
+                self.throttle_streak += 1
+                logger.warning(
+                    f"[LLMGovernor] {self.model} rate limited; concurrency limit "
+                    f"{self.limit:.1f}, cooling down {backoff:.1f}s"
+                )
+            else:
+                self.throttle_streak = 0
+                self.limit = min(float(self.config.max_concurrency), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "concurrency_limit": round(self.limit, 2),
+                "cooldown_remaining_sec": max(0.0, self.cooldown_until - time.monotonic()),
+                "admitted": dict(self.metrics["admitted"]),
+                "queue_wait_total_sec": dict(self.metrics["queue_wait_total_sec"]),
+                "queue_wait_max_sec": dict(self.metrics["queue_wait_max_sec"]),
+                "throttled": self.metrics["throttled"],
+                "timeouts": self.metrics["timeouts"],
+            }
+
+    def _admission_delay(self, estimated_tokens: int, now: float) -> float | None:
+        """0 if the head waiter may start now, seconds to wait, or None to wait for a release."""
+        if now < self.cooldown_until:
+            return self.cooldown_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        delay = 0.0
+        for bucket, amount in ((self.requests, 1), (self.tokens, estimated_tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                delay = max(delay, bucket.delay_for(amount))
+        return delay
+
+    def _admit(self, estimated_tokens: int) -> None:
+        self.in_flight += 1
+        if self.requests is not None:
+            self.requests.tokens -= 1
+        if self.tokens is not None:
+            self.tokens.tokens -= min(estimated_tokens, self.tokens.capacity)
+
+
+class LLMGovernor:
+    """Registry of per-model limiters shared by all governed LLMs in the process."""
+
+    def __init__(self):
+        self._limiters: dict[str, _ModelLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, model: str, config: LLMGovernorConfig) -> _ModelLimiter:
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                limiter = self._limiters[model] = _ModelLimiter(model, config)
+            elif limiter.config != config:
+                logger.debug(f"[LLMGovernor] Keeping the first governor config for {model}")
+            return limiter
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {model: limiter.stats() for model, limiter in limiters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._limiters.clear()
+
+
+_governor = LLMGovernor()
+
+
+async def _acquire_async(limiter: _ModelLimiter, priority: str, estimated_tokens: int) -> None:
+    # Admission blocks on a condition variable, so it waits in a worker thread. If the
+    # caller is cancelled meanwhile, a slot granted later is handed back at once.
+    task = asyncio.ensure_future(asyncio.to_thread(limiter.acquire, priority, estimated_tokens))
+    try:
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+
+        def _release_late(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is None:
+                limiter.release(estimated_tokens, 0)
+
+        task.add_done_callback(_release_late)
+        raise
+
+
+def get_llm_governor() -> LLMGovernor:
+    return _governor
+
+
+class GovernedLLM(BaseLLM):
+    """
+    Wraps an LLM so its calls are admitted by the process-wide governor.
+
+    Calls rejected with HTTP 429 are retried up to `max_retries` times after the
+    shared cooldown. Other attributes are forwarded to the wrapped LLM.
+    """
+
+    def __init__(self, llm: BaseLLM, config: LLMGovernorConfig):
+        self.llm = llm
+        self.governor_config = config
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def generate(self, messages: MessageList, **kwargs) -> str:
+        """Generate a response once the governor admits the call."""
+        priority = resolve_priority(kwargs.pop("priority", None))
+        limiter, reserved = self._prepare(messages, kwargs)
+        prompt_tokens = reserved - self._completion_reserve(kwargs)
+        attempt = 0
+        while True:
+            limiter.acquire(priority, reserved)
+            try:
+                response = self.llm.generate(messages, **kwargs)
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                limiter.release(reserved, reserved, throttled=throttled)
+                if throttled and attempt < self.governor_config.max_retries:
+                    attempt += 1
+                    continue
+                raise
+            completion = response if isinstance(response, str) else str(response)
+            limiter.release(reserved, prompt_tokens + estimate_tokens(completion))
+            return response
+
+    def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
+        """Stream a response, holding a governor slot until the stream ends."""
+        priority = resolve_priority(kwargs.pop("priority", None))
+        limiter, reserved = self._prepare(messages, kwargs)
+        prompt_tokens = reserved - self._completion_reserve(kwargs)
+        attempt = 0
+        while True:
+            limiter.acquire(priority, reserved)
+            completion_chars = 0
+            try:
+                for chunk in self.llm.generate_stream(messages, **kwargs):
+                    completion_chars += len(chunk)
+                    yield chunk
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                limiter.release(reserved, reserved, throttled=throttled)
+                # Only retry if nothing was streamed to the caller yet
+                retry = throttled and not completion_chars
+                if retry and attempt < self.governor_config.max_retries:
+                    attempt += 1
+                    continue
+                raise
+            except GeneratorExit:
+                limiter.release(reserved, prompt_tokens + completion_chars // CHARS_PER_TOKEN)
+                raise
+            limiter.release(reserved, prompt_tokens + completion_chars // CHARS_PER_TOKEN)
+            return
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Async `generate`; only waiting for admission uses a worker thread."""
+        priority = resolve_priority(kwargs.pop("priority", None))
+        limiter, reserved = self._prepare(messages, kwargs)
+        prompt_tokens = reserved - self._completion_reserve(kwargs)
+        attempt = 0
+        while True:
+            await _acquire_async(limiter, priority, reserved)
+            used, throttled = reserved, False
+            try:
+                response = await self.llm.agenerate(messages, **kwargs)
+                completion = response if isinstance(response, str) else str(response)
+                used = prompt_tokens + estimate_tokens(completion)
+                return response
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                if not (throttled and attempt < self.governor_config.max_retries):
+                    raise
+            finally:
+                # Also runs when the calling task is cancelled
+                limiter.release(reserved, used, throttled=throttled)
+            attempt += 1
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Async stream, holding a governor slot until the stream ends or is closed."""
+        priority = resolve_priority(kwargs.pop("priority", None))
+        limiter, reserved = self._prepare(messages, kwargs)
+        prompt_tokens = reserved - self._completion_reserve(kwargs)
+        attempt = 0
+        while True:
+            await _acquire_async(limiter, priority, reserved)
+            completion_chars, throttled = 0, False
+            try:
+                async with aclosing(self.llm.agenerate_stream(messages, **kwargs)) as chunks:
+                    async for chunk in chunks:
+                        completion_chars += len(chunk)
+                        yield chunk
+                return
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                retry = throttled and not completion_chars
+                if not (retry and attempt < self.governor_config.max_retries):
+                    raise
+            finally:
+                used = prompt_tokens + completion_chars // CHARS_PER_TOKEN
+                limiter.release(reserved, reserved if throttled else used, throttled=throttled)
+            attempt += 1
+
+    def _prepare(self, messages: MessageList, kwargs: dict[str, Any]) -> tuple[_ModelLimiter, int]:
+        llm_config = getattr(self.llm, "config", None)
+        model = kwargs.get("model_name_or_path") or getattr(
+            llm_config, "model_name_or_path", type(self.llm).__name__
+        )
+        limiter = get_llm_governor().limiter(model, self.governor_config)
+        return limiter, estimate_prompt_tokens(messages) + self._completion_reserve(kwargs)
+
+    def _completion_reserve(self, kwargs: dict[str, Any]) -> int:
+        llm_config = getattr(self.llm, "config", None)
+        max_tokens = kwargs.get("max_tokens") or getattr(llm_config, "max_tokens", None)
+        expected = self.governor_config.expected_completion_tokens
+        return min(int(max_tokens), expected) if max_tokens else expected
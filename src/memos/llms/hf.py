@@ -7,7 +7,14 @@ from transformers import (
 
 from memos.configs.llm import HFLLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.hf_batching import (
+    ContinuousBatchingEngine,
+    SamplingParams,
+    cache_to_tensors,
+    tensors_to_cache,
+)
+from memos.llms.hf_prefix_cache import RadixKVCache
+from memos.llms.utils import remove_thinking_tags, strip_think_stream
 from memos.log import get_logger
 from memos.types import MessageList
 
@@ -15,6 +22,36 @@ from memos.types import MessageList
 logger = get_logger(__name__)
 
 
+class IncrementalDetokenizer:
+    """
+    Turns a growing list of token ids into text chunks in O(1) work per token.
+
+    Only the window from `prefix_offset` is decoded: the window decoded with and
+    without the newest tokens differs by exactly the new text, which stays correct for
+    tokenizers that merge spaces or bytes across tokens. Text ending in U+FFFD (an
+    incomplete multi-byte character) is held back until the character completes.
+    """
+
+    def __init__(self, tokenizer: Any):
+        self.tokenizer = tokenizer
+        self.ids: list[int] = []
+        self.prefix_offset = 0
+        self.read_offset = 0
+
+    def push(self, token_id: int) -> str:
+        """Add one token and return the text it completes (possibly empty)."""
+        self.ids.append(token_id)
+        prefix_text = self.tokenizer.decode(
+            self.ids[self.prefix_offset : self.read_offset], skip_special_tokens=True
+        )
+        new_text = self.tokenizer.decode(self.ids[self.prefix_offset :], skip_special_tokens=True)
+        if len(new_text) <= len(prefix_text) or new_text.endswith("\ufffd"):
+            return ""
+        self.prefix_offset = self.read_offset
+        self.read_offset = len(self.ids)
+        return new_text[len(prefix_text) :]
+
+
 class HFLLM(BaseLLM):
     """
     HFLLM: Transformers LLM class supporting cache-augmented generation (CAG) and sampling.
@@ -64,6 +101,21 @@ class HFLLM(BaseLLM):
             processors.append(TopPLogitsWarper(self.config.top_p))
         self.logits_processors = LogitsProcessorList(processors)
 
+        # Shared decode loop for requests without a caller-provided KV cache
+        self.batching_engine = None
+        if getattr(self.config, "continuous_batching", False):
+            eos_id = self.tokenizer.eos_token_id
+            self.batching_engine = ContinuousBatchingEngine(
+                self.model,
+                eos_token_ids=[eos_id] if eos_id is not None else [],
+                max_batch_size=self.config.max_batch_size,
+            )
+
+        # KV of prompt prefixes shared across requests (system prompt, memory blocks)
+        self.prefix_cache = None
+        if getattr(self.config, "prefix_cache_max_bytes", 0) > 0:
+            self.prefix_cache = RadixKVCache(self.config.prefix_cache_max_bytes)
+
     def generate(
         self, messages: MessageList, past_key_values: DynamicCache | None = None, **kwargs
     ):
@@ -79,6 +131,10 @@ class HFLLM(BaseLLM):
             messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
         )
         logger.info(f"HFLLM prompt: {prompt}")
+        if past_key_values is None and self.batching_engine is not None:
+            return self._generate_batched(prompt, **kwargs)
+        if past_key_values is None and self.prefix_cache is not None:
+            return self._generate_with_prefix_cache(prompt, **kwargs)
         if past_key_values is None:
             return self._generate_full(prompt, **kwargs)
         else:
@@ -99,10 +155,61 @@ class HFLLM(BaseLLM):
             messages, tokenize=False, add_generation_prompt=self.config.add_generation_prompt
         )
         logger.info(f"HFLLM streaming prompt: {prompt}")
-        if past_key_values is None:
-            yield from self._generate_full_stream(prompt)
+        if past_key_values is None and self.batching_engine is not None:
+            chunks = self._generate_batched_stream(prompt, **kwargs)
+        elif past_key_values is None and self.prefix_cache is not None:
+            chunks = self._generate_with_prefix_cache_stream(prompt, **kwargs)
+        elif past_key_values is None:
+            chunks = self._generate_full_stream(prompt)
         else:
-            yield from self._generate_with_cache_stream(prompt, past_key_values)
+            chunks = self._generate_with_cache_stream(prompt, past_key_values)
+        if getattr(self.config, "remove_think_prefix", False):
+            chunks = strip_think_stream(chunks)
+        yield from chunks
+
+    def _sampling_params(self, **kwargs) -> SamplingParams:
+        do_sample = getattr(self.config, "do_sample", False)
+        return SamplingParams(
+            max_new_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+            do_sample=do_sample,
+            temperature=kwargs.get("temperature", self.config.temperature) if do_sample else 1.0,
+            top_k=kwargs.get("top_k", self.config.top_k) if do_sample else 0,
+            top_p=kwargs.get("top_p", self.config.top_p) if do_sample else 1.0,
+        )
+
+    def _generate_batched(self, prompt: str, **kwargs) -> str:
+        """
+        Generate output through the continuous-batching engine.
+        Args:
+            prompt (str): The input prompt string.
+        Returns:
+            str: Model response.
+        """
+        prompt_ids = self.tokenizer(prompt).input_ids
+        new_ids = self.batching_engine.generate(prompt_ids, self._sampling_params(**kwargs))
+        response = self.tokenizer.decode(new_ids, skip_special_tokens=True)
+        logger.info(f"Batched-gen raw response: {response}")
+        return (
+            remove_thinking_tags(response)
+            if getattr(self.config, "remove_think_prefix", False)
+            else response
+        )
+
+    def _generate_batched_stream(self, prompt: str, **kwargs) -> Generator[str, None, None]:
+        """
+        Stream output from the continuous-batching engine.
+        Tokens are detokenized incrementally, so multi-token characters come out whole.
+        Args:
+            prompt (str): The input prompt string.
+        Yields:
+            str: Streaming response chunks.
+        """
+        prompt_ids = self.tokenizer(prompt).input_ids
+        detokenizer = IncrementalDetokenizer(self.tokenizer)
+        for token in self.batching_engine.stream(prompt_ids, self._sampling_params(**kwargs)):
+            text = detokenizer.push(token)
+            if text:
+                yield text
 
     def _generate_full(self, prompt: str, **kwargs) -> str:
         """
@@ -151,11 +258,9 @@ class HFLLM(BaseLLM):
 
         # Get generation parameters
         max_new_tokens = kwargs.get("max_tokens", self.config.max_tokens)
-        remove_think_prefix = getattr(self.config, "remove_think_prefix", False)
 
         # Manual streaming generation
         generated_ids = inputs.input_ids.clone()
-        accumulated_text = ""
 
         for _ in range(max_new_tokens):
             # Forward pass
@@ -191,18 +296,7 @@ class HFLLM(BaseLLM):
             # Decode and yield the new token
             new_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
             if new_token_text:  # Only yield non-empty tokens
-                accumulated_text += new_token_text
-
-                # Apply thinking tag removal if enabled
-                if remove_think_prefix:
-                    processed_text = remove_thinking_tags(accumulated_text)
-                    # Only yield the difference (new content)
-                    if len(processed_text) > len(accumulated_text) - len(new_token_text):
-                        yield processed_text[len(accumulated_text) - len(new_token_text) :]
-                    else:
-                        yield new_token_text
-                else:
-                    yield new_token_text
+                yield new_token_text
 
     def _generate_with_cache(self, query: str, kv: DynamicCache, **kwargs) -> str:
         """
@@ -213,12 +307,34 @@ class HFLLM(BaseLLM):
         Returns:
             str: Model response.
         """
-        import torch
-
         query_ids = self.tokenizer(
             query, return_tensors="pt", add_special_tokens=False
         ).input_ids.to(self.model.device)
         logits, kv = self._prefill(query_ids, kv)
+        return self._decode_after_prefill(logits, kv, **kwargs)
+
+    def _generate_with_prefix_cache(self, prompt: str, **kwargs) -> str:
+        """
+        Generate output from the full prompt, reusing cached KV for its longest known prefix.
+        Args:
+            prompt (str): The input prompt string.
+        Returns:
+            str: Model response.
+        """
+        logits, kv = self._prefill_with_prefix_cache(self.tokenizer(prompt).input_ids)
+        return self._decode_after_prefill(logits, kv, **kwargs)
+
+    def _decode_after_prefill(self, logits: Any, kv: DynamicCache, **kwargs) -> str:
+        """
+        Decode a response token by token once the prompt has been prefilled.
+        Args:
+            logits (torch.Tensor): Last-step logits of the prefill.
+            kv (DynamicCache): KV cache covering the prompt.
+        Returns:
+            str: Model response.
+        """
+        import torch
+
         next_token = self._select_next_token(logits)
         generated = [next_token]
         for _ in range(kwargs.get("max_tokens", self.config.max_tokens) - 1):
@@ -254,26 +370,42 @@ class HFLLM(BaseLLM):
             query, return_tensors="pt", add_special_tokens=False
         ).input_ids.to(self.model.device)
 
-        max_new_tokens = kwargs.get("max_tokens", self.config.max_tokens)
-        remove_think_prefix = getattr(self.config, "remove_think_prefix", False)
-
         # Initial forward pass
         logits, kv = self._prefill(query_ids, kv)
+        yield from self._decode_after_prefill_stream(logits, kv, **kwargs)
+
+    def _generate_with_prefix_cache_stream(
+        self, prompt: str, **kwargs
+    ) -> Generator[str, None, None]:
+        """
+        Stream output from the full prompt, reusing cached KV for its longest known prefix.
+        Args:
+            prompt (str): The input prompt string.
+        Yields:
+            str: Streaming response chunks.
+        """
+        logits, kv = self._prefill_with_prefix_cache(self.tokenizer(prompt).input_ids)
+        yield from self._decode_after_prefill_stream(logits, kv, **kwargs)
+
+    def _decode_after_prefill_stream(
+        self, logits: Any, kv: DynamicCache, **kwargs
+    ) -> Generator[str, None, None]:
+        """
+        Stream a response token by token once the prompt has been prefilled.
+        Args:
+            logits (torch.Tensor): Last-step logits of the prefill.
+            kv (DynamicCache): KV cache covering the prompt.
+        Yields:
+            str: Streaming response chunks.
+        """
+        max_new_tokens = kwargs.get("max_tokens", self.config.max_tokens)
+
         next_token = self._select_next_token(logits)
 
         # Yield first token
         first_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
-        accumulated_text = ""
         if first_token_text:
-            accumulated_text += first_token_text
-            if remove_think_prefix:
-                processed_text = remove_thinking_tags(accumulated_text)
-                if len(processed_text) > len(accumulated_text) - len(first_token_text):
-                    yield processed_text[len(accumulated_text) - len(first_token_text) :]
-                else:
-                    yield first_token_text
-            else:
-                yield first_token_text
+            yield first_token_text
 
         generated = [next_token]
 
@@ -287,18 +419,7 @@ class HFLLM(BaseLLM):
             # Decode and yield the new token
             new_token_text = self.tokenizer.decode(next_token[0], skip_special_tokens=True)
             if new_token_text:
-                accumulated_text += new_token_text
-
-                # Apply thinking tag removal if enabled
-                if remove_think_prefix:
-                    processed_text = remove_thinking_tags(accumulated_text)
-                    # Only yield the difference (new content)
-                    if len(processed_text) > len(accumulated_text) - len(new_token_text):
-                        yield processed_text[len(accumulated_text) - len(new_token_text) :]
-                    else:
-                        yield new_token_text
-                else:
-                    yield new_token_text
+                yield new_token_text
 
             generated.append(next_token)
 
@@ -322,6 +443,24 @@ class HFLLM(BaseLLM):
             )
         return out.logits[:, -1, :], out.past_key_values
 
+    def _prefill_with_prefix_cache(self, token_ids: list[int]) -> tuple[Any, DynamicCache]:
+        """
+        Prefill a prompt, forwarding only the tokens after its longest cached prefix.
+        At least the last token is always forwarded, since its logits start decoding.
+        Args:
+            token_ids (list[int]): Prompt token IDs.
+        Returns:
+            tuple[torch.Tensor, DynamicCache]: (last-step logits, KV cache of the prompt)
+        """
+        import torch
+
+        matched, layers = self.prefix_cache.match(token_ids, max_len=len(token_ids) - 1)
+        kv = tensors_to_cache(layers) if layers is not None else None
+        remainder = torch.tensor([token_ids[matched:]], dtype=torch.long, device=self.model.device)
+        logits, kv = self._prefill(remainder, kv)
+        self.prefix_cache.insert(token_ids, cache_to_tensors(kv))
+        return logits, kv
+
     def _select_next_token(self, logits: Any) -> Any:
         """
         Select the next token from logits using sampling or argmax, depending on config.
@@ -367,24 +506,7 @@ class HFLLM(BaseLLM):
         import torch
         import transformers
 
-        # Accept multiple input types and convert to standard chat messages
-        if isinstance(messages, str):
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"Below is some information about the user.\n{messages}",
-                }
-            ]
-        elif isinstance(messages, list) and messages and isinstance(messages[0], str):
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"Below is some information about the user.\n{' '.join(messages)}",
-                }
-            ]
-        prompt = self.tokenizer.apply_chat_template(
-            messages, tokenize=False, add_generation_prompt=False
-        )
+        prompt = self._kv_cache_prompt(messages)
         inputs = self.tokenizer(prompt, return_tensors="pt")
         inputs["input_ids"] = inputs["input_ids"].to(self.model.device, dtype=torch.long)
         seq_len = inputs["input_ids"].size(-1)
@@ -392,6 +514,8 @@ class HFLLM(BaseLLM):
             raise ValueError(
                 "Prompt after chat template is empty, cannot build KV cache. Check your messages input."
             )
+        if self.prefix_cache is not None:
+            return self._build_kv_cache_with_prefix_cache(inputs["input_ids"][0].tolist())
         # Create cache and perform forward pass without pre-existing cache
         with torch.no_grad():
             outputs = self.model(**inputs, use_cache=True)
@@ -441,3 +565,97 @@ class HFLLM(BaseLLM):
             raise RuntimeError(
                 "Failed to build KV cache: no cache data available from model outputs"
             )
+
+    def extend_kv_cache(self, messages, base_messages, base_kv: DynamicCache) -> DynamicCache:
+        """
+        Build the KV cache of `messages` from `base_kv`, the cache previously built for
+        `base_messages`: the KV of their common token prefix is reused and only the
+        tokens after it are prefilled.
+        Args:
+            messages: New messages, in any form accepted by `build_kv_cache`.
+            base_messages: Messages `base_kv` was built from.
+            base_kv (DynamicCache): KV cache of `base_messages`.
+        Returns:
+            DynamicCache: The constructed KV cache object.
+        """
+        token_ids = self.tokenizer(self._kv_cache_prompt(messages)).input_ids
+        if not token_ids:
+            raise ValueError(
+                "Prompt after chat template is empty, cannot build KV cache. Check your messages input."
+            )
+        base_ids = self.tokenizer(self._kv_cache_prompt(base_messages)).input_ids
+        base_layers = cache_to_tensors(base_kv)
+        common = 0
+        limit = min(len(token_ids), len(base_ids))
+        if base_layers:
+            limit = min(limit, base_layers[0][0].size(2))
+        while common < limit and token_ids[common] == base_ids[common]:
+            common += 1
+        logger.info(f"[HFLLM] Reusing {common}/{len(token_ids)} KV cache tokens")
+        layers = [
+            (
+                k[:, :, :common, :].to(self.model.device),
+                v[:, :, :common, :].to(self.model.device),
+            )
+            for k, v in base_layers
+        ]
+        return self._prefill_after_prefix(token_ids, common, layers if common else None)
+
+    def _kv_cache_prompt(self, messages) -> str:
+        """
+        Render `build_kv_cache` input as a chat-template prompt.
+        Supports the following input types:
+            - str: Used as a system prompt.
+            - list[str]: Concatenated and used as a system prompt.
+            - list[dict]: Used directly as chat messages.
+        """
+        # Accept multiple input types and convert to standard chat messages
+        if isinstance(messages, str):
+            messages = [
+                {
+                    "role": "system",
+                    "content": f"Below is some information about the user.\n{messages}",
+                }
+            ]
+        elif isinstance(messages, list) and messages and isinstance(messages[0], str):
+            messages = [
+                {
+                    "role": "system",
+                    "content": f"Below is some information about the user.\n{' '.join(messages)}",
+                }
+            ]
+        return self.tokenizer.apply_chat_template(
+            messages, tokenize=False, add_generation_prompt=False
+        )
+
+    def _prefill_after_prefix(
+        self, token_ids: list[int], matched: int, layers: list[tuple[Any, Any]] | None
+    ) -> DynamicCache:
+        """
+        Complete the KV cache of `token_ids` given the KV `layers` of its first `matched`
+        tokens, forwarding only the remaining tokens.
+        """
+        import torch
+
+        if layers is not None and matched == len(token_ids):
+            return tensors_to_cache(layers)
+        kv = tensors_to_cache(layers) if layers is not None else None
+        remainder = torch.tensor([token_ids[matched:]], dtype=torch.long, device=self.model.device)
+        _, kv = self._prefill(remainder, kv)
+        return kv
+
+    def _build_kv_cache_with_prefix_cache(self, token_ids: list[int]) -> DynamicCache:
+        """
+        Build the KV cache of a prompt, forwarding only the tokens after its longest
+        cached prefix. A fully cached prompt needs no forward pass at all.
+        Args:
+            token_ids (list[int]): Prompt token IDs.
+        Returns:
+            DynamicCache: The constructed KV cache object.
+        """
+        matched, layers = self.prefix_cache.match(token_ids)
+        if matched == len(token_ids):
+            return tensors_to_cache(layers)
+        kv = self._prefill_after_prefix(token_ids, matched, layers)
+        self.prefix_cache.insert(token_ids, cache_to_tensors(kv))
+        return kv
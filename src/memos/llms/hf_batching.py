@@ -0,0 +1,344 @@
+"""
+Continuous-batching decode loop for local Hugging Face causal LMs.
+
+`ContinuousBatchingEngine` owns one worker thread that runs every forward pass for
+the requests submitted to it. Between decode steps it admits queued requests
+(prefilling each one and merging its KV cache into the batch) and retires finished
+ones, so concurrent requests share each decode step's matmuls instead of
+serializing or racing on a shared `DynamicCache`.
+
+The batch KV cache is kept left-padded: every row ends at the same column, and an
+attention mask plus explicit position ids hide the padding from the model. Leading
+columns that only hold padding are trimmed whenever sequences retire.
+"""
+
+import queue
+import threading
+import time
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class SamplingParams:
+    max_new_tokens: int = 512
+    do_sample: bool = False
+    temperature: float = 1.0
+    top_k: int = 0
+    top_p: float = 1.0
+
+
+@dataclass(eq=False)
+class _Sequence:
+    prompt_ids: list[int]
+    params: SamplingParams
+    submitted_at: float = field(default_factory=time.monotonic)
+    output: queue.Queue = field(default_factory=queue.Queue)
+    generated: int = 0
+    last_token: int | None = None
+    cancelled: bool = False
+
+
+def cache_to_tensors(cache: Any) -> list[tuple[Any, Any]]:
+    """Per-layer (keys, values) tensors of a cache, across transformers versions."""
+    if isinstance(cache, tuple | list):
+        return [(layer[0], layer[1]) for layer in cache]
+    if hasattr(cache, "layers"):
+        return [(layer.keys, layer.values) for layer in cache.layers]
+    return list(zip(cache.key_cache, cache.value_cache, strict=True))
+
+
+def tensors_to_cache(layers: list[tuple[Any, Any]]) -> Any:
+    from transformers import DynamicCache
+
+    if hasattr(DynamicCache, "from_legacy_cache"):
+        return DynamicCache.from_legacy_cache(tuple(layers))
+    return DynamicCache(ddp_cache_data=layers)
+
+
+def _left_pad(tensor: Any, width: int, dim: int) -> Any:
+    import torch
+
+    if width == 0:
+        return tensor
+    shape = list(tensor.shape)
+    shape[dim] = width
+    return torch.cat([tensor.new_zeros(shape), tensor], dim=dim)
+
+
+def sample_next_token(logits: Any, params: SamplingParams) -> int:
+    """Pick the next token for one sequence from its 1-D logits."""
+    import torch
+
+    if not params.do_sample:
+        return int(torch.argmax(logits).item())
+    logits = logits.float() / max(params.temperature, 1e-5)
+    if params.top_k > 0:
+        kth = torch.topk(logits, min(params.top_k, logits.size(-1))).values[-1]
+        logits = logits.masked_fill(logits < kth, float("-inf"))
+    if 0.0 < params.top_p < 1.0:
+        sorted_logits, sorted_idx = torch.sort(logits, descending=True)
+        sorted_probs = torch.softmax(sorted_logits, dim=-1)
+        # Keep the smallest prefix whose probability mass reaches top_p
+        remove = sorted_probs.cumsum(dim=-1) - sorted_probs >= params.top_p
+        logits = logits.scatter(0, sorted_idx[remove], float("-inf"))
+    probs = torch.softmax(logits, dim=-1)
+    return int(torch.multinomial(probs, num_samples=1).item())
+
+
+class ContinuousBatchingEngine:
+    """
+    Request queue and decode loop shared by all callers of one model.
+
+    Args:
+        model: A transformers causal LM.
+        eos_token_ids: Token ids that finish a sequence.
+        max_batch_size: Sequences decoded together in one step.
+        max_prefill_per_step: New requests admitted between two decode steps, which
+            bounds the latency a burst of prefills adds to running sequences.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        eos_token_ids: list[int] | None = None,
+        max_batch_size: int = 8,
+        max_prefill_per_step: int = 2,
+    ):
+        self.model = model
+        self.eos_token_ids = set(eos_token_ids or [])
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_prefill_per_step = max(1, max_prefill_per_step)
+
+        self._pending: deque[_Sequence] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+        # Batch state, only touched by the worker thread
+        self._active: list[_Sequence] = []
+        self._kv: list[tuple[Any, Any]] = []
+        self._mask: Any = None
+
+        self._metrics = {
+            "requests": 0,
+            "completed": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "prefill_tokens": 0,
+            "decode_tokens": 0,
+            "decode_steps": 0,
+            "decode_seconds": 0.0,
+            "queue_wait_total_sec": 0.0,
+        }
+
+    # ---- public API ----
+
+    def submit(self, prompt_ids: list[int], params: SamplingParams) -> _Sequence:
+        if not prompt_ids:
+            raise ValueError("Prompt is empty")
+        sequence = _Sequence(prompt_ids=list(prompt_ids), params=params)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("ContinuousBatchingEngine is shut down")
+            self._pending.append(sequence)
+            self._metrics["requests"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="memos-hf-batching", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return sequence
+
+    def stream(self, prompt_ids: list[int], params: SamplingParams) -> Iterator[int]:
+        """Yield generated token ids as they are decoded; closing the iterator cancels."""
+        sequence = self.submit(prompt_ids, params)
+        try:
+            while True:
+                item = sequence.output.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            sequence.cancelled = True
+
+    def generate(self, prompt_ids: list[int], params: SamplingParams) -> list[int]:
+        return list(self.stream(prompt_ids, params))
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics["queued"] = len(self._pending)
+        metrics["active"] = len(self._active)
+        steps = metrics["decode_steps"]
+        metrics["avg_batch_size"] = metrics["decode_tokens"] / steps if steps else 0.0
+        seconds = metrics["decode_seconds"]
+        metrics["decode_tokens_per_sec"] = metrics["decode_tokens"] / seconds if seconds else 0.0
+        return metrics
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    # ---- worker ----
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._active and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    failed = list(self._pending) + self._active
+                    self._pending.clear()
+                    break
+                admitted = []
+                while (
+                    self._pending
+                    and len(self._active) + len(admitted) < self.max_batch_size
+                    and len(admitted) < self.max_prefill_per_step
+                ):
+                    admitted.append(self._pending.popleft())
+
+            try:
+                for sequence in admitted:
+                    self._admit(sequence)
+                if self._active:
+                    self._decode_step()
+            except Exception as e:
+                logger.error(f"[ContinuousBatching] Decode step failed: {e}", exc_info=True)
+                for sequence in self._active + [s for s in admitted if s not in self._active]:
+                    sequence.output.put(e)
+                self._metrics["failed"] += len(self._active)
+                self._reset_batch()
+
+        for sequence in failed:
+            sequence.output.put(RuntimeError("ContinuousBatchingEngine is shut down"))
+
+    def _admit(self, sequence: _Sequence) -> None:
+        import torch
+
+        self._metrics["queue_wait_total_sec"] += time.monotonic() - sequence.submitted_at
+        if sequence.cancelled:
+            self._metrics["cancelled"] += 1
+            return
+        device = self.model.device
+        input_ids = torch.tensor([sequence.prompt_ids], dtype=torch.long, device=device)
+        with torch.no_grad():
+            out = self.model(input_ids=input_ids, use_cache=True, return_dict=True)
+        self._metrics["prefill_tokens"] += len(sequence.prompt_ids)
+
+        token = sample_next_token(out.logits[0, -1, :], sequence.params)
+        if self._emit(sequence, token):
+            return
+
+        layers = cache_to_tensors(out.past_key_values)
+        mask = torch.ones((1, len(sequence.prompt_ids)), dtype=torch.long, device=device)
+        if not self._active:
+            self._kv, self._mask = layers, mask
+        else:
+            batch_len, new_len = self._mask.size(1), mask.size(1)
+            width = max(batch_len, new_len)
+            self._kv = [
+                (
+                    torch.cat(
+                        [_left_pad(bk, width - batch_len, 2), _left_pad(k, width - new_len, 2)]
+                    ),
+                    torch.cat(
+                        [_left_pad(bv, width - batch_len, 2), _left_pad(v, width - new_len, 2)]
+                    ),
+                )
+                for (bk, bv), (k, v) in zip(self._kv, layers, strict=True)
+            ]
+            self._mask = torch.cat(
+                [_left_pad(self._mask, width - batch_len, 1), _left_pad(mask, width - new_len, 1)]
+            )
+        self._active.append(sequence)
+
+    def _decode_step(self) -> None:
+        import torch
+
+        start = time.monotonic()
+        device = self.model.device
+        input_ids = torch.tensor(
+            [[sequence.last_token] for sequence in self._active], dtype=torch.long, device=device
+        )
+        # Position of the new token = number of real tokens already in the row
+        position_ids = self._mask.sum(dim=1, keepdim=True)
+        mask = torch.cat([self._mask, self._mask.new_ones((len(self._active), 1))], dim=1)
+        with torch.no_grad():
+            out = self.model(
+                input_ids=input_ids,
+                attention_mask=mask,
+                position_ids=position_ids,
+                past_key_values=tensors_to_cache(self._kv),
+                use_cache=True,
+                return_dict=True,
+            )
+        self._kv = cache_to_tensors(out.past_key_values)
+        self._mask = mask
+
+        keep = []
+        for row, sequence in enumerate(self._active):
+            token = sample_next_token(out.logits[row, -1, :], sequence.params)
+            if not self._emit(sequence, token):
+                keep.append(row)
+        self._metrics["decode_steps"] += 1
+        self._metrics["decode_tokens"] += len(self._active)
+        self._metrics["decode_seconds"] += time.monotonic() - start
+        if len(keep) < len(self._active):
+            self._retire(keep)
+
+    def _emit(self, sequence: _Sequence, token: int) -> bool:
+        """Deliver a token; returns True if the sequence is finished."""
+        if sequence.cancelled:
+            self._metrics["cancelled"] += 1
+            sequence.output.put(_DONE)
+            return True
+        if token in self.eos_token_ids:
+            self._metrics["completed"] += 1
+            sequence.output.put(_DONE)
+            return True
+        sequence.output.put(token)
+        sequence.last_token = token
+        sequence.generated += 1
+        if sequence.generated >= sequence.params.max_new_tokens:
+            self._metrics["completed"] += 1
+            sequence.output.put(_DONE)
+            return True
+        return False
+
+    def _retire(self, keep: list[int]) -> None:
+        import torch
+
+        self._active = [self._active[row] for row in keep]
+        if not self._active:
+            self._reset_batch()
+            return
+        index = torch.tensor(keep, dtype=torch.long, device=self._mask.device)
+        mask = self._mask.index_select(0, index)
+        # Drop leading columns that are padding in every remaining row
+        start = int((mask.sum(dim=0) > 0).nonzero()[0].item())
+        self._mask = mask[:, start:]
+        self._kv = [
+            (k.index_select(0, index)[:, :, start:, :], v.index_select(0, index)[:, :, start:, :])
+            for k, v in self._kv
+        ]
+
+    def _reset_batch(self) -> None:
+        self._active, self._kv, self._mask = [], [], None
@@ -0,0 +1,202 @@
+"""
+Radix-tree prefix cache of KV tensors for local Hugging Face models.
+
+Keys and values of a token depend only on the tokens before it, so the KV cache of
+any prompt prefix can be reused by every prompt that starts with the same tokens.
+`RadixKVCache` stores KV segments on the edges of a radix tree keyed by token ids:
+shared prefixes (system prompts, common memory blocks) are stored once, a lookup
+returns the KV of the longest cached prefix, and least recently used leaves are
+evicted when the stored tensors exceed the byte budget.
+"""
+
+import threading
+import time
+
+from typing import Any
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class _RadixNode:
+    __slots__ = ("children", "kv", "last_access", "nbytes", "parent", "tokens")
+
+    def __init__(self, tokens: tuple[int, ...], kv: list[tuple[Any, Any]], parent: Any):
+        self.tokens = tokens
+        # Per-layer (keys, values) for exactly `tokens`, shape [1, heads, len(tokens), dim]
+        self.kv = kv
+        self.parent = parent
+        self.children: dict[int, _RadixNode] = {}
+        self.last_access = time.monotonic()
+        self.nbytes = sum(
+            k.numel() * k.element_size() + v.numel() * v.element_size() for k, v in kv
+        )
+
+    def split(self, at: int) -> "_RadixNode":
+        """Split the edge after `at` tokens; returns the new upper node."""
+        upper = _RadixNode(
+            self.tokens[:at],
+            [(k[:, :, :at, :].clone(), v[:, :, :at, :].clone()) for k, v in self.kv],
+            self.parent,
+        )
+        upper.last_access = self.last_access
+        self.parent.children[self.tokens[0]] = upper
+        self.tokens = self.tokens[at:]
+        self.kv = [(k[:, :, at:, :].clone(), v[:, :, at:, :].clone()) for k, v in self.kv]
+        self.nbytes -= upper.nbytes
+        self.parent = upper
+        upper.children[self.tokens[0]] = self
+        return upper
+
+
+def _common_prefix(a: tuple[int, ...], b: list[int], offset: int) -> int:
+    n = min(len(a), len(b) - offset)
+    i = 0
+    while i < n and a[i] == b[offset + i]:
+        i += 1
+    return i
+
+
+class RadixKVCache:
+    """
+    Thread-safe radix tree from token-id prefixes to KV tensors.
+
+    Args:
+        max_bytes: Budget for the stored KV tensors; LRU leaves are evicted beyond it.
+        min_match_tokens: Matches shorter than this are reported as misses, since
+            stitching a very short prefix saves less than it costs.
+    """
+
+    def __init__(self, max_bytes: int, min_match_tokens: int = 16):
+        self.max_bytes = max_bytes
+        self.min_match_tokens = min_match_tokens
+        self._root = _RadixNode((), [], None)
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.stats = {
+            "lookups": 0,
+            "hits": 0,
+            "matched_tokens": 0,
+            "requested_tokens": 0,
+            "inserted_tokens": 0,
+            "evicted_nodes": 0,
+        }
+
+    def match(self, token_ids: list[int], max_len: int | None = None) -> tuple[int, Any]:
+        """
+        Find the longest cached prefix of `token_ids` (at most `max_len` tokens).
+
+        Returns:
+            (matched length, per-layer (keys, values) tensors of the prefix), or
+            (0, None) on a miss.
+        """
+        import torch
+
+        limit = len(token_ids) if max_len is None else min(max_len, len(token_ids))
+        ids = token_ids[:limit]
+        segments: list[list[tuple[Any, Any]]] = []
+        matched = 0
+        now = time.monotonic()
+        with self._lock:
+            self.stats["lookups"] += 1
+            self.stats["requested_tokens"] += limit
+            node = self._root
+            while matched < limit:
+                child = node.children.get(ids[matched])
+                if child is None:
+                    break
+                common = _common_prefix(child.tokens, ids, matched)
+                child.last_access = now
+                if common < len(child.tokens):
+                    segments.append(
+                        [(k[:, :, :common, :], v[:, :, :common, :]) for k, v in child.kv]
+                    )
+                    matched += common
+                    break
+                segments.append(child.kv)
+                matched += common
+                node = child
+
+            if matched < max(1, self.min_match_tokens):
+                return 0, None
+            self.stats["hits"] += 1
+            self.stats["matched_tokens"] += matched
+            # Concatenating copies, so later evictions cannot touch the returned tensors
+            layers = [
+                (
+                    torch.cat([segment[i][0] for segment in segments], dim=2),
+                    torch.cat([segment[i][1] for segment in segments], dim=2),
+                )
+                for i in range(len(segments[0]))
+            ]
+        return matched, layers
+
+    def insert(self, token_ids: list[int], kv: list[tuple[Any, Any]]) -> None:
+        """
+        Store the KV of `token_ids`; `kv` holds per-layer tensors covering at least
+        those tokens from position 0.
+        """
+        n = len(token_ids)
+        if n == 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            node, pos = self._root, 0
+            while pos < n:
+                child = node.children.get(token_ids[pos])
+                if child is None:
+                    leaf = _RadixNode(
+                        tuple(token_ids[pos:]),
+                        [(k[:, :, pos:n, :].clone(), v[:, :, pos:n, :].clone()) for k, v in kv],
+                        node,
+                    )
+                    node.children[token_ids[pos]] = leaf
+                    self.total_bytes += leaf.nbytes
+                    self.stats["inserted_tokens"] += n - pos
+                    break
+                common = _common_prefix(child.tokens, token_ids, pos)
+                if common < len(child.tokens):
+                    child = child.split(common)
+                child.last_access = now
+                node, pos = child, pos + common
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._root.children.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["bytes"] = self.total_bytes
+        requested = stats["requested_tokens"]
+        stats["token_hit_rate"] = stats["matched_tokens"] / requested if requested else 0.0
+        return stats
+
+    def _evict(self) -> None:
+        if self.total_bytes <= self.max_bytes:
+            return
+        leaves = []
+        stack = list(self._root.children.values())
+        while stack:
+            node = stack.pop()
+            if node.children:
+                stack.extend(node.children.values())
+            else:
+                leaves.append(node)
+        leaves.sort(key=lambda node: node.last_access)
+        while leaves and self.total_bytes > self.max_bytes:
+            node = leaves.pop(0)
+            parent = node.parent
+            del parent.children[node.tokens[0]]
+            self.total_bytes -= node.nbytes
+            self.stats["evicted_nodes"] += 1
+            if parent is not self._root and not parent.children:
+                # The parent became a leaf; keep LRU order when re-inserting it
+                index = 0
+                while index < len(leaves) and leaves[index].last_access <= parent.last_access:
+                    index += 1
+                leaves.insert(index, parent)
@@ -5,7 +5,7 @@ from ollama import Client, Message
 
 from memos.configs.llm import OllamaLLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ReasoningStreamFormatter, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
 
@@ -110,19 +110,12 @@ class OllamaLLM(BaseLLM):
             stream=True,
         )
         # Streaming chunks of text
-        reasoning_started = False
+        formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
         for chunk in response:
-            if hasattr(chunk.message, "thinking") and chunk.message.thinking:
-                if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
-                    reasoning_started = True
-                yield chunk.message.thinking
-
-            if hasattr(chunk.message, "content") and chunk.message.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield chunk.message.content
+            yield from formatter.push(
+                getattr(chunk.message, "thinking", None), getattr(chunk.message, "content", None)
+            )
+        yield from formatter.finish()
 
     def tool_call_parser(self, tool_calls: list[Message.ToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
@@ -1,8 +1,15 @@
+import asyncio
 import json
+import os
+import threading
 import time
+import weakref
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator
+from contextlib import aclosing, suppress
+from typing import Any
 
+import httpx
 import openai
 
 from openai._types import NOT_GIVEN
@@ -10,7 +17,7 @@ from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMe
 
 from memos.configs.llm import AzureLLMConfig, OpenAILLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ReasoningStreamFormatter, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
 from memos.utils import timed_with_status
@@ -18,6 +25,84 @@ from memos.utils import timed_with_status
 
 logger = get_logger(__name__)
 
+# Timeout (seconds) of one async request, unless the call passes `timeout`
+LLM_ASYNC_TIMEOUT_SEC = float(os.getenv("MEMOS_LLM_ASYNC_TIMEOUT_SEC", "120"))
+# Longest gap between two streamed chunks before an async stream is aborted
+LLM_STREAM_IDLE_TIMEOUT_SEC = float(os.getenv("MEMOS_LLM_STREAM_IDLE_TIMEOUT_SEC", "60"))
+# Connections held by each LLM's async HTTP pool (per event loop)
+LLM_ASYNC_MAX_CONNECTIONS = int(os.getenv("MEMOS_LLM_ASYNC_MAX_CONNECTIONS", "1000"))
+
+
+class AsyncClientPool:
+    """
+    Lazily created async OpenAI clients, one per event loop.
+
+    httpx connections belong to the loop that opened them, so every loop gets its own
+    client and connection pool; all coroutines on that loop share it.
+    """
+
+    def __init__(self, factory: Callable[[httpx.AsyncClient], Any]):
+        self._factory = factory
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=LLM_ASYNC_MAX_CONNECTIONS,
+                        max_keepalive_connections=min(LLM_ASYNC_MAX_CONNECTIONS, 100),
+                    ),
+                    timeout=httpx.Timeout(LLM_ASYNC_TIMEOUT_SEC, connect=10.0),
+                )
+                client = self._clients[loop] = self._factory(http_client)
+            return client
+
+    async def aclose(self) -> None:
+        """Close the client of the running event loop."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+
+async def iter_async_stream(
+    stream: Any, remove_think_prefix: bool, reasoning_attr: str = "reasoning_content"
+) -> AsyncGenerator[str, None]:
+    """
+    Turn an async chat-completions stream into text chunks, wrapping reasoning deltas
+    in <think> tags like the sync `generate_stream` implementations.
+
+    The upstream HTTP response is closed when the consumer stops early (e.g. the SSE
+    client disconnected and the request task was cancelled), so the server stops
+    generating, and when no chunk arrives within LLM_STREAM_IDLE_TIMEOUT_SEC.
+    """
+    iterator: AsyncIterator = stream.__aiter__()
+    formatter = ReasoningStreamFormatter(remove_think_prefix)
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(iterator), LLM_STREAM_IDLE_TIMEOUT_SEC)
+            except StopAsyncIteration:
+                break
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            for text in formatter.push(
+                getattr(delta, reasoning_attr, None), getattr(delta, "content", None)
+            ):
+                yield text
+        for text in formatter.finish():
+            yield text
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            with suppress(Exception):
+                await close()
+
 
 class OpenAILLM(BaseLLM):
     """OpenAI LLM class via openai.chat.completions.create."""
@@ -27,6 +112,14 @@ class OpenAILLM(BaseLLM):
         self.client = openai.Client(
             api_key=config.api_key, base_url=config.api_base, default_headers=config.default_headers
         )
+        self.async_clients = AsyncClientPool(
+            lambda http_client: openai.AsyncOpenAI(
+                api_key=config.api_key,
+                base_url=config.api_base,
+                default_headers=config.default_headers,
+                http_client=http_client,
+            )
+        )
         logger.info("OpenAI LLM instance initialized")
 
     @timed_with_status(
@@ -38,15 +131,7 @@ class OpenAILLM(BaseLLM):
     )
     def generate(self, messages: MessageList, **kwargs) -> str:
         """Generate a response from OpenAI LLM, optionally overriding generation params."""
-        request_body = {
-            "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
-            "messages": messages,
-            "temperature": kwargs.get("temperature", self.config.temperature),
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-            "top_p": kwargs.get("top_p", self.config.top_p),
-            "extra_body": kwargs.get("extra_body", self.config.extra_body),
-            "tools": kwargs.get("tools", NOT_GIVEN),
-        }
+        request_body = self._request_body(messages, kwargs)
         start_time = time.perf_counter()
         logger.info(f"OpenAI LLM Request body: {request_body}")
 
@@ -56,7 +141,49 @@ class OpenAILLM(BaseLLM):
         logger.info(
             f"Request body: {request_body}, Response from OpenAI: {response.model_dump_json()}, Cost time: {cost_time}"
         )
+        return self._parse_response(response)
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Generate a response with the async client; the request is abandoned on cancel."""
+        request_body = self._request_body(messages, kwargs)
+        start_time = time.perf_counter()
+        response = await self.async_clients.get().chat.completions.create(
+            **request_body, timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC)
+        )
+        logger.info(
+            f"Async response from OpenAI: {response.model_dump_json()}, "
+            f"Cost time: {time.perf_counter() - start_time}"
+        )
+        return self._parse_response(response)
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Stream a response with the async client, closing the upstream stream on cancel."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        request_body = self._request_body(messages, kwargs)
+        request_body["model"] = self.config.model_name_or_path
+        request_body["stream"] = True
+        stream = await self.async_clients.get().chat.completions.create(
+            **request_body, timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC)
+        )
+        async with aclosing(iter_async_stream(stream, self.config.remove_think_prefix)) as chunks:
+            async for text in chunks:
+                yield text
+
+    def _request_body(self, messages: MessageList, kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "extra_body": kwargs.get("extra_body", self.config.extra_body),
+            "tools": kwargs.get("tools", NOT_GIVEN),
+        }
 
+    def _parse_response(self, response: Any) -> Any:
         if not response.choices:
             logger.warning("OpenAI response has no choices")
             return ""
@@ -100,7 +227,7 @@ class OpenAILLM(BaseLLM):
         logger.info(f"OpenAI LLM Stream Request body: {request_body}")
         response = self.client.chat.completions.create(**request_body)
 
-        reasoning_started = False
+        formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
 
         for chunk in response:
             if not chunk.choices:
@@ -108,20 +235,12 @@ class OpenAILLM(BaseLLM):
             delta = chunk.choices[0].delta
 
             # Support for custom 'reasoning_content' (if present in OpenAI-compatible models like Qwen, DeepSeek)
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
-                    reasoning_started = True
-                yield delta.reasoning_content
-            elif hasattr(delta, "content") and delta.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield delta.content
+            yield from formatter.push(
+                getattr(delta, "reasoning_content", None), getattr(delta, "content", None)
+            )
 
         # Ensure we close the <think> block if not already done
-        if reasoning_started and not self.config.remove_think_prefix:
-            yield "</think>"
+        yield from formatter.finish()
 
     def tool_call_parser(self, tool_calls: list[ChatCompletionMessageToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
@@ -145,20 +264,58 @@ class AzureLLM(BaseLLM):
             api_version=config.api_version,
             api_key=config.api_key,
         )
+        self.async_clients = AsyncClientPool(
+            lambda http_client: openai.AsyncAzureOpenAI(
+                azure_endpoint=config.base_url,
+                api_version=config.api_version,
+                api_key=config.api_key,
+                http_client=http_client,
+            )
+        )
         logger.info("Azure LLM instance initialized")
 
     def generate(self, messages: MessageList, **kwargs) -> str:
         """Generate a response from Azure OpenAI LLM."""
-        response = self.client.chat.completions.create(
-            model=self.config.model_name_or_path,
-            messages=messages,
-            temperature=kwargs.get("temperature", self.config.temperature),
-            max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            top_p=kwargs.get("top_p", self.config.top_p),
-            tools=kwargs.get("tools", NOT_GIVEN),
-            extra_body=kwargs.get("extra_body", self.config.extra_body),
-        )
+        response = self.client.chat.completions.create(**self._request_body(messages, kwargs))
         logger.info(f"Response from Azure OpenAI: {response.model_dump_json()}")
+        return self._parse_response(response)
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Generate a response with the async Azure client."""
+        response = await self.async_clients.get().chat.completions.create(
+            **self._request_body(messages, kwargs),
+            timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC),
+        )
+        logger.info(f"Async response from Azure OpenAI: {response.model_dump_json()}")
+        return self._parse_response(response)
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Stream a response with the async Azure client, closing the upstream stream on cancel."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        request_body = self._request_body(messages, kwargs)
+        request_body.pop("tools")
+        stream = await self.async_clients.get().chat.completions.create(
+            **request_body, stream=True, timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC)
+        )
+        async with aclosing(iter_async_stream(stream, self.config.remove_think_prefix)) as chunks:
+            async for text in chunks:
+                yield text
+
+    def _request_body(self, messages: MessageList, kwargs: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "model": self.config.model_name_or_path,
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "tools": kwargs.get("tools", NOT_GIVEN),
+            "extra_body": kwargs.get("extra_body", getattr(self.config, "extra_body", None)),
+        }
+
+    def _parse_response(self, response: Any) -> Any:
         if not response.choices:
             logger.warning("Azure OpenAI response has no choices")
             return ""
@@ -187,7 +344,7 @@ class AzureLLM(BaseLLM):
             extra_body=kwargs.get("extra_body", self.config.extra_body),
         )
 
-        reasoning_started = False
+        formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
 
         for chunk in response:
             if not chunk.choices:
@@ -195,20 +352,12 @@ class AzureLLM(BaseLLM):
             delta = chunk.choices[0].delta
 
             # Support for custom 'reasoning_content' (if present in OpenAI-compatible models like Qwen, DeepSeek)
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
-                    reasoning_started = True
-                yield delta.reasoning_content
-            elif hasattr(delta, "content") and delta.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield delta.content
+            yield from formatter.push(
+                getattr(delta, "reasoning_content", None), getattr(delta, "content", None)
+            )
 
         # Ensure we close the <think> block if not already done
-        if reasoning_started and not self.config.remove_think_prefix:
-            yield "</think>"
+        yield from formatter.finish()
 
     def tool_call_parser(self, tool_calls: list[ChatCompletionMessageToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
@@ -10,7 +10,7 @@ from openai.types.responses.response_reasoning_item import ResponseReasoningItem
 
 from memos.configs.llm import AzureLLMConfig, OpenAILLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ReasoningStreamFormatter, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
 from memos.utils import timed
@@ -77,7 +77,7 @@ class OpenAIResponsesLLM(BaseLLM):
             stream=True,
         )
 
-        reasoning_started = False
+        formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
 
         for event in stream:
             event_type = getattr(event, "type", "")
@@ -85,19 +85,11 @@ class OpenAIResponsesLLM(BaseLLM):
                 "response.reasoning.delta",
                 "response.reasoning_summary_text.delta",
             ) and hasattr(event, "delta"):
-                if not self.config.remove_think_prefix:
-                    if not reasoning_started:
-                        yield "<think>"
-                        reasoning_started = True
-                    yield event.delta
+                yield from formatter.push(reasoning=event.delta)
             elif event_type == "response.output_text.delta" and hasattr(event, "delta"):
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield event.delta
+                yield from formatter.push(content=event.delta)
 
-        if reasoning_started and not self.config.remove_think_prefix:
-            yield "</think>"
+        yield from formatter.finish()
 
     def tool_call_parser(self, tool_calls: list[ResponseFunctionToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
@@ -164,7 +156,7 @@ class AzureResponsesLLM(BaseLLM):
             else NOT_GIVEN,
         )
 
-        reasoning_started = False
+        formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
 
         for event in stream:
             event_type = getattr(event, "type", "")
@@ -172,19 +164,11 @@ class AzureResponsesLLM(BaseLLM):
                 "response.reasoning.delta",
                 "response.reasoning_summary_text.delta",
             ) and hasattr(event, "delta"):
-                if not self.config.remove_think_prefix:
-                    if not reasoning_started:
-                        yield "<think>"
-                        reasoning_started = True
-                    yield event.delta
+                yield from formatter.push(reasoning=event.delta)
             elif event_type == "response.output_text.delta" and hasattr(event, "delta"):
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield event.delta
+                yield from formatter.push(content=event.delta)
 
-        if reasoning_started and not self.config.remove_think_prefix:
-            yield "</think>"
+        yield from formatter.finish()
 
     def tool_call_parser(self, tool_calls: list[ResponseFunctionToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
@@ -1,5 +1,7 @@
 import re
 
+from collections.abc import Generator, Iterable
+
 
 def remove_thinking_tags(text: str) -> str:
     """
@@ -12,3 +14,139 @@ def remove_thinking_tags(text: str) -> str:
         str: The cleaned text.
     """
     return re.sub(r"^<think>.*?</think>\s*", "", text, flags=re.DOTALL).strip()
+
+
+THINK_OPEN_TAG = "<think>"
+THINK_CLOSE_TAG = "</think>"
+
+
+def _partial_tag_suffix(text: str, tag: str) -> int:
+    """Length of the longest suffix of `text` that is a proper prefix of `tag`."""
+    for size in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:size]):
+            return size
+    return 0
+
+
+class ThinkStreamFilter:
+    """
+    Incremental splitter of streamed text into reasoning and answer parts.
+
+    Deltas are scanned once: `<think>`/`</think>` tags are recognized even when
+    split across chunks, and only a possible partial tag at the end of a delta is
+    held back. Each call costs O(len(delta)) instead of re-scanning the whole
+    accumulated response.
+
+    Example:
+        stream_filter = ThinkStreamFilter()
+        for delta in stream:
+            for kind, text in stream_filter.feed(delta):
+                ...  # kind is "reasoning" or "text"
+        for kind, text in stream_filter.flush():
+            ...
+    """
+
+    def __init__(self):
+        self.in_think = False
+        self._pending = ""
+        self._answer_started = False
+
+    def feed(self, delta: str) -> list[tuple[str, str]]:
+        """Consume one delta and return the (kind, text) parts that are complete."""
+        text = self._pending + delta
+        self._pending = ""
+        parts = []
+        while text:
+            tag = THINK_CLOSE_TAG if self.in_think else THINK_OPEN_TAG
+            index = text.find(tag)
+            if index >= 0:
+                if index:
+                    parts.append((self.kind, text[:index]))
+                self.in_think = not self.in_think
+                text = text[index + len(tag) :]
+                continue
+            held = _partial_tag_suffix(text, tag)
+            if held < len(text):
+                parts.append((self.kind, text[: len(text) - held]))
+            self._pending = text[len(text) - held :]
+            break
+        return parts
+
+    def flush(self) -> list[tuple[str, str]]:
+        """Return held-back text at the end of the stream."""
+        text, self._pending = self._pending, ""
+        return [(self.kind, text)] if text else []
+
+    def feed_answer(self, delta: str) -> str:
+        """
+        Consume one delta and return only the answer text `remove_thinking_tags`
+        would keep: `<think>` sections and whitespace before the answer are dropped.
+        """
+        return self._answer(self.feed(delta))
+
+    def flush_answer(self) -> str:
+        return self._answer(self.flush())
+
+    @property
+    def kind(self) -> str:
+        return "reasoning" if self.in_think else "text"
+
+    def _answer(self, parts: list[tuple[str, str]]) -> str:
+        text = "".join(part for kind, part in parts if kind == "text")
+        if not self._answer_started:
+            text = text.lstrip()
+            self._answer_started = bool(text)
+        return text
+
+
+def strip_think_stream(chunks: Iterable[str]) -> Generator[str, None, None]:
+    """Streaming counterpart of `remove_thinking_tags`."""
+    stream_filter = ThinkStreamFilter()
+    for chunk in chunks:
+        text = stream_filter.feed_answer(chunk)
+        if text:
+            yield text
+    text = stream_filter.flush_answer()
+    if text:
+        yield text
+
+
+class ReasoningStreamFormatter:
+    """
+    Turns streamed reasoning/content deltas of reasoning models into text chunks.
+
+    Reasoning is wrapped in `<think>` tags. With `remove_think_prefix` it is dropped,
+    as in non-streaming `generate`, and content goes through a `ThinkStreamFilter`
+    so inline `<think>` sections are dropped as well.
+    """
+
+    def __init__(self, remove_think_prefix: bool):
+        self._answer_filter = ThinkStreamFilter() if remove_think_prefix else None
+        self._reasoning_started = False
+
+    def push(self, reasoning: str | None = None, content: str | None = None) -> list[str]:
+        chunks = []
+        if reasoning and self._answer_filter is None:
+            if not self._reasoning_started:
+                chunks.append(THINK_OPEN_TAG)
+                self._reasoning_started = True
+            chunks.append(reasoning)
+        if content:
+            if self._answer_filter is not None:
+                content = self._answer_filter.feed_answer(content)
+            elif self._reasoning_started:
+                chunks.append(THINK_CLOSE_TAG)
+                self._reasoning_started = False
+            if content:
+                chunks.append(content)
+        return chunks
+
+    def finish(self) -> list[str]:
+        """Chunks that close the stream: held-back answer text or a closing tag."""
+        if self._answer_filter is not None:
+            text = self._answer_filter.flush_answer()
+            return [text] if text else []
+        if self._reasoning_started:
+            self._reasoning_started = False
+            return [THINK_CLOSE_TAG]
+        return []
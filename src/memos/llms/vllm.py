@@ -1,5 +1,7 @@
 import json
 
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from typing import Any, cast
 
 import openai
@@ -8,7 +10,8 @@ from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMe
 
 from memos.configs.llm import VLLMLLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.openai import LLM_ASYNC_TIMEOUT_SEC, AsyncClientPool, iter_async_stream
+from memos.llms.utils import ReasoningStreamFormatter, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageDict
 
@@ -38,6 +41,14 @@ class VLLMLLM(BaseLLM):
             base_url=getattr(self.config, "api_base", "http://localhost:8088/v1"),
             default_headers=self.config.default_headers,
         )
+        self.async_clients = AsyncClientPool(
+            lambda http_client: openai.AsyncOpenAI(
+                api_key=api_key,
+                base_url=getattr(self.config, "api_base", "http://localhost:8088/v1"),
+                default_headers=self.config.default_headers,
+                http_client=http_client,
+            )
+        )
 
     def build_vllm_kv_cache(self, messages: Any) -> str:
         """
@@ -105,42 +116,81 @@ class VLLMLLM(BaseLLM):
         Generate response using vLLM API client. detail view https://docs.vllm.ai/en/latest/features/reasoning_outputs/
         """
         if self.client:
-            completion_kwargs = {
-                "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
-                "messages": messages,
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                "top_p": kwargs.get("top_p", self.config.top_p),
-                "extra_body": kwargs.get("extra_body", self.config.extra_body),
-            }
-            if kwargs.get("tools"):
-                completion_kwargs["tools"] = kwargs.get("tools")
-                completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
-
-            response = self.client.chat.completions.create(**completion_kwargs)
-
-            if not response.choices:
-                logger.warning("VLLM response has no choices")
-                return ""
-
-            if response.choices[0].message.tool_calls:
-                return self.tool_call_parser(response.choices[0].message.tool_calls)
-
-            reasoning_content = (
-                f"<think>{response.choices[0].message.reasoning}</think>"
-                if hasattr(response.choices[0].message, "reasoning")
-                else ""
-            )
-            response_text = response.choices[0].message.content or ""
-            logger.info(f"VLLM API response: {response_text}")
-            return (
-                remove_thinking_tags(response_text)
-                if getattr(self.config, "remove_think_prefix", False)
-                else reasoning_content + response_text
+            response = self.client.chat.completions.create(
+                **self._completion_kwargs(messages, kwargs)
             )
+            return self._parse_response(response)
         else:
             raise RuntimeError("API client is not available")
 
+    async def agenerate(self, messages: list[MessageDict], **kwargs) -> str:
+        """
+        Generate a response with the async client; the request is abandoned on cancel.
+        """
+        response = await self.async_clients.get().chat.completions.create(
+            **self._completion_kwargs(messages, kwargs),
+            timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC),
+        )
+        return self._parse_response(response)
+
+    async def agenerate_stream(
+        self, messages: list[MessageDict], **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response with the async client. Closing the stream (e.g. when the SSE
+        client disconnects) closes the HTTP response, which makes vLLM abort the request.
+        """
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        completion_kwargs = self._completion_kwargs(messages, kwargs)
+        completion_kwargs["model"] = self.config.model_name_or_path
+        stream = await self.async_clients.get().chat.completions.create(
+            **completion_kwargs, stream=True, timeout=kwargs.get("timeout", LLM_ASYNC_TIMEOUT_SEC)
+        )
+        texts = iter_async_stream(
+            stream, self.config.remove_think_prefix, reasoning_attr="reasoning"
+        )
+        async with aclosing(texts):
+            async for text in texts:
+                yield text
+
+    def _completion_kwargs(self, messages: list[MessageDict], kwargs: dict[str, Any]) -> dict:
+        completion_kwargs = {
+            "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "extra_body": kwargs.get("extra_body", self.config.extra_body),
+        }
+        if kwargs.get("tools"):
+            completion_kwargs["tools"] = kwargs.get("tools")
+            completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
+        return completion_kwargs
+
+    def _parse_response(self, response: Any) -> Any:
+        if not response.choices:
+            logger.warning("VLLM response has no choices")
+            return ""
+
+        if response.choices[0].message.tool_calls:
+            return self.tool_call_parser(response.choices[0].message.tool_calls)
+
+        reasoning_content = (
+            f"<think>{response.choices[0].message.reasoning}</think>"
+            if hasattr(response.choices[0].message, "reasoning")
+            else ""
+        )
+        response_text = response.choices[0].message.content or ""
+        logger.info(f"VLLM API response: {response_text}")
+        return (
+            remove_thinking_tags(response_text)
+            if getattr(self.config, "remove_think_prefix", False)
+            else reasoning_content + response_text
+        )
+
     def _messages_to_prompt(self, messages: list[MessageDict]) -> str:
         """
         Convert messages to prompt string.
@@ -174,22 +224,15 @@ class VLLMLLM(BaseLLM):
 
             stream = self.client.chat.completions.create(**completion_kwargs)
 
-            reasoning_started = False
+            formatter = ReasoningStreamFormatter(self.config.remove_think_prefix)
             for chunk in stream:
                 if not chunk.choices:
                     continue
                 delta = chunk.choices[0].delta
-                if hasattr(delta, "reasoning") and delta.reasoning:
-                    if not reasoning_started and not self.config.remove_think_prefix:
-                        yield "<think>"
-                        reasoning_started = True
-                    yield delta.reasoning
-
-            if hasattr(delta, "content") and delta.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield delta.content
+                yield from formatter.push(
+                    getattr(delta, "reasoning", None), getattr(delta, "content", None)
+                )
+            yield from formatter.finish()
 
         else:
             raise RuntimeError("API client is not available")
@@ -27,6 +27,7 @@ from memos.mem_feedback.utils import (
 from memos.mem_reader.factory import MemReaderFactory
 from memos.mem_reader.read_multi_modal import detect_lang
 from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.organize.aggregates import update_node_tracked
 from memos.memories.textual.tree_text_memory.organize.manager import (
     MemoryManager,
     extract_working_binding_ids,
@@ -306,8 +307,12 @@ class MemFeedback(BaseMemFeedback):
             self.graph_store.update_node(
                 item_id, {"covered_history": old_memory_item.id}, user_name=user_name
             )
-            self.graph_store.update_node(
-                old_memory_item.id, {"status": "archived"}, user_name=user_name
+            update_node_tracked(
+                self.graph_store,
+                old_memory_item.id,
+                {"status": "archived"},
+                user_name=user_name,
+                old_metadata=old_memory_item.metadata.model_dump(),
             )
 
         logger.info(
@@ -15,6 +15,7 @@ from memos.mem_reader.read_skill_memory.process_skill_memory import process_skil
 from memos.mem_reader.simple_struct import PROMPT_DICT, SimpleStructMemReader
 from memos.mem_reader.utils import parse_json_result
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memos_tools.token_counter import IncrementalTokenCounter
 from memos.templates.mem_reader_prompts import MEMORY_MERGE_PROMPT_EN, MEMORY_MERGE_PROMPT_ZH
 from memos.templates.tool_mem_prompts import TOOL_TRAJECTORY_PROMPT_EN, TOOL_TRAJECTORY_PROMPT_ZH
 from memos.types import MessagesType
@@ -214,7 +215,8 @@ class MultiModalStructMemReader(SimpleStructMemReader):
 
         windows = []
         buf_items = []
-        cur_text = ""
+        # Items are counted once; the window total is updated as items enter and leave
+        window_tokens = IncrementalTokenCounter()
 
         # Extract info from first item (all items should have same user_id, session_id)
         first_item = processed_items[0]
@@ -232,7 +234,8 @@ class MultiModalStructMemReader(SimpleStructMemReader):
             # Check if adding this item would exceed max_tokens (same logic as _iter_chat_windows)
             # Note: After splitting large items, each item should be <= max_tokens,
             # but we still check to handle edge cases
-            if self._count_tokens(cur_text + line) > max_tokens and cur_text:
+            line_tokens = self._count_tokens(line)
+            if window_tokens.total + line_tokens > max_tokens and window_tokens.total:
                 # Yield current window
                 window = self._build_window_from_items(buf_items, info)
                 if window:
@@ -240,18 +243,13 @@ class MultiModalStructMemReader(SimpleStructMemReader):
 
                 # Keep overlap: remove items until remaining tokens <= overlap
                 # (same logic as _iter_chat_windows)
-                while (
-                    buf_items
-                    and self._count_tokens("".join([it.memory or "" for it in buf_items])) > overlap
-                ):
+                while buf_items and window_tokens.total > overlap:
                     buf_items.pop(0)
-                # Recalculate cur_text from remaining items
-                cur_text = "".join([it.memory or "" for it in buf_items])
+                    window_tokens.popleft()
 
             # Add item to current window
             buf_items.append(item)
-            # Recalculate cur_text from all items in buffer (same as _iter_chat_windows)
-            cur_text = "".join([it.memory or "" for it in buf_items])
+            window_tokens.append(line, line_tokens)
 
         # Yield final window if any items remain
         if buf_items:
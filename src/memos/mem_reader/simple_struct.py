@@ -35,6 +35,7 @@ from memos.memories.textual.item import (
     TextualMemoryItem,
     TreeNodeTextualMemoryMetadata,
 )
+from memos.memos_tools.token_counter import IncrementalTokenCounter
 from memos.templates.mem_reader_prompts import (
     CUSTOM_TAGS_INSTRUCTION,
     CUSTOM_TAGS_INSTRUCTION_ZH,
@@ -295,8 +296,9 @@ class SimpleStructMemReader(BaseMemReader, ABC):
         use token counter to get a slide window generator
         """
         max_tokens = max_tokens or self.chat_window_max_tokens
-        buf, sources, start_idx = [], [], 0
-        cur_text = ""
+        # Lines are counted once; the window total is updated as lines enter and leave
+        window = IncrementalTokenCounter()
+        sources, start_idx = [], 0
         for idx, item in enumerate(scene_data_info):
             role = item.get("role", "")
             content = item.get("content", "")
@@ -309,16 +311,15 @@ class SimpleStructMemReader(BaseMemReader, ABC):
             prefix = "".join(parts)
             line = f"{prefix}{content}\n"
 
-            if self._count_tokens(cur_text + line) > max_tokens and cur_text:
-                text = "".join(buf)
-                yield {"text": text, "sources": sources.copy(), "start_idx": start_idx}
-                while buf and self._count_tokens("".join(buf)) > overlap:
-                    buf.pop(0)
+            line_tokens = self._count_tokens(line)
+            if window.total + line_tokens > max_tokens and len(window):
+                yield {"text": window.text(), "sources": sources.copy(), "start_idx": start_idx}
+                while len(window) and window.total > overlap:
+                    window.popleft()
                     sources.pop(0)
                 start_idx = idx
-                cur_text = "".join(buf)
 
-            buf.append(line)
+            window.append(line, line_tokens)
             sources.append(
                 {
                     "type": "chat",
@@ -328,10 +329,9 @@ class SimpleStructMemReader(BaseMemReader, ABC):
                     "content": content,
                 }
             )
-            cur_text = "".join(buf)
 
-        if buf:
-            yield {"text": "".join(buf), "sources": sources.copy(), "start_idx": start_idx}
+        if len(window):
+            yield {"text": window.text(), "sources": sources.copy(), "start_idx": start_idx}
 
     @timed
     def _process_chat_data(self, scene_data_info, info, **kwargs):
@@ -2,29 +2,14 @@ import json
 import re
 
 from memos import log
+from memos.memos_tools.token_counter import count_tokens
 
 
 logger = log.get_logger(__name__)
 
-try:
-    import tiktoken
 
-    try:
-        _ENC = tiktoken.encoding_for_model("gpt-4o-mini")
-    except Exception:
-        _ENC = tiktoken.get_encoding("cl100k_base")
-
-    def count_tokens_text(s: str) -> int:
-        return len(_ENC.encode(s or "", disallowed_special=()))
-except Exception:
-    # Heuristic fallback: zh chars ~1 token, others ~1 token per ~4 chars
-    def count_tokens_text(s: str) -> int:
-        if not s:
-            return 0
-        zh_chars = re.findall(r"[\u4e00-\u9fff]", s)
-        zh = len(zh_chars)
-        rest = len(s) - zh
-        return zh + max(1, rest // 4)
+def count_tokens_text(s: str) -> int:
+    return count_tokens(s)
 
 
 def derive_key(text: str, max_len: int = 80) -> str:
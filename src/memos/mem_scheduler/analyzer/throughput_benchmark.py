@@ -0,0 +1,468 @@
+"""
+Scheduler Throughput Benchmark
+
+This module runs the real `SchedulerRedisQueue`, `SchedulerOrchestrator` and
+`SchedulerDispatcher` against an in-process fakeredis server with stub handlers of
+configurable latency, and reports:
+- enqueue rate
+- end-to-end task latency percentiles (enqueue -> handler finished)
+- fairness across users and labels
+- Redis commands per task
+
+The report is a plain JSON document so runs can be diffed across commits:
+
+    python -m memos.mem_scheduler.analyzer.throughput_benchmark --output bench.json
+    python -m memos.mem_scheduler.analyzer.throughput_benchmark --compare base.json bench.json
+"""
+
+import argparse
+import json
+import math
+import subprocess
+import threading
+import time
+
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from memos.dependency import require_python_package
+from memos.log import get_logger
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.task_schedule_modules.dispatcher import SchedulerDispatcher
+from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+from memos.mem_scheduler.utils import metrics
+
+
+logger = get_logger(__name__)
+
+REPORT_SCHEMA_VERSION = 1
+
+
+@dataclass
+class SchedulerBenchmarkConfig:
+    """Workload description for a single benchmark run."""
+
+    num_users: int = 4
+    mem_cubes_per_user: int = 1
+    tasks_per_stream: int = 50
+    labels: list[str] = field(default_factory=lambda: ["mem_read", "mem_update"])
+    # Stub handler latency in milliseconds, per label (falls back to `default_latency_ms`)
+    handler_latency_ms: dict[str, float] = field(default_factory=dict)
+    default_latency_ms: float = 5.0
+    consume_batch: int = 3
+    consume_interval_seconds: float = 0.01
+    max_workers: int = 8
+    use_xautoclaim: bool = True
+    timeout_seconds: float = 120.0
+
+
+class RedisCommandCounter:
+    """Proxy around a Redis client that counts issued commands and round trips."""
+
+    def __init__(self, client: Any):
+        self._client = client
+        self._lock = threading.Lock()
+        self.command_counts: Counter = Counter()
+        self.round_trips = 0
+
+    def _record(self, command: str, round_trip: bool) -> None:
+        with self._lock:
+            self.command_counts[command] += 1
+            if round_trip:
+                self.round_trips += 1
+
+    def _record_round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.command_counts.clear()
+            self.round_trips = 0
+
+    def snapshot(self) -> tuple[dict[str, int], int]:
+        with self._lock:
+            return dict(self.command_counts), self.round_trips
+
+    def pipeline(self, *args, **kwargs) -> "_CountingPipeline":
+        return _CountingPipeline(self._client.pipeline(*args, **kwargs), self)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def _counted(*args, **kwargs):
+            self._record(name, round_trip=True)
+            return attr(*args, **kwargs)
+
+        return _counted
+
+
+class _CountingPipeline:
+    """Pipeline proxy: every queued command is counted, `execute` is one round trip."""
+
+    def __init__(self, pipeline: Any, counter: RedisCommandCounter):
+        self._pipeline = pipeline
+        self._counter = counter
+
+    def execute(self, *args, **kwargs):
+        self._counter._record_round_trip()
+        return self._pipeline.execute(*args, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._pipeline.__exit__(exc_type, exc_val, exc_tb)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._pipeline, name)
+        if not callable(attr):
+            return attr
+
+        def _counted(*args, **kwargs):
+            self._counter._record(name, round_trip=False)
+            return attr(*args, **kwargs)
+
+        return _counted
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; `pct` in [0, 100]."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def jain_fairness_index(values: list[float]) -> float | None:
+    """Jain's fairness index: 1.0 means perfectly even, 1/n means one party got everything."""
+    if not values:
+        return None
+    square_of_sum = sum(values) ** 2
+    sum_of_squares = sum(v * v for v in values)
+    if sum_of_squares == 0:
+        return 1.0
+    return square_of_sum / (len(values) * sum_of_squares)
+
+
+def _latency_summary(latencies_ms: list[float]) -> dict[str, float | None]:
+    return {
+        "count": len(latencies_ms),
+        "mean": sum(latencies_ms) / len(latencies_ms) if latencies_ms else None,
+        "p50": percentile(latencies_ms, 50),
+        "p90": percentile(latencies_ms, 90),
+        "p99": percentile(latencies_ms, 99),
+        "max": max(latencies_ms) if latencies_ms else None,
+    }
+
+
+def _current_git_commit() -> str | None:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, cwd=Path(__file__).parent
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return None
+
+
+class SchedulerThroughputBenchmark:
+    """Drive the scheduler queue/broker/dispatcher stack with a synthetic workload."""
+
+    @require_python_package(
+        import_name="fakeredis",
+        install_command="pip install fakeredis",
+        install_link="https://fakeredis.readthedocs.io/",
+    )
+    def __init__(self, config: SchedulerBenchmarkConfig | None = None):
+        import fakeredis
+
+        self.config = config or SchedulerBenchmarkConfig()
+        self.redis_counter = RedisCommandCounter(fakeredis.FakeRedis(decode_responses=True))
+        self.orchestrator = SchedulerOrchestrator()
+        self.queue = SchedulerRedisQueue(
+            stream_key_prefix=f"scheduler:bench:{int(time.time() * 1000)}",
+            orchestrator=self.orchestrator,
+            redis_client=self.redis_counter,
+        )
+        # fakeredis does not implement INFO, so xautoclaim support cannot be probed
+        self.queue.supports_xautoclaim = self.config.use_xautoclaim
+        self.dispatcher = SchedulerDispatcher(
+            max_workers=self.config.max_workers,
+            memos_message_queue=self.queue,
+            enable_parallel_dispatch=True,
+            metrics=metrics,
+            orchestrator=self.orchestrator,
+        )
+
+        self._results_lock = threading.Lock()
+        self._finish_times: dict[str, float] = {}
+        self._enqueue_times: dict[str, float] = {}
+        self._messages_by_id: dict[str, ScheduleMessageItem] = {}
+        self._all_done = threading.Event()
+        self._expected_tasks = 0
+
+        for label in self.config.labels:
+            self.dispatcher.register_handler(label=label, handler=self._make_stub_handler(label))
+
+    def _make_stub_handler(self, label: str):
+        latency_sec = (
+            self.config.handler_latency_ms.get(label, self.config.default_latency_ms) / 1000
+        )
+
+        def _handler(messages: list[ScheduleMessageItem]) -> None:
+            if latency_sec > 0:
+                time.sleep(latency_sec)
+            finished = time.perf_counter()
+            with self._results_lock:
+                for msg in messages:
+                    self._finish_times.setdefault(msg.item_id, finished)
+                if len(self._finish_times) >= self._expected_tasks:
+                    self._all_done.set()
+
+        return _handler
+
+    def _build_workload(self) -> list[ScheduleMessageItem]:
+        messages = []
+        for task_idx in range(self.config.tasks_per_stream):
+            for user_idx in range(self.config.num_users):
+                for cube_idx in range(self.config.mem_cubes_per_user):
+                    for label in self.config.labels:
+                        messages.append(
+                            ScheduleMessageItem(
+                                user_id=f"bench_user_{user_idx}",
+                                mem_cube_id=f"bench_cube_{user_idx}_{cube_idx}",
+                                label=label,
+                                content=f"task {task_idx}",
+                            )
+                        )
+        return messages
+
+    def _enqueue(self, messages: list[ScheduleMessageItem]) -> float:
+        start = time.perf_counter()
+        for msg in messages:
+            self._enqueue_times[msg.item_id] = time.perf_counter()
+            self.queue.put(msg)
+        return time.perf_counter() - start
+
+    def _consume_until_done(self) -> None:
+        deadline = time.perf_counter() + self.config.timeout_seconds
+        while not self._all_done.is_set() and time.perf_counter() < deadline:
+            if self.dispatcher.get_running_task_count() >= self.dispatcher.max_workers:
+                time.sleep(self.config.consume_interval_seconds)
+                continue
+            messages = self.queue.get_messages(batch_size=self.config.consume_batch)
+            if messages:
+                self.dispatcher.dispatch(messages)
+            time.sleep(self.config.consume_interval_seconds)
+        self.dispatcher.join(timeout=max(0.0, deadline - time.perf_counter()))
+
+    def run(self) -> dict[str, Any]:
+        """Run the workload once and return the report dictionary."""
+        messages = self._build_workload()
+        self._messages_by_id = {msg.item_id: msg for msg in messages}
+        self._expected_tasks = len(messages)
+
+        self.redis_counter.reset()
+        enqueue_seconds = self._enqueue(messages)
+
+        consume_start = time.perf_counter()
+        self._consume_until_done()
+        consume_seconds = time.perf_counter() - consume_start
+
+        commands, round_trips = self.redis_counter.snapshot()
+        report = self._build_report(
+            enqueue_seconds=enqueue_seconds,
+            consume_seconds=consume_seconds,
+            commands=commands,
+            round_trips=round_trips,
+        )
+        self.shutdown()
+        return report
+
+    def _build_report(
+        self,
+        enqueue_seconds: float,
+        consume_seconds: float,
+        commands: dict[str, int],
+        round_trips: int,
+    ) -> dict[str, Any]:
+        latencies_ms: list[float] = []
+        by_user: dict[str, list[float]] = defaultdict(list)
+        by_label: dict[str, list[float]] = defaultdict(list)
+        for item_id, finished in self._finish_times.items():
+            msg = self._messages_by_id.get(item_id)
+            if msg is None:
+                continue
+            latency_ms = (finished - self._enqueue_times[item_id]) * 1000
+            latencies_ms.append(latency_ms)
+            by_user[msg.user_id].append(latency_ms)
+            by_label[msg.label].append(latency_ms)
+
+        completed = len(latencies_ms)
+        total_commands = sum(commands.values())
+        return {
+            "schema_version": REPORT_SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _current_git_commit(),
+            "config": asdict(self.config),
+            "tasks": {"submitted": self._expected_tasks, "completed": completed},
+            "enqueue": {
+                "seconds": enqueue_seconds,
+                "rate_per_sec": self._expected_tasks / enqueue_seconds if enqueue_seconds else None,
+            },
+            "throughput": {
+                "seconds": consume_seconds,
+                "tasks_per_sec": completed / consume_seconds if consume_seconds else None,
+            },
+            "latency_ms": _latency_summary(latencies_ms),
+            "fairness": {
+                "users_jain_index_mean_latency": jain_fairness_index(
+                    [sum(v) / len(v) for v in by_user.values()]
+                ),
+                "labels_jain_index_mean_latency": jain_fairness_index(
+                    [sum(v) / len(v) for v in by_label.values()]
+                ),
+                "by_user": {k: _latency_summary(v) for k, v in sorted(by_user.items())},
+                "by_label": {k: _latency_summary(v) for k, v in sorted(by_label.items())},
+            },
+            "redis": {
+                "total_commands": total_commands,
+                "round_trips": round_trips,
+                "commands_per_task": total_commands / completed if completed else None,
+                "round_trips_per_task": round_trips / completed if completed else None,
+                "by_command": dict(sorted(commands.items())),
+            },
+        }
+
+    def shutdown(self) -> None:
+        self.dispatcher.shutdown()
+        self.queue._stop_stream_keys_refresh_thread()
+
+
+# Report keys compared by `compare_reports`: (path, higher_is_better)
+COMPARED_METRICS = [
+    (("enqueue", "rate_per_sec"), True),
+    (("throughput", "tasks_per_sec"), True),
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p90"), False),
+    (("latency_ms", "p99"), False),
+    (("fairness", "users_jain_index_mean_latency"), True),
+    (("fairness", "labels_jain_index_mean_latency"), True),
+    (("redis", "commands_per_task"), False),
+    (("redis", "round_trips_per_task"), False),
+]
+
+
+def compare_reports(baseline: dict[str, Any], candidate: dict[str, Any]) -> dict[str, dict]:
+    """
+    Compare two benchmark reports metric by metric.
+
+    Returns:
+        Mapping from dotted metric name to baseline/candidate values, the relative
+        change and whether the change is an improvement.
+    """
+    comparison: dict[str, dict] = {}
+    for path, higher_is_better in COMPARED_METRICS:
+        base_value = baseline
+        cand_value = candidate
+        for key in path:
+            base_value = (base_value or {}).get(key)
+            cand_value = (cand_value or {}).get(key)
+        change = None
+        if base_value and cand_value is not None:
+            change = (cand_value - base_value) / base_value
+        comparison[".".join(path)] = {
+            "baseline": base_value,
+            "candidate": cand_value,
+            "relative_change": change,
+            "improved": None if change is None else (change > 0) == higher_is_better,
+        }
+    return comparison
+
+
+def run_benchmark(config: SchedulerBenchmarkConfig | None = None) -> dict[str, Any]:
+    return SchedulerThroughputBenchmark(config=config).run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scheduler throughput benchmark (fakeredis)")
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--cubes-per-user", type=int, default=1)
+    parser.add_argument("--tasks-per-stream", type=int, default=50)
+    parser.add_argument("--labels", nargs="+", default=["mem_read", "mem_update"])
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=5.0,
+        help="Default stub handler latency in milliseconds",
+    )
+    parser.add_argument(
+        "--label-latency",
+        nargs="*",
+        default=[],
+        metavar="LABEL=MS",
+        help="Per-label stub handler latency, e.g. mem_read=20",
+    )
+    parser.add_argument("--consume-batch", type=int, default=3)
+    parser.add_argument("--consume-interval", type=float, default=0.01)
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--no-xautoclaim", action="store_true")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON report here")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CANDIDATE"),
+        help="Compare two existing reports instead of running the benchmark",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            candidate = json.load(f)
+        print(json.dumps(compare_reports(baseline, candidate), indent=2))
+        return
+
+    label_latency = {}
+    for item in args.label_latency:
+        label, _, value = item.partition("=")
+        label_latency[label] = float(value)
+
+    config = SchedulerBenchmarkConfig(
+        num_users=args.users,
+        mem_cubes_per_user=args.cubes_per_user,
+        tasks_per_stream=args.tasks_per_stream,
+        labels=args.labels,
+        handler_latency_ms=label_latency,
+        default_latency_ms=args.latency_ms,
+        consume_batch=args.consume_batch,
+        consume_interval_seconds=args.consume_interval,
+        max_workers=args.max_workers,
+        use_xautoclaim=not args.no_xautoclaim,
+        timeout_seconds=args.timeout,
+    )
+    report = run_benchmark(config)
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json)
+        logger.info(f"Benchmark report written to {args.output}")
+    print(report_json)
+
+
+if __name__ == "__main__":
+    main()
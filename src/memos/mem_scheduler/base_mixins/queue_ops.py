@@ -46,6 +46,16 @@ class BaseSchedulerQueueMixin:
             if current_trace_id:
                 msg.trace_id = current_trace_id
 
+            if self.admission_controller is not None and self.admission_controller.should_shed(
+                label=msg.label, user_id=msg.user_id
+            ):
+                logger.warning(
+                    "Shedding %s task for user %s due to scheduler queue backlog",
+                    msg.label,
+                    msg.user_id,
+                )
+                continue
+
             with suppress(Exception):
                 self.metrics.task_enqueued(user_id=msg.user_id, task_type=msg.label)
 
@@ -194,14 +204,14 @@ class BaseSchedulerQueueMixin:
                             self.metrics.task_dequeued(user_id=msg.user_id, task_type=msg.label)
                         finally:
                             set_request_context(prev_context)
-                    try:
-                        with suppress(Exception):
-                            if messages:
-                                self.dispatcher.on_messages_enqueued(messages)
 
-                        self.dispatcher.dispatch(messages)
-                    except Exception as e:
-                        logger.error("Error dispatching messages: %s", e)
+                if self.message_coalescer is not None:
+                    # Buffered groups are released once their window elapses, even if
+                    # nothing new was fetched in this round
+                    messages = self.message_coalescer.add_and_release(messages)
+
+                if messages:
+                    self._dispatch_consumed_messages(messages)
 
                 time.sleep(self._consume_interval)
 
@@ -210,6 +220,22 @@ class BaseSchedulerQueueMixin:
                     logger.error("Unexpected error in message consumer: %s", e, exc_info=True)
                 time.sleep(self._consume_interval)
 
+        if self.message_coalescer is not None:
+            remaining = self.message_coalescer.release(force=True)
+            if remaining:
+                logger.info("Dispatching %s coalesced messages left on shutdown", len(remaining))
+                self._dispatch_consumed_messages(remaining)
+
+    def _dispatch_consumed_messages(self, messages: list[ScheduleMessageItem]) -> None:
+        try:
+            with suppress(Exception):
+                if messages:
+                    self.dispatcher.on_messages_enqueued(messages)
+
+            self.dispatcher.dispatch(messages)
+        except Exception as e:
+            logger.error("Error dispatching messages: %s", e)
+
     def _monitor_loop(self):
         while self._running:
             try:
@@ -27,17 +27,32 @@ from memos.mem_scheduler.monitors.general_monitor import SchedulerGeneralMonitor
 from memos.mem_scheduler.monitors.task_schedule_monitor import TaskScheduleMonitor
 from memos.mem_scheduler.schemas.general_schemas import (
     DEFAULT_ACT_MEM_DUMP_PATH,
+    DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS,
+    DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_POLICY,
+    DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
     DEFAULT_CONSUME_BATCH,
     DEFAULT_CONSUME_INTERVAL_SECONDS,
     DEFAULT_CONTEXT_WINDOW_SIZE,
+    DEFAULT_ENABLE_ADMISSION_CONTROL,
+    DEFAULT_ENABLE_MESSAGE_COALESCING,
     DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE,
     DEFAULT_MAX_WEB_LOG_QUEUE_SIZE,
+    DEFAULT_MESSAGE_COALESCE_MAX_BATCH,
+    DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS,
     DEFAULT_STARTUP_MODE,
     DEFAULT_THREAD_POOL_MAX_WORKERS,
     DEFAULT_TOP_K,
     DEFAULT_USE_REDIS_QUEUE,
+    DEFAULT_USE_SQLITE_QUEUE,
     TreeTextMemory_SEARCH_METHOD,
 )
+from memos.mem_scheduler.task_schedule_modules.admission_control import (
+    DEFAULT_ADMISSION_SHED_LABELS,
+    SchedulerAdmissionController,
+)
+from memos.mem_scheduler.task_schedule_modules.coalescer import SchedulerMessageCoalescer
 from memos.mem_scheduler.task_schedule_modules.dispatcher import SchedulerDispatcher
 from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
 from memos.mem_scheduler.task_schedule_modules.task_queue import ScheduleTaskQueue
@@ -118,6 +133,8 @@ class BaseScheduler(
 
         # message queue configuration
         self.use_redis_queue = self.config.get("use_redis_queue", DEFAULT_USE_REDIS_QUEUE)
+        self.use_sqlite_queue = self.config.get("use_sqlite_queue", DEFAULT_USE_SQLITE_QUEUE)
+        self.sqlite_queue_path = self.config.get("sqlite_queue_path", None)
         self.max_internal_message_queue_size = self.config.get(
             "max_internal_message_queue_size", DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE
         )
@@ -137,6 +154,8 @@ class BaseScheduler(
         self._monitor_thread = None
         self.memos_message_queue = ScheduleTaskQueue(
             use_redis_queue=self.use_redis_queue,
+            use_sqlite_queue=self.use_sqlite_queue,
+            sqlite_queue_path=self.sqlite_queue_path,
             maxsize=self.max_internal_message_queue_size,
             disabled_handlers=self.disabled_handlers,
             orchestrator=self.orchestrator,
@@ -152,6 +171,44 @@ class BaseScheduler(
             submit_web_logs=self._submit_web_logs,
             orchestrator=self.orchestrator,
         )
+        # Optional coalescing stage between the task queue and the dispatcher
+        self.enable_message_coalescing = self.config.get(
+            "enable_message_coalescing", DEFAULT_ENABLE_MESSAGE_COALESCING
+        )
+        self.message_coalescer: SchedulerMessageCoalescer | None = None
+        if self.enable_message_coalescing:
+            self.message_coalescer = SchedulerMessageCoalescer(
+                window_seconds=self.config.get(
+                    "message_coalesce_window_seconds", DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS
+                ),
+                max_batch_size=self.config.get(
+                    "message_coalesce_max_batch", DEFAULT_MESSAGE_COALESCE_MAX_BATCH
+                ),
+            )
+        # Optional admission control based on the task queue backlog
+        self.enable_admission_control = self.config.get(
+            "enable_admission_control", DEFAULT_ENABLE_ADMISSION_CONTROL
+        )
+        self.admission_controller: SchedulerAdmissionController | None = None
+        if self.enable_admission_control:
+            self.admission_controller = SchedulerAdmissionController(
+                memos_message_queue=self.memos_message_queue,
+                policy=self.config.get("admission_policy", DEFAULT_ADMISSION_POLICY),
+                max_user_queue_depth=self.config.get(
+                    "admission_max_user_queue_depth", DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH
+                ),
+                max_global_queue_depth=self.config.get(
+                    "admission_max_global_queue_depth", DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH
+                ),
+                max_oldest_age_seconds=self.config.get(
+                    "admission_max_oldest_age_seconds", DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS
+                ),
+                shed_labels=self.config.get("admission_shed_labels")
+                or DEFAULT_ADMISSION_SHED_LABELS,
+                retry_after_seconds=self.config.get(
+                    "admission_retry_after_seconds", DEFAULT_ADMISSION_RETRY_AFTER_SECONDS
+                ),
+            )
         # Task schedule monitor: initialize with underlying queue implementation
         self.get_status_parallel = self.config.get("get_status_parallel", True)
         self.task_schedule_monitor = TaskScheduleMonitor(
@@ -15,6 +15,19 @@ from memos.types.general_types import MemCubeID, UserID
 logger = get_logger(__name__)
 
 
+def order_for_prefix_reuse(cached_memories: list[str], new_memories: list[str]) -> list[str]:
+    """
+    Order memories so that those already in the cached composition come first, in
+    their cached order, followed by new ones. The composed text then shares the
+    longest possible prefix with the cached one, and so does its KV cache.
+    """
+    remaining = list(dict.fromkeys(m for m in new_memories if m.strip()))
+    remaining_set = set(remaining)
+    stable = [m for m in dict.fromkeys(cached_memories) if m in remaining_set]
+    stable_set = set(stable)
+    return stable + [m for m in remaining if m not in stable_set]
+
+
 class ActivationMemoryManager:
     def __init__(
         self,
@@ -39,6 +52,9 @@ class ActivationMemoryManager:
         """
         Update activation memory by extracting KVCacheItems from new_memory (list of str),
         add them to a KVCacheMemory instance, and dump to disk.
+
+        Memories kept from the previous composition stay first and in order, so the
+        Hugging Face KV cache is rebuilt by prefilling only the changed tail.
         """
         if len(new_memories) == 0:
             logger.error("update_activation_memory: new_memory is empty.")
@@ -60,22 +76,26 @@ class ActivationMemoryManager:
                 logger.error("Not Implemented.")
                 return
 
+            # huggingface or vllm kv cache
+            original_cache_items: list[VLLMKVCacheItem] = act_mem.get_all()
+            original_text_memories = []
+            pre_cache_item = None
+            if len(original_cache_items) > 0:
+                pre_cache_item = original_cache_items[-1]
+                original_text_memories = pre_cache_item.records.text_memories
+
+            # Skip empty strings; keep memories of the cached composition first
+            new_text_memories = order_for_prefix_reuse(original_text_memories, new_text_memories)
             new_text_memory = MEMORY_ASSEMBLY_TEMPLATE.format(
                 memory_text="".join(
                     [
                         f"{i + 1}. {sentence.strip()}\n"
                         for i, sentence in enumerate(new_text_memories)
-                        if sentence.strip()  # Skip empty strings
                     ]
                 )
             )
 
-            # huggingface or vllm kv cache
-            original_cache_items: list[VLLMKVCacheItem] = act_mem.get_all()
-            original_text_memories = []
-            if len(original_cache_items) > 0:
-                pre_cache_item: VLLMKVCacheItem = original_cache_items[-1]
-                original_text_memories = pre_cache_item.records.text_memories
+            if pre_cache_item is not None:
                 original_composed_text_memory = pre_cache_item.records.composed_text_memory
                 if original_composed_text_memory == new_text_memory:
                     logger.warning(
@@ -85,10 +105,15 @@ class ActivationMemoryManager:
                         else new_text_memory,
                     )
                     return
-                act_mem.delete_all()
 
-            cache_item = act_mem.extract(new_text_memory)
+            if isinstance(act_mem, VLLMKVCacheMemory) or pre_cache_item is None:
+                cache_item = act_mem.extract(new_text_memory)
+            else:
+                cache_item = act_mem.extract(new_text_memory, base=pre_cache_item)
+            if pre_cache_item is not None:
+                act_mem.delete_all()
             cache_item.records.text_memories = new_text_memories
+            cache_item.records.composed_text_memory = new_text_memory
             cache_item.records.timestamp = get_utc_now()
 
             act_mem.add([cache_item])
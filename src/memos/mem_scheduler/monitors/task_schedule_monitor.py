@@ -3,6 +3,11 @@ from __future__ import annotations
 from memos.log import get_logger
 from memos.mem_scheduler.task_schedule_modules.local_queue import SchedulerLocalQueue
 from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+from memos.mem_scheduler.task_schedule_modules.sqlite_queue import (
+    LEASED_STATUS,
+    READY_STATUS,
+    SchedulerSQLiteQueue,
+)
 
 
 logger = get_logger(__name__)
@@ -13,13 +18,13 @@ class TaskScheduleMonitor:
     Monitor for task scheduling queue status.
 
     Initialize with the underlying `memos_message_queue` implementation
-    (either SchedulerRedisQueue or SchedulerLocalQueue) and optionally a
+    (SchedulerRedisQueue, SchedulerSQLiteQueue or SchedulerLocalQueue) and optionally a
     dispatcher for local running task counts.
     """
 
     def __init__(
         self,
-        memos_message_queue: SchedulerRedisQueue | SchedulerLocalQueue,
+        memos_message_queue: SchedulerRedisQueue | SchedulerSQLiteQueue | SchedulerLocalQueue,
         dispatcher: object | None = None,
         get_status_parallel: bool = False,
     ) -> None:
@@ -34,6 +39,8 @@ class TaskScheduleMonitor:
     def get_tasks_status(self) -> dict:
         if isinstance(self.queue, SchedulerRedisQueue):
             return self._get_redis_tasks_status()
+        elif isinstance(self.queue, SchedulerSQLiteQueue):
+            return self._get_sqlite_tasks_status()
         elif isinstance(self.queue, SchedulerLocalQueue):
             return self._get_local_tasks_status()
         else:
@@ -67,7 +74,7 @@ class TaskScheduleMonitor:
         header = f"Task Queue Status | running={total_running}, remaining={total_remaining}"
         print(header)
 
-        if isinstance(self.queue, SchedulerRedisQueue):
+        if isinstance(self.queue, SchedulerRedisQueue | SchedulerSQLiteQueue):
             # Build grouping: {"user_id:mem_cube_id": {task_label: {counts}}}
             try:
                 from collections import defaultdict
@@ -164,6 +171,29 @@ class TaskScheduleMonitor:
             logger.warning(f"Failed to collect local queue status: {e}")
         return task_status
 
+    def _get_sqlite_tasks_status(self) -> dict:
+        task_status = self.init_task_status()
+
+        try:
+            stream_counts = self.queue.get_stream_task_counts()
+        except Exception as e:
+            logger.warning(f"Failed to collect SQLite queue status: {e}")
+            return task_status
+
+        for stream_key, counts in stream_counts.items():
+            # running = leased to a consumer, not yet acked; remaining = not yet delivered
+            running = int(counts.get(LEASED_STATUS, 0))
+            remaining = int(counts.get(READY_STATUS, 0))
+            task_status[stream_key] = self.init_task_status()
+            task_status[stream_key]["running"] += running
+            task_status[stream_key]["pending"] += remaining
+            task_status[stream_key]["remaining"] += remaining
+            task_status["running"] += running
+            task_status["pending"] += remaining
+            task_status["remaining"] += remaining
+
+        return task_status
+
     def _get_redis_tasks_status(self) -> dict:
         task_status = self.init_task_status()
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import declarative_base
 from memos.log import get_logger
 from memos.mem_scheduler.orm_modules.base_model import DatabaseError
 from memos.mem_scheduler.schemas.api_schemas import (
+    APIMemoryHistoryEntryItem,
     APISearchHistoryManager,
 )
 from memos.mem_scheduler.utils.db_utils import get_utc_now
@@ -28,6 +29,9 @@ class APIRedisDBManager:
     # Add orm_class attribute for compatibility
     orm_class = None
 
+    # Optimistic concurrency retries in sync_with_redis before giving up
+    max_sync_attempts = 5
+
     def __init__(
         self,
         user_id: str | None = None,
@@ -65,6 +69,10 @@ class APIRedisDBManager:
         self.window_size = window_size
         self.lock_key = f"{self._get_key_prefix()}:lock"
 
+        # Delta sync state: running ids as of the last sync
+        self._synced_running_ids: set[str] = set()
+        self._legacy_checked = False
+
         logger.info(
             f"RedisDBManager initialized for user_id: {user_id}, mem_cube_id: {mem_cube_id}"
         )
@@ -94,6 +102,22 @@ class APIRedisDBManager:
         """
         return f"{self._get_key_prefix()}:data"
 
+    def _get_entries_key(self) -> str:
+        """Redis hash of completed entries: item_id -> serialized entry"""
+        return f"{self._get_key_prefix()}:entries"
+
+    def _get_order_key(self) -> str:
+        """Redis sorted set of completed entry ids scored by created_time"""
+        return f"{self._get_key_prefix()}:order"
+
+    def _get_running_key(self) -> str:
+        """Redis set of running task ids"""
+        return f"{self._get_key_prefix()}:running"
+
+    def _get_version_key(self) -> str:
+        """Redis counter bumped by every write, WATCHed for optimistic concurrency"""
+        return f"{self._get_key_prefix()}:version"
+
     def _init_redis_client(self):
         """Initialize Redis client from config or environment"""
         try:
@@ -281,8 +305,40 @@ class APIRedisDBManager:
         )
         return merged_manager
 
+    def _entry_score(self, entry: APIMemoryHistoryEntryItem) -> float:
+        created_time = getattr(entry, "created_time", None)
+        return created_time.timestamp() if created_time is not None else 0.0
+
+    def _migrate_legacy_blob(self) -> None:
+        """Move data stored by older versions as a single JSON blob into the delta layout."""
+        if self._legacy_checked:
+            return
+        legacy_data = self.redis_client.get(self._get_data_key())
+        if legacy_data:
+            legacy = APISearchHistoryManager.from_json(legacy_data)
+            with self.redis_client.pipeline() as pipe:
+                for entry in legacy.completed_entries:
+                    pipe.hsetnx(self._get_entries_key(), entry.item_id, entry.to_json())
+                    pipe.zadd(
+                        self._get_order_key(), {entry.item_id: self._entry_score(entry)}, nx=True
+                    )
+                if legacy.running_item_ids:
+                    pipe.sadd(self._get_running_key(), *legacy.running_item_ids)
+                pipe.incr(self._get_version_key())
+                pipe.delete(self._get_data_key())
+                pipe.execute()
+            logger.info(f"Migrated legacy search history blob for {self._get_key_prefix()}")
+        self._legacy_checked = True
+
     def sync_with_redis(self, size_limit: int | None = None) -> None:
-        """Synchronize data between Redis and the business object
+        """Synchronize data between Redis and the business object using delta writes
+
+        Entries live in a Redis hash keyed by item_id, ordered by a sorted set on
+        created_time; running ids live in a set. A sync only writes entries that are
+        new or were modified (see `APISearchHistoryManager.mark_entry_dirty`), the
+        running ids added/removed since the last sync, and trims entries that fell
+        out of the window. Concurrent writers are detected with WATCH on the version
+        key instead of a lock, and the sync is retried on conflict.
 
         Args:
             size_limit: Optional maximum number of items to keep after synchronization
@@ -292,68 +348,168 @@ class APIRedisDBManager:
         if size_limit is None:
             size_limit = self.window_size
 
-        # Acquire lock before operations
-        lock_status = self.acquire_lock(block=True)
-        if not lock_status:
-            logger.error("Failed to acquire Redis lock for synchronization")
+        if self.obj is None:
+            logger.warning(f"No object to synchronize for {self._get_key_prefix()}")
             return
 
-        # Load existing data from Redis
-        data_key = self._get_data_key()
-        redis_data = self.redis_client.get(data_key)
+        from redis.exceptions import WatchError
 
-        if redis_data:
-            # Merge Redis data with current object
-            merged_obj = self.merge_items(
-                redis_data=redis_data, obj_instance=self.obj, size_limit=size_limit
-            )
-
-            # Update the current object with merged data
-            self.obj = merged_obj
-            logger.info(
-                f"Successfully synchronized with Redis data for {self.user_id}/{self.mem_cube_id}"
-            )
-        else:
-            logger.info(
-                f"No existing Redis data found for {self.user_id}/{self.mem_cube_id}, using current object"
-            )
+        self._migrate_legacy_blob()
 
-        # Save the synchronized object back to Redis
-        self.save_to_db(self.obj)
+        for attempt in range(1, self.max_sync_attempts + 1):
+            try:
+                self._sync_once(size_limit=size_limit)
+                logger.info(
+                    f"Successfully synchronized with Redis data for {self.user_id}/{self.mem_cube_id}"
+                )
+                return
+            except WatchError:
+                logger.info(
+                    f"Concurrent update detected for {self._get_key_prefix()} "
+                    f"(attempt {attempt}/{self.max_sync_attempts}), retrying"
+                )
+        logger.error(
+            f"Gave up synchronizing {self._get_key_prefix()} after "
+            f"{self.max_sync_attempts} conflicting attempts; the next sync will retry"
+        )
 
-        self.release_locks()
+    def _sync_once(self, size_limit: int | None) -> None:
+        obj = self.obj
+        entries_key = self._get_entries_key()
+        order_key = self._get_order_key()
+        running_key = self._get_running_key()
+        version_key = self._get_version_key()
+
+        with self.redis_client.pipeline() as pipe:
+            pipe.watch(version_key)
+            remote_order = dict(pipe.zrange(order_key, 0, -1, withscores=True))
+            remote_running = set(pipe.smembers(running_key))
+
+            # Rank local and remote entries together and keep the newest ones
+            local_entries = {entry.item_id: entry for entry in obj.completed_entries}
+            scores = dict(remote_order)
+            scores.update({item_id: self._entry_score(e) for item_id, e in local_entries.items()})
+            ranked_ids = sorted(scores, key=scores.get, reverse=True)
+            kept_ids = ranked_ids[:size_limit] if size_limit else ranked_ids
+            kept_set = set(kept_ids)
+
+            # Fetch only the surviving entries written by other workers
+            missing_ids = [item_id for item_id in kept_ids if item_id not in local_entries]
+            fetched: dict[str, APIMemoryHistoryEntryItem] = {}
+            if missing_ids:
+                for item_id, data in zip(
+                    missing_ids, pipe.hmget(entries_key, missing_ids), strict=False
+                ):
+                    if data:
+                        fetched[item_id] = APIMemoryHistoryEntryItem.from_json(data)
+
+            dirty_ids = obj.pop_dirty_item_ids()
+            to_write = {
+                item_id: entry
+                for item_id, entry in local_entries.items()
+                if item_id in kept_set and (item_id not in remote_order or item_id in dirty_ids)
+            }
+            to_trim = [item_id for item_id in remote_order if item_id not in kept_set]
+
+            local_running = set(obj.running_item_ids)
+            running_added = local_running - self._synced_running_ids
+            running_removed = self._synced_running_ids - local_running
+
+            try:
+                pipe.multi()
+                if to_write:
+                    pipe.hset(
+                        entries_key,
+                        mapping={item_id: e.to_json() for item_id, e in to_write.items()},
+                    )
+                    pipe.zadd(
+                        order_key,
+                        {item_id: self._entry_score(e) for item_id, e in to_write.items()},
+                    )
+                if to_trim:
+                    pipe.hdel(entries_key, *to_trim)
+                    pipe.zrem(order_key, *to_trim)
+                if running_added:
+                    pipe.sadd(running_key, *running_added)
+                if running_removed:
+                    pipe.srem(running_key, *running_removed)
+                pipe.incr(version_key)
+                pipe.execute()
+            except Exception:
+                # Entries stay dirty for the next attempt
+                obj._dirty_item_ids.update(dirty_ids)
+                raise
+
+        merged_entries = [
+            local_entries.get(item_id) or fetched.get(item_id) for item_id in kept_ids
+        ]
+        obj.completed_entries = [entry for entry in merged_entries if entry is not None]
+        obj.running_item_ids = list((remote_running | running_added) - running_removed)
+        self._synced_running_ids = set(obj.running_item_ids)
+        logger.debug(
+            f"Delta sync for {self._get_key_prefix()}: wrote {len(to_write)}, "
+            f"fetched {len(fetched)}, trimmed {len(to_trim)} entries"
+        )
 
     def save_to_db(self, obj_instance: Any) -> None:
-        """Save the current state of the business object to Redis
+        """Replace the stored state with the given business object
 
         Args:
-            obj_instance: The object instance to save (must have to_json method)
+            obj_instance: The APISearchHistoryManager instance to save
         """
+        entries = obj_instance.completed_entries
+        with self.redis_client.pipeline() as pipe:
+            pipe.delete(
+                self._get_entries_key(),
+                self._get_order_key(),
+                self._get_running_key(),
+                self._get_data_key(),
+            )
+            if entries:
+                pipe.hset(
+                    self._get_entries_key(),
+                    mapping={entry.item_id: entry.to_json() for entry in entries},
+                )
+                pipe.zadd(
+                    self._get_order_key(),
+                    {entry.item_id: self._entry_score(entry) for entry in entries},
+                )
+            if obj_instance.running_item_ids:
+                pipe.sadd(self._get_running_key(), *obj_instance.running_item_ids)
+            pipe.incr(self._get_version_key())
+            pipe.execute()
+        if obj_instance is self.obj:
+            self._synced_running_ids = set(obj_instance.running_item_ids)
+            obj_instance.pop_dirty_item_ids()
+        self._legacy_checked = True
 
-        data_key = self._get_data_key()
-
-        self.redis_client.set(data_key, obj_instance.to_json())
-
-        logger.info(f"Updated existing Redis record for {data_key}")
+        logger.info(f"Updated existing Redis record for {self._get_key_prefix()}")
 
     def load_from_db(self) -> Any | None:
-        data_key = self._get_data_key()
+        self._migrate_legacy_blob()
 
-        # Load from Redis
-        serialized_data = self.redis_client.get(data_key)
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zrevrange(self._get_order_key(), 0, -1)
+            pipe.hgetall(self._get_entries_key())
+            pipe.smembers(self._get_running_key())
+            ordered_ids, entries, running_ids = pipe.execute()
 
-        if not serialized_data:
-            logger.info(f"No Redis record found for {data_key}")
+        if not ordered_ids and not running_ids:
+            logger.info(f"No Redis record found for {self._get_key_prefix()}")
             return None
 
-        # Deserialize the business object using the actual object type
-        if hasattr(self, "obj_type") and self.obj_type is not None:
-            db_instance = self.obj_type.from_json(serialized_data)
-        else:
-            # Default to APISearchHistoryManager for this class
-            db_instance = APISearchHistoryManager.from_json(serialized_data)
+        window_size = self.obj.window_size if self.obj is not None else self.window_size
+        db_instance = APISearchHistoryManager(
+            window_size=window_size,
+            completed_entries=[
+                APIMemoryHistoryEntryItem.from_json(entries[item_id])
+                for item_id in ordered_ids
+                if item_id in entries
+            ],
+            running_item_ids=list(running_ids),
+        )
 
-        logger.info(f"Successfully loaded object from Redis for {data_key} ")
+        logger.info(f"Successfully loaded object from Redis for {self._get_key_prefix()} ")
 
         return db_instance
 
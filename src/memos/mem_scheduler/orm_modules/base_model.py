@@ -10,6 +10,7 @@ from typing import Any, TypeVar
 
 from sqlalchemy import Boolean, Column, DateTime, String, Text, and_, create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from memos.log import get_logger
@@ -55,6 +56,12 @@ class BaseDBManager(UserManager):
     multiple processes or threads.
     """
 
+    # Optimistic concurrency retries in sync_with_orm before giving up
+    max_sync_attempts = 3
+    # Defaults for subclasses that skip __init__ (e.g. the Redis managers)
+    _obj: Any = None
+    _dirty: bool = False
+
     def __init__(
         self,
         engine: Engine,
@@ -85,6 +92,34 @@ class BaseDBManager(UserManager):
             mem_cube_id=self.mem_cube_id,
         )
 
+    @property
+    def obj(self) -> Any:
+        """The business object kept in sync with the database"""
+        return self._obj
+
+    @obj.setter
+    def obj(self, value: Any) -> None:
+        self._obj = value
+        if value is not None:
+            self._dirty = True
+
+    def mark_dirty(self) -> None:
+        """Flag the business object as modified so the next sync writes it.
+
+        Objects with their own tracking (`pop_dirty`, e.g. MemoryMonitorManager)
+        flag themselves in their mutating methods; call this after editing their
+        fields directly.
+        """
+        self._dirty = True
+
+    def _pop_dirty(self) -> bool:
+        """Return and clear whether the object changed since the last write"""
+        pop_dirty = getattr(self.obj, "pop_dirty", None)
+        # Objects without change tracking are always written
+        obj_dirty = pop_dirty() if pop_dirty is not None else True
+        dirty, self._dirty = self._dirty or obj_dirty, False
+        return dirty
+
     @property
     @abstractmethod
     def orm_class(self) -> type[LockableORM]:
@@ -331,10 +366,17 @@ class BaseDBManager(UserManager):
         """
         Synchronize data between the database and the business object.
 
-        This method performs a three-step synchronization process:
-        1. Acquire lock and get existing data from database
-        2. Merge database items with current object items
-        3. Write merged data back to database and release lock
+        Uses optimistic concurrency on `version_control` instead of the row lock:
+        1. Read the current version tag (without loading the serialized data)
+        2. If another writer bumped the version since our last sync (or this is our
+           first sync of an existing record), load its data and merge it into the
+           current object
+        3. If the object was modified since our last write (see `mark_dirty`), write it
+           with `UPDATE ... WHERE version_control = <version read in 1>`; if no row
+           matched, another writer won the race and the sync is retried
+
+        A sync without local changes writes nothing and leaves the version alone, so
+        idle syncs neither serialize the object nor make other writers reload it.
 
         Args:
             size_limit: Optional maximum number of items to keep after synchronization.
@@ -346,62 +388,54 @@ class BaseDBManager(UserManager):
         user_id = self.user_id
         mem_cube_id = self.mem_cube_id
 
-        session = self._get_session()
-
-        try:
-            # Acquire lock before any database operations
-            lock_status = self.acquire_lock(block=True)
-            if not lock_status:
-                logger.error("Failed to acquire lock for synchronization")
-                return
-
-            # 1. Get existing data from database
-            orm_instance = (
-                session.query(self.orm_class)
-                .filter_by(user_id=user_id, mem_cube_id=mem_cube_id)
-                .first()
-            )
-
-            # If no existing record, create a new one
-            if orm_instance is None:
-                if self.obj is None:
-                    logger.warning("No object to synchronize and no existing database record")
-                    return
-
-                orm_instance = self.orm_class(
-                    user_id=user_id,
-                    mem_cube_id=mem_cube_id,
-                    serialized_data=self.obj.to_json(),
-                    version_control="0",  # Start with tag 0 for new records
+        if self.obj is None:
+            logger.warning("No current object to merge with database data")
+            return
+        dirty = self._pop_dirty()
+
+        for attempt in range(1, self.max_sync_attempts + 1):
+            session = self._get_session()
+            try:
+                # 1. Read the version tag only
+                row = (
+                    session.query(self.orm_class.version_control)
+                    .filter_by(user_id=user_id, mem_cube_id=mem_cube_id)
+                    .first()
                 )
-                logger.info(
-                    "No existing ORM instance found. Created a new one. "
-                    "Note: size_limit was not applied because there is no existing data to merge."
-                )
-                session.add(orm_instance)
-                session.commit()
-                # Update last_version_control for new record
-                self.last_version_control = "0"
-                return
 
-            # 2. Check version control and merge data from database with current object
-            if self.obj is not None:
-                current_db_tag = orm_instance.version_control
-                new_tag = self._increment_version_control(current_db_tag)
-                # Check if this is the first sync (last_version_control is None)
-                if self.last_version_control is None:
-                    # First sync, increment version and perform merge
-                    logger.info(
-                        f"First sync, incrementing version from {current_db_tag} to {new_tag} for {self.user_id}/{self.mem_cube_id}"
+                # If no existing record, create a new one
+                if row is None:
+                    session.add(
+                        self.orm_class(
+                            user_id=user_id,
+                            mem_cube_id=mem_cube_id,
+                            serialized_data=self.obj.to_json(),
+                            version_control="0",  # Start with tag 0 for new records
+                        )
                     )
-                elif current_db_tag == self.last_version_control:
+                    try:
+                        session.commit()
+                    except IntegrityError:
+                        # Another writer created the record concurrently; retry as an update
+                        session.rollback()
+                        continue
                     logger.info(
-                        f"Version control unchanged ({current_db_tag}), directly update {self.user_id}/{self.mem_cube_id}"
+                        "No existing ORM instance found. Created a new one. "
+                        "Note: size_limit was not applied because there is no existing data to merge."
                     )
-                else:
-                    # Version control has changed, increment it and perform merge
+                    self.last_version_control = "0"
+                    return
+
+                # 2. Merge when another writer changed the record since our last sync
+                current_db_tag = row.version_control
+                if current_db_tag != self.last_version_control:
                     logger.info(
-                        f"Version control changed from {self.last_version_control} to {current_db_tag}, incrementing to {new_tag} for {self.user_id}/{self.mem_cube_id}"
+                        f"Version control changed from {self.last_version_control} to {current_db_tag} for {self.user_id}/{self.mem_cube_id}, merging"
+                    )
+                    orm_instance = (
+                        session.query(self.orm_class)
+                        .filter_by(user_id=user_id, mem_cube_id=mem_cube_id)
+                        .first()
                     )
                     try:
                         self.merge_items(
@@ -411,28 +445,58 @@ class BaseDBManager(UserManager):
                         logger.error(f"Error during merge_items: {merge_error}", exc_info=True)
                         logger.warning("Continuing with current object data without merge")
 
-                # 3. Write merged data back to database
-                orm_instance.serialized_data = self.obj.to_json()
-                orm_instance.version_control = new_tag
-                logger.info(f"Updated serialized_data for {self.user_id}/{self.mem_cube_id}")
+                if not dirty:
+                    self.last_version_control = current_db_tag
+                    logger.info(
+                        f"No local changes for {self.user_id}/{self.mem_cube_id}, skipped write "
+                        f"(version {current_db_tag})"
+                    )
+                    return
 
-                # Update last_version_control to current value
-                self.last_version_control = orm_instance.version_control
-            else:
-                logger.warning("No current object to merge with database data")
+                # 3. Conditional write of the modified object
+                new_tag = self._increment_version_control(current_db_tag)
+                updated = (
+                    session.query(self.orm_class)
+                    .filter_by(
+                        user_id=user_id, mem_cube_id=mem_cube_id, version_control=current_db_tag
+                    )
+                    .update(
+                        {"serialized_data": self.obj.to_json(), "version_control": new_tag},
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
 
-            session.commit()
-            logger.info(f"Synchronization completed for {self.user_id}/{self.mem_cube_id}")
+                if updated == 0:
+                    logger.info(
+                        f"Concurrent update detected for {self.user_id}/{self.mem_cube_id} "
+                        f"(attempt {attempt}/{self.max_sync_attempts}), retrying"
+                    )
+                    continue
 
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                f"Error during synchronization for {user_id}/{mem_cube_id}: {e}", exc_info=True
-            )
-        finally:
-            # Always release locks and close session
-            self.release_locks(user_id=user_id, mem_cube_id=mem_cube_id)
-            session.close()
+                self.last_version_control = new_tag
+                logger.info(
+                    f"Synchronization completed for {self.user_id}/{self.mem_cube_id} "
+                    f"(version {new_tag})"
+                )
+                return
+
+            except Exception as e:
+                session.rollback()
+                # Keep the changes for the next sync
+                self._dirty = self._dirty or dirty
+                logger.error(
+                    f"Error during synchronization for {user_id}/{mem_cube_id}: {e}", exc_info=True
+                )
+                return
+            finally:
+                session.close()
+
+        self._dirty = self._dirty or dirty
+        logger.error(
+            f"Gave up synchronizing {user_id}/{mem_cube_id} after {self.max_sync_attempts} "
+            "conflicting attempts; the next sync will retry"
+        )
 
     def save_to_db(self, obj_instance) -> None:
         """Save the current state of the business object to the database
@@ -484,6 +548,11 @@ class BaseDBManager(UserManager):
                 self.last_version_control = new_version
 
             session.commit()
+            if obj_instance is self.obj:
+                self._pop_dirty()
+            else:
+                # The stored data differs from self.obj; write it on the next sync
+                self.mark_dirty()
 
         except Exception as e:
             session.rollback()
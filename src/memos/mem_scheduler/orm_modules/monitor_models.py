@@ -249,10 +249,8 @@ class DBManagerForQueryMonitorQueue(BaseDBManager):
                 :size_limit
             ]
 
-        # Update the queue with merged items
-        obj_instance.clear()  # Clear existing items
-        for item in merged_items:
-            obj_instance.put(item)  # Add merged items back
+        # Update the queue with merged items, without flagging it for another write
+        obj_instance.load_items(merged_items)
 
         logger.info(
             f"Merged {len(merged_items)} query items for {obj_instance} (size_limit: {size_limit})"
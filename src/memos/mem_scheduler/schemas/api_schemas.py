@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer
 
 from memos.log import get_logger
 from memos.mem_scheduler.general_modules.misc import DictConversionMixin
@@ -77,12 +77,23 @@ class APISearchHistoryManager(BaseModel, DictConversionMixin):
     running_item_ids: list[str] = Field(
         default_factory=list, description="List of running task ids"
     )
+    # Completed entries modified in place since the last sync (not serialized)
+    _dirty_item_ids: set[str] = PrivateAttr(default_factory=set)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         validate_assignment=True,
     )
 
+    def mark_entry_dirty(self, item_id: str) -> None:
+        """Flag a completed entry as modified so delta sync rewrites it."""
+        self._dirty_item_ids.add(item_id)
+
+    def pop_dirty_item_ids(self) -> set[str]:
+        """Return and clear the ids of entries modified since the last call."""
+        dirty, self._dirty_item_ids = self._dirty_item_ids, set()
+        return dirty
+
     def complete_entry(self, task_id: str) -> bool:
         """
         Remove task_id from running list when completed.
@@ -209,6 +220,7 @@ class APISearchHistoryManager(BaseModel, DictConversionMixin):
                     entry.session_id = session_id
                 if memories is not None:
                     entry.memories = memories
+                self.mark_entry_dirty(item_id)
 
                 logger.debug(f"Updated entry with item_id: {item_id}, new status: {task_status}")
                 return True
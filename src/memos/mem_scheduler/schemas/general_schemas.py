@@ -24,10 +24,34 @@ DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE = -1
 DEFAULT_TOP_K = 5
 DEFAULT_CONTEXT_WINDOW_SIZE = 5
 DEFAULT_USE_REDIS_QUEUE = os.getenv("MEMSCHEDULER_USE_REDIS_QUEUE", "False").lower() == "true"
+DEFAULT_USE_SQLITE_QUEUE = os.getenv("MEMSCHEDULER_USE_SQLITE_QUEUE", "False").lower() == "true"
+DEFAULT_SQLITE_QUEUE_PATH = os.getenv(
+    "MEMSCHEDULER_SQLITE_QUEUE_PATH", f"{BASE_DIR}/outputs/mem_scheduler/scheduler_task_queue.db"
+)
 DEFAULT_MULTI_TASK_RUNNING_TIMEOUT = 30
 DEFAULT_SCHEDULER_RETRIEVER_BATCH_SIZE = 20
 DEFAULT_SCHEDULER_RETRIEVER_RETRIES = 1
 DEFAULT_STOP_WAIT = False
+DEFAULT_ENABLE_MESSAGE_COALESCING = (
+    os.getenv("MEMSCHEDULER_ENABLE_MESSAGE_COALESCING", "False").lower() == "true"
+)
+DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS = 0.05
+DEFAULT_MESSAGE_COALESCE_MAX_BATCH = 50
+DEFAULT_ENABLE_ADMISSION_CONTROL = (
+    os.getenv("MEMSCHEDULER_ENABLE_ADMISSION_CONTROL", "False").lower() == "true"
+)
+DEFAULT_ADMISSION_POLICY = os.getenv("MEMSCHEDULER_ADMISSION_POLICY", "reject")
+DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH = int(
+    os.getenv("MEMSCHEDULER_ADMISSION_MAX_USER_QUEUE_DEPTH", "1000")
+)
+DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH = int(
+    os.getenv("MEMSCHEDULER_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH", "50000")
+)
+DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS = float(
+    os.getenv("MEMSCHEDULER_ADMISSION_MAX_OLDEST_AGE_SECONDS", "1800")
+)
+DEFAULT_ADMISSION_RETRY_AFTER_SECONDS = 5
+DEFAULT_ADMISSION_STATS_TTL_SECONDS = 1.0
 
 # startup mode configuration
 STARTUP_BY_THREAD = "thread"
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import ClassVar
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator
 
 from memos.log import get_logger
 from memos.mem_scheduler.general_modules.misc import AutoDroppingQueue, DictConversionMixin
@@ -83,6 +83,18 @@ class QueryMonitorQueue(AutoDroppingQueue[QueryMonitorItem]):
     Each item is expected to be a dictionary containing:
     """
 
+    # Modified since the last sync (see BaseDBManager.sync_with_orm); new queues count
+    _dirty: bool = True
+
+    def mark_dirty(self) -> None:
+        """Flag the queue as modified so the next sync writes it."""
+        self._dirty = True
+
+    def pop_dirty(self) -> bool:
+        """Return and clear the modified flag."""
+        dirty, self._dirty = self._dirty, False
+        return dirty
+
     def put(self, item: QueryMonitorItem, block: bool = True, timeout: float | None = 5.0) -> None:
         """
         Add a query item to the queue. Ensures the item is of correct type.
@@ -96,6 +108,18 @@ class QueryMonitorQueue(AutoDroppingQueue[QueryMonitorItem]):
             f"Thread {threading.get_ident()} acquired mutex. Timeout is set to {timeout} seconds"
         )
         super().put(item, block, timeout)
+        self._dirty = True
+
+    def load_items(self, items: list[QueryMonitorItem]) -> None:
+        """
+        Replace the queue content with items read from the database.
+
+        Unlike `put`, this does not mark the queue modified: the items are already
+        stored, so rewriting them would only make other writers reload the queue.
+        """
+        self.clear()
+        for item in items:
+            super().put(item)
 
     def get_queries_by_timestamp(
         self, start_time: datetime, end_time: datetime
@@ -271,6 +295,17 @@ class MemoryMonitorManager(BaseModel, DictConversionMixin):
     max_capacity: int | None = Field(
         default=None, description="Maximum number of memories allowed (None for unlimited)", ge=1
     )
+    # Modified since the last sync (see BaseDBManager.sync_with_orm); not serialized
+    _dirty: bool = PrivateAttr(default=True)
+
+    def mark_dirty(self) -> None:
+        """Flag the memories as modified so the next sync writes them."""
+        self._dirty = True
+
+    def pop_dirty(self) -> bool:
+        """Return and clear the modified flag."""
+        dirty, self._dirty = self._dirty, False
+        return dirty
 
     @computed_field
     @property
@@ -326,6 +361,7 @@ class MemoryMonitorManager(BaseModel, DictConversionMixin):
         # Validate partial_retention_number
         if partial_retention_number < 0:
             raise ValueError("partial_retention_number must be non-negative")
+        self._dirty = True
 
         # Step 1: Update existing memories or add new ones
         added_count = 0
@@ -0,0 +1,296 @@
+"""
+Admission control from the scheduler task queues to the API.
+
+Without feedback from the queue, `/add` keeps enqueuing `mem_read` tasks during an
+ingest storm: streams grow without bound and tasks wait for hours while the API still
+reports success. The admission controller samples per-user and global queue depth and
+the age of the oldest unfinished message, and applies one of the following policies
+when a limit is exceeded:
+
+- reject:  refuse the request (the API answers 429 with a Retry-After header);
+- degrade: accept the request but process it synchronously in fast mode, so no
+           background task is enqueued for it;
+- shed:    accept the request but drop low-priority labels at submission time. The
+           `mem_read` task of an `/add` carries the only copy of its messages, so
+           it is not shed by default; `/add` is degraded as above instead.
+"""
+
+import math
+import threading
+import time
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from memos.log import get_logger
+from memos.mem_scheduler.schemas.general_schemas import (
+    DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS,
+    DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH,
+    DEFAULT_ADMISSION_POLICY,
+    DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
+    DEFAULT_ADMISSION_STATS_TTL_SECONDS,
+)
+from memos.mem_scheduler.schemas.task_schemas import (
+    MEM_ARCHIVE_TASK_LABEL,
+    MEM_ORGANIZE_TASK_LABEL,
+    MEM_UPDATE_TASK_LABEL,
+)
+
+
+logger = get_logger(__name__)
+
+ADMISSION_ACTION_ADMIT = "admit"
+ADMISSION_POLICY_REJECT = "reject"
+ADMISSION_POLICY_DEGRADE = "degrade"
+ADMISSION_POLICY_SHED = "shed"
+ADMISSION_POLICIES = (ADMISSION_POLICY_REJECT, ADMISSION_POLICY_DEGRADE, ADMISSION_POLICY_SHED)
+
+# Maintenance labels whose loss only delays memory refinement
+DEFAULT_ADMISSION_SHED_LABELS = (
+    MEM_UPDATE_TASK_LABEL,
+    MEM_ORGANIZE_TASK_LABEL,
+    MEM_ARCHIVE_TASK_LABEL,
+)
+
+# Retry-After grows with the overload ratio, up to this multiple of the base value
+MAX_RETRY_AFTER_MULTIPLIER = 10
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of an admission check."""
+
+    action: str = ADMISSION_ACTION_ADMIT
+    reasons: list[str] = field(default_factory=list)
+    retry_after_seconds: int | None = None
+
+    @property
+    def admitted(self) -> bool:
+        return self.action != ADMISSION_POLICY_REJECT
+
+
+class SchedulerAdmissionController:
+    """
+    Decides whether new work may be enqueued, based on the scheduler queue backlog.
+
+    Queue statistics are read through `get_stream_backlog()` of the task queue and
+    cached for `stats_ttl_seconds`, so admission checks on the request path cost at
+    most one backlog scan per TTL regardless of request rate.
+    """
+
+    def __init__(
+        self,
+        memos_message_queue: Any,
+        policy: str = DEFAULT_ADMISSION_POLICY,
+        max_user_queue_depth: int | None = DEFAULT_ADMISSION_MAX_USER_QUEUE_DEPTH,
+        max_global_queue_depth: int | None = DEFAULT_ADMISSION_MAX_GLOBAL_QUEUE_DEPTH,
+        max_oldest_age_seconds: float | None = DEFAULT_ADMISSION_MAX_OLDEST_AGE_SECONDS,
+        shed_labels: tuple[str, ...] | list[str] = DEFAULT_ADMISSION_SHED_LABELS,
+        retry_after_seconds: int = DEFAULT_ADMISSION_RETRY_AFTER_SECONDS,
+        stats_ttl_seconds: float = DEFAULT_ADMISSION_STATS_TTL_SECONDS,
+    ):
+        """
+        Args:
+            memos_message_queue: Task queue exposing `get_stream_backlog()`
+                (`ScheduleTaskQueue` or one of its backends).
+            policy: One of "reject", "degrade" or "shed".
+            max_user_queue_depth: Max queued tasks per user; <= 0 or None disables it.
+            max_global_queue_depth: Max queued tasks overall; <= 0 or None disables it.
+            max_oldest_age_seconds: Max age of the oldest queued task; <= 0 or None
+                disables it.
+            shed_labels: Labels dropped at submission time under the "shed" policy.
+            retry_after_seconds: Base Retry-After value for rejected requests.
+            stats_ttl_seconds: How long a backlog snapshot is reused.
+        """
+        if policy not in ADMISSION_POLICIES:
+            raise ValueError(f"Unknown admission policy '{policy}', expected {ADMISSION_POLICIES}")
+
+        self.memos_message_queue = memos_message_queue
+        self.policy = policy
+        self.max_user_queue_depth = max_user_queue_depth
+        self.max_global_queue_depth = max_global_queue_depth
+        self.max_oldest_age_seconds = max_oldest_age_seconds
+        self.shed_labels = set(shed_labels)
+        self.retry_after_seconds = max(1, int(retry_after_seconds))
+        self.stats_ttl_seconds = max(0.0, float(stats_ttl_seconds))
+
+        self._lock = threading.Lock()
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_ts = 0.0
+
+        # Counters for monitoring
+        self.decision_counts: dict[str, int] = {}
+        self.shed_count = 0
+
+    @staticmethod
+    def _parse_user_id(stream_key: str) -> str | None:
+        # Stream key format: {prefix}:{user_id}:{mem_cube_id}:{task_label}
+        parts = stream_key.split(":")
+        return parts[-3] if len(parts) >= 4 else None
+
+    def _collect_snapshot(self) -> dict[str, Any]:
+        now = time.time()
+        try:
+            backlog = self.memos_message_queue.get_stream_backlog()
+        except Exception as e:
+            logger.warning(f"[AdmissionController] Failed to read queue backlog: {e}")
+            backlog = {}
+
+        global_stats = {"depth": 0, "oldest_enqueued_at": None}
+        users: dict[str, dict[str, Any]] = {}
+        for stream_key, stream_stats in backlog.items():
+            depth = int(stream_stats.get("depth") or 0)
+            oldest = stream_stats.get("oldest_enqueued_at")
+            targets = [global_stats]
+            user_id = self._parse_user_id(stream_key)
+            if user_id is not None:
+                targets.append(users.setdefault(user_id, {"depth": 0, "oldest_enqueued_at": None}))
+            for target in targets:
+                target["depth"] += depth
+                if depth and oldest is not None:
+                    current = target["oldest_enqueued_at"]
+                    target["oldest_enqueued_at"] = (
+                        oldest if current is None else min(current, oldest)
+                    )
+
+        def _with_age(stats: dict[str, Any]) -> dict[str, Any]:
+            oldest = stats["oldest_enqueued_at"]
+            return {
+                "depth": stats["depth"],
+                "oldest_age_seconds": max(0.0, now - oldest) if oldest is not None else 0.0,
+            }
+
+        return {
+            "sampled_at": now,
+            "streams": len(backlog),
+            "global": _with_age(global_stats),
+            "users": {user_id: _with_age(stats) for user_id, stats in users.items()},
+        }
+
+    def get_snapshot(self, refresh: bool = False) -> dict[str, Any]:
+        """Return the cached backlog snapshot, re-sampling it once the TTL expired."""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                refresh
+                or self._snapshot is None
+                or now - self._snapshot_ts >= self.stats_ttl_seconds
+            ):
+                self._snapshot = self._collect_snapshot()
+                self._snapshot_ts = now
+            return self._snapshot
+
+    @staticmethod
+    def _ratio(value: float, limit: float | None) -> float:
+        if not limit or limit <= 0:
+            return 0.0
+        return value / limit
+
+    def _overload(self, stats: dict[str, Any], depth_limit: int | None, scope: str):
+        """Return (max overload ratio, reasons) for a global or per-user stats entry."""
+        reasons = []
+        depth_ratio = self._ratio(stats["depth"], depth_limit)
+        age_ratio = self._ratio(stats["oldest_age_seconds"], self.max_oldest_age_seconds)
+        if depth_ratio > 1:
+            reasons.append(f"{scope}_queue_depth {stats['depth']} > {depth_limit}")
+        if age_ratio > 1:
+            reasons.append(
+                f"{scope}_oldest_task_age {stats['oldest_age_seconds']:.0f}s "
+                f"> {self.max_oldest_age_seconds:.0f}s"
+            )
+        return max(depth_ratio, age_ratio), reasons
+
+    def _evaluate(self, user_id: str | None) -> tuple[float, list[str]]:
+        snapshot = self.get_snapshot()
+        ratio, reasons = self._overload(snapshot["global"], self.max_global_queue_depth, "global")
+        if user_id is not None:
+            user_stats = snapshot["users"].get(user_id)
+            if user_stats is not None:
+                user_ratio, user_reasons = self._overload(
+                    user_stats, self.max_user_queue_depth, "user"
+                )
+                ratio = max(ratio, user_ratio)
+                reasons.extend(user_reasons)
+        return ratio, reasons
+
+    def check(self, user_id: str | None = None) -> AdmissionDecision:
+        """
+        Decide how a new request for `user_id` should be handled.
+
+        Returns:
+            AdmissionDecision whose action is "admit" when no limit is exceeded and the
+            configured policy otherwise.
+        """
+        ratio, reasons = self._evaluate(user_id)
+        if not reasons:
+            decision = AdmissionDecision()
+        else:
+            retry_after = None
+            if self.policy == ADMISSION_POLICY_REJECT:
+                multiplier = min(max(ratio, 1.0), MAX_RETRY_AFTER_MULTIPLIER)
+                retry_after = math.ceil(self.retry_after_seconds * multiplier)
+            decision = AdmissionDecision(
+                action=self.policy, reasons=reasons, retry_after_seconds=retry_after
+            )
+            logger.warning(
+                f"[AdmissionController] user={user_id} action={decision.action} reasons={reasons}"
+            )
+
+        with self._lock:
+            self.decision_counts[decision.action] = self.decision_counts.get(decision.action, 0) + 1
+        return decision
+
+    def should_shed(self, label: str, user_id: str | None = None) -> bool:
+        """Whether a message with `label` should be dropped at submission time."""
+        if self.policy != ADMISSION_POLICY_SHED or label not in self.shed_labels:
+            return False
+        _, reasons = self._evaluate(user_id)
+        if not reasons:
+            return False
+        with self._lock:
+            self.shed_count += 1
+        return True
+
+    def get_queue_health(self, user_id: str | None = None, top_n: int = 10) -> dict[str, Any]:
+        """
+        Summarize queue health for monitoring endpoints.
+
+        Args:
+            user_id: Include this user's backlog and admission outcome.
+            top_n: Number of users with the deepest backlog to include.
+        """
+        snapshot = self.get_snapshot()
+        _, global_reasons = self._overload(
+            snapshot["global"], self.max_global_queue_depth, "global"
+        )
+        top_users = sorted(
+            snapshot["users"].items(), key=lambda item: item[1]["depth"], reverse=True
+        )[: max(0, top_n)]
+
+        health = {
+            "policy": self.policy,
+            "limits": {
+                "max_user_queue_depth": self.max_user_queue_depth,
+                "max_global_queue_depth": self.max_global_queue_depth,
+                "max_oldest_age_seconds": self.max_oldest_age_seconds,
+            },
+            "sampled_at": snapshot["sampled_at"],
+            "streams": snapshot["streams"],
+            "global": snapshot["global"],
+            "overloaded": bool(global_reasons),
+            "reasons": global_reasons,
+            "top_users": dict(top_users),
+            "decision_counts": dict(self.decision_counts),
+            "shed_count": self.shed_count,
+        }
+        if user_id is not None:
+            user_stats = snapshot["users"].get(user_id, {"depth": 0, "oldest_age_seconds": 0.0})
+            _, user_reasons = self._overload(user_stats, self.max_user_queue_depth, "user")
+            health["user"] = {
+                "user_id": user_id,
+                **user_stats,
+                "overloaded": bool(user_reasons),
+                "reasons": user_reasons,
+            }
+        return health
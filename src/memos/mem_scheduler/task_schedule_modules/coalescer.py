@@ -0,0 +1,255 @@
+"""
+Message coalescing stage for the scheduler.
+
+Bursty clients tend to enqueue many near-identical messages for the same user and
+mem_cube within milliseconds. The coalescer sits between the task queue and the
+dispatcher: it buffers fetched messages per (user_id, mem_cube_id, label) for a short
+window, drops duplicated payloads, and merges compatible id-list messages so that each
+handler runs once per burst instead of once per message.
+
+Messages that were folded into another one are kept on the surviving message so the
+dispatcher can still acknowledge them and update their task status.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from typing import Any
+
+from memos.log import get_logger
+from memos.mem_scheduler.schemas.general_schemas import (
+    DEFAULT_MESSAGE_COALESCE_MAX_BATCH,
+    DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS,
+)
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import (
+    ADD_TASK_LABEL,
+    MEM_READ_TASK_LABEL,
+)
+
+
+logger = get_logger(__name__)
+
+# Attribute name used to attach absorbed messages to the surviving message
+COALESCED_MESSAGES_ATTR = "_coalesced_messages"
+
+# Labels whose content is a JSON list of memory ids that can be unioned
+DEFAULT_ID_LIST_MERGE_LABELS = (MEM_READ_TASK_LABEL, ADD_TASK_LABEL)
+
+
+def get_coalesced_messages(message: ScheduleMessageItem) -> list[ScheduleMessageItem]:
+    """Return the messages that were folded into `message` by the coalescer."""
+    return list(getattr(message, COALESCED_MESSAGES_ATTR, None) or [])
+
+
+def expand_coalesced_messages(
+    messages: list[ScheduleMessageItem],
+) -> list[ScheduleMessageItem]:
+    """Return `messages` followed by every message that was folded into them."""
+    expanded: list[ScheduleMessageItem] = []
+    for msg in messages:
+        expanded.append(msg)
+        expanded.extend(get_coalesced_messages(msg))
+    return expanded
+
+
+class SchedulerMessageCoalescer:
+    """
+    Buffers scheduler messages per (user_id, mem_cube_id, label) and merges them.
+
+    Within a group, messages are merged in arrival order:
+    - identical payloads (same content and routing context) collapse into the first one;
+    - for id-list labels (mem_read, add) compatible messages are merged into a single
+      message whose content is the ordered union of all memory ids.
+
+    Remaining distinct messages of a group are released together, so handlers that
+    refresh working memory from a batch (e.g. mem_update) run once for the whole burst
+    against the latest state instead of once per message.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_MESSAGE_COALESCE_WINDOW_SECONDS,
+        max_batch_size: int = DEFAULT_MESSAGE_COALESCE_MAX_BATCH,
+        id_list_merge_labels: tuple[str, ...] | list[str] = DEFAULT_ID_LIST_MERGE_LABELS,
+    ):
+        """
+        Args:
+            window_seconds: How long a group is buffered after its first message arrives.
+                A value <= 0 only coalesces messages fetched in the same batch.
+            max_batch_size: A group is released early once it holds this many messages.
+            id_list_merge_labels: Labels whose JSON id-list contents may be unioned.
+        """
+        self.window_seconds = max(0.0, float(window_seconds or 0.0))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.id_list_merge_labels = set(id_list_merge_labels)
+
+        self._buffer: dict[tuple[str, str, str], list[ScheduleMessageItem]] = {}
+        self._first_seen: dict[tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+        # Counters for monitoring
+        self.received_count = 0
+        self.released_count = 0
+
+    @staticmethod
+    def _group_key(message: ScheduleMessageItem) -> tuple[str, str, str]:
+        return (message.user_id, message.mem_cube_id, message.label)
+
+    @staticmethod
+    def _context_fingerprint(message: ScheduleMessageItem) -> str:
+        """Hash everything except the content that a handler may read from a message."""
+        context = {
+            "session_id": message.session_id,
+            "user_name": message.user_name,
+            "task_id": message.task_id,
+            "info": message.info,
+            "chat_history": message.chat_history,
+            "user_context": message.user_context.model_dump(exclude_none=True)
+            if message.user_context
+            else None,
+        }
+        payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _payload_fingerprint(cls, message: ScheduleMessageItem) -> str:
+        payload = f"{cls._context_fingerprint(message)}:{message.content}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _parse_id_list(content: Any) -> list | None:
+        if isinstance(content, list):
+            return content
+        if not isinstance(content, str):
+            return None
+        try:
+            parsed = json.loads(content)
+        except (TypeError, ValueError):
+            return None
+        return parsed if isinstance(parsed, list) else None
+
+    @staticmethod
+    def _absorb(survivor: ScheduleMessageItem, absorbed: ScheduleMessageItem) -> None:
+        merged = get_coalesced_messages(survivor)
+        merged.append(absorbed)
+        merged.extend(get_coalesced_messages(absorbed))
+        object.__setattr__(survivor, COALESCED_MESSAGES_ATTR, merged)
+        if get_coalesced_messages(absorbed):
+            object.__setattr__(absorbed, COALESCED_MESSAGES_ATTR, [])
+
+    def coalesce(self, messages: list[ScheduleMessageItem]) -> list[ScheduleMessageItem]:
+        """
+        Merge a list of messages without buffering.
+
+        Messages of different (user_id, mem_cube_id, label) groups are never merged.
+        The relative order of surviving messages is preserved.
+
+        Args:
+            messages: Messages to coalesce.
+
+        Returns:
+            The surviving messages. Absorbed messages are reachable via
+            `get_coalesced_messages` on their survivor.
+        """
+        survivors: list[ScheduleMessageItem] = []
+        seen_payloads: dict[tuple[tuple[str, str, str], str], ScheduleMessageItem] = {}
+        id_list_heads: dict[tuple[tuple[str, str, str], str], tuple[ScheduleMessageItem, list]] = {}
+
+        for msg in messages:
+            group_key = self._group_key(msg)
+
+            payload_key = (group_key, self._payload_fingerprint(msg))
+            duplicate_of = seen_payloads.get(payload_key)
+            if duplicate_of is not None:
+                self._absorb(duplicate_of, msg)
+                continue
+            seen_payloads[payload_key] = msg
+
+            if msg.label in self.id_list_merge_labels:
+                ids = self._parse_id_list(msg.content)
+                if ids is not None:
+                    merge_key = (group_key, self._context_fingerprint(msg))
+                    head = id_list_heads.get(merge_key)
+                    if head is not None:
+                        head_msg, head_ids = head
+                        for mem_id in ids:
+                            if mem_id not in head_ids:
+                                head_ids.append(mem_id)
+                        head_msg.content = json.dumps(head_ids, ensure_ascii=False)
+                        self._absorb(head_msg, msg)
+                        continue
+                    id_list_heads[merge_key] = (msg, list(ids))
+
+            survivors.append(msg)
+
+        if len(survivors) < len(messages):
+            logger.info(
+                f"[SchedulerMessageCoalescer] Coalesced {len(messages)} messages into {len(survivors)}"
+            )
+        return survivors
+
+    def add(self, messages: list[ScheduleMessageItem]) -> None:
+        """Buffer fetched messages until their group's window elapses."""
+        if not messages:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for msg in messages:
+                group_key = self._group_key(msg)
+                if group_key not in self._buffer:
+                    self._buffer[group_key] = []
+                    self._first_seen[group_key] = now
+                self._buffer[group_key].append(msg)
+            self.received_count += len(messages)
+
+    def release(self, force: bool = False) -> list[ScheduleMessageItem]:
+        """
+        Pop and coalesce every group that is ready to be dispatched.
+
+        A group is ready once its window has elapsed or it reached `max_batch_size`.
+
+        Args:
+            force: Release all buffered groups regardless of their age (used on shutdown).
+
+        Returns:
+            Coalesced messages ready to be dispatched.
+        """
+        now = time.monotonic()
+        ready: list[ScheduleMessageItem] = []
+        with self._lock:
+            for group_key in list(self._buffer.keys()):
+                group = self._buffer[group_key]
+                age = now - self._first_seen[group_key]
+                if force or age >= self.window_seconds or len(group) >= self.max_batch_size:
+                    ready.extend(group)
+                    del self._buffer[group_key]
+                    del self._first_seen[group_key]
+
+        if not ready:
+            return []
+        released = self.coalesce(ready)
+        with self._lock:
+            self.released_count += len(released)
+        return released
+
+    def add_and_release(self, messages: list[ScheduleMessageItem]) -> list[ScheduleMessageItem]:
+        """Buffer `messages` and return whatever is ready to be dispatched."""
+        self.add(messages)
+        return self.release()
+
+    def pending_count(self) -> int:
+        """Number of messages currently held in the buffer."""
+        with self._lock:
+            return sum(len(group) for group in self._buffer.values())
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            pending = sum(len(group) for group in self._buffer.values())
+            return {
+                "received": self.received_count,
+                "released": self.released_count,
+                "pending": pending,
+            }
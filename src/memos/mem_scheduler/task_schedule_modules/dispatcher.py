@@ -13,6 +13,7 @@ from memos.context.context import (
     generate_trace_id,
     set_request_context,
 )
+from memos.llms.governor import BACKGROUND, LLM_PRIORITY_KEY
 from memos.log import get_logger
 from memos.mem_scheduler.general_modules.base import BaseSchedulerModule
 from memos.mem_scheduler.general_modules.task_threads import ThreadManager
@@ -21,8 +22,10 @@ from memos.mem_scheduler.schemas.general_schemas import (
 )
 from memos.mem_scheduler.schemas.message_schemas import ScheduleLogForWebItem, ScheduleMessageItem
 from memos.mem_scheduler.schemas.task_schemas import RunningTaskItem, TaskPriorityLevel
+from memos.mem_scheduler.task_schedule_modules.coalescer import expand_coalesced_messages
 from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
 from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+from memos.mem_scheduler.task_schedule_modules.sqlite_queue import SchedulerSQLiteQueue
 from memos.mem_scheduler.task_schedule_modules.task_queue import ScheduleTaskQueue
 from memos.mem_scheduler.utils.misc_utils import group_messages_by_user_and_mem_cube, is_cloud_env
 from memos.mem_scheduler.utils.monitor_event_utils import emit_monitor_event, to_iso
@@ -131,8 +134,10 @@ class SchedulerDispatcher(BaseSchedulerModule):
         def wrapped_handler(messages: list[ScheduleMessageItem]):
             start_time = time.time()
             start_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
+            # Messages merged by the coalescer share the outcome of their survivor
+            tracked_messages = expand_coalesced_messages(messages)
             if self.status_tracker:
-                for msg in messages:
+                for msg in tracked_messages:
                     self.status_tracker.task_started(task_id=msg.item_id, user_id=msg.user_id)
             try:
                 first_msg = messages[0]
@@ -143,6 +148,8 @@ class SchedulerDispatcher(BaseSchedulerModule):
                     user_name=getattr(first_msg, "user_name", None),
                     user_type=None,
                 )
+                # Scheduled work yields LLM capacity to interactive requests
+                ctx.set(LLM_PRIORITY_KEY, BACKGROUND)
                 set_request_context(ctx)
 
                 # --- mark start: record queuing time(now - enqueue_ts)---
@@ -198,9 +205,9 @@ class SchedulerDispatcher(BaseSchedulerModule):
                 duration = finish_time - start_time
                 self.metrics.observe_task_duration(duration, m.user_id, m.label)
                 if self.status_tracker:
-                    for msg in messages:
+                    for msg in tracked_messages:
                         self.status_tracker.task_completed(task_id=msg.item_id, user_id=msg.user_id)
-                    self._maybe_emit_task_completion(messages)
+                    self._maybe_emit_task_completion(tracked_messages)
                 self.metrics.task_completed(user_id=m.user_id, task_type=m.label)
 
                 emit_monitor_event(
@@ -234,11 +241,11 @@ class SchedulerDispatcher(BaseSchedulerModule):
                 finish_time = time.time()
                 self.metrics.task_failed(m.user_id, m.label, type(e).__name__)
                 if self.status_tracker:
-                    for msg in messages:
+                    for msg in tracked_messages:
                         self.status_tracker.task_failed(
                             task_id=msg.item_id, user_id=msg.user_id, error_message=str(e)
                         )
-                    self._maybe_emit_task_completion(messages, error=e)
+                    self._maybe_emit_task_completion(tracked_messages, error=e)
                 emit_monitor_event(
                     "finish",
                     m,
@@ -266,13 +273,13 @@ class SchedulerDispatcher(BaseSchedulerModule):
 
                 raise
             finally:
-                # Ensure Redis messages are acknowledged even if handler fails
+                # Ensure Redis/SQLite messages are acknowledged even if handler fails
                 if (
-                    isinstance(self.memos_message_queue, SchedulerRedisQueue)
+                    isinstance(self.memos_message_queue, SchedulerRedisQueue | SchedulerSQLiteQueue)
                     and self.memos_message_queue is not None
                 ):
                     try:
-                        for msg in messages:
+                        for msg in tracked_messages:
                             redis_message_id = msg.redis_message_id
                             self.memos_message_queue.ack_message(
                                 user_id=msg.user_id,
@@ -18,6 +18,7 @@ from memos.mem_scheduler.task_schedule_modules.base_handler import BaseScheduler
 from memos.mem_scheduler.utils.filter_utils import transform_name_to_key
 from memos.mem_scheduler.utils.misc_utils import is_cloud_env
 from memos.memories.textual.tree import TreeTextMemory
+from memos.memories.textual.tree_text_memory.organize.aggregates import update_node_tracked
 
 
 logger = get_logger(__name__)
@@ -228,8 +229,11 @@ class MemReadMessageHandler(BaseSchedulerHandler):
                                 )
                                 for old_id in old_ids:
                                     try:
-                                        mem_reader.graph_db.update_node(
-                                            str(old_id), {"status": "archived"}, user_name=user_name
+                                        update_node_tracked(
+                                            mem_reader.graph_db,
+                                            str(old_id),
+                                            {"status": "archived"},
+                                            user_name=user_name,
                                         )
                                         logger.info(
                                             "[Scheduler] Archived merged_from memory: %s",
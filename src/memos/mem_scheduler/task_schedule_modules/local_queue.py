@@ -4,6 +4,7 @@ This module provides a local-based queue implementation that can replace
 the local memos_message_queue functionality in BaseScheduler.
 """
 
+from datetime import timezone
 from typing import TYPE_CHECKING
 
 
@@ -192,6 +193,22 @@ class SchedulerLocalQueue(RedisSchedulerModule):
         logger.debug(f"Current queue sizes: {sizes}")
         return sizes
 
+    def get_stream_backlog(self) -> dict[str, dict[str, float | int | None]]:
+        """Return depth and oldest message timestamp (epoch seconds) for every stream."""
+        backlog: dict[str, dict[str, float | int | None]] = {}
+        for stream_key, queue in list(self.queue_streams.items()):
+            with queue.mutex:
+                depth = len(queue.queue)
+                oldest = queue.queue[0] if depth else None
+            oldest_ts = getattr(oldest, "timestamp", None)
+            if oldest_ts is not None and oldest_ts.tzinfo is None:
+                oldest_ts = oldest_ts.replace(tzinfo=timezone.utc)
+            backlog[stream_key] = {
+                "depth": depth,
+                "oldest_enqueued_at": oldest_ts.timestamp() if oldest_ts is not None else None,
+            }
+        return backlog
+
     def clear(self, stream_key: str | None = None) -> None:
         if stream_key:
             if stream_key in self.queue_streams:
@@ -12,6 +12,7 @@ import time
 
 from collections import deque
 from collections.abc import Callable
+from typing import Any
 from uuid import uuid4
 
 from memos.context.context import ContextThread
@@ -55,6 +56,7 @@ class SchedulerRedisQueue(RedisSchedulerModule):
         max_len: int | None = None,
         auto_delete_acked: bool = True,  # Whether to automatically delete acknowledged messages
         status_tracker: TaskStatusTracker | None = None,
+        redis_client: Any | None = None,
     ):
         """
         Initialize the Redis queue.
@@ -66,6 +68,8 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             max_len: Maximum length of the stream (for memory management)
             maxsize: Maximum size of the queue (for Queue compatibility, ignored)
             auto_delete_acked: Whether to automatically delete acknowledged messages from stream
+            redis_client: Pre-built Redis client to use instead of auto-initialization
+                (e.g. a fakeredis client for benchmarks and tests)
         """
         super().__init__()
         # Stream configuration
@@ -103,8 +107,12 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             f"consumer_group='{self.consumer_group}', consumer_name='{self.consumer_name}'"
         )
 
-        # Auto-initialize Redis connection
-        if self.auto_initialize_redis():
+        # Use the injected client if given, otherwise auto-initialize Redis connection
+        if redis_client is not None:
+            self._redis_conn = redis_client
+            self._is_connected = True
+            self._check_xautoclaim_support()
+        elif self.auto_initialize_redis():
             self._is_connected = True
             self._check_xautoclaim_support()
 
@@ -983,6 +991,47 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             logger.error(f"Failed to get Redis queue size: {e}", stack_info=True)
             return {}
 
+    def get_stream_backlog(self) -> dict[str, dict[str, float | int | None]]:
+        """
+        Return depth and oldest-entry timestamp for every known stream.
+
+        Acked messages are deleted from their stream, so the first entry of a stream is
+        the oldest unfinished message. Its age is derived from the entry ID. XLEN and
+        XRANGE COUNT 1 are pipelined per chunk of keys.
+
+        Returns:
+            Mapping of stream key to {"depth": int, "oldest_enqueued_at": epoch seconds | None}.
+        """
+        if not self._redis_conn:
+            return {}
+
+        stream_keys = self.get_stream_keys()
+        backlog: dict[str, dict[str, float | int | None]] = {}
+        chunk_size = max(1, int(self._pipeline_chunk_size))
+        for start in range(0, len(stream_keys), chunk_size):
+            chunk_keys = stream_keys[start : start + chunk_size]
+            try:
+                pipe = self._redis_conn.pipeline(transaction=False)
+                for key in chunk_keys:
+                    pipe.xlen(key)
+                    pipe.xrange(key, count=1)
+                results = pipe.execute()
+            except Exception as e:
+                logger.warning(
+                    f"[REDIS_QUEUE] Pipeline execute failed for backlog chunk: "
+                    f"offset={start}, size={len(chunk_keys)}, error={e}"
+                )
+                continue
+
+            for idx, key in enumerate(chunk_keys):
+                depth = int(results[2 * idx] or 0)
+                oldest_ms = self._parse_last_ms_from_entries(results[2 * idx + 1])
+                backlog[key] = {
+                    "depth": depth,
+                    "oldest_enqueued_at": oldest_ms / 1000 if oldest_ms is not None else None,
+                }
+        return backlog
+
     def show_task_status(self, stream_key_prefix: str | None = None) -> dict[str, dict[str, int]]:
         effective_prefix = (
             stream_key_prefix if stream_key_prefix is not None else self.stream_key_prefix
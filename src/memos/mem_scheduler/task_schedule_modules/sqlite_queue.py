@@ -0,0 +1,422 @@
+"""
+SQLite Queue implementation for SchedulerMessageItem objects.
+
+This module provides a durable, single-node queue backed by a SQLite database in
+WAL mode. It mirrors the `SchedulerRedisQueue` interface so it can replace the
+Redis stream queue in BaseScheduler without running any external service.
+
+Delivery semantics follow Redis consumer groups:
+- A dequeued message is leased to this consumer instead of being removed.
+- `ack_message` deletes the row once the handler finished.
+- A lease that is not acknowledged within the task's minimum idle time becomes
+  visible again and is claimed by the next `get_messages` call (pending-claim recovery).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from contextlib import suppress
+from pathlib import Path
+from uuid import uuid4
+
+from memos.log import get_logger
+from memos.mem_scheduler.general_modules.base import BaseSchedulerModule
+from memos.mem_scheduler.schemas.general_schemas import DEFAULT_SQLITE_QUEUE_PATH
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import DEFAULT_STREAM_KEY_PREFIX
+from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.utils.status_tracker import TaskStatusTracker
+
+
+logger = get_logger(__name__)
+
+READY_STATUS = "ready"
+LEASED_STATUS = "leased"
+
+
+class SchedulerSQLiteQueue(BaseSchedulerModule):
+    """
+    SQLite WAL-backed queue for storing and processing SchedulerMessageItem objects.
+
+    Messages are stored in a single table keyed by an autoincrement id, which is
+    exposed to the dispatcher through `ScheduleMessageItem.redis_message_id` so the
+    acknowledgement path is shared with the Redis queue.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = DEFAULT_SQLITE_QUEUE_PATH,
+        stream_key_prefix: str = DEFAULT_STREAM_KEY_PREFIX,
+        orchestrator: SchedulerOrchestrator | None = None,
+        consumer_name: str | None = "scheduler_consumer",
+        max_len: int | None = None,
+        status_tracker: TaskStatusTracker | None = None,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Initialize the SQLite queue.
+
+        Args:
+            db_path: Path of the SQLite database file (":memory:" for a non-durable queue)
+            stream_key_prefix: Prefix for stream keys, same format as the Redis queue
+            orchestrator: SchedulerOrchestrator providing task priorities and idle thresholds
+            consumer_name: Name of the consumer holding leases (a random suffix is appended)
+            max_len: Maximum number of messages kept per stream; oldest ready messages are trimmed
+            status_tracker: TaskStatusTracker instance
+            busy_timeout_ms: How long writers wait for a database lock before failing
+        """
+        super().__init__()
+        self.db_path = str(db_path)
+        self.stream_key_prefix = stream_key_prefix
+        self.orchestrator = SchedulerOrchestrator() if orchestrator is None else orchestrator
+        self.consumer_name = f"{consumer_name}_{uuid4().hex[:8]}"
+        self.max_len = max_len if max_len and max_len > 0 else None
+        self.status_tracker = status_tracker
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # A single connection guarded by a lock; WAL lets other processes read concurrently
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=busy_timeout_ms / 1000,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._closed = False
+        self._create_schema()
+
+        logger.info(
+            f"[SQLITE_QUEUE] Initialized with db_path='{self.db_path}', "
+            f"stream_prefix='{self.stream_key_prefix}', consumer_name='{self.consumer_name}'"
+        )
+
+    def _create_schema(self) -> None:
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS scheduler_tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stream_key TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    consumer TEXT,
+                    lease_expires_at REAL,
+                    delivery_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_scheduler_tasks_ready
+                    ON scheduler_tasks (status, priority, id);
+                CREATE INDEX IF NOT EXISTS idx_scheduler_tasks_stream
+                    ON scheduler_tasks (stream_key, status);
+                """
+            )
+
+    def get_stream_key(self, user_id: str, mem_cube_id: str, task_label: str) -> str:
+        stream_key = f"{self.stream_key_prefix}:{user_id}:{mem_cube_id}:{task_label}"
+        return stream_key
+
+    def _get_priority(self, task_label: str) -> int:
+        priority = self.orchestrator.get_task_priority(task_label=task_label)
+        return int(getattr(priority, "value", priority))
+
+    def put(
+        self, message: ScheduleMessageItem, block: bool = True, timeout: float | None = None
+    ) -> None:
+        """
+        Add a message to the SQLite queue (Queue-compatible interface).
+
+        Args:
+            message: SchedulerMessageItem to add to the queue
+            block: Ignored; writers wait up to `busy_timeout_ms` for the database lock
+            timeout: Ignored for SQLite implementation
+
+        Raises:
+            TypeError: If message is not a ScheduleMessageItem
+        """
+        if not isinstance(message, ScheduleMessageItem):
+            raise TypeError(f"Expected ScheduleMessageItem, got {type(message)}")
+
+        stream_key = self.get_stream_key(
+            user_id=message.user_id, mem_cube_id=message.mem_cube_id, task_label=message.label
+        )
+        message.stream_key = stream_key
+        payload = json.dumps(message.to_dict(), ensure_ascii=False)
+
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = self._conn.execute(
+                        "INSERT INTO scheduler_tasks "
+                        "(stream_key, label, priority, payload, enqueued_at, status) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            stream_key,
+                            message.label,
+                            self._get_priority(message.label),
+                            payload,
+                            time.time(),
+                            READY_STATUS,
+                        ),
+                    )
+                    if self.max_len is not None:
+                        self._trim_stream(stream_key)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            logger.info(
+                f"Added message {cursor.lastrowid} to SQLite queue: {message.label} - {message.content[:100]}..."
+            )
+        except Exception as e:
+            logger.error(f"Failed to add message to SQLite queue: {e}")
+            raise
+
+    def _trim_stream(self, stream_key: str) -> None:
+        """Drop the oldest ready messages of a stream beyond `max_len` (like XADD MAXLEN)."""
+        self._conn.execute(
+            "DELETE FROM scheduler_tasks WHERE id IN ("
+            "  SELECT id FROM scheduler_tasks WHERE stream_key = ? AND status = ? "
+            "  ORDER BY id DESC LIMIT -1 OFFSET ?"
+            ")",
+            (stream_key, READY_STATUS, self.max_len),
+        )
+
+    def _lease_messages(
+        self, batch_size: int, stream_key: str | None = None
+    ) -> list[ScheduleMessageItem]:
+        """Lease up to `batch_size` ready or expired messages in priority order."""
+        if batch_size is None or batch_size <= 0:
+            return []
+
+        now = time.time()
+        query = (
+            "SELECT id, stream_key, label, payload FROM scheduler_tasks "
+            "WHERE (status = ? OR (status = ? AND lease_expires_at <= ?))"
+        )
+        params: list = [READY_STATUS, LEASED_STATUS, now]
+        if stream_key is not None:
+            query += " AND stream_key = ?"
+            params.append(stream_key)
+        query += " ORDER BY priority ASC, id ASC LIMIT ?"
+        params.append(int(batch_size))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(query, params).fetchall()
+                leases = [
+                    (
+                        LEASED_STATUS,
+                        self.consumer_name,
+                        now + self.orchestrator.get_task_idle_min(task_label=label) / 1000,
+                        row_id,
+                    )
+                    for row_id, _stream_key, label, _payload in rows
+                ]
+                if leases:
+                    self._conn.executemany(
+                        "UPDATE scheduler_tasks SET status = ?, consumer = ?, "
+                        "lease_expires_at = ?, delivery_count = delivery_count + 1 WHERE id = ?",
+                        leases,
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return self._convert_messages(rows)
+
+    def _convert_messages(self, rows: list[tuple]) -> list[ScheduleMessageItem]:
+        """Convert leased rows into ScheduleMessageItem with queue metadata."""
+        result: list[ScheduleMessageItem] = []
+        for row_id, stream_key, _label, payload in rows:
+            try:
+                message = ScheduleMessageItem.from_dict(json.loads(payload))
+                message.stream_key = stream_key
+                message.redis_message_id = str(row_id)
+                result.append(message)
+            except Exception as e:
+                logger.error(f"Failed to parse message {row_id}: {e}", stack_info=True)
+        return result
+
+    def get(
+        self,
+        stream_key: str,
+        block: bool = True,
+        timeout: float | None = None,
+        batch_size: int | None = 1,
+    ) -> list[ScheduleMessageItem]:
+        effective_batch_size = batch_size if batch_size is not None else 1
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            messages = self._lease_messages(batch_size=effective_batch_size, stream_key=stream_key)
+            if messages or not block:
+                return messages
+            if deadline is not None and time.time() >= deadline:
+                from queue import Empty
+
+                raise Empty("No messages available in SQLite queue")
+            time.sleep(0.01)
+
+    def get_nowait(self, stream_key: str, batch_size: int | None = 1) -> list[ScheduleMessageItem]:
+        return self.get(stream_key=stream_key, block=False, batch_size=batch_size)
+
+    def get_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
+        """Lease a batch of messages across all streams, highest priority first."""
+        return self._lease_messages(batch_size=batch_size)
+
+    def ack_message(
+        self,
+        user_id: str,
+        mem_cube_id: str,
+        task_label: str,
+        redis_message_id,
+        message: ScheduleMessageItem | None,
+    ) -> None:
+        if not redis_message_id:
+            logger.debug(
+                f"Skip ack: Empty message id for user_id='{user_id}', label='{task_label}'"
+            )
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM scheduler_tasks WHERE id = ?", (int(redis_message_id),)
+                )
+        except Exception as e:
+            logger.warning(f"Ack failed for SQLite message '{redis_message_id}': {e}")
+
+    def requeue_expired_leases(self) -> int:
+        """
+        Return messages whose lease has expired to the ready state.
+
+        Expired leases are already claimable by `get_messages`; this only makes them
+        visible in `qsize()` / `show_task_status()` again, e.g. after a restart.
+
+        Returns:
+            Number of messages returned to the ready state.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE scheduler_tasks SET status = ?, consumer = NULL, lease_expires_at = NULL "
+                "WHERE status = ? AND lease_expires_at <= ?",
+                (READY_STATUS, LEASED_STATUS, time.time()),
+            )
+        return cursor.rowcount
+
+    def get_stream_task_counts(self) -> dict[str, dict[str, int]]:
+        """Return per-stream counts of ready and leased messages."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stream_key, status, COUNT(*) FROM scheduler_tasks "
+                "GROUP BY stream_key, status"
+            ).fetchall()
+        counts: dict[str, dict[str, int]] = {}
+        for stream_key, status, count in rows:
+            stream_counts = counts.setdefault(stream_key, {READY_STATUS: 0, LEASED_STATUS: 0})
+            stream_counts[status] = count
+        return counts
+
+    def get_stream_backlog(self) -> dict[str, dict[str, float | int | None]]:
+        """Return depth and oldest enqueue time (epoch seconds) for every stream."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stream_key, COUNT(*), MIN(enqueued_at) FROM scheduler_tasks "
+                "GROUP BY stream_key"
+            ).fetchall()
+        return {
+            stream_key: {"depth": depth, "oldest_enqueued_at": oldest}
+            for stream_key, depth, oldest in rows
+        }
+
+    def qsize(self) -> dict:
+        """
+        Get the number of messages per stream, including leased ones, plus 'total_size'.
+        """
+        qsize_stats = {
+            stream_key: sum(stream_counts.values())
+            for stream_key, stream_counts in self.get_stream_task_counts().items()
+        }
+        qsize_stats["total_size"] = sum(qsize_stats.values())
+        return qsize_stats
+
+    def show_task_status(self, stream_key_prefix: str | None = None) -> dict[str, dict[str, int]]:
+        effective_prefix = stream_key_prefix or self.stream_key_prefix
+        grouped = {
+            stream_key: {"remaining": stream_counts[READY_STATUS]}
+            for stream_key, stream_counts in self.get_stream_task_counts().items()
+            if stream_key.startswith(effective_prefix)
+        }
+        total_remaining = sum(v["remaining"] for v in grouped.values())
+        print(f"Task Queue Status by user_id | remaining={total_remaining}")
+        for stream_key in sorted(grouped.keys()):
+            print(f"- {stream_key}: remaining={grouped[stream_key]['remaining']}")
+        return grouped
+
+    def get_stream_keys(self, stream_key_prefix: str | None = None) -> list[str]:
+        prefix = stream_key_prefix or self.stream_key_prefix
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT stream_key FROM scheduler_tasks WHERE stream_key LIKE ? ESCAPE '\\'",
+                (self._escape_like(prefix) + ":%",),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scheduler_tasks").fetchone()[0]
+
+    def empty(self) -> bool:
+        return self.size() == 0
+
+    def full(self) -> bool:
+        if self.max_len is None:
+            return False
+        return any(
+            sum(stream_counts.values()) >= self.max_len
+            for stream_counts in self.get_stream_task_counts().values()
+        )
+
+    def clear(self, stream_key: str | None = None) -> None:
+        with self._lock:
+            if stream_key is not None:
+                self._conn.execute(
+                    "DELETE FROM scheduler_tasks WHERE stream_key = ?", (stream_key,)
+                )
+            else:
+                self._conn.execute("DELETE FROM scheduler_tasks")
+        logger.info(f"Cleared SQLite queue: {stream_key or 'all streams'}")
+
+    @property
+    def unfinished_tasks(self) -> int:
+        return self.size()
+
+    def close(self) -> None:
+        """Checkpoint the WAL and close the database connection."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.debug(f"WAL checkpoint on close failed: {e}")
+            self._conn.close()
+            self._closed = True
+
+    def __del__(self):
+        with suppress(Exception):
+            self.close()
@@ -11,6 +11,7 @@ from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
 from memos.mem_scheduler.task_schedule_modules.local_queue import SchedulerLocalQueue
 from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
 from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+from memos.mem_scheduler.task_schedule_modules.sqlite_queue import SchedulerSQLiteQueue
 from memos.mem_scheduler.utils.db_utils import get_utc_now
 from memos.mem_scheduler.utils.misc_utils import group_messages_by_user_and_mem_cube
 from memos.mem_scheduler.utils.monitor_event_utils import emit_monitor_event, to_iso
@@ -28,8 +29,11 @@ class ScheduleTaskQueue:
         disabled_handlers: list | None = None,
         orchestrator: SchedulerOrchestrator | None = None,
         status_tracker: TaskStatusTracker | None = None,
+        use_sqlite_queue: bool = False,
+        sqlite_queue_path: str | None = None,
     ):
         self.use_redis_queue = use_redis_queue
+        self.use_sqlite_queue = use_sqlite_queue
         self.maxsize = maxsize
         self.orchestrator = SchedulerOrchestrator() if orchestrator is None else orchestrator
         self.status_tracker = status_tracker
@@ -44,6 +48,17 @@ class ScheduleTaskQueue:
                 orchestrator=self.orchestrator,
                 status_tracker=self.status_tracker,  # Propagate status_tracker
             )
+        elif self.use_sqlite_queue:
+            if maxsize is None or not isinstance(maxsize, int) or maxsize <= 0:
+                maxsize = None
+            sqlite_kwargs = {"db_path": sqlite_queue_path} if sqlite_queue_path else {}
+            self.memos_message_queue = SchedulerSQLiteQueue(
+                max_len=maxsize,
+                consumer_name="scheduler_consumer",
+                orchestrator=self.orchestrator,
+                status_tracker=self.status_tracker,
+                **sqlite_kwargs,
+            )
         else:
             self.memos_message_queue = SchedulerLocalQueue(maxsize=self.maxsize)
 
@@ -70,8 +85,8 @@ class ScheduleTaskQueue:
         redis_message_id,
         message: ScheduleMessageItem | None,
     ) -> None:
-        if not isinstance(self.memos_message_queue, SchedulerRedisQueue):
-            logger.warning("ack_message is only supported for Redis queues")
+        if not isinstance(self.memos_message_queue, SchedulerRedisQueue | SchedulerSQLiteQueue):
+            logger.warning("ack_message is only supported for Redis and SQLite queues")
             return
 
         self.memos_message_queue.ack_message(
@@ -83,12 +98,16 @@ class ScheduleTaskQueue:
         )
 
     def get_stream_keys(self) -> list[str]:
-        if isinstance(self.memos_message_queue, SchedulerRedisQueue):
+        if isinstance(self.memos_message_queue, SchedulerRedisQueue | SchedulerSQLiteQueue):
             stream_keys = self.memos_message_queue.get_stream_keys()
         else:
             stream_keys = list(self.memos_message_queue.queue_streams.keys())
         return stream_keys
 
+    def get_stream_backlog(self) -> dict[str, dict[str, float | int | None]]:
+        """Per-stream depth and oldest enqueue time (epoch seconds) of the active backend."""
+        return self.memos_message_queue.get_stream_backlog()
+
     def submit_messages(self, messages: ScheduleMessageItem | list[ScheduleMessageItem]):
         """Submit messages to the message queue (either local queue or Redis)."""
         if isinstance(messages, ScheduleMessageItem):
@@ -1,18 +1,32 @@
+import json
 import os
 import pickle
+import shutil
 
+from contextlib import suppress
 from datetime import datetime
+from typing import Any
 
 from transformers import DynamicCache
 
 from memos.configs.memory import KVCacheMemoryConfig
 from memos.dependency import require_python_package
 from memos.llms.factory import LLMFactory
+from memos.llms.hf_batching import cache_to_tensors
+from memos.log import get_logger
 from memos.memories.activation.base import BaseActMemory
 from memos.memories.activation.item import KVCacheItem
+from memos.memories.activation.kv_store import LazyKVCacheItems, StoredKVItem, save_kv_item
 from memos.memories.textual.item import TextualMemoryItem
 
 
+logger = get_logger(__name__)
+
+KV_STORE_SUFFIX = ".kv"
+KV_MANIFEST_FILENAME = "manifest.json"
+KV_STORE_VERSION = 1
+
+
 class KVCacheMemory(BaseActMemory):
     """
     Key-Value Cache Memory for activation memories.
@@ -27,21 +41,31 @@ class KVCacheMemory(BaseActMemory):
         """Initialize the KV Cache Memory with a configuration."""
         self.config = config
         self.llm = LLMFactory.from_config(config.extractor_llm)
-        self.kv_cache_memories: dict[str, KVCacheItem] = {}
+        self.kv_cache_memories: LazyKVCacheItems = self._new_items()
+        # Ids added since the last load/dump; only these have their tensors rewritten
+        self._dirty_ids: set[str] = set()
 
-    def extract(self, text: str) -> KVCacheItem:
+    def extract(self, text: str, base: KVCacheItem | None = None) -> KVCacheItem:
         """Extract memory based on the text.
 
-        Uses the LLM to build KV caches from the provided text.
+        Uses the LLM to build KV caches from the provided text. When `base` (an item
+        extracted earlier) is given, the KV of the token prefix its text shares with
+        `text` is reused and only the rest is prefilled.
 
         Args:
             text: Input text to extract memory from
+            base: Optional previously extracted item to reuse
 
         Returns:
             Extracted memory item
         """
-        # Build KV cache from the text using the LLM
-        kv_cache = self.llm.build_kv_cache(text)
+        base_text = base.metadata.get("source_text") if base is not None else None
+        extend_kv_cache = getattr(self.llm, "extend_kv_cache", None)
+        if base_text and extend_kv_cache is not None and base.memory is not None:
+            kv_cache = extend_kv_cache(text, base_text, base.memory)
+        else:
+            # Build KV cache from the text using the LLM
+            kv_cache = self.llm.build_kv_cache(text)
 
         # Create a KVCacheItem with the extracted cache
         cache_item = KVCacheItem(
@@ -59,6 +83,7 @@ class KVCacheMemory(BaseActMemory):
         """
         for memory in memories:
             self.kv_cache_memories[memory.id] = memory
+            self._dirty_ids.add(memory.id)
 
     def get_cache(self, cache_ids: list[str]) -> DynamicCache | None:
         """Merge multiple KV caches into a single cache.
@@ -121,11 +146,19 @@ class KVCacheMemory(BaseActMemory):
             memory_ids: List of memory IDs to delete
         """
         for memory_id in memory_ids:
-            self.kv_cache_memories.pop(memory_id, None)
+            # `del` rather than `pop`, which would load a stored item just to drop it
+            if memory_id in self.kv_cache_memories:
+                del self.kv_cache_memories[memory_id]
+            self._dirty_ids.discard(memory_id)
 
     def delete_all(self) -> None:
         """Delete all memories."""
         self.kv_cache_memories.clear()
+        self._dirty_ids.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Tier sizes, resident bytes, hit rate and reload latency of the cached items."""
+        return self.kv_cache_memories.stats()
 
     def from_textual_memory(self, mem: TextualMemoryItem) -> KVCacheItem:
         """
@@ -137,17 +170,34 @@ class KVCacheMemory(BaseActMemory):
         return KVCacheItem(memory=kv_cache, metadata=mem.metadata.model_dump())
 
     def load(self, dir: str) -> None:
-        """Load memories from os.path.join(dir, self.config.memory_filename)
+        """Load memories from the KV store in `dir`, or from the legacy pickle file
+        os.path.join(dir, self.config.memory_filename).
+
+        Only the manifest is read; each item's tensors are loaded on first access.
 
         Args:
             dir (str): The directory containing the memory files.
         """
+        self._dirty_ids = set()
+        store_dir = self._store_dir(dir)
+        manifest = self._read_manifest(store_dir)
+        if manifest is not None:
+            self.kv_cache_memories = self._new_items()
+            for memory_id, entry in manifest["items"].items():
+                self.kv_cache_memories.set_stored(
+                    memory_id, StoredKVItem(os.path.join(store_dir, entry["file"]), entry)
+                )
+            return
+        self._load_pickle(dir)
+
+    def _load_pickle(self, dir: str) -> None:
         import torch
 
         file_path = os.path.join(dir, self.config.memory_filename)
 
         if not os.path.exists(file_path):
             # If file doesn't exist, start with empty memories
+            self.kv_cache_memories = self._new_items()
             return
 
         try:
@@ -163,39 +213,115 @@ class KVCacheMemory(BaseActMemory):
                     memories = data["kv_cache_memories"]
                     if isinstance(memories, list):
                         # Convert list to dict format
-                        self.kv_cache_memories = {item.id: item for item in memories}
-                    else:
-                        self.kv_cache_memories = memories
+                        memories = {item.id: item for item in memories}
+                    self.kv_cache_memories = self._new_items(memories)
                 else:
                     # Reset to empty if no memories in data
-                    self.kv_cache_memories = {}
+                    self.kv_cache_memories = self._new_items()
             elif isinstance(data, list):
                 # Backward compatibility: convert list to dict
-                self.kv_cache_memories = {item.id: item for item in data}
+                self.kv_cache_memories = self._new_items({item.id: item for item in data})
             else:
                 # Reset to empty if data format is unexpected
-                self.kv_cache_memories = {}
+                self.kv_cache_memories = self._new_items()
 
         except (EOFError, pickle.UnpicklingError, Exception):
             # If loading fails, start with empty memories
-            self.kv_cache_memories = {}
+            self.kv_cache_memories = self._new_items()
 
     def dump(self, dir: str) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)
+        """Dump memories to a KV store directory next to self.config.memory_filename.
+
+        Each item's tensors live in their own safetensors file listed in a JSON
+        manifest. Only items added since the last load/dump are written; files and
+        the manifest are replaced atomically, so a crash leaves the previous store.
 
         Args:
             dir (str): The directory where the memory files will be saved.
         """
-        file_path = os.path.join(dir, self.config.memory_filename)
+        store_dir = self._store_dir(dir)
+        os.makedirs(store_dir, exist_ok=True)
+        previous = self._read_manifest(store_dir) or {"items": {}}
+
+        entries = {}
+        moved: list[tuple[str, StoredKVItem]] = []
+        persisted: list[tuple[str, StoredKVItem]] = []
+        for memory_id in self.kv_cache_memories:
+            stored = self.kv_cache_memories.stored(memory_id)
+            filename = f"{memory_id}.safetensors"
+            path = os.path.join(store_dir, filename)
+            if stored is not None:
+                # On disk and not loaded: reuse the file, copying it if it lives elsewhere
+                if os.path.abspath(stored.path) != os.path.abspath(path):
+                    self._atomic_write(path, lambda tmp, src=stored.path: shutil.copyfile(src, tmp))
+                    moved.append(
+                        (memory_id, StoredKVItem(path, {**stored.entry, "file": filename}))
+                    )
+                entries[memory_id] = {**stored.entry, "file": filename}
+                continue
+
+            # Cold items are dequantized for the write but stay cold in memory
+            item = self.kv_cache_memories.peek(memory_id)
+            if memory_id in self._dirty_ids or memory_id not in previous["items"]:
+                entries[memory_id] = save_kv_item(item, path)
+            else:
+                entries[memory_id] = {
+                    "file": filename,
+                    "num_layers": len(cache_to_tensors(item.memory)),
+                    "item": item.model_dump(mode="json", exclude={"memory"}),
+                }
+            persisted.append((memory_id, StoredKVItem(path, entries[memory_id])))
+
+        manifest = {"version": KV_STORE_VERSION, "items": entries}
+        manifest_path = os.path.join(store_dir, KV_MANIFEST_FILENAME)
+
+        def write_manifest(tmp: str) -> None:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+
+        self._atomic_write(manifest_path, write_manifest)
+
+        # Remove files of deleted items only after the new manifest is in place
+        for memory_id, entry in previous["items"].items():
+            if memory_id not in entries:
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(store_dir, entry["file"]))
+        # Spilled and loaded items can now be dropped back to their store files
+        for memory_id, stored in moved:
+            self.kv_cache_memories.set_stored(memory_id, stored)
+        for memory_id, stored in persisted:
+            self.kv_cache_memories.mark_persisted(memory_id, stored)
+        self._dirty_ids.clear()
+
+    def _new_items(self, items: dict[str, KVCacheItem] | None = None) -> LazyKVCacheItems:
+        return LazyKVCacheItems(
+            items,
+            max_resident_bytes=getattr(self.config, "max_resident_bytes", 0) or 0,
+            cold_dtype=getattr(self.config, "cold_storage_dtype", None),
+            spill_dir=getattr(self.config, "spill_dir", None),
+        )
 
-        # Create directory if it doesn't exist
-        os.makedirs(dir, exist_ok=True)
+    def _store_dir(self, dir: str) -> str:
+        stem = os.path.splitext(self.config.memory_filename)[0]
+        return os.path.join(dir, stem + KV_STORE_SUFFIX)
 
-        # Prepare data to save (only memories)
-        data = {"kv_cache_memories": self.kv_cache_memories}
+    @staticmethod
+    def _read_manifest(store_dir: str) -> dict[str, Any] | None:
+        manifest_path = os.path.join(store_dir, KV_MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"[KVCacheMemory] Failed to read KV store manifest {manifest_path}: {e}")
+            return None
 
-        with open(file_path, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    @staticmethod
+    def _atomic_write(path: str, write) -> None:
+        tmp = f"{path}.tmp"
+        write(tmp)
+        os.replace(tmp, path)
 
     def _concat_caches(self, caches: list[DynamicCache]) -> DynamicCache:
         """
@@ -0,0 +1,327 @@
+"""
+Tiered in-memory store for KVCacheMemory items.
+
+Items live in one of three tiers:
+    - hot: a full-precision `KVCacheItem`;
+    - cold: `QuantizedKVItem`, int8/fp8 tensors on CPU, dequantized on access;
+    - disk: `StoredKVItem`, a safetensors file read on access.
+
+With a byte budget, least recently used hot items are quantized (if a cold dtype is
+set) and then spilled to disk until the resident tensors fit. Items that came from
+a dumped store and were not replaced since are spilled by dropping them back to
+their store file, without writing anything.
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from transformers import DynamicCache
+
+from memos.llms.hf_batching import cache_to_tensors, tensors_to_cache
+from memos.log import get_logger
+from memos.memories.activation.item import KVCacheItem
+
+
+logger = get_logger(__name__)
+
+# Largest magnitude representable by each cold dtype
+_QUANT_MAX = {"int8": 127.0, "fp8": 448.0}
+
+
+def _tensor_bytes(tensor: Any) -> int:
+    return tensor.numel() * tensor.element_size()
+
+
+def kv_item_bytes(item: KVCacheItem) -> int:
+    """Bytes held by the KV tensors of an item."""
+    if item.memory is None:
+        return 0
+    return sum(_tensor_bytes(k) + _tensor_bytes(v) for k, v in cache_to_tensors(item.memory))
+
+
+def save_kv_item(item: KVCacheItem, path: str) -> dict[str, Any]:
+    """
+    Write the tensors of `item` to a safetensors file (via a temporary file and an
+    atomic rename) and return its manifest entry.
+    """
+    from safetensors.torch import save_file
+
+    layers = cache_to_tensors(item.memory)
+    tensors = {}
+    for i, (keys, values) in enumerate(layers):
+        tensors[f"layers.{i}.keys"] = keys.detach().cpu().contiguous()
+        tensors[f"layers.{i}.values"] = values.detach().cpu().contiguous()
+    tmp = f"{path}.tmp"
+    save_file(tensors, tmp)
+    os.replace(tmp, path)
+    return {
+        "file": os.path.basename(path),
+        "num_layers": len(layers),
+        "item": item.model_dump(mode="json", exclude={"memory"}),
+    }
+
+
+@dataclass
+class StoredKVItem:
+    """An item whose tensors are on disk and not loaded yet."""
+
+    path: str
+    entry: dict[str, Any]
+    # Written by the store to make room, rather than part of a dumped KV store
+    spilled: bool = False
+
+    def load(self) -> KVCacheItem:
+        from safetensors.torch import load_file
+
+        tensors = load_file(self.path)
+        layers = [
+            (tensors[f"layers.{i}.keys"], tensors[f"layers.{i}.values"])
+            for i in range(self.entry["num_layers"])
+        ]
+        cache = tensors_to_cache(layers) if layers else DynamicCache()
+        return KVCacheItem(memory=cache, **self.entry["item"])
+
+
+@dataclass
+class QuantizedKVItem:
+    """
+    A cold item kept on CPU in int8 or fp8. Keys are scaled per channel and values
+    per token, which keeps outlier channels in keys from flattening everything else.
+    """
+
+    fields: dict[str, Any]
+    dtype: str
+    layers: list[tuple[Any, Any, Any, Any]] = field(default_factory=list)
+    orig_dtype: Any = None
+
+    @classmethod
+    def from_item(cls, item: KVCacheItem, dtype: str) -> "QuantizedKVItem":
+        layers = []
+        orig_dtype = None
+        for keys, values in cache_to_tensors(item.memory):
+            orig_dtype = keys.dtype
+            qk, sk = _quantize(keys, dtype, dim=2)
+            qv, sv = _quantize(values, dtype, dim=3)
+            layers.append((qk, sk, qv, sv))
+        return cls(
+            fields=item.model_dump(exclude={"memory"}),
+            dtype=dtype,
+            layers=layers,
+            orig_dtype=orig_dtype,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(sum(_tensor_bytes(t) for t in layer) for layer in self.layers)
+
+    def load(self) -> KVCacheItem:
+        layers = [
+            (_dequantize(qk, sk, self.orig_dtype), _dequantize(qv, sv, self.orig_dtype))
+            for qk, sk, qv, sv in self.layers
+        ]
+        cache = tensors_to_cache(layers) if layers else DynamicCache()
+        return KVCacheItem(memory=cache, **self.fields)
+
+
+def _quantize(tensor: Any, dtype: str, dim: int) -> tuple[Any, Any]:
+    import torch
+
+    t32 = tensor.detach().to("cpu", torch.float32)
+    scale = t32.abs().amax(dim=dim, keepdim=True).clamp(min=1e-8) / _QUANT_MAX[dtype]
+    if dtype == "int8":
+        quantized = torch.round(t32 / scale).clamp(-127, 127).to(torch.int8)
+    else:
+        quantized = (t32 / scale).to(torch.float8_e4m3fn)
+    return quantized, scale
+
+
+def _dequantize(quantized: Any, scale: Any, dtype: Any) -> Any:
+    import torch
+
+    return (quantized.to(torch.float32) * scale).to(dtype)
+
+
+class LazyKVCacheItems(MutableMapping):
+    """
+    Ordered id -> KVCacheItem mapping over the hot/cold/disk tiers.
+
+    Reading an item promotes it to the hot tier. Persisted items are read from disk
+    on first access, so loading a store costs only its manifest.
+
+    Args:
+        items: Initial hot items.
+        max_resident_bytes: Budget for hot and cold tensors (0 disables eviction).
+        cold_dtype: "int8" or "fp8" to quantize cold items before spilling them.
+        spill_dir: Directory for spilled items; a temporary directory by default.
+    """
+
+    def __init__(
+        self,
+        items: dict[str, KVCacheItem] | None = None,
+        max_resident_bytes: int = 0,
+        cold_dtype: str | None = None,
+        spill_dir: str | None = None,
+    ):
+        self.max_resident_bytes = max_resident_bytes
+        self.cold_dtype = cold_dtype
+        self.spill_dir = spill_dir
+        self._items: dict[str, KVCacheItem | QuantizedKVItem | StoredKVItem] = {}
+        # Resident (hot or cold) ids, least recently used first, with their sizes
+        self._resident: OrderedDict[str, int] = OrderedDict()
+        # Store files of loaded items that were not replaced since
+        self._origins: dict[str, StoredKVItem] = {}
+        self._lock = threading.RLock()
+        self.resident_bytes = 0
+        self._metrics = {
+            "hits": 0,
+            "dequantized": 0,
+            "disk_loads": 0,
+            "reload_seconds": 0.0,
+            "quantized": 0,
+            "spilled": 0,
+        }
+        for memory_id, item in (items or {}).items():
+            self[memory_id] = item
+
+    def __getitem__(self, memory_id: str) -> KVCacheItem:
+        with self._lock:
+            item = self._items[memory_id]
+            if isinstance(item, KVCacheItem):
+                self._metrics["hits"] += 1
+                self._resident.move_to_end(memory_id)
+                return item
+
+            start = time.perf_counter()
+            loaded = item.load()
+            self._metrics["reload_seconds"] += time.perf_counter() - start
+            if isinstance(item, QuantizedKVItem):
+                self._metrics["dequantized"] += 1
+            else:
+                self._metrics["disk_loads"] += 1
+                if not item.spilled:
+                    self._origins[memory_id] = item
+            self._place(memory_id, loaded)
+            return loaded
+
+    def __setitem__(self, memory_id: str, item: KVCacheItem) -> None:
+        with self._lock:
+            self._origins.pop(memory_id, None)
+            self._place(memory_id, item)
+
+    def __delitem__(self, memory_id: str) -> None:
+        with self._lock:
+            item = self._items.pop(memory_id)
+            self._origins.pop(memory_id, None)
+            self.resident_bytes -= self._resident.pop(memory_id, 0)
+            if isinstance(item, StoredKVItem) and item.spilled:
+                with suppress(FileNotFoundError):
+                    os.remove(item.path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        # MutableMapping.clear pops items, which would load them just to drop them
+        with self._lock:
+            for memory_id in list(self._items):
+                del self[memory_id]
+
+    def is_loaded(self, memory_id: str) -> bool:
+        return not isinstance(self._items[memory_id], StoredKVItem)
+
+    def stored(self, memory_id: str) -> StoredKVItem | None:
+        item = self._items[memory_id]
+        return item if isinstance(item, StoredKVItem) else None
+
+    def set_stored(self, memory_id: str, stored: StoredKVItem) -> None:
+        with self._lock:
+            if memory_id in self._items:
+                del self[memory_id]
+            self._items[memory_id] = stored
+
+    def mark_persisted(self, memory_id: str, stored: StoredKVItem) -> None:
+        """Record that the current content of an item is in a store file."""
+        with self._lock:
+            if isinstance(self._items.get(memory_id), StoredKVItem):
+                self._items[memory_id] = stored
+            else:
+                self._origins[memory_id] = stored
+
+    def peek(self, memory_id: str) -> KVCacheItem:
+        """The item in full precision, without promoting it or touching the LRU order."""
+        item = self._items[memory_id]
+        return item if isinstance(item, KVCacheItem) else item.load()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._metrics)
+            tiers = [type(item) for item in self._items.values()]
+            stats["resident_bytes"] = self.resident_bytes
+            stats["hot_items"] = tiers.count(KVCacheItem)
+            stats["cold_items"] = tiers.count(QuantizedKVItem)
+            stats["disk_items"] = tiers.count(StoredKVItem)
+        reloads = stats["dequantized"] + stats["disk_loads"]
+        accesses = stats["hits"] + reloads
+        stats["hit_rate"] = stats["hits"] / accesses if accesses else 0.0
+        stats["avg_reload_ms"] = stats["reload_seconds"] * 1000 / reloads if reloads else 0.0
+        return stats
+
+    def _place(self, memory_id: str, item: KVCacheItem | QuantizedKVItem) -> None:
+        self.resident_bytes -= self._resident.pop(memory_id, 0)
+        size = item.nbytes if isinstance(item, QuantizedKVItem) else kv_item_bytes(item)
+        self._items[memory_id] = item
+        self._resident[memory_id] = size
+        self.resident_bytes += size
+        if isinstance(item, KVCacheItem):
+            self._enforce_budget(keep=memory_id)
+
+    def _enforce_budget(self, keep: str) -> None:
+        if self.max_resident_bytes <= 0 or self.resident_bytes <= self.max_resident_bytes:
+            return
+        if self.cold_dtype:
+            for memory_id in list(self._resident):
+                if self.resident_bytes <= self.max_resident_bytes:
+                    return
+                item = self._items[memory_id]
+                if memory_id != keep and isinstance(item, KVCacheItem):
+                    self._place(memory_id, QuantizedKVItem.from_item(item, self.cold_dtype))
+                    self._metrics["quantized"] += 1
+        for memory_id in list(self._resident):
+            if self.resident_bytes <= self.max_resident_bytes:
+                return
+            if memory_id != keep:
+                self._spill(memory_id)
+        if self.resident_bytes > self.max_resident_bytes:
+            logger.warning(
+                f"[KVCacheStore] Item {keep} alone exceeds the budget of "
+                f"{self.max_resident_bytes} resident bytes"
+            )
+
+    def _spill(self, memory_id: str) -> None:
+        stored = self._origins.pop(memory_id, None)
+        if stored is None or not os.path.exists(stored.path):
+            item = self._items[memory_id]
+            if isinstance(item, QuantizedKVItem):
+                item = item.load()
+            path = os.path.join(self._spill_root(), f"{memory_id}.safetensors")
+            stored = StoredKVItem(path, save_kv_item(item, path), spilled=True)
+        self.resident_bytes -= self._resident.pop(memory_id)
+        self._items[memory_id] = stored
+        self._metrics["spilled"] += 1
+
+    def _spill_root(self) -> str:
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="memos_kv_spill_")
+        os.makedirs(self.spill_dir, exist_ok=True)
+        return self.spill_dir
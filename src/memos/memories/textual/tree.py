@@ -376,11 +376,20 @@ class TreeTextMemory(BaseTextMemory):
         page_size: int | None = None,
         filter: dict | None = None,
         memory_type: list[str] | None = None,
+        include_totals: bool = True,
     ) -> dict:
         """Get all memories.
+        With `include_totals=False` only the requested nodes are read, skipping the
+        node/edge counts and edges of `export_graph`, for callers with precomputed counts.
         Returns:
             list[TextualMemoryItem]: List of all memories.
         """
+        if not include_totals:
+            return {
+                "nodes": self._get_nodes_only(
+                    user_name, user_id, page, page_size, filter, memory_type
+                )
+            }
         graph_output = self.graph_store.export_graph(
             user_name=user_name,
             user_id=user_id,
@@ -391,15 +400,97 @@ class TreeTextMemory(BaseTextMemory):
         )
         return graph_output
 
+    def _get_nodes_only(
+        self,
+        user_name: str | None,
+        user_id: str | None,
+        page: int | None,
+        page_size: int | None,
+        filter: dict | None,
+        memory_type: list[str] | None,
+    ) -> list[dict]:
+        if page is not None and page_size is not None:
+            page, page_size = max(1, page), max(1, page_size)
+            # One keyset read up to the end of the page, sliced like SKIP/LIMIT would be
+            result = self.get_all_page(
+                user_name=user_name,
+                user_id=user_id,
+                page_size=page * page_size,
+                filter=filter,
+                memory_type=memory_type,
+            )
+            return result["nodes"][(page - 1) * page_size :]
+
+        nodes: list[dict] = []
+        cursor = None
+        while True:
+            result = self.get_all_page(
+                user_name=user_name,
+                user_id=user_id,
+                cursor=cursor,
+                filter=filter,
+                memory_type=memory_type,
+            )
+            nodes.extend(result["nodes"])
+            cursor = result.get("next_cursor")
+            if not cursor:
+                return nodes
+
+    def get_memory_aggregates(self, user_name: str | None = None) -> dict[str, Any]:
+        """Return precomputed counts by memory type, status and tag plus recent activity."""
+        return self.memory_manager.aggregates.snapshot(user_name)
+
+    def get_all_page(
+        self,
+        user_name: str | None = None,
+        user_id: str | None = None,
+        cursor: str | None = None,
+        page_size: int = 500,
+        filter: dict | None = None,
+        memory_type: list[str] | None = None,
+        include_embedding: bool = False,
+    ) -> dict:
+        """Get one cursor-paginated page of memories.
+        Returns:
+            dict: {"nodes": [...], "next_cursor": str | None}
+        """
+        return self.graph_store.export_nodes_page(
+            cursor=cursor,
+            page_size=page_size,
+            memory_type=memory_type,
+            filter=filter,
+            include_embedding=include_embedding,
+            user_name=user_name,
+            user_id=user_id,
+        )
+
     def delete(self, memory_ids: list[str], user_name: str | None = None) -> None:
         """Hard delete: permanently remove nodes and their edges from the graph."""
         if not memory_ids:
             return
+        aggregates = self.memory_manager.aggregates
+        try:
+            # Fetch metadata up front so the aggregates can be decremented exactly
+            metadata_by_id = {
+                node["id"]: node.get("metadata") or {}
+                for node in self.graph_store.get_nodes(memory_ids, user_name=user_name) or []
+            }
+        except Exception as e:
+            logger.warning(f"TreeTextMemory.delete_hard: failed to fetch nodes: {e}")
+            metadata_by_id = None
+        deleted = []
         for mid in memory_ids:
             try:
                 self.graph_store.delete_node(mid, user_name=user_name)
+                deleted.append(mid)
             except Exception as e:
                 logger.warning(f"TreeTextMemory.delete_hard: failed to delete {mid}: {e}")
+        if metadata_by_id is None:
+            aggregates.invalidate(user_name)
+        else:
+            aggregates.record_deleted(
+                user_name, [metadata_by_id[mid] for mid in deleted if mid in metadata_by_id]
+            )
 
     def delete_by_memory_ids(self, memory_ids: list[str]) -> None:
         """Delete memories by memory_ids."""
@@ -407,11 +498,14 @@ class TreeTextMemory(BaseTextMemory):
             self.graph_store.delete_node_by_prams(memory_ids=memory_ids)
         except Exception as e:
             logger.error(f"An error occurred while deleting memories by memory_ids: {e}")
+        # The owning cubes are unknown here, so every aggregate is recounted on next read
+        self.memory_manager.aggregates.invalidate()
 
     def delete_all(self, user_name: str | None = None) -> None:
         """Delete all memories and their relationships from the graph store."""
         try:
             self.graph_store.clear(user_name=user_name)
+            self.memory_manager.aggregates.invalidate(user_name)
             logger.info("All memories and edges have been deleted from the graph.")
         except Exception as e:
             logger.error(f"An error occurred while deleting all memories: {e}")
@@ -427,6 +521,8 @@ class TreeTextMemory(BaseTextMemory):
         self.graph_store.delete_node_by_prams(
             writable_cube_ids=writable_cube_ids, file_ids=file_ids, filter=filter
         )
+        for cube_id in writable_cube_ids or [None]:
+            self.memory_manager.aggregates.invalidate(cube_id)
 
     def load(self, dir: str, user_name: str | None = None) -> None:
         try:
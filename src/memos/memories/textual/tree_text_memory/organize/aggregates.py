@@ -0,0 +1,366 @@
+"""
+Materialized per-user memory aggregates.
+
+Counts by memory_type and status, tag counts and hourly activity buckets are kept in
+process and updated incrementally by the write, update and delete paths, so dashboards
+and memory-size checks read them in O(1) instead of aggregating over the user's nodes.
+Status and memory_type changes go through `update_node_tracked`, which moves the node
+between counts of the aggregate store shared by every writer of the graph store.
+Counts are seeded with one grouped-count query and periodically reconciled against
+the graph store in the background, which also corrects drift from paths that cannot
+be tracked exactly (trims, deletes by filter, concurrent writers in other processes).
+"""
+
+import os
+import threading
+import time
+
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+# Seconds after which an aggregate is reconciled against the graph store in the background
+AGGREGATES_RECONCILE_SEC = float(os.getenv("MEMOS_AGGREGATES_RECONCILE_SEC", "600"))
+# Whether reconciliation scans nodes to rebuild tag counts and activity buckets
+AGGREGATES_SCAN_TAGS = os.getenv("MEMOS_AGGREGATES_SCAN_TAGS", "true").lower() == "true"
+# Users kept in memory; the least recently used aggregate is evicted beyond this
+AGGREGATES_MAX_USERS = int(os.getenv("MEMOS_AGGREGATES_MAX_USERS", "10000"))
+
+ACTIVITY_BUCKET_SEC = 3600
+ACTIVITY_BUCKETS = 24 * 7
+SCAN_PAGE_SIZE = 1000
+DEFAULT_STATUS = "activated"
+# Node fields whose updates move the node between aggregate counts
+TRACKED_UPDATE_FIELDS = frozenset({"memory_type", "status"})
+
+
+def _bucket(timestamp: float) -> int:
+    return int(timestamp // ACTIVITY_BUCKET_SEC) * ACTIVITY_BUCKET_SEC
+
+
+def _parse_timestamp(value: Any) -> float | None:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _count_key(metadata: dict[str, Any]) -> tuple[str, str]:
+    return (metadata.get("memory_type") or "Unknown", metadata.get("status") or DEFAULT_STATUS)
+
+
+class _UserAggregate:
+    def __init__(self):
+        # (memory_type, status) -> count
+        self.counts: Counter = Counter()
+        self.tags: Counter = Counter()
+        # bucket start (epoch seconds) -> {"added": n, "deleted": n}
+        self.activity: dict[int, Counter] = {}
+        self.reconciled_at = 0.0
+        self.tags_complete = False
+        self.stale = True
+
+    def apply(self, metadatas: Iterable[dict[str, Any]], sign: int, now: float) -> None:
+        n = 0
+        for metadata in metadatas:
+            key = _count_key(metadata)
+            self.counts[key] = max(0, self.counts[key] + sign)
+            for tag in metadata.get("tags") or []:
+                self.tags[tag] = max(0, self.tags[tag] + sign)
+            n += 1
+        if n:
+            self._touch_activity(now, "added" if sign > 0 else "deleted", n)
+        self.counts += Counter()  # drop zero entries
+        self.tags += Counter()
+
+    def _touch_activity(self, now: float, kind: str, n: int) -> None:
+        self.activity.setdefault(_bucket(now), Counter())[kind] += n
+        cutoff = _bucket(now) - ACTIVITY_BUCKETS * ACTIVITY_BUCKET_SEC
+        for start in [s for s in self.activity if s <= cutoff]:
+            del self.activity[start]
+
+
+class MemoryAggregateStore:
+    """
+    In-process aggregate store keyed by user_name (cube id).
+
+    Reads never scan nodes: a missing or invalidated aggregate is rebuilt with a single
+    grouped-count query, and tag counts/activity are rebuilt by a paged background scan
+    every `reconcile_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        graph_store: Any,
+        reconcile_interval: float = AGGREGATES_RECONCILE_SEC,
+        scan_tags: bool = AGGREGATES_SCAN_TAGS,
+        max_users: int = AGGREGATES_MAX_USERS,
+    ):
+        self.graph_store = graph_store
+        self.reconcile_interval = reconcile_interval
+        self.scan_tags = scan_tags
+        self.max_users = max_users
+        self._users: OrderedDict[str, _UserAggregate] = OrderedDict()
+        self._scanning: set[str] = set()
+        self._lock = threading.RLock()
+
+    # ---- write path ----
+
+    def record_added(self, user_name: str | None, metadatas: Iterable[dict[str, Any]]) -> None:
+        """Count nodes just written for `user_name`."""
+        with self._lock:
+            self._get(user_name).apply(metadatas, 1, time.time())
+
+    def record_deleted(self, user_name: str | None, metadatas: Iterable[dict[str, Any]]) -> None:
+        """Uncount nodes just hard-deleted for `user_name`."""
+        with self._lock:
+            self._get(user_name).apply(metadatas, -1, time.time())
+
+    def record_updated(
+        self, user_name: str | None, old_metadata: dict[str, Any], fields: dict[str, Any]
+    ) -> None:
+        """Move a node between (memory_type, status) counts after `fields` were written."""
+        old_key = _count_key(old_metadata)
+        new_key = _count_key({**old_metadata, **fields})
+        if old_key == new_key:
+            return
+        with self._lock:
+            aggregate = self._get(user_name)
+            if aggregate.counts[old_key] > 0:
+                aggregate.counts[old_key] -= 1
+            aggregate.counts[new_key] += 1
+            aggregate.counts += Counter()
+
+    def record_trimmed(self, user_name: str | None, memory_type: str, keep_latest: int) -> None:
+        """Clamp a memory_type to `keep_latest` nodes after remove_oldest_memory."""
+        with self._lock:
+            aggregate = self._get(user_name)
+            keys = sorted(
+                (key for key in aggregate.counts if key[0] == memory_type),
+                key=lambda key: aggregate.counts[key],
+                reverse=True,
+            )
+            excess = sum(aggregate.counts[key] for key in keys) - max(0, int(keep_latest))
+            if excess <= 0:
+                return
+            aggregate._touch_activity(time.time(), "deleted", excess)
+            # Which statuses were removed is unknown; take from the largest buckets and
+            # let reconciliation fix the split (tags are fixed the same way)
+            for key in keys:
+                taken = min(excess, aggregate.counts[key])
+                aggregate.counts[key] -= taken
+                excess -= taken
+                if excess == 0:
+                    break
+            aggregate.counts += Counter()
+
+    def invalidate(self, user_name: str | None = None) -> None:
+        """
+        Mark aggregates stale after changes that cannot be counted exactly.
+
+        Args:
+            user_name: User to invalidate; None invalidates every user.
+        """
+        with self._lock:
+            targets = self._users.values() if user_name is None else [self._get(user_name)]
+            for aggregate in targets:
+                aggregate.stale = True
+
+    # ---- read path ----
+
+    def memory_type_counts(self, user_name: str | None) -> dict[str, int]:
+        """Node counts by memory_type (all statuses), as used by memory-size checks."""
+        aggregate = self._ensure(user_name)
+        with self._lock:
+            result: Counter = Counter()
+            for (memory_type, _), count in aggregate.counts.items():
+                result[memory_type] += count
+            return dict(result)
+
+    def snapshot(
+        self, user_name: str | None, top_tags: int = 50, activity_hours: int = 24
+    ) -> dict[str, Any]:
+        """
+        Dashboard view of a user's aggregates.
+
+        Returns:
+            total, by_memory_type and by_status (non-deleted nodes), by_status_all,
+            top tags, hourly activity for the last `activity_hours` hours and
+            reconciliation metadata.
+        """
+        aggregate = self._ensure(user_name)
+        now = time.time()
+        with self._lock:
+            by_memory_type: Counter = Counter()
+            by_status: Counter = Counter()
+            for (memory_type, status), count in aggregate.counts.items():
+                by_status[status] += count
+                if status != "deleted":
+                    by_memory_type[memory_type] += count
+            first_bucket = _bucket(now) - (max(1, activity_hours) - 1) * ACTIVITY_BUCKET_SEC
+            activity = [
+                {
+                    "start": datetime.fromtimestamp(start, tz=timezone.utc).isoformat(),
+                    "added": aggregate.activity.get(start, Counter())["added"],
+                    "deleted": aggregate.activity.get(start, Counter())["deleted"],
+                }
+                for start in range(first_bucket, _bucket(now) + 1, ACTIVITY_BUCKET_SEC)
+            ]
+            return {
+                "total": sum(by_memory_type.values()),
+                "by_memory_type": dict(by_memory_type),
+                "by_status": {k: v for k, v in by_status.items() if k != "deleted"},
+                "by_status_all": dict(by_status),
+                "top_tags": [
+                    {"tag": tag, "count": count}
+                    for tag, count in aggregate.tags.most_common(top_tags)
+                ],
+                "tags_complete": aggregate.tags_complete,
+                "activity": activity,
+                "reconciled_at": (
+                    datetime.fromtimestamp(aggregate.reconciled_at, tz=timezone.utc).isoformat()
+                    if aggregate.reconciled_at
+                    else None
+                ),
+            }
+
+    # ---- reconciliation ----
+
+    def reconcile_counts(self, user_name: str | None) -> None:
+        """Rebuild (memory_type, status) counts with one grouped-count query."""
+        records = self.graph_store.get_grouped_counts(
+            group_fields=["memory_type", "status"], user_name=user_name
+        )
+        counts: Counter = Counter()
+        for record in records:
+            key = (record.get("memory_type") or "Unknown", record.get("status") or DEFAULT_STATUS)
+            counts[key] += int(record.get("count") or 0)
+        with self._lock:
+            aggregate = self._get(user_name)
+            aggregate.counts = counts
+            aggregate.stale = False
+            aggregate.reconciled_at = time.time()
+        logger.info(f"[MemoryAggregates] Reconciled counts for {user_name}: {dict(counts)}")
+
+    def reconcile_scan(self, user_name: str | None) -> None:
+        """Rebuild tag counts and added-activity buckets by paging through the nodes."""
+        tags: Counter = Counter()
+        added: Counter = Counter()
+        cutoff = _bucket(time.time()) - ACTIVITY_BUCKETS * ACTIVITY_BUCKET_SEC
+        cursor = None
+        while True:
+            page = self.graph_store.export_nodes_page(
+                cursor=cursor, page_size=SCAN_PAGE_SIZE, user_name=user_name
+            )
+            nodes = list(page.get("nodes") or [])
+            for node in nodes:
+                metadata = node.get("metadata") or {}
+                tags.update(metadata.get("tags") or [])
+                created = _parse_timestamp(metadata.get("created_at"))
+                if created is not None and _bucket(created) > cutoff:
+                    added[_bucket(created)] += 1
+            cursor = page.get("next_cursor")
+            if not nodes or not cursor:
+                break
+        with self._lock:
+            aggregate = self._get(user_name)
+            aggregate.tags = tags
+            aggregate.tags_complete = True
+            for start, count in added.items():
+                aggregate.activity.setdefault(start, Counter())["added"] = count
+
+    def _reconcile_in_background(self, user_name: str | None, counts: bool = True) -> None:
+        key = user_name or ""
+        with self._lock:
+            if key in self._scanning:
+                return
+            self._scanning.add(key)
+
+        def _run():
+            try:
+                if counts:
+                    self.reconcile_counts(user_name)
+                if self.scan_tags:
+                    self.reconcile_scan(user_name)
+            except Exception as e:
+                logger.warning(f"[MemoryAggregates] Reconcile failed for {user_name}: {e}")
+            finally:
+                with self._lock:
+                    self._scanning.discard(key)
+
+        threading.Thread(target=_run, name="memos-aggregates-reconcile", daemon=True).start()
+
+    def _ensure(self, user_name: str | None) -> _UserAggregate:
+        with self._lock:
+            aggregate = self._get(user_name)
+            stale = aggregate.stale
+        if stale:
+            self.reconcile_counts(user_name)
+            if self.scan_tags and not aggregate.tags_complete:
+                self._reconcile_in_background(user_name, counts=False)
+        elif time.time() - aggregate.reconciled_at >= self.reconcile_interval:
+            self._reconcile_in_background(user_name)
+        return aggregate
+
+    def _get(self, user_name: str | None) -> _UserAggregate:
+        key = user_name or ""
+        aggregate = self._users.get(key)
+        if aggregate is None:
+            aggregate = self._users[key] = _UserAggregate()
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(key)
+        return aggregate
+
+
+_stores: WeakKeyDictionary = WeakKeyDictionary()
+_stores_lock = threading.Lock()
+
+
+def get_aggregate_store(graph_store: Any) -> MemoryAggregateStore:
+    """The aggregate store shared by every component writing to `graph_store`."""
+    with _stores_lock:
+        store = _stores.get(graph_store)
+        if store is None:
+            store = _stores[graph_store] = MemoryAggregateStore(graph_store)
+        return store
+
+
+def update_node_tracked(
+    graph_store: Any,
+    node_id: str,
+    fields: dict[str, Any],
+    user_name: str | None = None,
+    old_metadata: dict[str, Any] | None = None,
+) -> None:
+    """
+    `graph_store.update_node` that keeps the aggregates of `graph_store` exact.
+
+    When `fields` changes memory_type or status and the graph store has an aggregate
+    store, the node is moved between (memory_type, status) counts. Its previous
+    metadata is read with `get_node` unless given as `old_metadata`.
+    """
+    store = _stores.get(graph_store)
+    if store is None or not TRACKED_UPDATE_FIELDS & fields.keys():
+        graph_store.update_node(id=node_id, fields=fields, user_name=user_name)
+        return
+    if old_metadata is None:
+        node = graph_store.get_node(node_id, user_name=user_name)
+        old_metadata = node.get("metadata") if node else None
+    graph_store.update_node(id=node_id, fields=fields, user_name=user_name)
+    if old_metadata is None:
+        store.invalidate(user_name)
+    else:
+        store.record_updated(user_name, old_metadata, fields)
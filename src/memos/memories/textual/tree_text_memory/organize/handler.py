@@ -10,6 +10,7 @@ from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.aggregates import update_node_tracked
 from memos.templates.tree_reorganize_prompts import (
     MEMORY_RELATION_DETECTOR_PROMPT,
     MEMORY_RELATION_RESOLVER_PROMPT,
@@ -181,8 +182,14 @@ class NodeHandler:
             ):
                 self.graph_store.add_edge(new_from, new_to, edge["type"], user_name=user_name)
 
-        self.graph_store.update_node(conflict_a.id, {"status": "archived"}, user_name=user_name)
-        self.graph_store.update_node(conflict_b.id, {"status": "archived"}, user_name=user_name)
+        for conflict in (conflict_a, conflict_b):
+            update_node_tracked(
+                self.graph_store,
+                conflict.id,
+                {"status": "archived"},
+                user_name=user_name,
+                old_metadata=conflict.metadata.model_dump(),
+            )
         self.graph_store.add_edge(conflict_a.id, merged.id, type="MERGED_TO", user_name=user_name)
         self.graph_store.add_edge(conflict_b.id, merged.id, type="MERGED_TO", user_name=user_name)
         logger.debug(
@@ -7,6 +7,7 @@ from memos.extras.nli_model.client import NLIClient
 from memos.extras.nli_model.types import NLIResult
 from memos.graph_dbs.base import BaseGraphDB
 from memos.memories.textual.item import ArchivedTextualMemory, TextualMemoryItem
+from memos.memories.textual.tree_text_memory.organize.aggregates import update_node_tracked
 
 
 logger = logging.getLogger(__name__)
@@ -155,10 +156,12 @@ class MemoryHistoryManager:
             for mem in memory_items:
                 futures.append(
                     executor.submit(
-                        self.graph_db.update_node,
-                        id=mem.id,
-                        fields={"status": status},
+                        update_node_tracked,
+                        self.graph_db,
+                        mem.id,
+                        {"status": status},
                         user_name=user_name,
+                        old_metadata=mem.metadata.model_dump(),
                     )
                 )
 
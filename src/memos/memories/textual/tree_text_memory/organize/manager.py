@@ -11,6 +11,7 @@ from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.aggregates import get_aggregate_store
 from memos.memories.textual.tree_text_memory.organize.reorganizer import (
     GraphStructureReorganizer,
     QueueMessage,
@@ -65,6 +66,7 @@ class MemoryManager:
         self.graph_store = graph_store
         self.embedder = embedder
         self.memory_size = memory_size
+        self.aggregates = get_aggregate_store(graph_store)
         self.current_memory_size = {
             "WorkingMemory": 0,
             "LongTermMemory": 0,
@@ -218,20 +220,21 @@ class MemoryManager:
 
             max_workers = min(8, max(1, len(nodes) // max(1, batch_size)))
             with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures: list[tuple[int, int, object]] = []
+                futures: list[tuple[int, list[dict], object]] = []
                 for batch_index, i in enumerate(range(0, len(nodes), batch_size), start=1):
                     batch = nodes[i : i + batch_size]
                     fut = executor.submit(
                         self.graph_store.add_nodes_batch, batch, user_name=user_name
                     )
-                    futures.append((batch_index, len(batch), fut))
+                    futures.append((batch_index, batch, fut))
 
-                for idx, size, fut in futures:
+                for idx, batch, fut in futures:
                     try:
                         fut.result()
+                        self.aggregates.record_added(user_name, [n["metadata"] for n in batch])
                     except Exception as e:
                         logger.exception(
-                            f"Batch add {node_kind} nodes error (batch {idx}, size {size}): ",
+                            f"Batch add {node_kind} nodes error (batch {idx}, size {len(batch)}): ",
                             exc_info=e,
                         )
 
@@ -254,6 +257,9 @@ class MemoryManager:
                 keep_latest=self.memory_size["WorkingMemory"],
                 user_name=user_name,
             )
+            self.aggregates.record_trimmed(
+                user_name, "WorkingMemory", self.memory_size["WorkingMemory"]
+            )
         except Exception:
             logger.warning(f"Remove WorkingMemory error: {traceback.format_exc()}")
 
@@ -282,6 +288,9 @@ class MemoryManager:
             keep_latest=self.memory_size["WorkingMemory"],
             user_name=user_name,
         )
+        self.aggregates.record_trimmed(
+            user_name, "WorkingMemory", self.memory_size["WorkingMemory"]
+        )
         self._refresh_memory_size(user_name=user_name)
 
     def get_current_memory_size(self, user_name: str | None = None) -> dict[str, int]:
@@ -293,14 +302,10 @@ class MemoryManager:
 
     def _refresh_memory_size(self, user_name: str | None = None) -> None:
         """
-        Query the latest counts from the graph store and update internal state.
+        Update internal state from the incrementally maintained aggregates; the graph
+        store is only queried when they are missing or were invalidated.
         """
-        results = self.graph_store.get_grouped_counts(
-            group_fields=["memory_type"], user_name=user_name
-        )
-        self.current_memory_size = {
-            record["memory_type"]: int(record["count"]) for record in results
-        }
+        self.current_memory_size = self.aggregates.memory_type_counts(user_name)
         logger.info(f"[MemoryManager] Refreshed memory sizes: {self.current_memory_size}")
 
     def _process_memory(self, memory: TextualMemoryItem, user_name: str | None = None):
@@ -381,6 +386,7 @@ class MemoryManager:
         working_memory = TextualMemoryItem(id=node_id, memory=memory.memory, metadata=metadata)
         # Insert node into graph
         self.graph_store.add_node(working_memory.id, working_memory.memory, metadata, user_name)
+        self.aggregates.record_added(user_name, [metadata])
         return node_id
 
     def _add_to_graph_memory(
@@ -410,6 +416,7 @@ class MemoryManager:
             metadata_dict,
             user_name=user_name,
         )
+        self.aggregates.record_added(user_name, [metadata_dict])
         self.reorganizer.add_message(
             QueueMessage(
                 op="add",
@@ -494,12 +501,11 @@ class MemoryManager:
                     background="",
                 ),
             )
+            new_metadata = new_node.metadata.model_dump(exclude_none=True)
             self.graph_store.add_node(
-                new_node.id,
-                new_node.memory,
-                new_node.metadata.model_dump(exclude_none=True),
-                user_name=user_name,
+                new_node.id, new_node.memory, new_metadata, user_name=user_name
             )
+            self.aggregates.record_added(user_name, [new_metadata])
             self.reorganizer.add_message(
                 QueueMessage(
                     op="add",
@@ -535,6 +541,7 @@ class MemoryManager:
                     self.graph_store.remove_oldest_memory(
                         memory_type=memory_type, keep_latest=limit, user_name=user_name
                     )
+                    self.aggregates.record_trimmed(user_name, memory_type, limit)
                     logger.debug(f"Cleaned up {memory_type}: {current_count} -> {limit}")
                 except Exception:
                     logger.warning(f"Remove {memory_type} error: {traceback.format_exc()}")
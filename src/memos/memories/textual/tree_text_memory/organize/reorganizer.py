@@ -15,6 +15,7 @@ from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.item import GraphDBEdge, GraphDBNode
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.base import BaseLLM
+from memos.llms.governor import BACKGROUND, llm_priority
 from memos.log import get_logger
 from memos.memories.textual.item import SourceMessage, TreeNodeTextualMemoryMetadata
 from memos.memories.textual.tree_text_memory.organize.handler import NodeHandler
@@ -131,17 +132,18 @@ class GraphStructureReorganizer:
         logger.debug("Structure optimizer is now idle.")
 
     def _run_message_consumer_loop(self):
-        while True:
-            message = self.queue.get()
-            if message.op == "end":
-                break
-
-            try:
-                if self._preprocess_message(message):
-                    self.handle_message(message)
-            except Exception:
-                logger.error(traceback.format_exc())
-            self.queue.task_done()
+        with llm_priority(BACKGROUND):
+            while True:
+                message = self.queue.get()
+                if message.op == "end":
+                    break
+
+                try:
+                    if self._preprocess_message(message):
+                        self.handle_message(message)
+                except Exception:
+                    logger.error(traceback.format_exc())
+                self.queue.task_done()
 
     @require_python_package(
         import_name="schedule",
@@ -159,16 +161,17 @@ class GraphStructureReorganizer:
         schedule.every(100).seconds.do(self.optimize_structure, scope="UserMemory")
 
         logger.info("Structure optimizer schedule started.")
-        while not getattr(self, "_stop_scheduler", False):
-            if any(self._is_optimizing.values()):
-                time.sleep(1)
-                continue
-            if self._reorganize_needed:
-                logger.info("[Reorganizer] Triggering optimize_structure due to new nodes.")
-                self.optimize_structure(scope="LongTermMemory")
-                self.optimize_structure(scope="UserMemory")
-                self._reorganize_needed = False
-            time.sleep(30)
+        with llm_priority(BACKGROUND):
+            while not getattr(self, "_stop_scheduler", False):
+                if any(self._is_optimizing.values()):
+                    time.sleep(1)
+                    continue
+                if self._reorganize_needed:
+                    logger.info("[Reorganizer] Triggering optimize_structure due to new nodes.")
+                    self.optimize_structure(scope="LongTermMemory")
+                    self.optimize_structure(scope="UserMemory")
+                    self._reorganize_needed = False
+                time.sleep(30)
 
     def stop(self):
         """
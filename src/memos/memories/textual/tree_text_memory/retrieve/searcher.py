@@ -5,6 +5,7 @@ from concurrent.futures import as_completed
 
 from memos.context.context import ContextThreadPoolExecutor
 from memos.embedders.factory import OllamaEmbedder
+from memos.embedders.prefetch import embed_with_prefetch
 from memos.graph_dbs.factory import Neo4jGraphDB
 from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
 from memos.log import get_logger
@@ -274,7 +275,7 @@ class Searcher:
         # fine mode will trigger initial embedding search
         if mode == "fine_old":
             logger.info("[SEARCH] Fine mode: embedding search")
-            query_embedding = self.embedder.embed([query])[0]
+            query_embedding = embed_with_prefetch(self.embedder, [query])[0]
 
             # retrieve related nodes by embedding
             related_nodes = [
@@ -323,7 +324,7 @@ class Searcher:
         # if goal has extra memories, embed them too
         if parsed_goal.memories:
             embed_texts = list(dict.fromkeys([query, *parsed_goal.memories]))
-            query_embedding = self.embedder.embed(embed_texts)
+            query_embedding = embed_with_prefetch(self.embedder, embed_texts)
         return parsed_goal, query_embedding, context, query
 
     @timed
@@ -0,0 +1,133 @@
+"""
+Shared token counting for chat windowing, chunking and embedding truncation.
+
+tiktoken encoders are built once per model and cached; without tiktoken a
+character heuristic is used (zh chars ~1 token, others ~1 token per ~4 chars).
+`IncrementalTokenCounter` keeps a running total over a sliding window of segments,
+so appending a line or trimming the oldest one only counts that segment instead
+of re-encoding the whole window.
+"""
+
+import functools
+import re
+
+from collections import deque
+from typing import Any
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_TOKENIZER_MODEL = "gpt-4o-mini"
+_FALLBACK_ENCODING = "cl100k_base"
+_ZH_CHAR = re.compile(r"[\u4e00-\u9fff]")
+
+
+@functools.lru_cache(maxsize=16)
+def get_encoder(model: str = DEFAULT_TOKENIZER_MODEL) -> Any:
+    """Cached tiktoken encoder for `model`, or None when tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("[TokenCounter] tiktoken not installed, using heuristic token counts")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding(_FALLBACK_ENCODING)
+        except Exception as e:
+            logger.warning(f"[TokenCounter] Failed to load tiktoken encoding: {e}")
+            return None
+
+
+def _heuristic_count(text: str) -> int:
+    if not text:
+        return 0
+    zh = len(_ZH_CHAR.findall(text))
+    rest = len(text) - zh
+    return zh + max(1, rest // 4)
+
+
+def count_tokens(text: str, model: str = DEFAULT_TOKENIZER_MODEL) -> int:
+    """Number of tokens in `text`."""
+    enc = get_encoder(model)
+    if enc is None:
+        return _heuristic_count(text)
+    return len(enc.encode(text or "", disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = DEFAULT_TOKENIZER_MODEL) -> str:
+    """
+    Longest prefix of `text` within `max_tokens` tokens, found with a single encode.
+
+    Returns at least one character of a non-empty text.
+    """
+    if not text or max_tokens is None or max_tokens <= 0:
+        return text
+    enc = get_encoder(model)
+    if enc is None:
+        return _heuristic_truncate(text, max_tokens)
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    # A partial multi-byte character at the cut is dropped
+    truncated = enc.decode_bytes(tokens[:max_tokens]).decode("utf-8", errors="ignore")
+    return truncated or text[:1]
+
+
+def _heuristic_truncate(text: str, max_tokens: int) -> str:
+    # The heuristic count only grows with the prefix, so one scan finds the cut
+    zh = rest = 0
+    for index, char in enumerate(text):
+        if _ZH_CHAR.match(char):
+            zh += 1
+        else:
+            rest += 1
+        if zh + max(1, rest // 4) > max_tokens:
+            return text[:index] or text[:1]
+    return text
+
+
+class IncrementalTokenCounter:
+    """
+    Token total of a sliding window of text segments.
+
+    Segments are counted once when appended; the window total is the sum of the
+    segment counts. Segments that end on a natural boundary (e.g. chat lines ending
+    in a newline) rarely share a token, so the sum tracks the count of the joined
+    text closely.
+    """
+
+    def __init__(self, model: str = DEFAULT_TOKENIZER_MODEL):
+        self.model = model
+        self._segments: deque[tuple[str, int]] = deque()
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def count(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    def append(self, text: str, tokens: int | None = None) -> int:
+        """Add a segment at the end; returns its token count."""
+        if tokens is None:
+            tokens = self.count(text)
+        self._segments.append((text, tokens))
+        self.total += tokens
+        return tokens
+
+    def popleft(self) -> str:
+        """Drop the oldest segment and return it."""
+        text, tokens = self._segments.popleft()
+        self.total -= tokens
+        return text
+
+    def clear(self) -> None:
+        self._segments.clear()
+        self.total = 0
+
+    def text(self) -> str:
+        return "".join(text for text, _ in self._segments)
@@ -1,38 +1,267 @@
 from __future__ import annotations
 
-from concurrent.futures import as_completed
+import heapq
+import os
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, wait
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from prometheus_client import Counter
+
 from memos.context.context import ContextThreadPoolExecutor
 from memos.multi_mem_cube.views import MemCubeView
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
     from memos.api.product_models import APIADDRequest, APIFeedbackRequest, APISearchRequest
     from memos.multi_mem_cube.single_cube import SingleCubeView
 
 
+# Size of the pool shared by all composite fan-outs in this process
+CUBE_FANOUT_MAX_WORKERS = int(os.getenv("MEMOS_CUBE_FANOUT_MAX_WORKERS", "16"))
+# Cubes that have not answered a search within this many seconds are left out
+CUBE_SEARCH_TIMEOUT = float(os.getenv("MEMOS_CUBE_SEARCH_TIMEOUT_SEC", "30"))
+# Searches allowed in flight per cube, counting ones abandoned after their deadline
+CUBE_MAX_INFLIGHT = int(os.getenv("MEMOS_CUBE_MAX_INFLIGHT", "4"))
+
+CUBE_FANOUT_SKIPPED_TOTAL = Counter(
+    "memos_cube_fanout_skipped_total",
+    "Cubes left out of a composite fan-out",
+    ["action", "cube_id", "reason"],
+)
+
+# Bucketed memory categories and the request field limiting each of them
+MERGED_CATEGORIES = {
+    "text_mem": "top_k",
+    "pref_mem": "pref_top_k",
+    "tool_mem": "tool_mem_top_k",
+    "skill_mem": "skill_mem_top_k",
+}
+
+_fanout_executor: ContextThreadPoolExecutor | None = None
+_fanout_lock = threading.Lock()
+_cube_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _get_fanout_executor() -> ContextThreadPoolExecutor:
+    global _fanout_executor
+    with _fanout_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ContextThreadPoolExecutor(
+                max_workers=CUBE_FANOUT_MAX_WORKERS, thread_name_prefix="memos-cube-fanout"
+            )
+        return _fanout_executor
+
+
+def _get_cube_slots(cube_id: str) -> threading.BoundedSemaphore:
+    with _fanout_lock:
+        slots = _cube_slots.get(cube_id)
+        if slots is None:
+            slots = _cube_slots[cube_id] = threading.BoundedSemaphore(CUBE_MAX_INFLIGHT)
+        return slots
+
+
+def _score(memory: dict[str, Any]) -> float:
+    metadata = memory.get("metadata")
+    score = metadata.get("relativity") if isinstance(metadata, dict) else None
+    try:
+        return float(score) if score is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def merge_cube_buckets(
+    buckets: list[dict[str, Any]], limit: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Merge per-cube buckets by normalized relevance, dropping cross-cube duplicates.
+
+    Scores are clamped at 0 and divided by the cube's max score when it exceeds 1, so
+    rerankers on different scales stay comparable. Each cube's memories are sorted by
+    score and the cubes are k-way merged; a memory is kept only the first time its id
+    or text is seen, and at most `limit` memories are kept overall. The per-cube bucket
+    layout is preserved, with memories in score order and buckets ordered by their best
+    memory.
+    """
+    sorted_runs = []
+    for bucket_idx, bucket in enumerate(buckets):
+        memories = [m for m in bucket.get("memories", []) if isinstance(m, dict)]
+        if not memories:
+            continue
+        scores = [max(0.0, _score(m)) for m in memories]
+        scale = max(1.0, max(scores))
+        run = sorted(
+            (
+                (-score / scale, bucket_idx, pos, mem)
+                for pos, (score, mem) in enumerate(zip(scores, memories, strict=True))
+            ),
+            key=lambda entry: entry[:3],
+        )
+        sorted_runs.append(run)
+
+    kept: dict[int, list[dict[str, Any]]] = {idx: [] for idx in range(len(buckets))}
+    best_rank: dict[int, int] = {}
+    seen_ids: set[str] = set()
+    seen_texts: set[str] = set()
+    total = 0
+    for _, bucket_idx, _, mem in heapq.merge(*sorted_runs, key=lambda entry: entry[:3]):
+        if limit is not None and total >= limit:
+            break
+        mem_id = mem.get("id")
+        text = mem.get("memory")
+        text_key = " ".join(text.split()) if isinstance(text, str) else None
+        if (mem_id and mem_id in seen_ids) or (text_key and text_key in seen_texts):
+            continue
+        if mem_id:
+            seen_ids.add(mem_id)
+        if text_key:
+            seen_texts.add(text_key)
+        kept[bucket_idx].append(mem)
+        best_rank.setdefault(bucket_idx, total)
+        total += 1
+
+    merged = []
+    for bucket_idx in sorted(range(len(buckets)), key=lambda i: best_rank.get(i, total + i)):
+        bucket = dict(buckets[bucket_idx])
+        bucket["memories"] = kept[bucket_idx]
+        if "total_nodes" in bucket:
+            bucket["total_nodes"] = len(kept[bucket_idx])
+        merged.append(bucket)
+    return merged
+
+
 @dataclass
 class CompositeCubeView(MemCubeView):
     """
     A composite view over multiple logical cubes.
 
-    For now (fast mode), it simply fan-out writes to all cubes;
-    later we can add smarter routing / slow mode here.
+    Reads and writes fan out to all cubes concurrently on a process-wide bounded pool.
+    Searches give each cube `search_timeout` seconds from when its search starts, and
+    at most `CUBE_MAX_INFLIGHT` searches run per cube, so a stuck cube cannot take over
+    the pool with abandoned calls. Per-cube results are merged by normalized score with
+    cross-cube dedup.
     """
 
     cube_views: list[SingleCubeView]
     logger: Any
+    search_timeout: float | None = CUBE_SEARCH_TIMEOUT
+
+    def _fan_out(
+        self,
+        action: str,
+        fn: Callable[[SingleCubeView], Any],
+        timeout: float | None = None,
+        fail_fast: bool = True,
+    ) -> list[tuple[SingleCubeView, Any]]:
+        """
+        Run `fn` for every cube view concurrently.
+
+        Returns:
+            (view, result) pairs in cube order. Cubes that timed out or had no free
+            in-flight slot are omitted. With `fail_fast`, the first error (in cube
+            order) is re-raised once all cubes have finished; otherwise failed cubes
+            are logged and omitted unless every cube failed.
+        """
+        if len(self.cube_views) == 1:
+            view = self.cube_views[0]
+            return [(view, fn(view))]
+
+        executor = _get_fanout_executor()
+        started: dict[int, float] = {}
+
+        def run(idx: int, view: SingleCubeView) -> Any:
+            started[idx] = time.monotonic()
+            return fn(view)
+
+        futures: list[Future | None] = []
+        for idx, view in enumerate(self.cube_views):
+            if not fail_fast:
+                slots = _get_cube_slots(view.cube_id)
+                if not slots.acquire(blocking=False):
+                    self.logger.warning(
+                        f"[CompositeCubeView] {action} on cube={view.cube_id} skipped: "
+                        f"{CUBE_MAX_INFLIGHT} calls already in flight"
+                    )
+                    CUBE_FANOUT_SKIPPED_TOTAL.labels(action, view.cube_id, "busy").inc()
+                    futures.append(None)
+                    continue
+            self.logger.info(f"[CompositeCubeView] fan-out {action} to cube={view.cube_id}")
+            future = executor.submit(run, idx, view)
+            if not fail_fast:
+                future.add_done_callback(lambda _, slots=slots: slots.release())
+            futures.append(future)
+
+        if fail_fast or timeout is None:
+            wait([future for future in futures if future is not None])
+        else:
+            self._wait_for_deadlines(futures, started, timeout)
+
+        results, errors = [], []
+        for view, future in zip(self.cube_views, futures, strict=True):
+            if future is None:
+                continue
+            if not future.done() or future.cancelled():
+                self.logger.warning(
+                    f"[CompositeCubeView] {action} on cube={view.cube_id} missed the "
+                    f"{timeout}s deadline, skipping"
+                )
+                CUBE_FANOUT_SKIPPED_TOTAL.labels(action, view.cube_id, "timeout").inc()
+                continue
+            error = future.exception()
+            if error is not None:
+                if fail_fast:
+                    raise error
+                self.logger.error(
+                    f"[CompositeCubeView] {action} on cube={view.cube_id} failed: {error}"
+                )
+                errors.append(error)
+                continue
+            results.append((view, future.result()))
+
+        if not results and errors:
+            raise errors[0]
+        return results
+
+    @staticmethod
+    def _wait_for_deadlines(
+        futures: list[Future | None], started: dict[int, float], timeout: float
+    ) -> None:
+        """
+        Wait until every future is done or past its deadline: `timeout` seconds after
+        its call started, or after now for calls still queued in the pool. Queued
+        calls that miss their deadline are cancelled.
+        """
+        queued_since = time.monotonic()
+        pending = {idx for idx, future in enumerate(futures) if future is not None}
+        while pending:
+            now = time.monotonic()
+            for idx in list(pending):
+                if futures[idx].done() or (
+                    now >= started.get(idx, queued_since) + timeout
+                    and (idx in started or futures[idx].cancel())
+                ):
+                    pending.discard(idx)
+            if not pending:
+                return
+            next_deadline = min(started.get(idx, queued_since) + timeout for idx in pending)
+            wait(
+                [futures[idx] for idx in pending],
+                timeout=max(0.0, next_deadline - now),
+                return_when=FIRST_COMPLETED,
+            )
 
     def add_memories(self, add_req: APIADDRequest) -> list[dict[str, Any]]:
         all_results: list[dict[str, Any]] = []
 
         # fast mode: for each cube view, add memories
         # maybe add more strategies in add_req.async_mode
-        for view in self.cube_views:
-            self.logger.info(f"[CompositeCubeView] fan-out add to cube={view.cube_id}")
-            results = view.add_memories(add_req)
+        for _, results in self._fan_out("add", lambda view: view.add_memories(add_req)):
             all_results.extend(results)
 
         return all_results
@@ -49,39 +278,35 @@ class CompositeCubeView(MemCubeView):
             "skill_mem": [],
         }
 
-        def _search_single_cube(view: SingleCubeView) -> dict[str, Any]:
-            self.logger.info(f"[CompositeCubeView] fan-out search to cube={view.cube_id}")
-            return view.search_memories(search_req)
-
-        # parallel search for each cube
-        with ContextThreadPoolExecutor(max_workers=2) as executor:
-            future_to_view = {
-                executor.submit(_search_single_cube, view): view for view in self.cube_views
-            }
-
-            for future in as_completed(future_to_view):
-                cube_result = future.result()
-                merged_results["text_mem"].extend(cube_result.get("text_mem", []))
-                merged_results["act_mem"].extend(cube_result.get("act_mem", []))
-                merged_results["para_mem"].extend(cube_result.get("para_mem", []))
-                merged_results["pref_mem"].extend(cube_result.get("pref_mem", []))
-                merged_results["tool_mem"].extend(cube_result.get("tool_mem", []))
-                merged_results["skill_mem"].extend(cube_result.get("skill_mem", []))
-                note = cube_result.get("pref_note")
-                if note:
-                    if merged_results["pref_note"]:
-                        merged_results["pref_note"] += " | " + note
-                    else:
-                        merged_results["pref_note"] = note
+        cube_results = self._fan_out(
+            "search",
+            lambda view: view.search_memories(search_req),
+            timeout=self.search_timeout,
+            fail_fast=False,
+        )
+        for _, cube_result in cube_results:
+            for key in ("text_mem", "act_mem", "para_mem", "pref_mem", "tool_mem", "skill_mem"):
+                merged_results[key].extend(cube_result.get(key, []))
+            note = cube_result.get("pref_note")
+            if note:
+                if merged_results["pref_note"]:
+                    merged_results["pref_note"] += " | " + note
+                else:
+                    merged_results["pref_note"] = note
+
+        for key, limit_field in MERGED_CATEGORIES.items():
+            merged_results[key] = merge_cube_buckets(
+                merged_results[key], limit=getattr(search_req, limit_field, None)
+            )
 
         return merged_results
 
     def feedback_memories(self, feedback_req: APIFeedbackRequest) -> list[dict[str, Any]]:
         all_results: list[dict[str, Any]] = []
 
-        for view in self.cube_views:
-            self.logger.info(f"[CompositeCubeView] fan-out add to cube={view.cube_id}")
-            results = view.feedback_memories(feedback_req)
+        for _, results in self._fan_out(
+            "feedback", lambda view: view.feedback_memories(feedback_req)
+        ):
             all_results.extend(results)
 
         return all_results
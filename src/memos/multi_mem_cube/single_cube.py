@@ -21,6 +21,7 @@ from memos.mem_scheduler.schemas.task_schemas import (
     MEM_READ_TASK_LABEL,
 )
 from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.organize.aggregates import update_node_tracked
 from memos.multi_mem_cube.views import MemCubeView
 from memos.search import search_text_memories
 from memos.templates.mem_reader_prompts import PROMPT_MAPPING
@@ -763,7 +764,8 @@ class SingleCubeView(MemCubeView):
                     if self.mem_reader and self.mem_reader.graph_db:
                         for old_id in old_ids:
                             try:
-                                self.mem_reader.graph_db.update_node(
+                                update_node_tracked(
+                                    self.mem_reader.graph_db,
                                     str(old_id),
                                     {"status": "archived"},
                                     user_name=user_context.mem_cube_id,
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+
+from memos.api.middleware import auth
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self.db.selects += 1
+        self._row = self.db.rows.get(params[0])
+
+    def fetchone(self):
+        return self._row
+
+    def executemany(self, sql, params):
+        self.db.updates.extend(params)
+
+
+class _FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+
+class _FakeDB:
+    def __init__(self):
+        self.rows = {}
+        self.selects = 0
+        self.updates = []
+
+    def getconn(self):
+        return _FakeConn(self)
+
+    def putconn(self, conn):
+        pass
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = _FakeDB()
+    monkeypatch.setattr(auth, "_get_auth_pool", lambda: db)
+    monkeypatch.setattr(auth, "_ensure_usage_flusher", lambda: None)
+    monkeypatch.setattr(auth, "_pending_last_used", {})
+    monkeypatch.setattr(auth, "_last_used_flushed", {})
+    auth.invalidate_api_key_cache()
+    yield db
+    auth.invalidate_api_key_cache()
+
+
+async def test_valid_key_is_cached(fake_db):
+    fake_db.rows["h1"] = (7, "alice", ["read"], None, True)
+
+    first = await auth.lookup_api_key("h1")
+    second = await auth.lookup_api_key("h1")
+
+    assert first == second == {"id": "7", "user_name": "alice", "scopes": ["read"]}
+    assert fake_db.selects == 1
+
+
+async def test_unknown_key_is_negatively_cached(fake_db):
+    assert await auth.lookup_api_key("missing") is None
+    assert await auth.lookup_api_key("missing") is None
+    assert fake_db.selects == 1
+
+
+async def test_revocation_invalidates_cache(fake_db):
+    fake_db.rows["h2"] = (8, "bob", ["write"], None, True)
+    assert await auth.lookup_api_key("h2") is not None
+
+    fake_db.rows["h2"] = (8, "bob", ["write"], None, False)
+    assert auth.invalidate_api_key_cache(key_id="8") == 1
+    assert await auth.lookup_api_key("h2") is None
+
+
+async def test_cached_key_still_expires(fake_db):
+    fake_db.rows["h3"] = (9, "carol", None, time.time() + 0.05, True)
+    assert await auth.lookup_api_key("h3") is not None
+    time.sleep(0.06)
+    assert await auth.lookup_api_key("h3") is None
+    assert fake_db.selects == 1
+
+
+async def test_last_used_is_write_behind(fake_db):
+    fake_db.rows["h4"] = (10, "dave", ["read"], None, True)
+    for _ in range(3):
+        await auth.lookup_api_key("h4")
+
+    # Nothing is written on the request path, and repeated use is coalesced
+    assert fake_db.updates == []
+    assert auth.flush_last_used() == 1
+    assert [key_id for _, key_id in fake_db.updates] == ["10"]
+    assert auth.flush_last_used() == 0
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import time
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastapi import HTTPException
+
+from memos.api.handlers import chat_handler as chat_module
+from memos.api.handlers.chat_handler import ChatHandler
+from memos.api.product_models import APISearchRequest
+from memos.context.context import ContextThreadPoolExecutor
+from memos.types import SearchMode
+
+
+@pytest.fixture
+def handler():
+    handler = ChatHandler.__new__(ChatHandler)
+    handler.logger = MagicMock()
+    handler.chat_llms = {"m1": MagicMock(), "m2": MagicMock()}
+    handler.search_handler = MagicMock()
+    handler._retrieval_executor = ContextThreadPoolExecutor(max_workers=2)
+    yield handler
+    handler._retrieval_executor.shutdown(wait=True)
+
+
+def _search_req(mode):
+    return APISearchRequest(query="q", user_id="u1", readable_cube_ids=["c1"], mode=mode)
+
+
+def _searcher(full_delay=0.0, full_error=None):
+    def search(req):
+        if req.mode == SearchMode.FAST:
+            return "fast"
+        time.sleep(full_delay)
+        if full_error:
+            raise full_error
+        return "full"
+
+    return search
+
+
+def test_fast_mode_searches_once(handler):
+    handler.search_handler.handle_search_memories.side_effect = _searcher()
+    timings = {}
+
+    assert handler._search_for_chat(_search_req(SearchMode.FAST), timings) == "fast"
+    assert handler.search_handler.handle_search_memories.call_count == 1
+    assert timings["retrieval_source"] == "fast"
+    assert "retrieval_ms" in timings
+
+
+def test_full_search_used_when_within_window(handler):
+    handler.search_handler.handle_search_memories.side_effect = _searcher()
+    timings = {}
+
+    assert handler._search_for_chat(_search_req(SearchMode.FINE), timings) == "full"
+    assert handler.search_handler.handle_search_memories.call_count == 2
+    assert timings["retrieval_source"] == "fine"
+
+
+def test_falls_back_to_fast_results_on_timeout(handler, monkeypatch):
+    monkeypatch.setattr(chat_module, "CHAT_SPECULATIVE_WINDOW_MS", 10)
+    handler.search_handler.handle_search_memories.side_effect = _searcher(full_delay=0.5)
+    timings = {}
+
+    assert handler._search_for_chat(_search_req(SearchMode.FINE), timings) == "fast"
+    assert timings["retrieval_source"] == "fast"
+    assert timings["retrieval_ms"] < 500
+
+
+def test_falls_back_to_fast_results_on_full_error(handler):
+    handler.search_handler.handle_search_memories.side_effect = _searcher(
+        full_error=RuntimeError("boom")
+    )
+    timings = {}
+
+    assert handler._search_for_chat(_search_req(SearchMode.MIXTURE), timings) == "fast"
+    assert timings["retrieval_source"] == "fast"
+
+
+def test_speculation_disabled(handler, monkeypatch):
+    monkeypatch.setattr(chat_module, "CHAT_SPECULATIVE_RETRIEVAL", False)
+    handler.search_handler.handle_search_memories.side_effect = _searcher()
+
+    assert handler._search_for_chat(_search_req(SearchMode.FINE), {}) == "full"
+    assert handler.search_handler.handle_search_memories.call_count == 1
+
+
+def test_resolve_chat_model(handler):
+    assert handler._resolve_chat_model(None) == "m1"
+    assert handler._resolve_chat_model("m2") == "m2"
+    with pytest.raises(HTTPException):
+        handler._resolve_chat_model("unknown")
+
+
+class _StreamingLLM:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def agenerate_stream(self, messages, **kwargs):
+        try:
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def test_stream_chat_events_splits_thinking(handler):
+    handler.chat_llms["m1"] = _StreamingLLM(["<think>hm", "m</think>Hel", "lo"])
+    parts, timings = [], {}
+
+    async def collect():
+        return [
+            json.loads(event[len("data: ") :])
+            async for event in handler._stream_chat_events(
+                "m1", [], timings, time.perf_counter(), parts
+            )
+        ]
+
+    events = asyncio.run(collect())
+
+    assert "".join(e["data"] for e in events if e["type"] == "reasoning") == "hmm"
+    assert "".join(parts) == "Hello"
+    assert "ttft_ms" in timings
+    assert handler.chat_llms["m1"].closed
+
+
+def test_stream_chat_events_closes_upstream_on_disconnect(handler):
+    llm = _StreamingLLM(["a", "b", "c"])
+    handler.chat_llms["m1"] = llm
+
+    async def read_first_then_disconnect():
+        stream = handler._stream_chat_events("m1", [], {}, time.perf_counter(), [])
+        await stream.__anext__()
+        await stream.aclose()
+
+    asyncio.run(read_first_then_disconnect())
+
+    assert llm.closed
@@ -0,0 +1,149 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import requests
+
+from memos.api import client as client_module
+from memos.api.client import AsyncMemOSClient, MemOSClient
+
+
+SEARCH_OK = {"code": 200, "message": "ok", "data": {"memory_detail_list": []}}
+ADD_OK = {"code": 200, "message": "ok", "data": {"success": True, "task_id": "t", "status": "ok"}}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.headers = headers or {}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    return delays
+
+
+def test_sync_client_retries_with_retry_after(monkeypatch, no_sleep):
+    client = MemOSClient(api_key="k", base_url="http://memos.test")
+    responses = [FakeResponse(429, headers={"Retry-After": "2"}), FakeResponse(200, SEARCH_OK)]
+    calls = []
+
+    def fake_post(url, **kwargs):
+        calls.append((url, kwargs))
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, "post", fake_post)
+    result = client.search_memory("q", "u1", "c1")
+
+    assert result.code == 200
+    assert result.memories == []
+    assert len(calls) == 2
+    assert calls[0][0] == "http://memos.test/search/memory"
+    assert no_sleep == [2.0]
+
+
+def test_sync_client_does_not_retry_client_errors(monkeypatch, no_sleep):
+    client = MemOSClient(api_key="k", base_url="http://memos.test")
+    calls = []
+
+    def fake_post(url, **kwargs):
+        calls.append(url)
+        return FakeResponse(400)
+
+    monkeypatch.setattr(client.session, "post", fake_post)
+    with pytest.raises(requests.HTTPError):
+        client.get_task_status("t1")
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_sync_client_retries_connection_errors(monkeypatch, no_sleep):
+    client = MemOSClient(api_key="k", base_url="http://memos.test", max_retries=2)
+
+    def fake_post(url, **kwargs):
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(client.session, "post", fake_post)
+    with pytest.raises(requests.ConnectionError):
+        client.get_task_status("t1")
+    assert len(no_sleep) == 1
+    assert 0 <= no_sleep[0] <= client.backoff_base
+
+
+def test_client_without_request_cannot_be_created():
+    class IncompleteClient(client_module._BaseMemOSClient):
+        pass
+
+    with pytest.raises(TypeError, match="_request"):
+        IncompleteClient(api_key="k", base_url="http://memos.test")
+
+
+def test_gzip_only_large_bodies():
+    client = MemOSClient(api_key="k", base_url="http://memos.test", gzip_requests=True)
+
+    body, headers = client._encode_json({"q": "small"})
+    assert "Content-Encoding" not in headers
+    assert json.loads(body) == {"q": "small"}
+
+    payload = {"q": "x" * (client_module.GZIP_MIN_BYTES * 2)}
+    body, headers = client._encode_json(payload)
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body)) == payload
+
+
+def test_sync_batch_keeps_order_and_returns_exceptions(monkeypatch):
+    client = MemOSClient(api_key="k", base_url="http://memos.test")
+
+    def fake_search(query, user_id, conversation_id):
+        if query == "bad":
+            raise ValueError(query)
+        return query
+
+    monkeypatch.setattr(client, "search_memory", fake_search)
+    searches = [{"query": q, "user_id": "u", "conversation_id": "c"} for q in ["a", "bad", "c"]]
+    results = client.search_memory_batch(searches, return_exceptions=True)
+
+    assert results[0] == "a"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "c"
+    with pytest.raises(ValueError):
+        client.search_memory_batch(searches)
+
+
+async def test_async_client_retries_and_batches(monkeypatch):
+    async def no_sleep(delay):
+        return None
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", no_sleep)
+    attempts = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        key = payload["conversation_id"]
+        attempts[key] = attempts.get(key, 0) + 1
+        if attempts[key] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=ADD_OK)
+
+    async with AsyncMemOSClient(api_key="k", base_url="http://memos.test") as client:
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        messages = [
+            {"messages": [{"role": "user", "content": "hi"}], "user_id": "u", "conversation_id": c}
+            for c in ["c1", "c2", "c3"]
+        ]
+        results = await client.add_message_batch(messages, concurrency=2)
+
+    assert [r.success for r in results] == [True, True, True]
+    assert attempts == {"c1": 2, "c2": 2, "c3": 2}
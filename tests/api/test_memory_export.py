@@ -0,0 +1,102 @@
+import gzip
+import json
+
+from types import SimpleNamespace
+
+from memos.api.handlers.memory_handler import handle_export_memories
+from memos.api.product_models import ExportMemoryRequest
+from memos.api.utils import serialization
+from memos.api.utils.serialization import decode_embedding_f16, iter_ndjson
+
+
+class FakeTextMemory:
+    def __init__(self, total):
+        self.nodes = [
+            {
+                "id": f"m{i}",
+                "memory": f"memory {i}",
+                "metadata": {"memory_type": "LongTermMemory", "tags": [str(i)], "embedding": [0.5]},
+            }
+            for i in range(total)
+        ]
+        self.calls = []
+
+    def get_all_page(self, cursor=None, page_size=500, include_embedding=False, **kwargs):
+        self.calls.append({"cursor": cursor, "page_size": page_size, **kwargs})
+        offset = int(cursor) if cursor else 0
+        nodes = self.nodes[offset : offset + page_size]
+        if not include_embedding:
+            nodes = [
+                {**n, "metadata": {k: v for k, v in n["metadata"].items() if k != "embedding"}}
+                for n in nodes
+            ]
+        end = offset + len(nodes)
+        return {"nodes": nodes, "next_cursor": str(end) if end < len(self.nodes) else None}
+
+
+def _cube(total):
+    return SimpleNamespace(text_mem=FakeTextMemory(total))
+
+
+def test_export_walks_all_pages():
+    cube = _cube(5)
+    records = list(handle_export_memories(ExportMemoryRequest(mem_cube_id="c", page_size=2), cube))
+
+    assert [r["data"]["id"] for r in records[:-1]] == ["m0", "m1", "m2", "m3", "m4"]
+    assert records[-1] == {"type": "end", "count": 5, "next_cursor": None}
+    assert [call["cursor"] for call in cube.text_mem.calls] == [None, "2", "4"]
+    assert all(call["user_name"] == "c" for call in cube.text_mem.calls)
+    assert "embedding" not in records[0]["data"]["metadata"]
+
+
+def test_export_limit_returns_resume_cursor():
+    cube = _cube(5)
+    req = ExportMemoryRequest(mem_cube_id="c", page_size=2, limit=3)
+    records = list(handle_export_memories(req, cube))
+
+    assert len(records) == 4
+    assert records[-1] == {"type": "end", "count": 3, "next_cursor": "3"}
+    assert [call["page_size"] for call in cube.text_mem.calls] == [2, 1]
+
+    resumed = list(handle_export_memories(ExportMemoryRequest(mem_cube_id="c", cursor="3"), cube))
+    assert [r["data"]["id"] for r in resumed[:-1]] == ["m3", "m4"]
+
+
+def test_export_projects_fields_and_encodes_embeddings():
+    cube = _cube(1)
+    req = ExportMemoryRequest(mem_cube_id="c", fields=["tags"], embedding_format="base64_f16")
+    data = next(handle_export_memories(req, cube))["data"]
+
+    assert data["id"] == "m0"
+    assert data["memory"] == "memory 0"
+    assert set(data["metadata"]) == {"tags", "embedding"}
+    assert decode_embedding_f16(data["metadata"]["embedding"]) == [0.5]
+
+
+def test_export_failure_yields_error_record():
+    cube = _cube(4)
+    original = cube.text_mem.get_all_page
+
+    def flaky(cursor=None, **kwargs):
+        if cursor:
+            raise RuntimeError("store down")
+        return original(cursor=cursor, **kwargs)
+
+    cube.text_mem.get_all_page = flaky
+    records = list(handle_export_memories(ExportMemoryRequest(mem_cube_id="c", page_size=2), cube))
+
+    assert records[-1]["type"] == "error"
+    assert records[-1]["count"] == 2
+    assert records[-1]["next_cursor"] == "2"
+
+
+def test_iter_ndjson_gzip_flushes_incrementally(monkeypatch):
+    monkeypatch.setattr(serialization, "NDJSON_GZIP_FLUSH_BYTES", 64)
+    records = [{"i": i, "text": "x" * 50} for i in range(20)]
+
+    plain = b"".join(iter_ndjson(records))
+    chunks = list(iter_ndjson(records, compress=True))
+
+    assert [json.loads(line) for line in plain.splitlines()] == records
+    assert len(chunks) > 2
+    assert gzip.decompress(b"".join(chunks)) == plain
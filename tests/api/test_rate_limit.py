@@ -0,0 +1,102 @@
+import fakeredis
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from memos.api.middleware import rate_limit
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """Reset module state and use a small limit."""
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT", 3)
+    monkeypatch.setattr(rate_limit, "RATE_WINDOW", 30)
+    monkeypatch.setattr(rate_limit, "_memory_store", rate_limit._BoundedLRU(100))
+    monkeypatch.setattr(rate_limit, "_denied_until", rate_limit._BoundedLRU(100))
+    monkeypatch.setattr(rate_limit, "_key_stats", rate_limit._BoundedLRU(100))
+    monkeypatch.setattr(rate_limit, "_global_stats", dict.fromkeys(rate_limit._global_stats, 0))
+    monkeypatch.setattr(rate_limit, "_redis_client", None)
+    monkeypatch.setattr(rate_limit, "_gcra_script", None)
+    return rate_limit
+
+
+@pytest.fixture
+def fake_redis(limiter, monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(limiter, "_redis_client", client)
+    return client
+
+
+def test_memory_gcra_allows_burst_then_refills(limiter):
+    now = 1000.0
+    results = [limiter._check_rate_limit_memory("k", now=now) for _ in range(4)]
+    assert [r[0] for r in results] == [True, True, True, False]
+    assert [r[1] for r in results[:3]] == [2, 1, 0]
+
+    # One emission interval (window / limit) later, exactly one request is allowed
+    allowed, remaining, _ = limiter._check_rate_limit_memory("k", now=now + 10)
+    assert allowed and remaining == 0
+    assert not limiter._check_rate_limit_memory("k", now=now + 10)[0]
+
+
+def test_memory_store_is_bounded(limiter, monkeypatch):
+    monkeypatch.setattr(limiter, "_memory_store", limiter._BoundedLRU(2))
+    for i in range(5):
+        limiter._check_rate_limit_memory(f"k{i}", now=1000.0)
+    assert list(limiter._memory_store) == ["k3", "k4"]
+
+
+def test_redis_script_matches_memory_semantics(fake_redis, limiter, monkeypatch):
+    monkeypatch.setattr(limiter, "RATE_LIMIT_LOCAL_PREADMISSION", False)
+    results = [limiter._check_rate_limit_redis("ratelimit:ip:1") for _ in range(4)]
+    assert [r[0] for r in results] == [True, True, True, False]
+    assert [r[1] for r in results[:3]] == [2, 1, 0]
+
+    # O(1) state: a single string key with a TTL
+    assert fake_redis.type("ratelimit:ip:1:gcra") == "string"
+    assert 0 < fake_redis.pttl("ratelimit:ip:1:gcra") <= 30_000
+    assert limiter.get_rate_limit_stats()["totals"]["redis_checks"] == 4
+
+
+def test_local_preadmission_skips_redis(fake_redis, limiter):
+    for _ in range(4):
+        limiter._check_rate_limit_redis("ratelimit:ip:2")
+
+    allowed, _, reset_time = limiter._check_rate_limit_redis("ratelimit:ip:2")
+    assert not allowed
+    stats = limiter.get_rate_limit_stats()
+    assert stats["totals"]["redis_checks"] == 4
+    assert stats["totals"]["local_denied"] == 1
+    assert stats["top_denied_keys"]["ratelimit:ip:2"] == {
+        "allowed": 3,
+        "denied": 1,
+        "local_denied": 1,
+    }
+
+
+def test_redis_error_falls_back_to_memory(fake_redis, limiter, monkeypatch):
+    def _broken(*args, **kwargs):
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(limiter, "_get_gcra_script", lambda client: _broken)
+    allowed, remaining, _ = limiter._check_rate_limit_redis("ratelimit:ip:3")
+    assert allowed and remaining == 2
+    assert limiter.get_rate_limit_stats()["totals"]["redis_errors"] == 1
+
+
+def test_middleware_returns_429_with_headers(limiter, monkeypatch):
+    monkeypatch.setattr(limiter, "_get_redis", lambda: None)
+    app = FastAPI()
+    app.add_middleware(limiter.RateLimitMiddleware)
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    client = TestClient(app)
+    responses = [client.get("/ping") for _ in range(4)]
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert responses[0].headers["X-RateLimit-Remaining"] == "2"
+    assert int(responses[3].headers["Retry-After"]) >= 1
+    assert responses[3].json()["retry_after"] >= 1
@@ -0,0 +1,55 @@
+from unittest.mock import Mock
+
+from memos.api.handlers.base_handler import HandlerDependencies
+from memos.api.handlers.search_handler import SearchHandler
+from memos.api.product_models import APIBatchSearchRequest, APISearchRequest, SearchResponse
+from memos.embedders.prefetch import embed_with_prefetch, prefetched_embeddings
+
+
+def test_search_batch_prefetches_embeddings_and_reports_errors():
+    embedder = Mock()
+    embedder.embed.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    deps = HandlerDependencies(
+        naive_mem_cube=Mock(),
+        mem_scheduler=Mock(),
+        searcher=Mock(embedder=embedder),
+        deepsearch_agent=Mock(),
+    )
+    handler = SearchHandler(deps)
+    seen_vectors = {}
+
+    def fake_search(req):
+        if req.query == "bad":
+            raise ValueError("boom")
+        seen_vectors[req.query] = embed_with_prefetch(embedder, [req.query])
+        return SearchResponse(message="ok", data={"query": req.query})
+
+    handler._search_memories = Mock(side_effect=fake_search)
+    batch = APIBatchSearchRequest(
+        entries=[
+            APISearchRequest(query="a", user_id="u1"),
+            APISearchRequest(query="bb", user_id="u2"),
+            APISearchRequest(query="bad", user_id="u1"),
+        ],
+        max_concurrency=2,
+    )
+
+    results = sorted(handler.handle_search_batch(batch), key=lambda r: r["index"])
+    assert [r["code"] for r in results] == [200, 200, 500]
+    assert results[1]["data"] == {"query": "bb"}
+    assert seen_vectors == {"a": [[1.0]], "bb": [[2.0]]}
+    # All queries were embedded in one call; searches reused the prefetched vectors
+    embedder.embed.assert_called_once_with(["a", "bb", "bad"])
+
+
+def test_embed_with_prefetch_only_embeds_missing_texts():
+    embedder = Mock()
+    embedder.embed.side_effect = lambda texts: [[0.0] for _ in texts]
+    other = Mock()
+
+    with prefetched_embeddings(embedder, {"known": [1.0]}):
+        assert embed_with_prefetch(embedder, ["known", "new"]) == [[1.0], [0.0]]
+        embedder.embed.assert_called_once_with(["new"])
+        # Vectors from another embedder are never reused
+        embed_with_prefetch(other, ["known"])
+        other.embed.assert_called_once_with(["known"])
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from memos.api.product_models import MemoryResponse
+from memos.api.utils.serialization import (
+    apply_embedding_format,
+    decode_embedding_f16,
+    dumps,
+    memory_json_response,
+)
+from memos.memories.textual.item import TextualMemoryItem
+
+
+def test_dumps_handles_models_numpy_and_datetimes():
+    item = TextualMemoryItem(memory="hello")
+    payload = {"item": item, "vec": np.array([1.0, 2.0]), "at": datetime(2024, 1, 1), "ids": {1}}
+    data = dumps(payload)
+    assert b'"memory":"hello"' in data
+    assert b'"vec":[1.0,2.0]' in data
+    assert b'"at":"2024-01-01T00:00:00"' in data
+    assert b'"ids":[1]' in data
+
+
+def test_apply_embedding_format_nested():
+    embedding = [0.25, 0.5, -2.0]
+    payload = {"a": [{"metadata": {"embedding": embedding}}, {"embedding": []}]}
+
+    apply_embedding_format(payload, "base64_f16")
+    encoded = payload["a"][0]["metadata"]["embedding"]
+    assert encoded["dim"] == 3
+    assert decode_embedding_f16(encoded) == embedding
+    assert payload["a"][1]["embedding"] == []
+
+
+def test_apply_embedding_format_rejects_unknown_format():
+    with pytest.raises(ValueError, match="base64_f32"):
+        apply_embedding_format({"embedding": [1.0]}, "base64_f32")
+
+
+def test_memory_json_response_does_not_mutate_content():
+    data = [{"metadata": {"embedding": [1.0]}}]
+    response = memory_json_response(MemoryResponse(message="ok", data=data), "exclude")
+    assert b'"embedding":[]' in response.body
+    assert data[0]["metadata"]["embedding"] == [1.0]
+
+    raw = {"data": [{"embedding": [1.0]}]}
+    memory_json_response(raw, "exclude")
+    assert raw["data"][0]["embedding"] == [1.0]
@@ -5,10 +5,13 @@ This module tests that the server_router endpoints correctly validate
 input request formats and return properly formatted responses.
 """
 
+import json
+
 from unittest.mock import Mock, patch
 
 import pytest
 
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from memos.api.product_models import (
@@ -19,6 +22,7 @@ from memos.api.product_models import (
     SearchResponse,
     SuggestionResponse,
 )
+from memos.api.utils.serialization import decode_embedding_f16
 
 
 # Patch init_server so we can import server_api without starting the full MemOS stack,
@@ -179,6 +183,49 @@ class TestServerRouterSearch:
         assert isinstance(data["data"], dict)
         assert "text_mem" in data["data"]
 
+    def test_search_embedding_format(self, mock_handlers, client):
+        """Test search endpoint compacts embeddings when requested."""
+        mock_handlers["search"].handle_search_memories.return_value = SearchResponse(
+            message="Search completed successfully",
+            data={"text_mem": [{"memories": [{"metadata": {"embedding": [0.5, -1.0]}}]}]},
+        )
+        request_data = {"query": "test query", "user_id": "test_user"}
+
+        full = client.post("/product/search", json=request_data).json()
+        compact = client.post(
+            "/product/search?embedding_format=base64_f16", json=request_data
+        ).json()
+        excluded = client.post("/product/search?embedding_format=exclude", json=request_data)
+
+        def _embedding(data):
+            return data["data"]["text_mem"][0]["memories"][0]["metadata"]["embedding"]
+
+        assert _embedding(full) == [0.5, -1.0]
+        assert decode_embedding_f16(_embedding(compact)) == [0.5, -1.0]
+        assert _embedding(excluded.json()) == []
+
+    def test_search_batch_streams_ndjson(self, mock_handlers, client):
+        """Test batch search endpoint streams one NDJSON line per entry."""
+        mock_handlers["search"].handle_search_batch.return_value = iter(
+            [
+                {"index": 1, "user_id": "u2", "code": 200, "message": "ok", "data": {}},
+                {"index": 0, "user_id": "u1", "code": 500, "message": "boom", "data": None},
+            ]
+        )
+        request_data = {
+            "entries": [{"query": "q1", "user_id": "u1"}, {"query": "q2", "user_id": "u2"}],
+            "max_concurrency": 2,
+        }
+
+        response = client.post("/product/search/batch", json=request_data)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["index"] for line in lines] == [1, 0]
+        batch_req = mock_handlers["search"].handle_search_batch.call_args[0][0]
+        assert [entry.query for entry in batch_req.entries] == ["q1", "q2"]
+
 
 class TestServerRouterAdd:
     """Test /add endpoint input/output format."""
@@ -229,6 +276,22 @@ class TestServerRouterAdd:
         assert data["message"] == "Memory added successfully"
         assert isinstance(data["data"], list)
 
+    def test_add_rejected_by_admission_control(self, mock_handlers, client):
+        """Test add endpoint surfaces 429 with Retry-After when the queue is overloaded."""
+        mock_handlers["add"].handle_add_memories.side_effect = HTTPException(
+            status_code=429,
+            detail="Scheduler queue is overloaded",
+            headers={"Retry-After": "7"},
+        )
+
+        response = client.post(
+            "/product/add", json={"user_id": "test_user", "memory_content": "content"}
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        assert response.json()["code"] == 429
+
 
 class TestServerRouterChatComplete:
     """Test /chat/complete endpoint input/output format."""
@@ -415,3 +478,43 @@ class TestServerRouterGetAll:
         data = response.json()
         assert data["message"] == "Memories retrieved successfully"
         assert isinstance(data["data"], list)
+
+    def test_get_all_stream_uses_export(self, mock_handlers, client):
+        """Test get_all with stream=true streams NDJSON through the export handler."""
+        mock_handlers["memory"].handle_export_memories.return_value = iter(
+            [
+                {"type": "memory", "data": {"id": "m1", "memory": "a", "metadata": {}}},
+                {"type": "end", "count": 1, "next_cursor": None},
+            ]
+        )
+        request_data = {"user_id": "test_user", "memory_type": "text_mem"}
+
+        response = client.post(
+            "/product/get_all?stream=true&embedding_format=exclude", json=request_data
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines] == ["memory", "end"]
+        export_req = mock_handlers["memory"].handle_export_memories.call_args.kwargs["export_req"]
+        assert export_req.mem_cube_id == "test_user"
+        assert export_req.embedding_format == "exclude"
+        mock_handlers["memory"].handle_get_all_memories.assert_not_called()
+
+
+class TestServerRouterExport:
+    """Test /export_memory endpoint streaming output."""
+
+    def test_export_gzip_stream(self, mock_handlers, client):
+        """Test export endpoint streams gzip-compressed NDJSON when requested."""
+        mock_handlers["memory"].handle_export_memories.return_value = iter(
+            [{"type": "end", "count": 0, "next_cursor": None}]
+        )
+
+        response = client.post("/product/export_memory", json={"mem_cube_id": "cube", "gzip": True})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # TestClient transparently decodes gzip content
+        assert json.loads(response.text.strip()) == {"type": "end", "count": 0, "next_cursor": None}
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from fastapi import HTTPException
+
+from memos.api.handlers.base_handler import HandlerDependencies
+from memos.api.handlers.search_handler import SearchHandler
+from memos.api.product_models import APISearchRequest, SearchResponse
+from memos.api.utils.single_flight import SingleFlight, SingleFlightTimeoutError
+
+
+def _run_concurrently(fn, n):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        return [f.exception() or f.result() for f in futures]
+
+
+def test_concurrent_calls_share_one_computation():
+    group = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"value": 42}
+
+    results = _run_concurrently(lambda: group.do("k", compute), 5)
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert group.stats["followers"] == 4
+    assert group.in_flight() == 0
+
+    # Completed calls are not cached
+    group.do("k", compute)
+    assert len(calls) == 2
+
+
+def test_error_is_propagated_to_followers():
+    group = SingleFlight()
+
+    def compute():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    results = _run_concurrently(lambda: group.do("k", compute), 3)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert group.stats["leaders"] == 1
+
+
+def test_follower_timeout():
+    group = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: group.do("k", release.wait))
+    leader.start()
+    time.sleep(0.05)
+
+    with pytest.raises(SingleFlightTimeoutError):
+        group.do("k", lambda: None, timeout=0.05)
+    release.set()
+    leader.join()
+
+
+def test_search_handler_coalesces_identical_requests():
+    deps = HandlerDependencies(
+        naive_mem_cube=Mock(), mem_scheduler=Mock(), searcher=Mock(), deepsearch_agent=Mock()
+    )
+    handler = SearchHandler(deps)
+    response = SearchResponse(message="ok", data={"text_mem": []})
+
+    def slow_search(req):
+        time.sleep(0.1)
+        return response
+
+    handler._search_memories = Mock(side_effect=slow_search)
+
+    def search(query):
+        return lambda: handler.handle_search_memories(APISearchRequest(query=query, user_id="u1"))
+
+    results = _run_concurrently(search("hello   world"), 3)
+    assert all(r is response for r in results)
+    assert handler._search_memories.call_count == 1
+
+    # Different users are never coalesced
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for user_id in ("u1", "u2"):
+            pool.submit(
+                handler.handle_search_memories, APISearchRequest(query="q", user_id=user_id)
+            )
+    assert handler._search_memories.call_count == 3
+
+
+def test_search_handler_maps_timeout_to_504():
+    deps = HandlerDependencies(
+        naive_mem_cube=Mock(), mem_scheduler=Mock(), searcher=Mock(), deepsearch_agent=Mock()
+    )
+    handler = SearchHandler(deps)
+    handler.single_flight = Mock()
+    handler.single_flight.do.side_effect = SingleFlightTimeoutError("slow")
+
+    with pytest.raises(HTTPException) as exc_info:
+        handler.handle_search_memories(APISearchRequest(query="q", user_id="u1"))
+    assert exc_info.value.status_code == 504
@@ -122,6 +122,9 @@ def test_hf_llm_config():
             "remove_think_prefix",
             "add_generation_prompt",
             "default_headers",
+            "continuous_batching",
+            "max_batch_size",
+            "prefix_cache_max_bytes",
         ],
     )
 
@@ -52,7 +52,13 @@ def test_kv_cache_memory_config():
         KVCacheMemoryConfig,
         factory_fields=["extractor_llm"],
         required_fields=[],
-        optional_fields=["cube_id", "memory_filename"],
+        optional_fields=[
+            "cube_id",
+            "memory_filename",
+            "max_resident_bytes",
+            "cold_storage_dtype",
+            "spill_dir",
+        ],
     )
 
     check_config_instantiation_valid(
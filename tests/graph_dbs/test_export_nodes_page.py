@@ -0,0 +1,128 @@
+"""
+Tests for cursor-paginated node export (BaseGraphDB.export_nodes_page).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.configs.graph_db import Neo4jGraphDBConfig
+from memos.graph_dbs.base import BaseGraphDB, decode_page_cursor, encode_page_cursor
+
+
+class _OffsetOnlyGraph:
+    """Stands in for a backend without native keyset support."""
+
+    export_nodes_page = BaseGraphDB.export_nodes_page
+
+    def __init__(self, total, honour_paging=True):
+        self.nodes = [{"id": f"n{i}", "memory": "", "metadata": {}} for i in range(total)]
+        self.honour_paging = honour_paging
+
+    def export_graph(self, page=None, page_size=None, **kwargs):
+        if self.honour_paging and page and page_size:
+            start = (page - 1) * page_size
+            return {"nodes": self.nodes[start : start + page_size]}
+        return {"nodes": list(self.nodes)}
+
+
+def _walk(graph, page_size):
+    ids, cursor = [], None
+    while True:
+        page = graph.export_nodes_page(cursor=cursor, page_size=page_size)
+        ids.extend(node["id"] for node in page["nodes"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("honour_paging", [True, False])
+@pytest.mark.parametrize("total", [0, 3, 4, 5])
+def test_fallback_walks_every_node_once(total, honour_paging):
+    graph = _OffsetOnlyGraph(total, honour_paging=honour_paging)
+    assert _walk(graph, page_size=2) == [f"n{i}" for i in range(total)]
+
+
+def test_cursor_roundtrip_and_validation():
+    position = {"created_at": "2025-01-01T00:00:00", "id": "a/b+c"}
+    assert decode_page_cursor(encode_page_cursor(position)) == position
+    with pytest.raises(ValueError):
+        decode_page_cursor("not-a-cursor!")
+
+
+@pytest.fixture
+def neo4j_db():
+    config = Neo4jGraphDBConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="test",
+        db_name="test_memory_db",
+        auto_create=False,
+        embedding_dimension=3,
+    )
+    with patch("neo4j.GraphDatabase") as mock_gd:
+        mock_gd.driver.return_value = MagicMock()
+        from memos.graph_dbs.neo4j import Neo4jGraphDB
+
+        db = Neo4jGraphDB(config)
+        db.driver = MagicMock()
+        yield db
+
+
+def test_neo4j_keyset_page(neo4j_db):
+    session_mock = neo4j_db.driver.session.return_value.__enter__.return_value
+    session_mock.run.return_value = [
+        {"n": {"id": f"n{i}", "memory": "m", "created_at": f"2025-01-0{3 - i}", "embedding": [1]}}
+        for i in range(3)
+    ]
+
+    page = neo4j_db.export_nodes_page(page_size=2, user_name="cube")
+
+    query, params = session_mock.run.call_args[0]
+    assert "LIMIT 3" in query
+    assert "SKIP" not in query
+    assert "cursor_id" not in params
+    assert [node["id"] for node in page["nodes"]] == ["n0", "n1"]
+    assert "embedding" not in page["nodes"][0]["metadata"]
+    assert decode_page_cursor(page["next_cursor"]) == {"created_at": "2025-01-02", "id": "n1"}
+
+    session_mock.run.return_value = []
+    last = neo4j_db.export_nodes_page(cursor=page["next_cursor"], page_size=2, user_name="cube")
+
+    query, params = session_mock.run.call_args[0]
+    assert "n.created_at < datetime($cursor_created_at)" in query
+    assert params["cursor_created_at"] == "2025-01-02"
+    assert params["cursor_id"] == "n1"
+    assert last == {"nodes": [], "next_cursor": None}
+
+
+def test_fallback_refuses_filters_it_cannot_apply():
+    with pytest.raises(NotImplementedError):
+        _OffsetOnlyGraph(3).export_nodes_page(filter={"user_id": "u1"})
+
+
+def test_postgres_page_applies_filter_in_sql():
+    from memos.graph_dbs.postgres import PostgresGraphDB
+
+    db = PostgresGraphDB.__new__(PostgresGraphDB)
+    db.user_name, db.schema = "cube", "memos"
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchall.return_value = []
+    db._get_conn, db._put_conn = MagicMock(return_value=conn), MagicMock()
+
+    db.export_nodes_page(
+        page_size=2,
+        filter={
+            "or": [{"user_id": "u1"}, {"created_at": {"gte": "2025-01-01"}, "tags": {"in": ["a"]}}]
+        },
+    )
+
+    query, params = cur.execute.call_args[0]
+    assert (
+        "((properties->>%s = %s) OR (created_at >= %s::timestamptz AND properties->>%s = ANY(%s)))"
+        in query
+    )
+    assert params == ["cube", "user_id", "u1", "2025-01-01", "tags", ["a"], 3]
+    with pytest.raises(ValueError):
+        db.export_nodes_page(filter={"user_id": {"regex": "u.*"}})
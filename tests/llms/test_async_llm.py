@@ -0,0 +1,128 @@
+import asyncio
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from memos.configs.llm import LLMConfigFactory, LLMGovernorConfig
+from memos.llms.base import BaseLLM
+from memos.llms.factory import LLMFactory
+from memos.llms.governor import GovernedLLM, get_llm_governor
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+def _chunk(**delta):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(**delta))])
+
+
+class FakeAsyncStream:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.chunks:
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        return self.chunks.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+def _openai_llm():
+    config = LLMConfigFactory.model_validate(
+        {
+            "backend": "openai",
+            "config": {"model_name_or_path": "gpt-4.1-nano", "api_key": "sk-xxxx"},
+        }
+    )
+    llm = LLMFactory.from_config(config)
+    create = AsyncMock()
+    llm.async_clients.get = MagicMock(
+        return_value=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+    )
+    return llm, create
+
+
+async def test_openai_agenerate():
+    llm, create = _openai_llm()
+    message = SimpleNamespace(content="Hi!", tool_calls=None, reasoning_content=None)
+    create.return_value = MagicMock(choices=[SimpleNamespace(message=message)])
+
+    assert await llm.agenerate(MESSAGES, temperature=0.1, timeout=5) == "Hi!"
+    kwargs = create.call_args.kwargs
+    assert kwargs["temperature"] == 0.1
+    assert kwargs["timeout"] == 5
+
+
+async def test_openai_agenerate_stream_wraps_reasoning():
+    llm, create = _openai_llm()
+    stream = FakeAsyncStream(
+        [_chunk(reasoning_content="thinking"), _chunk(content="Hello"), _chunk(content="!")]
+    )
+    create.return_value = stream
+
+    parts = [part async for part in llm.agenerate_stream(MESSAGES)]
+    assert "".join(parts) == "<think>thinking</think>Hello!"
+    assert create.call_args.kwargs["stream"] is True
+    assert stream.closed
+
+
+async def test_closing_stream_early_closes_upstream():
+    llm, create = _openai_llm()
+    stream = FakeAsyncStream([_chunk(content=str(i)) for i in range(100)])
+    create.return_value = stream
+
+    agen = llm.agenerate_stream(MESSAGES)
+    assert await agen.__anext__() == "0"
+    # What Starlette does when the SSE client disconnects
+    await agen.aclose()
+    assert stream.closed
+    assert len(stream.chunks) > 90
+
+
+async def test_base_llm_default_async_methods_use_sync_implementation():
+    class SyncOnlyLLM(BaseLLM):
+        def __init__(self, config=None):
+            self.config = config
+
+        def generate(self, messages, **kwargs):
+            return "sync"
+
+        def generate_stream(self, messages, **kwargs):
+            yield from ["a", "b"]
+
+    llm = SyncOnlyLLM()
+    assert await llm.agenerate(MESSAGES) == "sync"
+    assert [part async for part in llm.agenerate_stream(MESSAGES)] == ["a", "b"]
+
+
+async def test_governed_agenerate_releases_slot_on_cancel():
+    get_llm_governor().reset()
+    started = asyncio.Event()
+
+    async def slow(messages, **kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    inner = MagicMock()
+    inner.config = SimpleNamespace(model_name_or_path="m", max_tokens=10)
+    inner.agenerate = slow
+    llm = GovernedLLM(inner, LLMGovernorConfig(max_concurrency=1))
+
+    task = asyncio.create_task(llm.agenerate(MESSAGES))
+    await started.wait()
+    assert get_llm_governor().stats()["m"]["in_flight"] == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert get_llm_governor().stats()["m"]["in_flight"] == 0
@@ -0,0 +1,117 @@
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from memos.configs.llm import LLMCacheConfig, LLMConfigFactory
+from memos.llms.cache import CachingLLM
+from memos.llms.factory import LLMFactory
+
+
+MESSAGES = [{"role": "user", "content": "Summarize the cluster"}]
+
+
+def _factory_config(temperature, cache):
+    return LLMConfigFactory.model_validate(
+        {
+            "backend": "openai",
+            "config": {
+                "model_name_or_path": "gpt-4.1-nano",
+                "temperature": temperature,
+                "api_key": "sk-xxxx",
+            },
+            "cache": cache,
+        }
+    )
+
+
+class TestCachingLLM(unittest.TestCase):
+    def _llm(self, temperature=0.0, **cache):
+        inner = MagicMock()
+        inner.config = SimpleNamespace(
+            model_name_or_path="m", temperature=temperature, max_tokens=100, top_p=1.0, top_k=50
+        )
+        inner.generate.side_effect = (
+            lambda messages, **kwargs: f"answer-{inner.generate.call_count}"
+        )
+        return inner, CachingLLM(inner, LLMCacheConfig(**cache))
+
+    def test_caches_deterministic_calls(self):
+        inner, llm = self._llm()
+        self.assertEqual(llm.generate(MESSAGES), "answer-1")
+        self.assertEqual(llm.generate(MESSAGES), "answer-1")
+        self.assertEqual(inner.generate.call_count, 1)
+
+        # Different decoding params are a different entry
+        self.assertEqual(llm.generate(MESSAGES, max_tokens=10), "answer-2")
+        stats = llm.cache_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 3)
+
+    def test_sampled_calls_bypass_unless_marked(self):
+        inner, llm = self._llm(temperature=0.7)
+        llm.generate(MESSAGES)
+        llm.generate(MESSAGES)
+        self.assertEqual(inner.generate.call_count, 2)
+        self.assertEqual(llm.cache_stats()["bypassed"], 2)
+
+        llm.generate(MESSAGES, cache=True)
+        llm.generate(MESSAGES, cache=True)
+        self.assertEqual(inner.generate.call_count, 3)
+        self.assertNotIn("cache", inner.generate.call_args.kwargs)
+
+        llm.generate(MESSAGES, temperature=0, cache=False)
+        self.assertEqual(inner.generate.call_count, 4)
+
+    def test_unkeyed_kwargs_bypass(self):
+        inner, llm = self._llm()
+        self.assertEqual(llm.generate(MESSAGES, past_key_values="kvA"), "answer-1")
+        self.assertEqual(llm.generate(MESSAGES, past_key_values="kvB"), "answer-2")
+        self.assertEqual(llm.generate(MESSAGES, past_key_values="kvA", cache=True), "answer-3")
+        self.assertEqual(inner.generate.call_args.kwargs, {"past_key_values": "kvA"})
+        self.assertEqual(llm.cache_stats()["bypassed"], 3)
+
+    def test_ttl_expiry(self):
+        inner, llm = self._llm(ttl_seconds=10)
+        with patch("memos.llms.cache.time.time", return_value=1000.0):
+            llm.generate(MESSAGES)
+        with patch("memos.llms.cache.time.time", return_value=1005.0):
+            llm.generate(MESSAGES)
+        self.assertEqual(inner.generate.call_count, 1)
+        with patch("memos.llms.cache.time.time", return_value=1011.0):
+            llm.generate(MESSAGES)
+        self.assertEqual(inner.generate.call_count, 2)
+
+    def test_lru_eviction(self):
+        inner, llm = self._llm(max_entries=1)
+        llm.generate(MESSAGES)
+        llm.generate([{"role": "user", "content": "other"}])
+        llm.generate(MESSAGES)
+        self.assertEqual(inner.generate.call_count, 3)
+
+    def test_sqlite_tier_survives_restart(self):
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "llm_cache.db")
+            inner, llm = self._llm(sqlite_path=path)
+            llm.generate(MESSAGES)
+            llm.cache.close()
+
+            inner2, llm2 = self._llm(sqlite_path=path)
+            self.assertEqual(llm2.generate(MESSAGES), "answer-1")
+            inner2.generate.assert_not_called()
+            self.assertEqual(llm2.cache_stats()["disk_hits"], 1)
+            llm2.cache.close()
+
+    def test_factory_wraps_when_configured(self):
+        plain = LLMFactory.from_config(_factory_config(0.0, None))
+        self.assertNotIsInstance(plain, CachingLLM)
+
+        cached = LLMFactory.from_config(_factory_config(0.0, {"max_entries": 8}))
+        self.assertIsInstance(cached, CachingLLM)
+        # Backend attributes stay reachable through the wrapper
+        self.assertEqual(cached.config.model_name_or_path, "gpt-4.1-nano")
+        self.assertIs(cached.client, cached.llm.client)
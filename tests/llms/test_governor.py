@@ -0,0 +1,152 @@
+import threading
+import time
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from memos.configs.llm import LLMGovernorConfig
+from memos.context.context import RequestContext, set_request_context
+from memos.llms.governor import (
+    BACKGROUND,
+    INTERACTIVE,
+    NORMAL,
+    GovernedLLM,
+    LLMGovernorTimeoutError,
+    get_llm_governor,
+    llm_priority,
+    resolve_priority,
+)
+
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def _inner(model="m"):
+    inner = MagicMock()
+    inner.config = SimpleNamespace(model_name_or_path=model, max_tokens=100)
+    return inner
+
+
+class TestLLMGovernor(unittest.TestCase):
+    def setUp(self):
+        get_llm_governor().reset()
+        set_request_context(None)
+
+    def test_limits_concurrency_per_model(self):
+        config = LLMGovernorConfig(max_concurrency=2)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_generate(messages, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return "ok"
+
+        # Two LLM instances of the same model share one limiter
+        llms = []
+        for _ in range(2):
+            inner = _inner()
+            inner.generate.side_effect = slow_generate
+            llms.append(GovernedLLM(inner, config))
+
+        threads = [
+            threading.Thread(target=llms[i % 2].generate, args=(MESSAGES,)) for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak[0], 2)
+        stats = get_llm_governor().stats()["m"]
+        self.assertEqual(stats["admitted"][NORMAL], 6)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_interactive_calls_are_admitted_first(self):
+        config = LLMGovernorConfig(max_concurrency=1)
+        limiter = get_llm_governor().limiter("m", config)
+        limiter.acquire(NORMAL, 10)
+        order = []
+
+        def wait_for(priority):
+            limiter.acquire(priority, 10)
+            order.append(priority)
+            limiter.release(10, 10)
+
+        background = threading.Thread(target=wait_for, args=(BACKGROUND,))
+        background.start()
+        time.sleep(0.05)
+        interactive = threading.Thread(target=wait_for, args=(INTERACTIVE,))
+        interactive.start()
+        time.sleep(0.05)
+
+        limiter.release(10, 10)
+        background.join()
+        interactive.join()
+        self.assertEqual(order, [INTERACTIVE, BACKGROUND])
+
+    def test_rate_limit_backs_off_and_retries(self):
+        config = LLMGovernorConfig(max_concurrency=8, backoff_base_seconds=0.01)
+        inner = _inner()
+        inner.generate.side_effect = [RateLimitError("429"), "ok"]
+        llm = GovernedLLM(inner, config)
+
+        self.assertEqual(llm.generate(MESSAGES), "ok")
+        self.assertEqual(inner.generate.call_count, 2)
+        stats = get_llm_governor().stats()["m"]
+        self.assertEqual(stats["throttled"], 1)
+        # Halved on the 429, then recovered additively by the successful call
+        self.assertLess(stats["concurrency_limit"], 8)
+
+    def test_non_rate_limit_errors_are_not_retried(self):
+        inner = _inner()
+        inner.generate.side_effect = ValueError("bad request")
+        llm = GovernedLLM(inner, LLMGovernorConfig())
+
+        with self.assertRaises(ValueError):
+            llm.generate(MESSAGES)
+        self.assertEqual(inner.generate.call_count, 1)
+        self.assertEqual(get_llm_governor().stats()["m"]["in_flight"], 0)
+
+    def test_token_budget_blocks_until_timeout(self):
+        config = LLMGovernorConfig(
+            tokens_per_minute=60, expected_completion_tokens=50, max_queue_wait_seconds=0.05
+        )
+        inner = _inner()
+        inner.generate.return_value = "x" * 400  # ~100 tokens, more than reserved
+        llm = GovernedLLM(inner, config)
+
+        llm.generate(MESSAGES)
+        with self.assertRaises(LLMGovernorTimeoutError):
+            llm.generate(MESSAGES)
+        self.assertEqual(get_llm_governor().stats()["m"]["timeouts"], 1)
+
+    def test_stream_holds_slot_until_exhausted(self):
+        inner = _inner()
+        inner.generate_stream.return_value = iter(["a", "b"])
+        llm = GovernedLLM(inner, LLMGovernorConfig())
+
+        stream = llm.generate_stream(MESSAGES, priority=INTERACTIVE)
+        self.assertEqual(next(stream), "a")
+        self.assertEqual(get_llm_governor().stats()["m"]["in_flight"], 1)
+        self.assertEqual(list(stream), ["b"])
+        self.assertEqual(get_llm_governor().stats()["m"]["in_flight"], 0)
+        self.assertNotIn("priority", inner.generate_stream.call_args.kwargs)
+
+    def test_priority_resolution(self):
+        self.assertEqual(resolve_priority(), NORMAL)
+        set_request_context(RequestContext(api_path="/product/chat/stream"))
+        self.assertEqual(resolve_priority(), INTERACTIVE)
+        with llm_priority(BACKGROUND):
+            self.assertEqual(resolve_priority(), BACKGROUND)
+            self.assertEqual(resolve_priority(INTERACTIVE), INTERACTIVE)
+        self.assertEqual(resolve_priority(), INTERACTIVE)
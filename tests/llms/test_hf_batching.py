@@ -0,0 +1,126 @@
+import threading
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+import torch
+
+from transformers import LlamaConfig, LlamaForCausalLM
+
+from memos.configs.llm import HFLLMConfig
+from memos.llms.hf import HFLLM, IncrementalDetokenizer
+from memos.llms.hf_batching import ContinuousBatchingEngine, SamplingParams
+
+
+PROMPTS = [[1, 5, 9, 3], [1, 7], [1, 2, 3, 4, 5, 6, 7, 8, 9], [1, 11, 12]]
+
+
+def _tiny_model():
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=64,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=128,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+def _reference(model, prompt, max_new_tokens):
+    out = model.generate(
+        torch.tensor([prompt]),
+        max_new_tokens=max_new_tokens,
+        do_sample=False,
+        pad_token_id=0,
+        eos_token_id=None,
+    )
+    return out[0, len(prompt) :].tolist()
+
+
+class TestContinuousBatchingEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = _tiny_model()
+
+    def test_concurrent_greedy_matches_single_sequence_decoding(self):
+        engine = ContinuousBatchingEngine(self.model, max_batch_size=3)
+        results = {}
+
+        def run(i):
+            params = SamplingParams(max_new_tokens=4 + 3 * i)
+            results[i] = engine.generate(PROMPTS[i], params)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(PROMPTS))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i, prompt in enumerate(PROMPTS):
+            self.assertEqual(results[i], _reference(self.model, prompt, 4 + 3 * i))
+        stats = engine.stats()
+        self.assertEqual(stats["completed"], len(PROMPTS))
+        self.assertEqual(stats["active"], 0)
+        self.assertGreater(stats["decode_tokens_per_sec"], 0)
+        engine.shutdown()
+
+    def test_eos_and_cancel_finish_sequences(self):
+        expected = _reference(self.model, PROMPTS[0], 6)
+        engine = ContinuousBatchingEngine(self.model, eos_token_ids=[expected[2]])
+        self.assertEqual(
+            engine.generate(PROMPTS[0], SamplingParams(max_new_tokens=6)), expected[:2]
+        )
+
+        stream = engine.stream(PROMPTS[1], SamplingParams(max_new_tokens=100))
+        next(stream)
+        stream.close()
+        # The cancelled sequence is retired and the engine keeps serving
+        self.assertEqual(
+            engine.generate(PROMPTS[2], SamplingParams(max_new_tokens=3)),
+            _reference(self.model, PROMPTS[2], 3),
+        )
+        engine.shutdown()
+
+
+@patch("transformers.AutoModelForCausalLM", MagicMock())
+@patch("transformers.AutoTokenizer", MagicMock())
+class TestHFLLMContinuousBatching(unittest.TestCase):
+    def test_generate_uses_batching_engine(self):
+        config = HFLLMConfig(
+            model_name_or_path="tiny", max_tokens=5, do_sample=False, continuous_batching=True
+        )
+        llm = HFLLM(config)
+        model = _tiny_model()
+        tokenizer = MagicMock()
+        tokenizer.apply_chat_template.return_value = "prompt"
+        tokenizer.return_value = MagicMock(input_ids=PROMPTS[0])
+        tokenizer.decode.side_effect = lambda ids, **kwargs: " ".join(map(str, ids))
+        llm.model, llm.tokenizer = model, tokenizer
+        llm.batching_engine = ContinuousBatchingEngine(model)
+
+        expected = _reference(model, PROMPTS[0], 5)
+        messages = [{"role": "user", "content": "hi"}]
+        self.assertEqual(llm.generate(messages), " ".join(map(str, expected)))
+        self.assertEqual("".join(llm.generate_stream(messages)), " ".join(map(str, expected)))
+        llm.batching_engine.shutdown()
+
+
+class TestIncrementalDetokenizer(unittest.TestCase):
+    def test_holds_back_partial_characters_and_decodes_short_windows(self):
+        tokenizer = MagicMock()
+        tokenizer.decode.side_effect = lambda ids, **kwargs: bytes(ids).decode(
+            "utf-8", errors="replace"
+        )
+        detokenizer = IncrementalDetokenizer(tokenizer)
+        text = "héllo wörld " * 20
+
+        chunks = [detokenizer.push(byte) for byte in text.encode("utf-8")]
+
+        self.assertEqual("".join(chunks), text)
+        # The second byte of "é" is needed before it is emitted
+        self.assertEqual(chunks[1:3], ["", "é"])
+        # Decoding never goes back to the start of the stream
+        self.assertLessEqual(max(len(c.args[0]) for c in tokenizer.decode.call_args_list), 3)
@@ -0,0 +1,164 @@
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+import torch
+
+from transformers import LlamaConfig, LlamaForCausalLM
+
+from memos.configs.llm import HFLLMConfig
+from memos.llms.hf import HFLLM
+from memos.llms.hf_batching import cache_to_tensors, tensors_to_cache
+from memos.llms.hf_prefix_cache import RadixKVCache
+
+
+SYSTEM = list(range(1, 21))
+
+
+def _tiny_model():
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=64,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=128,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+def _fake_kv(token_ids, layers=2):
+    # Each position holds its token id, so slices can be checked by value
+    values = torch.tensor(token_ids, dtype=torch.float32).view(1, 1, -1, 1)
+    return [(values.clone(), values.clone() * 10) for _ in range(layers)]
+
+
+class TestRadixKVCache(unittest.TestCase):
+    def test_match_returns_longest_prefix_across_split_edges(self):
+        cache = RadixKVCache(max_bytes=1 << 20, min_match_tokens=2)
+        first = [*SYSTEM, 30, 31, 32]
+        cache.insert(first, _fake_kv(first))
+        second = [*SYSTEM, 40, 41]
+        cache.insert(second, _fake_kv(second))
+
+        matched, layers = cache.match([*SYSTEM, 40, 41, 42])
+        self.assertEqual(matched, len(second))
+        self.assertEqual(layers[0][0].flatten().tolist(), second)
+        self.assertEqual(layers[1][1].flatten().tolist(), [t * 10 for t in second])
+
+        matched, layers = cache.match(first, max_len=len(first) - 1)
+        self.assertEqual(matched, len(first) - 1)
+        self.assertEqual(layers[0][0].flatten().tolist(), first[:-1])
+
+        self.assertEqual(cache.match([50, 51, 52]), (0, None))
+        self.assertEqual(cache.match(SYSTEM[:1]), (0, None))
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertGreater(stats["token_hit_rate"], 0)
+
+    def test_evicts_least_recently_used_leaves_over_budget(self):
+        one = _fake_kv(SYSTEM)
+        per_prompt = sum(k.numel() * k.element_size() * 2 for k, _ in one)
+        cache = RadixKVCache(max_bytes=2 * per_prompt, min_match_tokens=1)
+        prompts = [[100 + i, *SYSTEM[1:]] for i in range(3)]
+        for prompt in prompts:
+            cache.insert(prompt, _fake_kv(prompt))
+
+        self.assertLessEqual(cache.get_stats()["bytes"], 2 * per_prompt)
+        self.assertEqual(cache.match(prompts[0]), (0, None))
+        self.assertEqual(cache.match(prompts[2])[0], len(SYSTEM))
+
+
+class TestPrefixCachedPrefill(unittest.TestCase):
+    def test_prefill_from_cached_prefix_matches_full_forward(self):
+        model = _tiny_model()
+        prompt = [*SYSTEM, 33, 34, 35]
+        with torch.no_grad():
+            full = model(input_ids=torch.tensor([prompt]), use_cache=True)
+            prefix = model(input_ids=torch.tensor([SYSTEM]), use_cache=True)
+        cache = RadixKVCache(max_bytes=1 << 20)
+        cache.insert(SYSTEM, cache_to_tensors(prefix.past_key_values))
+
+        matched, layers = cache.match(prompt, max_len=len(prompt) - 1)
+        self.assertEqual(matched, len(SYSTEM))
+        with torch.no_grad():
+            rest = model(
+                input_ids=torch.tensor([prompt[matched:]]),
+                past_key_values=tensors_to_cache(layers),
+                use_cache=True,
+            )
+        torch.testing.assert_close(rest.logits[:, -1, :], full.logits[:, -1, :])
+
+
+@patch("transformers.AutoModelForCausalLM", MagicMock())
+@patch("transformers.AutoTokenizer", MagicMock())
+class TestHFLLMPrefixCache(unittest.TestCase):
+    def test_generate_reuses_cached_prompt_prefix(self):
+        config = HFLLMConfig(
+            model_name_or_path="tiny", max_tokens=5, do_sample=False, prefix_cache_max_bytes=1 << 20
+        )
+        llm = HFLLM(config)
+        model = _tiny_model()
+        prompt = [*SYSTEM, 33, 34]
+        tokenizer = MagicMock()
+        tokenizer.apply_chat_template.return_value = "prompt"
+        tokenizer.return_value = MagicMock(input_ids=prompt)
+        tokenizer.eos_token_id = None
+        tokenizer.decode.side_effect = lambda ids, **kwargs: " ".join(str(int(i)) for i in ids)
+        llm.model, llm.tokenizer = model, tokenizer
+
+        expected = model.generate(
+            torch.tensor([prompt]),
+            max_new_tokens=5,
+            do_sample=False,
+            pad_token_id=0,
+            eos_token_id=None,
+        )[0, len(prompt) :].tolist()
+        messages = [{"role": "user", "content": "hi"}]
+        first = llm.generate(messages)
+        second = llm.generate(messages)
+        self.assertEqual(first, " ".join(map(str, expected)))
+        self.assertEqual(second, first)
+        self.assertEqual(llm.prefix_cache.get_stats()["matched_tokens"], len(prompt) - 1)
+
+
+class _CharTokenizer:
+    """One token per character, enough to exercise prompt-prefix reuse."""
+
+    eos_token_id = None
+
+    def apply_chat_template(self, messages, tokenize=False, add_generation_prompt=False):
+        return "".join(f"<{m['role']}>{m['content']}</s>" for m in messages)
+
+    def __call__(self, text, return_tensors=None):
+        ids = [ord(char) % 64 for char in text]
+        return MagicMock(input_ids=torch.tensor([ids]) if return_tensors else ids)
+
+
+@patch("transformers.AutoModelForCausalLM", MagicMock())
+@patch("transformers.AutoTokenizer", MagicMock())
+class TestHFLLMExtendKVCache(unittest.TestCase):
+    def test_extend_matches_full_build(self):
+        llm = HFLLM(HFLLMConfig(model_name_or_path="tiny", do_sample=False))
+        llm.model, llm.tokenizer = _tiny_model(), _CharTokenizer()
+        base_text = "1. likes tea\n"
+        new_text = "1. likes tea\n2. owns a cat\n"
+        base_kv = llm._prefill_after_prefix(
+            llm.tokenizer(llm._kv_cache_prompt(base_text)).input_ids, 0, None
+        )
+        full = llm._prefill_after_prefix(
+            llm.tokenizer(llm._kv_cache_prompt(new_text)).input_ids, 0, None
+        )
+
+        with patch.object(llm, "_prefill", wraps=llm._prefill) as prefill:
+            extended = llm.extend_kv_cache(new_text, base_text, base_kv)
+        # Only the tokens after the shared prefix are forwarded
+        forwarded = prefill.call_args.args[0].size(1)
+        self.assertEqual(forwarded, len(new_text) - len(base_text) + len("</s>"))
+        for (k, v), (fk, fv) in zip(
+            cache_to_tensors(extended), cache_to_tensors(full), strict=True
+        ):
+            torch.testing.assert_close(k, fk)
+            torch.testing.assert_close(v, fv)
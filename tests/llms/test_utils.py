@@ -0,0 +1,42 @@
+import unittest
+
+from memos.llms.utils import (
+    ReasoningStreamFormatter,
+    ThinkStreamFilter,
+    remove_thinking_tags,
+    strip_think_stream,
+)
+
+
+class TestThinkStreamFilter(unittest.TestCase):
+    def test_splits_tags_across_chunk_boundaries(self):
+        stream_filter = ThinkStreamFilter()
+        parts = []
+        for delta in ["<th", "ink>plan", " a</thi", "nk>Hello <", "b>!"]:
+            parts.extend(stream_filter.feed(delta))
+        parts.extend(stream_filter.flush())
+
+        reasoning = "".join(text for kind, text in parts if kind == "reasoning")
+        answer = "".join(text for kind, text in parts if kind == "text")
+        self.assertEqual(reasoning, "plan a")
+        self.assertEqual(answer, "Hello <b>!")
+
+    def test_strip_think_stream_matches_remove_thinking_tags(self):
+        response = "<think>Let me think.\nDone.</think>\n\nHello World!"
+        for size in (1, 2, 3, 7):
+            chunks = [response[i : i + size] for i in range(0, len(response), size)]
+            self.assertEqual("".join(strip_think_stream(chunks)), remove_thinking_tags(response))
+        self.assertEqual("".join(strip_think_stream(["no tags <", "3"])), "no tags <3")
+
+
+class TestReasoningStreamFormatter(unittest.TestCase):
+    def test_wraps_or_drops_reasoning(self):
+        deltas = [("plan", None), (None, "<think>x</think>"), (None, " Hi"), (None, "!")]
+
+        formatter = ReasoningStreamFormatter(remove_think_prefix=False)
+        chunks = [c for delta in deltas for c in formatter.push(*delta)] + formatter.finish()
+        self.assertEqual("".join(chunks), "<think>plan</think><think>x</think> Hi!")
+
+        formatter = ReasoningStreamFormatter(remove_think_prefix=True)
+        chunks = [c for delta in deltas for c in formatter.push(*delta)] + formatter.finish()
+        self.assertEqual("".join(chunks), "Hi!")
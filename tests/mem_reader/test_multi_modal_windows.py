@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.mem_reader.multi_modal_struct import MultiModalStructMemReader
+from memos.memories.textual.item import (
+    SourceMessage,
+    TextualMemoryItem,
+    TreeNodeTextualMemoryMetadata,
+)
+
+
+def _item(memory: str) -> TextualMemoryItem:
+    return TextualMemoryItem(
+        memory=memory,
+        metadata=TreeNodeTextualMemoryMetadata(
+            user_id="u1",
+            session_id="s1",
+            memory_type="LongTermMemory",
+            sources=[SourceMessage(type="chat", role="user", content=memory)],
+        ),
+    )
+
+
+@pytest.fixture
+def reader():
+    reader = MultiModalStructMemReader.__new__(MultiModalStructMemReader)
+    reader.embedder = MagicMock()
+    reader.embedder.embed.side_effect = lambda texts: [[0.1] * 4 for _ in texts]
+    reader.chat_window_max_tokens = 4096
+    reader._count_tokens = MagicMock(side_effect=lambda text: len(text.split()))
+    return reader
+
+
+def test_window_loop_counts_each_line_once(reader):
+    items = [_item(f"item {i}") for i in range(3)]
+
+    reader._concat_multi_modal_memories(items, max_tokens=4, overlap=0)
+
+    # One count for the large-item split check, one for the window
+    counted = [call.args[0] for call in reader._count_tokens.call_args_list]
+    assert sorted(counted) == sorted(
+        [f"item {i}" for i in range(3)] + [f"item {i}\n" for i in range(3)]
+    )
+
+
+def test_windows_split_on_line_token_total(reader):
+    items = [_item(f"item {i}") for i in range(3)]
+
+    windows = reader._concat_multi_modal_memories(items, max_tokens=4, overlap=0)
+
+    assert [w.memory.count("item") for w in windows] == [2, 1]
@@ -0,0 +1,71 @@
+import unittest
+
+from unittest.mock import MagicMock
+
+from memos.mem_scheduler.memory_manage_modules.activation_memory_manager import (
+    ActivationMemoryManager,
+    order_for_prefix_reuse,
+)
+from memos.memories.activation.item import KVCacheItem
+from memos.memories.activation.kv import KVCacheMemory
+
+
+class TestOrderForPrefixReuse(unittest.TestCase):
+    def test_cached_memories_stay_first_in_cached_order(self):
+        cached = ["a", "b", "c", "d"]
+        new = ["e", "c", "a", " ", "d", "e"]
+        self.assertEqual(order_for_prefix_reuse(cached, new), ["a", "c", "d", "e"])
+
+    def test_without_cache_keeps_new_order(self):
+        self.assertEqual(order_for_prefix_reuse([], ["b", "a"]), ["b", "a"])
+
+
+class TestIncrementalActivationUpdate(unittest.TestCase):
+    def setUp(self):
+        self.manager = ActivationMemoryManager(
+            act_mem_dump_path="/tmp/unused",
+            monitor=MagicMock(),
+            log_func_callback=MagicMock(),
+            log_activation_memory_update_func=MagicMock(),
+        )
+        self.act_mem = MagicMock(spec=KVCacheMemory)
+        self.mem_cube = MagicMock(act_mem=self.act_mem)
+        self.act_mem.extract.side_effect = lambda text, base=None: KVCacheItem(
+            metadata={"source_text": text}
+        )
+
+    def _update(self, memories):
+        self.manager.update_activation_memory(
+            new_memories=memories,
+            label="test",
+            user_id="user",
+            mem_cube_id="cube",
+            mem_cube=self.mem_cube,
+        )
+
+    def test_rebuild_extends_previous_cache(self):
+        previous = KVCacheItem()
+        previous.records.text_memories = ["likes tea", "owns a cat"]
+        self.act_mem.get_all.return_value = [previous]
+
+        self._update(["plays chess", "owns a cat", "likes tea"])
+
+        text, kwargs = self.act_mem.extract.call_args.args[0], self.act_mem.extract.call_args.kwargs
+        self.assertIs(kwargs["base"], previous)
+        self.assertLess(text.index("likes tea"), text.index("owns a cat"))
+        self.assertLess(text.index("owns a cat"), text.index("plays chess"))
+        added = self.act_mem.add.call_args.args[0][0]
+        self.assertEqual(added.records.text_memories, ["likes tea", "owns a cat", "plays chess"])
+        self.assertEqual(added.records.composed_text_memory, text)
+        self.act_mem.delete_all.assert_called_once()
+        self.act_mem.dump.assert_called_once_with("/tmp/unused")
+
+    def test_unchanged_composition_is_skipped(self):
+        self._update(["likes tea"])
+        stored = self.act_mem.add.call_args.args[0][0]
+        self.act_mem.get_all.return_value = [stored]
+        self.act_mem.reset_mock()
+
+        self._update(["likes tea"])
+        self.act_mem.extract.assert_not_called()
+        self.act_mem.dump.assert_not_called()
@@ -0,0 +1,175 @@
+import time
+import unittest
+
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+
+from memos.api.handlers.add_handler import AddHandler
+from memos.api.product_models import APIADDRequest
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import MEM_READ_TASK_LABEL, MEM_UPDATE_TASK_LABEL
+from memos.mem_scheduler.task_schedule_modules.admission_control import (
+    ADMISSION_ACTION_ADMIT,
+    ADMISSION_POLICY_DEGRADE,
+    ADMISSION_POLICY_REJECT,
+    ADMISSION_POLICY_SHED,
+    SchedulerAdmissionController,
+)
+from memos.mem_scheduler.task_schedule_modules.local_queue import SchedulerLocalQueue
+from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+
+
+class _StaticBacklogQueue:
+    def __init__(self, backlog):
+        self.backlog = backlog
+
+    def get_stream_backlog(self):
+        return self.backlog
+
+
+def _backlog(now=None, **depths):
+    now = now or time.time()
+    return {
+        f"scheduler:messages:stream:{user}:cube:{MEM_READ_TASK_LABEL}": {
+            "depth": depth,
+            "oldest_enqueued_at": now - 1,
+        }
+        for user, depth in depths.items()
+    }
+
+
+def _make_message(label, user_id="user1"):
+    return ScheduleMessageItem(user_id=user_id, mem_cube_id="cube", label=label, content="x")
+
+
+class TestSchedulerAdmissionController(unittest.TestCase):
+    def test_admit_under_limits(self):
+        controller = SchedulerAdmissionController(
+            _StaticBacklogQueue(_backlog(user1=3)), max_user_queue_depth=10
+        )
+        decision = controller.check("user1")
+        self.assertEqual(decision.action, ADMISSION_ACTION_ADMIT)
+        self.assertTrue(decision.admitted)
+
+    def test_reject_when_user_depth_exceeded(self):
+        controller = SchedulerAdmissionController(
+            _StaticBacklogQueue(_backlog(user1=30, user2=1)),
+            policy=ADMISSION_POLICY_REJECT,
+            max_user_queue_depth=10,
+            retry_after_seconds=2,
+        )
+        decision = controller.check("user1")
+        self.assertFalse(decision.admitted)
+        self.assertEqual(decision.retry_after_seconds, 6)
+        self.assertIn("user_queue_depth", decision.reasons[0])
+
+        # Other users are not affected by a per-user limit
+        self.assertTrue(controller.check("user2").admitted)
+
+    def test_global_depth_and_age_limits(self):
+        now = time.time()
+        backlog = _backlog(now=now, user1=5, user2=5)
+        backlog[next(iter(backlog))]["oldest_enqueued_at"] = now - 120
+        controller = SchedulerAdmissionController(
+            _StaticBacklogQueue(backlog),
+            policy=ADMISSION_POLICY_DEGRADE,
+            max_global_queue_depth=8,
+            max_oldest_age_seconds=60,
+        )
+        decision = controller.check("user2")
+        self.assertEqual(decision.action, ADMISSION_POLICY_DEGRADE)
+        self.assertTrue(decision.admitted)
+        self.assertEqual(len(decision.reasons), 2)
+
+        health = controller.get_queue_health(user_id="user1")
+        self.assertTrue(health["overloaded"])
+        self.assertEqual(health["global"]["depth"], 10)
+        self.assertGreaterEqual(health["user"]["oldest_age_seconds"], 119)
+
+    def test_shed_only_configured_labels_when_overloaded(self):
+        queue = _StaticBacklogQueue(_backlog(user1=30))
+        controller = SchedulerAdmissionController(
+            queue, policy=ADMISSION_POLICY_SHED, max_user_queue_depth=10, stats_ttl_seconds=0
+        )
+        self.assertTrue(controller.should_shed(MEM_UPDATE_TASK_LABEL, user_id="user1"))
+        self.assertFalse(controller.should_shed(MEM_READ_TASK_LABEL, user_id="user1"))
+
+        queue.backlog = _backlog(user1=1)
+        self.assertFalse(controller.should_shed(MEM_UPDATE_TASK_LABEL, user_id="user1"))
+
+    def test_snapshot_is_cached(self):
+        queue = MagicMock()
+        queue.get_stream_backlog.return_value = _backlog(user1=1)
+        controller = SchedulerAdmissionController(queue, stats_ttl_seconds=60)
+        for _ in range(5):
+            controller.check("user1")
+        queue.get_stream_backlog.assert_called_once()
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            SchedulerAdmissionController(_StaticBacklogQueue({}), policy="drop")
+
+
+class TestStreamBacklog(unittest.TestCase):
+    def test_local_queue_backlog(self):
+        queue = SchedulerLocalQueue()
+        queue.put(_make_message(MEM_READ_TASK_LABEL))
+        queue.put(_make_message(MEM_READ_TASK_LABEL))
+        (stats,) = queue.get_stream_backlog().values()
+        self.assertEqual(stats["depth"], 2)
+        self.assertLessEqual(stats["oldest_enqueued_at"], time.time())
+
+    def test_redis_queue_backlog(self):
+        import fakeredis
+
+        queue = SchedulerRedisQueue(redis_client=fakeredis.FakeRedis(decode_responses=True))
+        try:
+            queue.put(_make_message(MEM_READ_TASK_LABEL))
+            queue.put(_make_message(MEM_READ_TASK_LABEL, user_id="user2"))
+            backlog = queue.get_stream_backlog()
+            self.assertEqual(sorted(s["depth"] for s in backlog.values()), [1, 1])
+            self.assertTrue(all(s["oldest_enqueued_at"] for s in backlog.values()))
+
+            controller = SchedulerAdmissionController(queue, max_user_queue_depth=10)
+            self.assertEqual(set(controller.get_snapshot()["users"]), {"user1", "user2"})
+        finally:
+            queue._stop_stream_keys_refresh_thread()
+
+
+class TestAddHandlerAdmission(unittest.TestCase):
+    def _make_handler(self, decision_action, reasons=("user_queue_depth 30 > 10",)):
+        controller = MagicMock()
+        controller.check.return_value = MagicMock(
+            action=decision_action, reasons=list(reasons), retry_after_seconds=5
+        )
+        handler = AddHandler.__new__(AddHandler)
+        handler.deps = MagicMock()
+        handler.deps.mem_scheduler = MagicMock(admission_controller=controller)
+        handler.logger = MagicMock()
+        return handler
+
+    def test_reject_raises_429(self):
+        handler = self._make_handler(ADMISSION_POLICY_REJECT)
+        with self.assertRaises(HTTPException) as ctx:
+            handler._apply_admission_control(APIADDRequest(user_id="user1"))
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertEqual(ctx.exception.headers["Retry-After"], "5")
+
+    def test_degrade_switches_to_sync_fast(self):
+        handler = self._make_handler(ADMISSION_POLICY_DEGRADE)
+        add_req = APIADDRequest(user_id="user1")
+        handler._apply_admission_control(add_req)
+        self.assertEqual(add_req.async_mode, "sync")
+        self.assertEqual(add_req.mode, "fast")
+
+    def test_shed_keeps_add_bounded_by_degrading_it(self):
+        handler = self._make_handler(ADMISSION_POLICY_SHED)
+        add_req = APIADDRequest(user_id="user1")
+        handler._apply_admission_control(add_req)
+        self.assertEqual(add_req.async_mode, "sync")
+        self.assertEqual(add_req.mode, "fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
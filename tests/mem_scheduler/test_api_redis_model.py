@@ -0,0 +1,97 @@
+import time
+import unittest
+
+import fakeredis
+
+from memos.mem_scheduler.orm_modules.api_redis_model import APIRedisDBManager
+from memos.mem_scheduler.schemas.api_schemas import (
+    APIMemoryHistoryEntryItem,
+    APISearchHistoryManager,
+)
+
+
+def _make_entry(item_id, query="query"):
+    entry = APIMemoryHistoryEntryItem(item_id=item_id, query=query, formatted_memories=[])
+    time.sleep(0.001)  # keep created_time strictly increasing
+    return entry
+
+
+class TestAPIRedisDBManagerDeltaSync(unittest.TestCase):
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+
+    def _make_manager(self, window_size=3):
+        return APIRedisDBManager(
+            user_id="user1",
+            mem_cube_id="cube1",
+            obj=APISearchHistoryManager(window_size=window_size),
+            redis_client=self.redis,
+            window_size=window_size,
+        )
+
+    def test_concurrent_managers_merge_entries_and_running_ids(self):
+        manager_a = self._make_manager()
+        manager_b = self._make_manager()
+
+        manager_a.obj.completed_entries.extend([_make_entry("a0"), _make_entry("a1")])
+        manager_a.obj.running_item_ids.append("task-a")
+        manager_a.sync_with_redis()
+
+        manager_b.obj.completed_entries.extend([_make_entry("b0"), _make_entry("b1")])
+        manager_b.sync_with_redis()
+
+        # Newest window_size entries survive, newest first; trimmed entries leave Redis
+        self.assertEqual([e.item_id for e in manager_b.obj.completed_entries], ["b1", "b0", "a1"])
+        self.assertEqual(manager_b.obj.running_item_ids, ["task-a"])
+        self.assertEqual(set(self.redis.hkeys(manager_a._get_entries_key())), {"a1", "b0", "b1"})
+
+        # Removing a running id locally removes it from Redis
+        manager_a.obj.running_item_ids.remove("task-a")
+        manager_a.sync_with_redis()
+        self.assertEqual(self.redis.smembers(manager_a._get_running_key()), set())
+        self.assertEqual(len(manager_a.obj.completed_entries), 3)
+
+    def test_only_new_and_dirty_entries_are_written(self):
+        manager = self._make_manager()
+        manager.obj.completed_entries.append(_make_entry("e0", query="old"))
+        manager.sync_with_redis()
+
+        # Tamper with the stored entry: an unchanged entry must not be rewritten
+        entries_key = manager._get_entries_key()
+        self.redis.hset(entries_key, "e0", _make_entry("e0", query="tampered").to_json())
+        manager.sync_with_redis()
+        stored = APIMemoryHistoryEntryItem.from_json(self.redis.hget(entries_key, "e0"))
+        self.assertEqual(stored.query, "tampered")
+
+        manager.obj.update_entry_by_item_id(
+            item_id="e0", query="new", formatted_memories=[], task_status="completed"
+        )
+        manager.sync_with_redis()
+        stored = APIMemoryHistoryEntryItem.from_json(self.redis.hget(entries_key, "e0"))
+        self.assertEqual(stored.query, "new")
+
+    def test_legacy_blob_is_migrated(self):
+        legacy = APISearchHistoryManager(
+            window_size=3, completed_entries=[_make_entry("old")], running_item_ids=["task"]
+        )
+        manager = self._make_manager()
+        self.redis.set(manager._get_data_key(), legacy.to_json())
+
+        loaded = manager.load_from_db()
+        self.assertEqual([e.item_id for e in loaded.completed_entries], ["old"])
+        self.assertEqual(loaded.running_item_ids, ["task"])
+        self.assertIsNone(self.redis.get(manager._get_data_key()))
+
+    def test_save_to_db_replaces_state(self):
+        manager = self._make_manager()
+        manager.obj.completed_entries.append(_make_entry("e0"))
+        manager.sync_with_redis()
+
+        replacement = APISearchHistoryManager(window_size=3, completed_entries=[_make_entry("e1")])
+        manager.save_to_db(replacement)
+        loaded = manager.load_from_db()
+        self.assertEqual([e.item_id for e in loaded.completed_entries], ["e1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
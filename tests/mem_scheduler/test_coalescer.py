@@ -0,0 +1,126 @@
+import json
+import time
+import unittest
+
+from unittest.mock import MagicMock
+
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import (
+    ADD_TASK_LABEL,
+    MEM_READ_TASK_LABEL,
+    MEM_UPDATE_TASK_LABEL,
+)
+from memos.mem_scheduler.task_schedule_modules.coalescer import (
+    SchedulerMessageCoalescer,
+    expand_coalesced_messages,
+    get_coalesced_messages,
+)
+from memos.mem_scheduler.task_schedule_modules.dispatcher import SchedulerDispatcher
+
+
+def _make_message(label, content, user_id="user1", mem_cube_id="cube1", **kwargs):
+    return ScheduleMessageItem(
+        user_id=user_id, mem_cube_id=mem_cube_id, label=label, content=content, **kwargs
+    )
+
+
+class TestSchedulerMessageCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.coalescer = SchedulerMessageCoalescer(window_seconds=0)
+
+    def test_identical_payloads_are_deduplicated(self):
+        msgs = [_make_message(MEM_UPDATE_TASK_LABEL, "where do I live?") for _ in range(3)]
+        result = self.coalescer.coalesce(msgs)
+
+        self.assertEqual(len(result), 1)
+        self.assertIs(result[0], msgs[0])
+        self.assertEqual(get_coalesced_messages(result[0]), msgs[1:])
+
+    def test_distinct_refresh_queries_are_released_together(self):
+        msgs = [
+            _make_message(MEM_UPDATE_TASK_LABEL, "query one"),
+            _make_message(MEM_UPDATE_TASK_LABEL, "query two"),
+        ]
+        result = self.coalescer.coalesce(msgs)
+        self.assertEqual([m.content for m in result], ["query one", "query two"])
+
+    def test_id_list_messages_are_merged(self):
+        msgs = [
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["a", "b"])),
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["b", "c"])),
+            _make_message(ADD_TASK_LABEL, json.dumps(["x"])),
+        ]
+        result = self.coalescer.coalesce(msgs)
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(json.loads(result[0].content), ["a", "b", "c"])
+        self.assertEqual(result[1].label, ADD_TASK_LABEL)
+        self.assertEqual(len(expand_coalesced_messages(result)), 3)
+
+    def test_incompatible_messages_are_not_merged(self):
+        msgs = [
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["a"]), task_id="t1"),
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["b"]), task_id="t2"),
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["c"]), user_id="user2"),
+        ]
+        result = self.coalescer.coalesce(msgs)
+        self.assertEqual(len(result), 3)
+
+    def test_window_buffers_until_elapsed(self):
+        coalescer = SchedulerMessageCoalescer(window_seconds=0.05)
+        released = coalescer.add_and_release(
+            [_make_message(MEM_READ_TASK_LABEL, json.dumps(["a"]))]
+        )
+        self.assertEqual(released, [])
+        released = coalescer.add_and_release(
+            [_make_message(MEM_READ_TASK_LABEL, json.dumps(["b"]))]
+        )
+        self.assertEqual(released, [])
+        self.assertEqual(coalescer.pending_count(), 2)
+
+        time.sleep(0.06)
+        released = coalescer.add_and_release([])
+        self.assertEqual(len(released), 1)
+        self.assertEqual(json.loads(released[0].content), ["a", "b"])
+        self.assertEqual(coalescer.stats(), {"received": 2, "released": 1, "pending": 0})
+
+    def test_max_batch_size_releases_early(self):
+        coalescer = SchedulerMessageCoalescer(window_seconds=60, max_batch_size=2)
+        msgs = [_make_message(MEM_UPDATE_TASK_LABEL, f"q{i}") for i in range(2)]
+        self.assertEqual(len(coalescer.add_and_release(msgs)), 2)
+
+    def test_force_release(self):
+        coalescer = SchedulerMessageCoalescer(window_seconds=60)
+        coalescer.add([_make_message(MEM_UPDATE_TASK_LABEL, "q")])
+        self.assertEqual(coalescer.release(), [])
+        self.assertEqual(len(coalescer.release(force=True)), 1)
+
+
+class TestDispatcherWithCoalescedMessages(unittest.TestCase):
+    def test_absorbed_messages_share_status(self):
+        status_tracker = MagicMock()
+        dispatcher = SchedulerDispatcher(
+            enable_parallel_dispatch=False,
+            status_tracker=status_tracker,
+            metrics=MagicMock(),
+        )
+        handler = MagicMock()
+        dispatcher.register_handler(MEM_READ_TASK_LABEL, handler)
+
+        msgs = [
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["a"])),
+            _make_message(MEM_READ_TASK_LABEL, json.dumps(["b"])),
+        ]
+        coalesced = SchedulerMessageCoalescer(window_seconds=0).coalesce(msgs)
+        dispatcher.dispatch(coalesced)
+
+        handler.assert_called_once()
+        self.assertEqual(len(handler.call_args[0][0]), 1)
+        completed_ids = {
+            call.kwargs["task_id"] for call in status_tracker.task_completed.call_args_list
+        }
+        self.assertEqual(completed_ids, {m.item_id for m in msgs})
+
+
+if __name__ == "__main__":
+    unittest.main()
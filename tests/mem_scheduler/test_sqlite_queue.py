@@ -0,0 +1,130 @@
+import os
+import tempfile
+import time
+import unittest
+
+from memos.mem_scheduler.monitors.task_schedule_monitor import TaskScheduleMonitor
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import (
+    MEM_READ_TASK_LABEL,
+    MEM_UPDATE_TASK_LABEL,
+    TaskPriorityLevel,
+)
+from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.task_schedule_modules.sqlite_queue import SchedulerSQLiteQueue
+from memos.mem_scheduler.task_schedule_modules.task_queue import ScheduleTaskQueue
+
+
+def _make_message(label, content="content", user_id="user1", mem_cube_id="cube1"):
+    return ScheduleMessageItem(
+        user_id=user_id, mem_cube_id=mem_cube_id, label=label, content=content
+    )
+
+
+class TestSchedulerSQLiteQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "queue.db")
+        self.orchestrator = SchedulerOrchestrator()
+        self.queue = SchedulerSQLiteQueue(db_path=self.db_path, orchestrator=self.orchestrator)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp_dir.cleanup()
+
+    def test_put_and_get_messages(self):
+        for i in range(5):
+            self.queue.put(_make_message(MEM_READ_TASK_LABEL, content=f"m{i}"))
+
+        messages = self.queue.get_messages(batch_size=3)
+        self.assertEqual([m.content for m in messages], ["m0", "m1", "m2"])
+        self.assertTrue(all(m.redis_message_id for m in messages))
+        self.assertEqual(
+            messages[0].stream_key, self.queue.get_stream_key("user1", "cube1", MEM_READ_TASK_LABEL)
+        )
+
+        # Leased messages are not delivered twice
+        rest = self.queue.get_messages(batch_size=10)
+        self.assertEqual([m.content for m in rest], ["m3", "m4"])
+        self.assertEqual(self.queue.get_messages(batch_size=10), [])
+
+    def test_ack_removes_message(self):
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL))
+        (message,) = self.queue.get_messages(batch_size=1)
+        self.assertEqual(self.queue.size(), 1)
+
+        self.queue.ack_message(
+            user_id=message.user_id,
+            mem_cube_id=message.mem_cube_id,
+            task_label=message.label,
+            redis_message_id=message.redis_message_id,
+            message=message,
+        )
+        self.assertTrue(self.queue.empty())
+
+    def test_expired_lease_is_reclaimed(self):
+        self.orchestrator.set_task_config(task_label=MEM_READ_TASK_LABEL, min_idle_ms=1)
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL))
+        (first,) = self.queue.get_messages(batch_size=1)
+
+        time.sleep(0.01)
+        (second,) = self.queue.get_messages(batch_size=1)
+        self.assertEqual(first.redis_message_id, second.redis_message_id)
+
+    def test_priority_order(self):
+        self.orchestrator.set_task_config(
+            task_label=MEM_UPDATE_TASK_LABEL, priority=TaskPriorityLevel.LEVEL_2
+        )
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL, content="low"))
+        self.queue.put(_make_message(MEM_UPDATE_TASK_LABEL, content="high"))
+
+        messages = self.queue.get_messages(batch_size=2)
+        self.assertEqual([m.content for m in messages], ["high", "low"])
+
+    def test_messages_survive_restart(self):
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL, content="durable"))
+        self.queue.close()
+
+        self.queue = SchedulerSQLiteQueue(db_path=self.db_path, orchestrator=self.orchestrator)
+        messages = self.queue.get_messages(batch_size=1)
+        self.assertEqual([m.content for m in messages], ["durable"])
+
+    def test_max_len_trims_oldest(self):
+        queue = SchedulerSQLiteQueue(db_path=":memory:", max_len=2)
+        for i in range(4):
+            queue.put(_make_message(MEM_READ_TASK_LABEL, content=f"m{i}"))
+        self.assertEqual([m.content for m in queue.get_messages(batch_size=10)], ["m2", "m3"])
+        queue.close()
+
+    def test_qsize_and_status(self):
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL))
+        self.queue.put(_make_message(MEM_READ_TASK_LABEL, user_id="user2"))
+        self.queue.get_messages(batch_size=1)
+
+        qsize = self.queue.qsize()
+        self.assertEqual(qsize["total_size"], 2)
+        self.assertEqual(len(self.queue.get_stream_keys()), 2)
+
+        status = TaskScheduleMonitor(memos_message_queue=self.queue).get_tasks_status()
+        self.assertEqual(status["running"], 1)
+        self.assertEqual(status["remaining"], 1)
+
+        self.queue.clear()
+        self.assertTrue(self.queue.empty())
+
+    def test_task_queue_uses_sqlite_backend(self):
+        task_queue = ScheduleTaskQueue(
+            use_redis_queue=False,
+            maxsize=-1,
+            use_sqlite_queue=True,
+            sqlite_queue_path=os.path.join(self.tmp_dir.name, "task_queue.db"),
+        )
+        self.assertIsInstance(task_queue.memos_message_queue, SchedulerSQLiteQueue)
+        task_queue.submit_messages([_make_message(MEM_READ_TASK_LABEL) for _ in range(2)])
+        self.assertEqual(len(task_queue.get_messages(batch_size=5)), 2)
+        self.assertEqual(len(task_queue.get_stream_keys()), 1)
+        task_queue.memos_message_queue.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from memos.mem_scheduler.analyzer.throughput_benchmark import (
+    SchedulerBenchmarkConfig,
+    SchedulerThroughputBenchmark,
+    compare_reports,
+    jain_fairness_index,
+    percentile,
+)
+
+
+class TestSchedulerThroughputBenchmark(unittest.TestCase):
+    def test_helpers(self):
+        self.assertEqual(percentile([3, 1, 2, 4], 50), 2)
+        self.assertEqual(percentile([3, 1, 2, 4], 100), 4)
+        self.assertIsNone(percentile([], 50))
+        self.assertAlmostEqual(jain_fairness_index([1, 1, 1]), 1.0)
+        self.assertAlmostEqual(jain_fairness_index([1, 0, 0, 0]), 0.25)
+
+    def test_small_run_produces_report(self):
+        config = SchedulerBenchmarkConfig(
+            num_users=2, tasks_per_stream=3, default_latency_ms=0, timeout_seconds=30
+        )
+        report = SchedulerThroughputBenchmark(config).run()
+
+        self.assertEqual(report["tasks"], {"submitted": 12, "completed": 12})
+        self.assertEqual(report["latency_ms"]["count"], 12)
+        self.assertEqual(set(report["fairness"]["by_user"]), {"bench_user_0", "bench_user_1"})
+        self.assertEqual(report["redis"]["by_command"]["xadd"], 12)
+        self.assertGreater(report["redis"]["commands_per_task"], 0)
+
+        comparison = compare_reports(report, report)
+        self.assertEqual(comparison["throughput.tasks_per_sec"]["relative_change"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,20 @@
 import os
 import tempfile
 
+from unittest.mock import patch
+
 import pytest
 
 from memos.mem_scheduler.orm_modules.base_model import BaseDBManager
-from memos.mem_scheduler.orm_modules.monitor_models import DBManagerForMemoryMonitorManager
+from memos.mem_scheduler.orm_modules.monitor_models import (
+    DBManagerForMemoryMonitorManager,
+    DBManagerForQueryMonitorQueue,
+)
 from memos.mem_scheduler.schemas.monitor_schemas import (
     MemoryMonitorItem,
     MemoryMonitorManager,
+    QueryMonitorItem,
+    QueryMonitorQueue,
 )
 
 
@@ -138,15 +145,11 @@ class TestVersionControl:
             manager.sync_with_orm()
             assert manager.last_version_control == "0"
 
-            # Second sync with same object - should increment version because sync_with_orm always increments
+            # Syncs without local changes write nothing and keep the version
             manager.sync_with_orm()
-            assert (
-                manager.last_version_control == "1"
-            )  # Should increment to "1" since sync_with_orm always increments
-
-            # Third sync - should increment to version "2"
+            assert manager.last_version_control == "0"
             manager.sync_with_orm()
-            assert manager.last_version_control == "2"  # Should increment to "2"
+            assert manager.last_version_control == "0"
 
             # Simulate a change by creating a new object with different content
             new_memory_manager = MemoryMonitorManager(
@@ -171,7 +174,7 @@ class TestVersionControl:
 
             # Sync again - should increment version because object content changed
             manager.sync_with_orm()
-            assert manager.last_version_control == "3"  # Should increment to "3"
+            assert manager.last_version_control == "1"
 
         finally:
             manager.close()
@@ -271,3 +274,129 @@ class TestVersionControl:
 
         finally:
             manager1.close()
+
+    def test_sync_with_orm_skips_unchanged_data(self, temp_db, memory_manager_obj):
+        """Test that an unchanged object is neither serialized nor written"""
+        engine = BaseDBManager.create_engine_from_db_path(temp_db)
+        manager = DBManagerForMemoryMonitorManager(
+            engine=engine,
+            user_id="test_user",
+            mem_cube_id="test_mem_cube",
+            obj=memory_manager_obj,
+        )
+
+        try:
+            manager.sync_with_orm()
+
+            # Overwrite the stored blob behind the manager's back, keeping the version
+            session = manager._get_session()
+            session.query(manager.orm_class).update(
+                {"serialized_data": "sentinel"}, synchronize_session=False
+            )
+            session.commit()
+            session.close()
+
+            with patch.object(
+                MemoryMonitorManager, "to_json", side_effect=AssertionError("serialized")
+            ):
+                manager.sync_with_orm()
+            assert manager.last_version_control == "0"
+            session = manager._get_session()
+            assert session.query(manager.orm_class).first().serialized_data == "sentinel"
+            session.close()
+
+            # Direct field edits are flagged explicitly, mutating methods flag themselves
+            memory_manager_obj.memories[0].recording_count += 1
+            manager.mark_dirty()
+            manager.sync_with_orm()
+            assert manager.last_version_control == "1"
+            assert manager.load_from_db().memories[0].recording_count == 2
+
+            memory_manager_obj.update_memories(
+                new_memory_monitors=list(memory_manager_obj.memories), partial_retention_number=0
+            )
+            manager.sync_with_orm()
+            assert manager.load_from_db().memories[0].recording_count == 3
+
+        finally:
+            manager.close()
+
+    def test_sync_with_orm_merges_concurrent_writer(self, temp_db, memory_manager_obj):
+        """Test that a version bumped by another writer triggers a merge before writing"""
+        engine = BaseDBManager.create_engine_from_db_path(temp_db)
+        manager1 = DBManagerForMemoryMonitorManager(
+            engine=engine,
+            user_id="test_user",
+            mem_cube_id="test_mem_cube",
+            obj=memory_manager_obj,
+        )
+        other_obj = MemoryMonitorManager(
+            user_id="test_user",
+            mem_cube_id="test_mem_cube",
+            memories=[
+                MemoryMonitorItem(
+                    item_id="test-item-2",
+                    memory_text="Test memory 2",
+                    tree_memory_item=None,
+                    tree_memory_item_mapping_key="test_key_2",
+                    sorting_score=0.5,
+                )
+            ],
+        )
+        manager2 = DBManagerForMemoryMonitorManager(
+            engine=engine,
+            user_id="test_user",
+            mem_cube_id="test_mem_cube",
+            obj=other_obj,
+        )
+
+        try:
+            manager1.sync_with_orm()
+            # The first sync of an existing record merges it before writing
+            manager2.sync_with_orm()
+            assert manager2.last_version_control == "1"
+            merged_ids = {item.item_id for item in manager2.load_from_db().memories}
+            assert merged_ids == {"test-item-1", "test-item-2"}
+
+            # manager1 has no local changes: it picks up the merge without writing
+            manager1.sync_with_orm()
+            assert manager1.last_version_control == "1"
+            assert {item.item_id for item in manager1.obj.memories} == merged_ids
+
+        finally:
+            manager2.close()
+            manager1.close()
+
+    def test_idle_query_queue_syncs_do_not_write_after_merge(self, temp_db):
+        """Test that merging another writer's queue does not force a write on the next sync"""
+        engine = BaseDBManager.create_engine_from_db_path(temp_db)
+        managers = []
+        for query_text in ("query from worker 1", "query from worker 2"):
+            queue = QueryMonitorQueue(maxsize=10)
+            queue.put(
+                QueryMonitorItem(
+                    user_id="test_user", mem_cube_id="test_mem_cube", query_text=query_text
+                )
+            )
+            managers.append(
+                DBManagerForQueryMonitorQueue(
+                    engine=engine, user_id="test_user", mem_cube_id="test_mem_cube", obj=queue
+                )
+            )
+
+        try:
+            for manager in managers:
+                manager.sync_with_orm()
+            settled = managers[1].last_version_control
+
+            # No new puts: merges pick up each other's items but never write again
+            for _ in range(6):
+                for manager in managers:
+                    manager.sync_with_orm()
+            assert [m.last_version_control for m in managers] == [settled, settled]
+            for manager in managers:
+                assert len(manager.obj.get_queue_content_without_pop()) == 2
+
+        finally:
+            for manager in managers:
+                manager.close()
@@ -0,0 +1,63 @@
+"""
+Test shared token counting, single-pass truncation and sliding chat windows.
+"""
+
+from types import SimpleNamespace
+
+from memos.mem_reader.simple_struct import SimpleStructMemReader
+from memos.memos_tools.token_counter import (
+    IncrementalTokenCounter,
+    count_tokens,
+    get_encoder,
+    truncate_to_tokens,
+)
+
+
+TEXT = "Memory systems store facts. 记忆系统保存用户的事实。 " * 20
+
+
+def test_encoder_is_cached():
+    assert get_encoder() is get_encoder()
+
+
+def test_truncate_returns_longest_prefix_within_budget():
+    for max_tokens in (1, 5, 17, 60):
+        truncated = truncate_to_tokens(TEXT, max_tokens)
+        assert TEXT.startswith(truncated)
+        assert count_tokens(truncated) <= max_tokens
+        assert count_tokens(TEXT[: len(truncated) + 1]) > max_tokens
+    assert truncate_to_tokens(TEXT, 10_000) == TEXT
+    assert truncate_to_tokens("", 3) == ""
+
+
+def test_incremental_counter_tracks_appends_and_trims():
+    counter = IncrementalTokenCounter()
+    lines = [f"user: message number {i}\n" for i in range(5)]
+    for line in lines:
+        counter.append(line)
+    assert counter.total == sum(count_tokens(line) for line in lines)
+
+    assert counter.popleft() == lines[0]
+    assert counter.text() == "".join(lines[1:])
+    assert counter.total == sum(count_tokens(line) for line in lines[1:])
+    counter.clear()
+    assert len(counter) == 0
+    assert counter.total == 0
+
+
+def test_chat_windows_respect_budget_and_overlap():
+    reader = SimpleNamespace(_count_tokens=count_tokens, chat_window_max_tokens=40)
+    messages = [{"role": "user", "content": f"this is chat line {i} " * 3} for i in range(12)]
+
+    windows = list(
+        SimpleStructMemReader._iter_chat_windows(reader, messages, max_tokens=40, overlap=10)
+    )
+
+    assert len(windows) > 1
+    covered = [source["index"] for window in windows for source in window["sources"]]
+    assert sorted(set(covered)) == list(range(len(messages)))
+    for window in windows:
+        assert count_tokens(window["text"]) <= 40
+        assert window["text"] == "".join(
+            f"user: {messages[s['index']]['content']}\n" for s in window["sources"]
+        )
@@ -84,3 +84,119 @@ def test_from_textual_memory(kv_memory):
     item = kv_memory.from_textual_memory(DummyTextualMemory())
     assert isinstance(item, KVCacheItem)
     assert item.metadata["bar"] == 1
+
+
+def make_layer_cache(value):
+    from memos.llms.hf_batching import tensors_to_cache
+
+    tensor = torch.full((1, 2, 3, 4), float(value))
+    return tensors_to_cache([(tensor, tensor * 2), (tensor + 1, tensor + 2)])
+
+
+def test_dump_and_lazy_load_round_trip(kv_memory, dummy_config, tmp_path):
+    item1 = KVCacheItem(memory=make_layer_cache(1), metadata={"source_text": "a"})
+    item2 = KVCacheItem(memory=make_layer_cache(2))
+    item2.records.text_memories = ["fact"]
+    kv_memory.add([item1, item2])
+    kv_memory.dump(str(tmp_path))
+
+    loaded = KVCacheMemory.__new__(KVCacheMemory)
+    loaded.config = dummy_config
+    loaded.load(str(tmp_path))
+    assert list(loaded.kv_cache_memories) == [item1.id, item2.id]
+    assert not loaded.kv_cache_memories.is_loaded(item2.id)
+
+    got = loaded.get(item2.id)
+    assert loaded.kv_cache_memories.is_loaded(item2.id)
+    assert not loaded.kv_cache_memories.is_loaded(item1.id)
+    assert got.records.text_memories == ["fact"]
+    assert torch.equal(got.memory.layers[1].values, item2.memory.layers[1].values)
+
+
+def test_dump_writes_only_changed_items(kv_memory, dummy_config, tmp_path):
+    item1 = KVCacheItem(memory=make_layer_cache(1))
+    item2 = KVCacheItem(memory=make_layer_cache(2))
+    kv_memory.add([item1, item2])
+    kv_memory.dump(str(tmp_path))
+    store = tmp_path / "test_kv_cache.kv"
+    mtime1 = (store / f"{item1.id}.safetensors").stat().st_mtime_ns
+
+    item3 = KVCacheItem(memory=make_layer_cache(3))
+    kv_memory.delete([item2.id])
+    kv_memory.add([item3])
+    kv_memory.dump(str(tmp_path))
+
+    assert (store / f"{item1.id}.safetensors").stat().st_mtime_ns == mtime1
+    assert not (store / f"{item2.id}.safetensors").exists()
+    assert (store / f"{item3.id}.safetensors").exists()
+
+    loaded = KVCacheMemory.__new__(KVCacheMemory)
+    loaded.config = dummy_config
+    loaded.load(str(tmp_path))
+    assert [item.id for item in loaded.get_all()] == [item1.id, item3.id]
+
+
+def test_extract_with_base_reuses_previous_cache(kv_memory):
+    base = kv_memory.extract("1. likes tea\n")
+    kv_memory.llm.extend_kv_cache = MagicMock(return_value=DynamicCache())
+
+    item = kv_memory.extract("1. likes tea\n2. owns a cat\n", base=base)
+
+    kv_memory.llm.extend_kv_cache.assert_called_once_with(
+        "1. likes tea\n2. owns a cat\n", "1. likes tea\n", base.memory
+    )
+    assert item.metadata["source_text"] == "1. likes tea\n2. owns a cat\n"
+
+
+@pytest.mark.parametrize("dtype, tolerance", [("int8", 0.02), ("fp8", 0.1)])
+def test_quantized_item_round_trip(dtype, tolerance):
+    from memos.llms.hf_batching import tensors_to_cache
+    from memos.memories.activation.kv_store import QuantizedKVItem, kv_item_bytes
+
+    keys, values = torch.randn(1, 2, 8, 16), torch.randn(1, 2, 8, 16)
+    item = KVCacheItem(memory=tensors_to_cache([(keys, values)]), metadata={"source_text": "a"})
+
+    cold = QuantizedKVItem.from_item(item, dtype)
+    restored = cold.load()
+
+    assert cold.nbytes < kv_item_bytes(item)
+    assert restored.id == item.id
+    assert restored.metadata == item.metadata
+    layer = restored.memory.layers[0]
+    assert layer.keys.dtype == keys.dtype
+    assert (layer.keys - keys).abs().max() <= tolerance * keys.abs().max()
+    assert (layer.values - values).abs().max() <= tolerance * values.abs().max()
+
+
+def test_resident_budget_quantizes_then_spills(kv_memory, dummy_config, tmp_path):
+    dummy_config.max_resident_bytes = 700
+    dummy_config.cold_storage_dtype = "int8"
+    dummy_config.spill_dir = str(tmp_path / "spill")
+    kv_memory.kv_cache_memories = kv_memory._new_items()
+    items = [KVCacheItem(memory=make_layer_cache(i)) for i in range(1, 4)]
+    kv_memory.add(items)
+
+    stats = kv_memory.cache_stats()
+    assert stats["resident_bytes"] <= 700
+    assert (stats["hot_items"], stats["cold_items"], stats["disk_items"]) == (1, 1, 1)
+    assert not kv_memory.kv_cache_memories.is_loaded(items[0].id)
+    assert (tmp_path / "spill" / f"{items[0].id}.safetensors").exists()
+
+    # Reading the spilled item brings it back and pushes the others down a tier
+    got = kv_memory.get(items[0].id)
+    assert torch.equal(got.memory.layers[1].values, items[0].memory.layers[1].values)
+    assert kv_memory.get(items[0].id) is got
+    stats = kv_memory.cache_stats()
+    assert stats["resident_bytes"] <= 700
+    assert (stats["disk_loads"], stats["hits"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+
+    # Dumping keeps cold items cold and writes them at full precision
+    kv_memory.dump(str(tmp_path))
+    loaded = KVCacheMemory.__new__(KVCacheMemory)
+    loaded.config = MagicMock(spec=KVCacheMemoryConfig, memory_filename="test_kv_cache.pkl")
+    loaded.load(str(tmp_path))
+    assert [item.id for item in loaded.get_all()] == [item.id for item in items]
+
+    kv_memory.delete([items[1].id])
+    assert not (tmp_path / "spill" / f"{items[1].id}.safetensors").exists()
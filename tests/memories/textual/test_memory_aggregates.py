@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.api.handlers.memory_handler import handle_get_memories_dashboard
+from memos.api.product_models import GetMemoryDashboardRequest
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.organize.aggregates import (
+    MemoryAggregateStore,
+    get_aggregate_store,
+    update_node_tracked,
+)
+from memos.memories.textual.tree_text_memory.organize.manager import MemoryManager
+
+
+@pytest.fixture
+def graph_store():
+    store = MagicMock()
+    store.get_grouped_counts.return_value = [
+        {"memory_type": "LongTermMemory", "status": "activated", "count": 3},
+        {"memory_type": "WorkingMemory", "status": "activated", "count": 2},
+        {"memory_type": "LongTermMemory", "status": "deleted", "count": 1},
+    ]
+    return store
+
+
+@pytest.fixture
+def aggregates(graph_store):
+    return MemoryAggregateStore(graph_store, reconcile_interval=3600, scan_tags=False)
+
+
+def test_seeds_once_then_counts_incrementally(aggregates, graph_store):
+    assert aggregates.memory_type_counts("cube") == {"LongTermMemory": 4, "WorkingMemory": 2}
+
+    aggregates.record_added(
+        "cube", [{"memory_type": "LongTermMemory", "status": "activated", "tags": ["a"]}]
+    )
+    aggregates.record_deleted("cube", [{"memory_type": "WorkingMemory", "status": "activated"}])
+
+    assert aggregates.memory_type_counts("cube") == {"LongTermMemory": 5, "WorkingMemory": 1}
+    assert graph_store.get_grouped_counts.call_count == 1
+
+
+def test_trim_clamps_memory_type(aggregates):
+    aggregates.memory_type_counts("cube")
+    aggregates.record_trimmed("cube", "LongTermMemory", keep_latest=2)
+    aggregates.record_trimmed("cube", "WorkingMemory", keep_latest=10)
+
+    assert aggregates.memory_type_counts("cube") == {"LongTermMemory": 2, "WorkingMemory": 2}
+
+
+def test_invalidate_recounts_on_next_read(aggregates, graph_store):
+    aggregates.memory_type_counts("cube")
+    aggregates.record_added("cube", [{"memory_type": "UserMemory"}])
+    aggregates.invalidate()
+
+    assert "UserMemory" not in aggregates.memory_type_counts("cube")
+    assert graph_store.get_grouped_counts.call_count == 2
+
+
+def test_snapshot_excludes_deleted_and_reports_activity(aggregates):
+    aggregates.record_added("cube", [{"memory_type": "UserMemory", "tags": ["x", "y"]}])
+    snapshot = aggregates.snapshot("cube", activity_hours=3)
+
+    assert snapshot["by_memory_type"] == {
+        "LongTermMemory": 3,
+        "WorkingMemory": 2,
+    }
+    assert snapshot["by_status_all"]["deleted"] == 1
+    assert snapshot["total"] == 5
+    assert len(snapshot["activity"]) == 3
+    assert snapshot["tags_complete"] is False
+
+
+def test_reconcile_scan_rebuilds_tags_and_activity(aggregates, graph_store):
+    now = datetime.now(timezone.utc).isoformat()
+    graph_store.export_nodes_page.side_effect = [
+        {
+            "nodes": [{"id": "1", "metadata": {"tags": ["a", "b"], "created_at": now}}],
+            "next_cursor": "c1",
+        },
+        {
+            "nodes": [{"id": "2", "metadata": {"tags": ["a"], "created_at": now}}],
+            "next_cursor": None,
+        },
+    ]
+
+    aggregates.reconcile_scan("cube")
+    snapshot = aggregates.snapshot("cube", activity_hours=1)
+
+    assert snapshot["top_tags"][0] == {"tag": "a", "count": 2}
+    assert snapshot["tags_complete"] is True
+    assert snapshot["activity"][-1]["added"] == 2
+    assert graph_store.export_nodes_page.call_args_list[1].kwargs["cursor"] == "c1"
+
+
+def test_memory_manager_reads_sizes_from_aggregates(graph_store):
+    manager = MemoryManager(graph_store=graph_store, embedder=MagicMock(), llm=MagicMock())
+    manager.aggregates.scan_tags = False
+    memory = TextualMemoryItem(
+        memory="test",
+        metadata=TreeNodeTextualMemoryMetadata(embedding=[0.1] * 5, memory_type="LongTermMemory"),
+    )
+
+    # The first refresh seeds from the store, which already contains the new node
+    manager.add([memory])
+    assert manager.current_memory_size["LongTermMemory"] == 4
+    manager.add([memory])
+
+    assert manager.current_memory_size["LongTermMemory"] == 5
+    assert graph_store.get_grouped_counts.call_count == 1
+
+
+def test_tracked_updates_move_counts(graph_store):
+    aggregates = get_aggregate_store(graph_store)
+    aggregates.scan_tags = False
+    aggregates.memory_type_counts("cube")
+    graph_store.get_node.return_value = {
+        "id": "n1",
+        "metadata": {"memory_type": "LongTermMemory", "status": "activated"},
+    }
+
+    update_node_tracked(graph_store, "n1", {"status": "archived"}, user_name="cube")
+    update_node_tracked(
+        graph_store,
+        "n2",
+        {"memory_type": "UserMemory"},
+        user_name="cube",
+        old_metadata={"memory_type": "WorkingMemory", "status": "activated"},
+    )
+    update_node_tracked(graph_store, "n3", {"usage": []}, user_name="cube")
+
+    snapshot = aggregates.snapshot("cube")
+    assert snapshot["by_status"] == {"activated": 4, "archived": 1}
+    assert snapshot["by_memory_type"] == {"LongTermMemory": 3, "WorkingMemory": 1, "UserMemory": 1}
+    assert graph_store.update_node.call_count == 3
+    graph_store.get_node.assert_called_once_with("n1", user_name="cube")
+    assert graph_store.get_grouped_counts.call_count == 1
+
+
+def test_dashboard_takes_totals_from_aggregates_without_count_queries():
+    text_mem = MagicMock()
+    text_mem.get_memory_aggregates.return_value = {
+        "by_memory_type": {"LongTermMemory": 7, "WorkingMemory": 2, "SkillMemory": 1}
+    }
+    text_mem.get_all.return_value = {"nodes": [{"id": "1", "metadata": {}}]}
+    request = GetMemoryDashboardRequest(
+        mem_cube_id="cube", page=1, page_size=10, include_skill_memory=True
+    )
+
+    response = handle_get_memories_dashboard(request, MagicMock(text_mem=text_mem))
+
+    statistics = response.data["statistics"]
+    assert statistics["total_text_nodes"] == 9
+    assert statistics["total_skill_nodes"] == 1
+    assert all(call.kwargs["include_totals"] is False for call in text_mem.get_all.call_args_list)
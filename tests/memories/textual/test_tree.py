@@ -166,3 +166,19 @@ def test_add_returns_ids(mock_tree_text_memory):
     mock_tree_text_memory.memory_manager.add.assert_called_once_with(
         mock_items, user_name=None, mode="sync"
     )
+
+
+def test_get_all_without_totals_reads_only_the_page(mock_tree_text_memory):
+    graph_store = mock_tree_text_memory.graph_store
+    graph_store.export_nodes_page.return_value = {
+        "nodes": [{"id": str(i)} for i in range(4)],
+        "next_cursor": "c",
+    }
+
+    result = mock_tree_text_memory.get_all(
+        user_name="cube", page=2, page_size=2, include_totals=False
+    )
+
+    assert result == {"nodes": [{"id": "2"}, {"id": "3"}]}
+    assert graph_store.export_nodes_page.call_args.kwargs["page_size"] == 4
+    graph_store.export_graph.assert_not_called()
@@ -0,0 +1,154 @@
+import threading
+import time
+
+from unittest.mock import Mock
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+from memos.api.product_models import APISearchRequest
+from memos.context.context import ContextThreadPoolExecutor
+from memos.multi_mem_cube import composite_cube
+from memos.multi_mem_cube.composite_cube import CompositeCubeView, merge_cube_buckets
+
+
+def _mem(mem_id, text, score):
+    return {"id": mem_id, "memory": text, "metadata": {"relativity": score}}
+
+
+def _bucket(cube_id, memories):
+    return {"cube_id": cube_id, "memories": memories, "total_nodes": len(memories)}
+
+
+def _view(cube_id, text_mem=None, delay=0.0, error=None):
+    view = Mock(cube_id=cube_id)
+
+    def search(req):
+        time.sleep(delay)
+        if error:
+            raise error
+        return {"text_mem": [_bucket(cube_id, text_mem or [])], "pref_note": f"note-{cube_id}"}
+
+    view.search_memories.side_effect = search
+    return view
+
+
+def test_merge_orders_by_score_and_dedups_across_cubes():
+    buckets = [
+        _bucket("a", [_mem("1", "apple", 0.2), _mem("2", "banana", 0.9)]),
+        _bucket(
+            "b", [_mem("3", "cherry", 0.95), _mem("2", "banana", 0.5), _mem("4", "Apple", 0.1)]
+        ),
+    ]
+    merged = merge_cube_buckets(buckets, limit=3)
+
+    # Cube b holds the best memory, so it comes first
+    assert [b["cube_id"] for b in merged] == ["b", "a"]
+    assert [m["id"] for m in merged[0]["memories"]] == ["3"]
+    assert [m["id"] for m in merged[1]["memories"]] == ["2", "1"]
+    assert merged[1]["total_nodes"] == 2
+
+
+def test_merge_normalizes_scores_above_one():
+    buckets = [
+        _bucket("bm25", [_mem("1", "x", 12.0), _mem("2", "y", 3.0)]),
+        _bucket("dense", [_mem("3", "z", 0.5)]),
+    ]
+    merged = merge_cube_buckets(buckets)
+    order = [m["id"] for b in merged for m in b["memories"]]
+    assert order == ["1", "2", "3"]
+    assert [m["id"] for m in merged[1]["memories"]] == ["3"]
+
+
+def test_search_fans_out_concurrently_and_merges():
+    views = [
+        _view("a", [_mem("1", "one", 0.3)], delay=0.2),
+        _view("b", [_mem("2", "two", 0.8)], delay=0.2),
+        _view("c", [_mem("3", "three", 0.5)], delay=0.2),
+    ]
+    composite = CompositeCubeView(cube_views=views, logger=Mock())
+
+    start = time.monotonic()
+    result = composite.search_memories(APISearchRequest(query="q", user_id="u"))
+    assert time.monotonic() - start < 0.5
+    assert [b["cube_id"] for b in result["text_mem"]] == ["b", "c", "a"]
+    assert result["pref_note"] == "note-a | note-b | note-c"
+
+
+def test_search_skips_slow_and_failed_cubes():
+    views = [
+        _view("fast", [_mem("1", "one", 0.3)]),
+        _view("slow", [_mem("2", "two", 0.9)], delay=0.5),
+        _view("broken", error=RuntimeError("down")),
+    ]
+    composite = CompositeCubeView(cube_views=views, logger=Mock(), search_timeout=0.1)
+
+    result = composite.search_memories(APISearchRequest(query="q", user_id="u"))
+    assert [b["cube_id"] for b in result["text_mem"]] == ["fast"]
+
+
+def test_search_raises_when_all_cubes_fail():
+    views = [_view("a", error=RuntimeError("down")), _view("b", error=RuntimeError("down"))]
+    composite = CompositeCubeView(cube_views=views, logger=Mock())
+    with pytest.raises(RuntimeError):
+        composite.search_memories(APISearchRequest(query="q", user_id="u"))
+
+
+def test_add_writes_to_cubes_in_parallel():
+    barrier = threading.Barrier(2, timeout=1)
+    views = []
+    for cube_id in ("a", "b"):
+        view = Mock(cube_id=cube_id)
+        view.add_memories.side_effect = lambda req, cube_id=cube_id: (
+            barrier.wait(),
+            [{"cube_id": cube_id}],
+        )[1]
+        views.append(view)
+
+    composite = CompositeCubeView(cube_views=views, logger=Mock())
+    assert composite.add_memories(Mock()) == [{"cube_id": "a"}, {"cube_id": "b"}]
+
+
+def _skipped(cube_id, reason):
+    return (
+        REGISTRY.get_sample_value(
+            "memos_cube_fanout_skipped_total",
+            {"action": "search", "cube_id": cube_id, "reason": reason},
+        )
+        or 0.0
+    )
+
+
+def test_search_deadline_starts_when_cube_search_starts(monkeypatch):
+    executor = ContextThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(composite_cube, "_get_fanout_executor", lambda: executor)
+    views = [
+        _view("queued-a", [_mem("1", "one", 0.3)], delay=0.2),
+        _view("queued-b", [_mem("2", "two", 0.8)], delay=0.2),
+    ]
+    composite = CompositeCubeView(cube_views=views, logger=Mock(), search_timeout=0.3)
+
+    # queued-b only starts after queued-a, past 0.3s from submission but within its own budget
+    result = composite.search_memories(APISearchRequest(query="q", user_id="u"))
+    assert [b["cube_id"] for b in result["text_mem"]] == ["queued-b", "queued-a"]
+    executor.shutdown()
+
+
+def test_search_bounds_in_flight_calls_per_cube(monkeypatch):
+    monkeypatch.setattr(composite_cube, "CUBE_MAX_INFLIGHT", 1)
+    stuck = _view("stuck", delay=0.5)
+    composite = CompositeCubeView(
+        cube_views=[_view("ok", [_mem("1", "one", 0.3)]), stuck], logger=Mock(), search_timeout=0.1
+    )
+    timeouts = _skipped("stuck", "timeout")
+    busy = _skipped("stuck", "busy")
+
+    for _ in range(2):
+        result = composite.search_memories(APISearchRequest(query="q", user_id="u"))
+        assert [b["cube_id"] for b in result["text_mem"]] == ["ok"]
+
+    # The abandoned call still holds the only slot, so the second search skips the cube
+    assert stuck.search_memories.call_count == 1
+    assert _skipped("stuck", "timeout") == timeouts + 1
+    assert _skipped("stuck", "busy") == busy + 1